@@ -1,12 +1,37 @@
-# Copyright (c) 2020, Manfred Moitzi
+# Copyright (c) 2020-2021, Manfred Moitzi
 # License: MIT License
-import time
-import random
+"""
+Benchmark of the linear equation solvers used by the global B-spline
+interpolation: standard LU decomposition against the banded matrix LU
+decomposition for random banded matrices, and the global B-spline
+interpolation of random fit points, which builds the compact banded matrix
+directly from the sparse basis function rows.
+
+Run all benchmarks and store the results of the solver comparison as CSV
+file:
+
+    python profiling/banded_matrix_solver.py --csv banded_matrix.csv
+
+Standard LU decomposition requires O(n³) operations, therefore it runs only
+for matrices up to `--max-lu` rows. The banded matrix LU decomposition is
+faster for matrices with more than ~15 rows (CPython).
+
+"""
+from typing import Callable, List, Tuple
+import argparse
 import csv
-from pathlib import Path
-from ezdxf.math.linalg import Matrix, BandedMatrixLU, banded_matrix, LUDecomposition
+import random
+import sys
+import time
 
-DIR = Path('~/Desktop/Outbox').expanduser()
+from ezdxf.math import Vec3, global_bspline_interpolation
+from ezdxf.math.linalg import (
+    Matrix, BandedMatrixLU, banded_matrix, LUDecomposition,
+)
+
+BANDS = [(1, 1), (2, 1), (1, 2), (2, 2), (3, 3), (4, 4)]
+SOLVER_SIZES = [10, 15, 20, 50, 100, 1000]
+INTERPOLATION_SIZES = [100, 1000, 10000, 50000]
 
 
 def random_values(n, spread=1.0):
@@ -21,6 +46,11 @@ def random_matrix(shape, m1: int, m2: int):
     return m
 
 
+def random_fit_points(count: int) -> List[Vec3]:
+    return [Vec3(x, random.uniform(-5, 5), random.uniform(-1, 1))
+            for x in range(count)]
+
+
 def profile_LU_matrix_solver(count: int, A: Matrix, B: Matrix):
     for _ in range(count):
         lu = LUDecomposition(A)
@@ -33,71 +63,74 @@ def profile_banded_matrix_solver(count, A: Matrix, B: Matrix):
         lu.solve_matrix(B)
 
 
-def profile(func, *args):
+def profile(func: Callable, *args) -> float:
     t0 = time.perf_counter()
     func(*args)
-    t1 = time.perf_counter()
-    delta = t1 - t0
-    return delta
-
+    return time.perf_counter() - t0
 
-REPEAT = 5
 
-with open(DIR / 'profiling_banded_matrix.csv', mode='wt', newline='') as f:
-    writer = csv.writer(f, dialect='excel')
-    writer.writerow(['Parameters', 'Standard LU', 'Banded LU', 'Factor'])
-    for size in range(10, 101, 5):
-        for m1, m2 in [(1, 1), (2, 1), (1, 2), (2, 2), (2, 3), (3, 2), (3, 3), (3, 4), (4, 3), (4, 4)]:
+def solver_benchmark(sizes: List[int], repeat: int,
+                     max_lu: int) -> List[Tuple]:
+    rows = []
+    for size in sizes:
+        for m1, m2 in BANDS:
             A = random_matrix((size, size), m1, m2)
-            B = Matrix(list(zip(random_values(size), random_values(size), random_values(size))))
-            t0 = profile(profile_LU_matrix_solver, REPEAT, A, B)
-            t1 = profile(profile_banded_matrix_solver, REPEAT, A, B)
-            factor = t0 / t1
-            print(
-                f'Matrix {size}x{size}, m1={m1}, m2={m2}, {REPEAT}x: Standard LU {t0:0.3f}s Banded LU {t1:0.3}s factor: x{factor:.1f}')
-            writer.writerow([f"N={size}, m1+m2+1={m1 + m2 + 1}", round(t0, 3), round(t1, 3), round(factor, 1)])
-
-# Advantage Banded Matrix starts at ~ N=15
-# Matrix 10x10, m1=1, m2=1, 5x: Standard LU 0.001s Banded LU 0.00057s factor: x2.1
-# Matrix 10x10, m1=2, m2=1, 5x: Standard LU 0.001s Banded LU 0.000922s factor: x1.4
-# Matrix 10x10, m1=1, m2=2, 5x: Standard LU 0.001s Banded LU 0.00055s factor: x2.1
-# Matrix 10x10, m1=2, m2=2, 5x: Standard LU 0.001s Banded LU 0.000908s factor: x1.3
-# Matrix 10x10, m1=2, m2=3, 5x: Standard LU 0.001s Banded LU 0.000901s factor: x1.4
-# Matrix 10x10, m1=3, m2=2, 5x: Standard LU 0.001s Banded LU 0.00122s factor: x1.0
-# Matrix 10x10, m1=3, m2=3, 5x: Standard LU 0.001s Banded LU 0.00128s factor: x1.0
-# Matrix 10x10, m1=3, m2=4, 5x: Standard LU 0.001s Banded LU 0.00126s factor: x1.0
-# Matrix 10x10, m1=4, m2=3, 5x: Standard LU 0.001s Banded LU 0.00158s factor: x0.8
-# Matrix 10x10, m1=4, m2=4, 5x: Standard LU 0.001s Banded LU 0.0016s factor: x0.8
-# Matrix 15x15, m1=1, m2=1, 5x: Standard LU 0.003s Banded LU 0.000709s factor: x3.9
-# Matrix 15x15, m1=2, m2=1, 5x: Standard LU 0.003s Banded LU 0.00126s factor: x2.4
-# Matrix 15x15, m1=1, m2=2, 5x: Standard LU 0.003s Banded LU 0.000705s factor: x3.9
-# Matrix 15x15, m1=2, m2=2, 5x: Standard LU 0.003s Banded LU 0.00122s factor: x2.4
-# Matrix 15x15, m1=2, m2=3, 5x: Standard LU 0.003s Banded LU 0.00123s factor: x2.4
-# Matrix 15x15, m1=3, m2=2, 5x: Standard LU 0.003s Banded LU 0.00179s factor: x1.7
-# Matrix 15x15, m1=3, m2=3, 5x: Standard LU 0.003s Banded LU 0.00176s factor: x1.7
-# Matrix 15x15, m1=3, m2=4, 5x: Standard LU 0.003s Banded LU 0.00176s factor: x1.7
-# Matrix 15x15, m1=4, m2=3, 5x: Standard LU 0.003s Banded LU 0.00228s factor: x1.3
-# Matrix 15x15, m1=4, m2=4, 5x: Standard LU 0.003s Banded LU 0.00227s factor: x1.3
-# Matrix 20x20, m1=1, m2=1, 5x: Standard LU 0.005s Banded LU 0.000869s factor: x6.2
-# Matrix 20x20, m1=2, m2=1, 5x: Standard LU 0.006s Banded LU 0.00161s factor: x3.6
-# Matrix 20x20, m1=1, m2=2, 5x: Standard LU 0.005s Banded LU 0.000868s factor: x6.2
-# Matrix 20x20, m1=2, m2=2, 5x: Standard LU 0.006s Banded LU 0.00157s factor: x3.6
-# Matrix 20x20, m1=2, m2=3, 5x: Standard LU 0.006s Banded LU 0.00158s factor: x3.6
-# Matrix 20x20, m1=3, m2=2, 5x: Standard LU 0.006s Banded LU 0.00223s factor: x2.6
-# Matrix 20x20, m1=3, m2=3, 5x: Standard LU 0.006s Banded LU 0.00225s factor: x2.6
-# Matrix 20x20, m1=3, m2=4, 5x: Standard LU 0.006s Banded LU 0.0023s factor: x2.5
-# Matrix 20x20, m1=4, m2=3, 5x: Standard LU 0.006s Banded LU 0.00293s factor: x2.0
-# Matrix 20x20, m1=4, m2=4, 5x: Standard LU 0.006s Banded LU 0.00297s factor: x1.9
-# ...
-# ...
-# ...
-# Matrix 100x100, m1=1, m2=1, 5x: Standard LU 0.398s Banded LU 0.00359s factor: x111.1
-# Matrix 100x100, m1=2, m2=1, 5x: Standard LU 0.402s Banded LU 0.00701s factor: x57.4
-# Matrix 100x100, m1=1, m2=2, 5x: Standard LU 0.396s Banded LU 0.00364s factor: x108.7
-# Matrix 100x100, m1=2, m2=2, 5x: Standard LU 0.405s Banded LU 0.00692s factor: x58.5
-# Matrix 100x100, m1=2, m2=3, 5x: Standard LU 0.405s Banded LU 0.00698s factor: x58.0
-# Matrix 100x100, m1=3, m2=2, 5x: Standard LU 0.406s Banded LU 0.0103s factor: x39.5
-# Matrix 100x100, m1=3, m2=3, 5x: Standard LU 0.406s Banded LU 0.0104s factor: x39.0
-# Matrix 100x100, m1=3, m2=4, 5x: Standard LU 0.405s Banded LU 0.0104s factor: x38.8
-# Matrix 100x100, m1=4, m2=3, 5x: Standard LU 0.408s Banded LU 0.0141s factor: x28.9
-# Matrix 100x100, m1=4, m2=4, 5x: Standard LU 0.407s Banded LU 0.014s factor: x29.0
+            B = Matrix(list(zip(random_values(size), random_values(size),
+                                random_values(size))))
+            t1 = profile(profile_banded_matrix_solver, repeat, A, B)
+            if size <= max_lu:
+                t0 = profile(profile_LU_matrix_solver, repeat, A, B)
+                factor = t0 / t1
+                print(f'Matrix {size}x{size}, m1={m1}, m2={m2}, {repeat}x: '
+                      f'Standard LU {t0:0.3f}s Banded LU {t1:0.3f}s '
+                      f'factor: x{factor:.1f}')
+                rows.append((f'N={size}, m1+m2+1={m1 + m2 + 1}', round(t0, 3),
+                             round(t1, 3), round(factor, 1)))
+            else:
+                print(f'Matrix {size}x{size}, m1={m1}, m2={m2}, {repeat}x: '
+                      f'Banded LU {t1:0.3f}s')
+                rows.append((f'N={size}, m1+m2+1={m1 + m2 + 1}', '',
+                             round(t1, 3), ''))
+    return rows
+
+
+def interpolation_benchmark(sizes: List[int], degree: int):
+    for size in sizes:
+        points = random_fit_points(size)
+        t0 = profile(global_bspline_interpolation, points, degree)
+        print(f'Global B-spline interpolation of {size} fit points, '
+              f'degree={degree}: {t0:0.3f}s')
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description='banded matrix solver benchmark')
+    parser.add_argument('--sizes', type=int, nargs='+', default=SOLVER_SIZES,
+                        help='matrix sizes of the solver comparison')
+    parser.add_argument('--fit-points', type=int, nargs='+',
+                        default=INTERPOLATION_SIZES,
+                        help='fit point counts of the interpolation benchmark')
+    parser.add_argument('--degree', type=int, default=3,
+                        help='degree of the interpolated B-splines')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='count of runs of each solver benchmark')
+    parser.add_argument('--max-lu', type=int, default=100,
+                        help='max. matrix size for the standard LU solver')
+    parser.add_argument('--seed', type=int, default=42, help='random seed')
+    parser.add_argument('--csv', help='store solver comparison as CSV file')
+    args = parser.parse_args()
+    random.seed(args.seed)
+
+    rows = solver_benchmark(args.sizes, args.repeat, args.max_lu)
+    if args.csv:
+        with open(args.csv, mode='wt', newline='') as f:
+            writer = csv.writer(f, dialect='excel')
+            writer.writerow(['Parameters', 'Standard LU', 'Banded LU',
+                             'Factor'])
+            writer.writerows(rows)
+    interpolation_benchmark(args.fit_points, args.degree)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,349 @@
+#  Copyright (c) 2021, Manfred Moitzi
+#  License: MIT License
+"""
+Benchmark suite for the hot paths of ezdxf: loading, saving, querying,
+bounding box calculation, disassembling, rendering by the drawing frontend
+and path flattening.
+
+The benchmarks run on synthetic DXF documents, created by the regular layout
+factory methods from a fixed random seed, the same `--size` and `--seed`
+arguments create always the same document.
+
+Run all benchmarks with and without C extensions and store the results:
+
+    python profiling/benchmark.py --mode both --output results.json
+
+Compare the results against a stored baseline, returns exit code 1 if any
+benchmark is slower than the baseline by more than `--threshold` percent:
+
+    python profiling/benchmark.py --baseline baseline.json
+
+"""
+from typing import Callable, Dict, List, Tuple
+import argparse
+import io
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+BENCHMARKS: Dict[str, Callable] = dict()
+DEFAULT_SIZE = 2000
+DEFAULT_SEED = 42
+DEFAULT_REPEAT = 3
+DEFAULT_THRESHOLD = 10.0  # percent
+
+
+def benchmark(func: Callable) -> Callable:
+    """ Register benchmark `func`, the name of the benchmark is the
+    function name without the prefix "bench_".
+    """
+    BENCHMARKS[func.__name__[6:]] = func
+    return func
+
+
+def make_document(size: int = DEFAULT_SIZE, seed: int = DEFAULT_SEED):
+    """ Returns a reproducible DXF R2013 document with `size` entities of each
+    type: LINE, SPLINE, HATCH, INSERT and MTEXT.
+    """
+    import ezdxf
+    rnd = random.Random(seed)
+
+    def point(extent: float = 1000):
+        return rnd.uniform(0, extent), rnd.uniform(0, extent)
+
+    doc = ezdxf.new('R2013')
+    for index in range(8):
+        doc.layers.new(f'LAYER{index}', dxfattribs={'color': index + 1})
+    layers = [f'LAYER{index}' for index in range(8)]
+    block = doc.blocks.new('SYMBOL')
+    block.add_circle((0, 0), 1)
+    block.add_lwpolyline([(-1, -1), (1, -1), (1, 1), (-1, 1)], close=True)
+    block.add_arc((0, 0), 0.5, 0, 180)
+
+    msp = doc.modelspace()
+    for _ in range(size):
+        attribs = {'layer': rnd.choice(layers)}
+        msp.add_line(point(), point(), dxfattribs=attribs)
+        x, y = point()
+        msp.add_spline(
+            [(x + dx * 10, y + rnd.uniform(-5, 5)) for dx in range(6)],
+            dxfattribs=attribs)
+        hatch = msp.add_hatch(color=rnd.randint(1, 7), dxfattribs=attribs)
+        x, y = point()
+        hatch.paths.add_polyline_path(
+            [(x, y), (x + 10, y), (x + 10, y + 10), (x, y + 10)])
+        msp.add_blockref('SYMBOL', point(), dxfattribs={
+            'layer': attribs['layer'],
+            'xscale': rnd.uniform(0.5, 2),
+            'yscale': rnd.uniform(0.5, 2),
+            'rotation': rnd.uniform(0, 360),
+        })
+        msp.add_mtext(
+            'Line1\\PLine2 {\\C1;red} text',
+            dxfattribs={'insert': point(), 'char_height': 2.5, **attribs},
+        )
+    return doc
+
+
+class Context:
+    """ Shared resources of all benchmarks. """
+
+    def __init__(self, size: int, seed: int, directory: str):
+        self.doc = make_document(size, seed)
+        self.asc_file = os.path.join(directory, 'benchmark.dxf')
+        self.bin_file = os.path.join(directory, 'benchmark_bin.dxf')
+        self.doc.saveas(self.asc_file)
+        self.doc.saveas(self.bin_file, fmt='bin')
+
+
+@benchmark
+def bench_readfile(ctx: Context):
+    import ezdxf
+    ezdxf.readfile(ctx.asc_file)
+
+
+@benchmark
+def bench_readfile_binary(ctx: Context):
+    import ezdxf
+    ezdxf.readfile(ctx.bin_file)
+
+
+@benchmark
+def bench_recover_readfile(ctx: Context):
+    from ezdxf import recover
+    recover.readfile(ctx.asc_file)
+
+
+@benchmark
+def bench_saveas_ascii(ctx: Context):
+    ctx.doc.write(io.StringIO())
+
+
+@benchmark
+def bench_saveas_binary(ctx: Context):
+    ctx.doc.write(io.BytesIO(), fmt='bin')
+
+
+@benchmark
+def bench_query(ctx: Context):
+    msp = ctx.doc.modelspace()
+    for index in range(8):
+        msp.query(f'LINE MTEXT[layer=="LAYER{index}"]')
+        msp.query(f'*[color=={index}]')
+
+
+@benchmark
+def bench_bbox_extends(ctx: Context):
+    from ezdxf import bbox
+    bbox.extends(ctx.doc.modelspace())
+
+
+@benchmark
+def bench_disassemble(ctx: Context):
+    from ezdxf import disassemble
+    primitives = disassemble.to_primitives(
+        disassemble.recursive_decompose(ctx.doc.modelspace()))
+    for _ in disassemble.to_vertices(primitives):
+        pass
+
+
+@benchmark
+def bench_drawing_frontend(ctx: Context):
+    from ezdxf.addons.drawing import Frontend, RenderContext
+    doc = ctx.doc
+    Frontend(RenderContext(doc), NullBackend()).draw_layout(
+        doc.modelspace(), finalize=True)
+
+
+@benchmark
+def bench_path_flattening(ctx: Context):
+    from ezdxf.render import make_path
+    msp = ctx.doc.modelspace()
+    for spline in msp.query('SPLINE'):
+        list(make_path(spline).flattening(0.01))
+    for insert in msp.query('INSERT'):
+        for entity in insert.virtual_entities():
+            if entity.dxftype() in ('CIRCLE', 'ARC'):
+                list(make_path(entity).flattening(0.01))
+
+
+def null_backend_class():
+    from ezdxf.addons.drawing.backend import Backend
+    from ezdxf.tools.fonts import FontMeasurements
+
+    class _NullBackend(Backend):
+        """ Backend without output to measure the frontend. """
+
+        def set_background(self, color):
+            pass
+
+        def draw_point(self, pos, properties):
+            pass
+
+        def draw_line(self, start, end, properties):
+            pass
+
+        def draw_filled_polygon(self, points, properties):
+            for _ in points:
+                pass
+
+        def draw_text(self, text, transform, properties, cap_height):
+            pass
+
+        def get_font_measurements(self, cap_height, font=None):
+            return FontMeasurements(baseline=0.0, cap_height=1.0,
+                                    x_height=0.5, descender_height=0.2)
+
+        def get_text_line_width(self, text, cap_height, font=None):
+            return len(text) * cap_height
+
+        def clear(self):
+            pass
+
+    return _NullBackend
+
+
+def NullBackend():
+    return null_backend_class()()
+
+
+def run_benchmarks(names: List[str], size: int, seed: int,
+                   repeat: int) -> Dict:
+    """ Run benchmarks `names` in the current process, returns the results
+    as JSON serializable dict.
+    """
+    import ezdxf
+    from ezdxf.acc import USE_C_EXT
+    results = dict()
+    with tempfile.TemporaryDirectory() as directory:
+        ctx = Context(size, seed, directory)
+        for name in names:
+            func = BENCHMARKS[name]
+            times = []
+            for _ in range(repeat):
+                t0 = time.perf_counter()
+                func(ctx)
+                times.append(time.perf_counter() - t0)
+            results[name] = {
+                'min': min(times),
+                'mean': sum(times) / len(times),
+            }
+    return {
+        'meta': {
+            'ezdxf': ezdxf.__version__,
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'c_ext': USE_C_EXT,
+            'size': size,
+            'seed': seed,
+            'repeat': repeat,
+        },
+        'results': results,
+    }
+
+
+def run_mode(mode: str, args) -> Dict:
+    """ Run benchmarks in a new process with or without C extensions, the
+    EZDXF_DISABLE_C_EXT state has to be set before importing ezdxf.
+    """
+    env = dict(os.environ)
+    env['EZDXF_DISABLE_C_EXT'] = '1' if mode == 'python' else '0'
+    cmd = [
+        sys.executable, os.path.abspath(__file__), '--child',
+        '--size', str(args.size), '--seed', str(args.seed),
+        '--repeat', str(args.repeat),
+    ]
+    if args.benchmarks:
+        cmd.extend(['--benchmarks', *args.benchmarks])
+    output = subprocess.run(cmd, env=env, check=True,
+                            stdout=subprocess.PIPE).stdout
+    return json.loads(output)
+
+
+def mode_name(result: Dict) -> str:
+    return 'c' if result['meta']['c_ext'] else 'python'
+
+
+def compare(results: Dict[str, Dict], baseline: Dict[str, Dict],
+            threshold: float) -> List[Tuple[str, str, float]]:
+    """ Print comparison table and returns the list of regressions as
+    (mode, benchmark, percent) tuples.
+    """
+    regressions = []
+    for mode, result in results.items():
+        base = baseline.get(mode)
+        if base is None:
+            print(f'No baseline for mode "{mode}".')
+            continue
+        for name, timing in result['results'].items():
+            base_timing = base['results'].get(name)
+            if base_timing is None:
+                continue
+            percent = (timing['min'] / base_timing['min'] - 1.0) * 100.0
+            flag = ''
+            if percent > threshold:
+                flag = ' REGRESSION'
+                regressions.append((mode, name, percent))
+            print(f'{mode:6} {name:20} {base_timing["min"]:8.3f}s '
+                  f'{timing["min"]:8.3f}s {percent:+7.1f}%{flag}')
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='ezdxf benchmark suite')
+    parser.add_argument('--mode', choices=['c', 'python', 'both'],
+                        default='c', help='with or without C extensions')
+    parser.add_argument('--size', type=int, default=DEFAULT_SIZE,
+                        help='count of entities of each type')
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED,
+                        help='random seed of the document generator')
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT,
+                        help='count of runs of each benchmark')
+    parser.add_argument('--benchmarks', nargs='+', choices=sorted(BENCHMARKS),
+                        help='run only these benchmarks')
+    parser.add_argument('--output', help='store results as JSON file')
+    parser.add_argument('--baseline', help='compare against JSON file')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='regression threshold in percent')
+    parser.add_argument('--child', action='store_true',
+                        help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    names = args.benchmarks or list(BENCHMARKS)
+
+    if args.child:
+        json.dump(run_benchmarks(names, args.size, args.seed, args.repeat),
+                  sys.stdout)
+        return 0
+
+    modes = ['c', 'python'] if args.mode == 'both' else [args.mode]
+    results = dict()
+    for mode in modes:
+        result = run_mode(mode, args)
+        name = mode_name(result)
+        if name != mode:
+            print(f'C extensions not available, running mode "{name}".')
+        results[name] = result
+        for benchmark_name, timing in result['results'].items():
+            print(f'{name:6} {benchmark_name:20} min: {timing["min"]:8.3f}s '
+                  f'mean: {timing["mean"]:8.3f}s')
+
+    if args.output:
+        with open(args.output, 'wt') as fp:
+            json.dump(results, fp, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, 'rt') as fp:
+            baseline = json.load(fp)
+        print(f'\nComparison against baseline "{args.baseline}":')
+        if compare(results, baseline, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -20,6 +20,11 @@ def profile_bspline_point_new(count, spline):
             spline.point(t)
 
 
+def profile_bspline_points_batch(count, spline):
+    for _ in range(count):
+        list(spline.points(linspace(0, 1.0, 100)))
+
+
 def profile_bspline_derivatives_new(count, spline):
     for _ in range(count):
         list(spline.derivatives(t=linspace(0, 1.0, 100)))
@@ -33,4 +38,5 @@ def profile(text, func, *args):
 
 
 profile('B-spline point new 300x: ', profile_bspline_point_new, 300, spline)
+profile('B-spline points batch 300x: ', profile_bspline_points_batch, 300, spline)
 profile('B-spline derivatives new 300x: ', profile_bspline_derivatives_new, 300, spline)
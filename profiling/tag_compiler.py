@@ -1,17 +1,27 @@
-#  Copyright (c) 2020, Manfred Moitzi
+#  Copyright (c) 2020-2021, Manfred Moitzi
 #  License: MIT License
 import os
 import time
-from ezdxf.lldxf.tagger import ascii_tags_loader, tag_compiler
+from ezdxf.lldxf.tagger import ascii_tags_loader, py_tag_compiler
 from ezdxf.recover import safe_tag_loader
 from ezdxf import EZDXF_TEST_FILES
 
+try:
+    from ezdxf.acc.tagger import tag_compiler as c_tag_compiler
+except ImportError:
+    c_tag_compiler = None
+
 BIG_FILE = os.path.join(EZDXF_TEST_FILES, 'CADKitSamples', 'torso_uniform.dxf')
 
 
-def load_ascii():
+def load_ascii(compiler):
+    with open(BIG_FILE, 'rt') as fp:
+        list(compiler(iter(ascii_tags_loader(fp))))
+
+
+def load_ascii_tags():
     with open(BIG_FILE, 'rt') as fp:
-        list(tag_compiler(iter(ascii_tags_loader(fp))))
+        list(ascii_tags_loader(fp))
 
 
 def safe_load_bytes():
@@ -23,15 +33,24 @@ def print_result(time, text):
     print(f'Operation: {text} takes {time:.2f} s\n')
 
 
-def run(func):
+def run(func, *args):
     start = time.perf_counter()
-    func()
+    func(*args)
     end = time.perf_counter()
     return end - start
 
 
 if __name__ == '__main__':
     print_result(run(safe_load_bytes), 'safe_tag_loader()')
-    print_result(run(load_ascii), 'ascii_tag_compiler()')
-
-
+    t0 = run(load_ascii_tags)
+    print_result(t0, 'ascii_tags_loader()')
+    t1 = run(load_ascii, py_tag_compiler)
+    print_result(t1, 'Python ascii_tag_compiler()')
+    if c_tag_compiler is None:
+        print('C-extension ezdxf.acc.tagger not available.')
+    else:
+        t2 = run(load_ascii, c_tag_compiler)
+        print_result(t2, 'Cython ascii_tag_compiler()')
+        # without the time of the ascii_tags_loader():
+        print(f'Cython tag compiler is {(t1 - t0) / (t2 - t0):.1f}x faster '
+              f'than the Python implementation.')
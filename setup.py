@@ -30,6 +30,15 @@ try:
         Extension("ezdxf.acc.construct", [
             "src/ezdxf/acc/construct.pyx",
         ], optional=True, language='c++'),
+        Extension("ezdxf.acc.tagger", [
+            "src/ezdxf/acc/tagger.pyx",
+        ], optional=True, language='c++'),
+        Extension("ezdxf.acc.compactpath", [
+            "src/ezdxf/acc/compactpath.pyx",
+        ], optional=True, language='c++'),
+        Extension("ezdxf.acc.bspline", [
+            "src/ezdxf/acc/bspline.pyx",
+        ], optional=True, language='c++'),
     ]
     commands = {'build_ext': build_ext}
 except ImportError:
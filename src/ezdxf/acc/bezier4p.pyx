@@ -11,6 +11,9 @@ from .vector cimport (
 from .matrix44 cimport Matrix44
 from libc.math cimport ceil, tan
 from ._cpp_vec3 cimport CppVec3
+from libcpp.vector cimport vector
+from cpython cimport array
+import array
 from ._cpp_cubic_bezier cimport CppCubicBezier
 from .construct import arc_angle_span_deg
 
@@ -24,6 +27,10 @@ __all__ = [
 ]
 
 DEF ABS_TOL = 1e-12
+# Each subdivision level reduces the flattening error by about 1/4, the
+# depth limit stops endless subdivision for a distance below the precision
+# of the curve points:
+DEF MAX_FLATTENING_DEPTH = 16
 DEF M_PI = 3.141592653589793
 DEF M_TAU = M_PI * 2.0
 DEF DEG2RAD = M_PI / 180.0
@@ -91,23 +98,42 @@ cdef class Bezier4P:
         return points
 
     def flattening(self, double distance, int segments = 4) -> List[Vec3]:
+        cdef _Flattening f = self._flattening(distance, segments)
+        return [v3_from_cpp_vec3(point) for point in f.points]
+
+    def flattening_array(self, double distance,
+                         int segments = 4) -> array.array:
+        cdef _Flattening f = self._flattening(distance, segments)
+        cdef Py_ssize_t count = f.points.size(), index
+        cdef array.array result = array.clone(
+            array.array('d'), count * 3, zero=False)
+        cdef double *v = result.data.as_doubles
+        cdef CppVec3 point
+        for index in range(count):
+            point = f.points[index]
+            v[index * 3] = point.x
+            v[index * 3 + 1] = point.y
+            v[index * 3 + 2] = point.z
+        return result
+
+    cdef _Flattening _flattening(self, double distance, int segments):
         cdef double dt = 1.0 / segments
         cdef double t0 = 0.0, t1
         cdef _Flattening f = _Flattening(self, distance)
-        cdef CppVec3 start_point = (<Vec3> self.start_point).to_cpp_vec3()
+        cdef CppVec3 start_point = self.curve.p0
         cdef CppVec3 end_point
 
         while t0 < 1.0:
             t1 = t0 + dt
             if isclose(t1, 1.0, ABS_TOL):
-                end_point = (<Vec3> self.end_point).to_cpp_vec3()
+                end_point = self.curve.p3
                 t1 = 1.0
             else:
                 end_point = self.curve.point(t1)
             f.flatten(start_point, end_point, t0, t1)
             t0 = t1
             start_point = end_point
-        return f.points
+        return f
 
     def approximated_length(self, segments: int = 128) -> float:
         cdef double length = 0.0
@@ -139,25 +165,48 @@ cdef class Bezier4P:
 cdef class _Flattening:
     cdef CppCubicBezier curve
     cdef double distance
-    cdef list points
+    cdef vector[CppVec3] points
+    # Stack of pending end points, subdivision depth and curve parameters:
+    cdef vector[CppVec3] stack_points
+    cdef vector[int] stack_depth
+    cdef vector[double] stack_t
 
     def __cinit__(self, Bezier4P curve, double distance):
         self.curve = curve.curve
         self.distance = distance
-        self.points = [curve.start_point]
-
-    cdef flatten(self, CppVec3 start_point, CppVec3 end_point,
-                 double start_t,
-                 double end_t):
-        cdef double mid_t = (start_t + end_t) * 0.5
-        cdef CppVec3 mid_point = self.curve.point(mid_t)
-        cdef double d = mid_point.distance(start_point.lerp(end_point, 0.5))
-        if d < self.distance:
-            # Convert CppVec3 to Python type Vec3:
-            self.points.append(v3_from_cpp_vec3(end_point))
-        else:
-            self.flatten(start_point, mid_point, start_t, mid_t)
-            self.flatten(mid_point, end_point, mid_t, end_t)
+        self.points.push_back(curve.curve.p0)
+
+    cdef void flatten(self, CppVec3 start_point, CppVec3 end_point,
+                      double start_t, double end_t):
+        # Iterative implementation of the adaptive recursive subdivision,
+        # yields the same vertices in the same order:
+        cdef double mid_t
+        cdef CppVec3 mid_point
+        cdef int depth
+        self.stack_points.push_back(end_point)
+        self.stack_depth.push_back(0)
+        self.stack_t.push_back(end_t)
+        while not self.stack_t.empty():
+            end_point = self.stack_points.back()
+            depth = self.stack_depth.back()
+            end_t = self.stack_t.back()
+            mid_t = (start_t + end_t) * 0.5
+            mid_point = self.curve.point(mid_t)
+            if depth >= MAX_FLATTENING_DEPTH or mid_point.distance(
+                    start_point.lerp(end_point, 0.5)) < self.distance:
+                self.points.push_back(end_point)
+                start_point = end_point
+                start_t = end_t
+                self.stack_points.pop_back()
+                self.stack_depth.pop_back()
+                self.stack_t.pop_back()
+            else:
+                # subdivide into [start, mid] and [mid, end]:
+                depth += 1
+                self.stack_depth[self.stack_depth.size() - 1] = depth
+                self.stack_points.push_back(mid_point)
+                self.stack_depth.push_back(depth)
+                self.stack_t.push_back(mid_t)
 
 DEF DEFAULT_TANGENT_FACTOR = 4.0 / 3.0  # 1.333333333333333333
 DEF OPTIMIZED_TANGENT_FACTOR = 1.3324407374108935
@@ -0,0 +1,456 @@
+# cython: language_level=3
+# distutils: language = c++
+# Copyright (c) 2021, Manfred Moitzi
+# License: MIT License
+import cython
+from cpython cimport array
+import array
+from libc.math cimport sqrt
+from libcpp.vector cimport vector
+from libcpp.algorithm cimport sort, unique
+from .vector cimport isclose
+
+__all__ = [
+    'flatten_bspline', 'bspline_points', 'bspline_derivatives',
+    'basis_functions',
+]
+
+DEF ABS_TOL = 1e-12
+# Each subdivision level reduces the flattening error by about 1/4, the
+# depth limit stops endless subdivision for a distance below the precision
+# of the curve points:
+DEF MAX_FLATTENING_DEPTH = 16
+
+cdef struct Point:
+    double x, y, z
+
+cdef class _Basis:
+    """ B-spline basis functions by the same algorithms as the Python
+    implementation in ezdxf.math.bspline.Basis.
+    """
+    cdef const double[:] knots
+    cdef const double[:] weights
+    cdef Py_ssize_t order, count, degree
+    cdef double max_t
+    cdef bint is_rational
+    cdef bint binary_search
+    # knot span of the previous evaluation:
+    cdef Py_ssize_t span
+    # basis function values of the last evaluation:
+    cdef vector[double] N, left, right
+    # basis function derivatives of the last evaluation, order values for
+    # each derivative:
+    cdef vector[double] ders, ndu, a
+
+    def __cinit__(self, const double[:] knots, const double[:] weights,
+                  int order, Py_ssize_t count):
+        self.knots = knots
+        self.weights = weights
+        self.order = order
+        self.degree = order - 1
+        self.count = count
+        if order < 1 or count < order:
+            raise ValueError('invalid count of control points')
+        if knots.shape[0] != count + order:
+            raise ValueError('invalid count of knot values')
+        self.is_rational = weights.shape[0] > 0
+        if self.is_rational and weights.shape[0] != count:
+            raise ValueError('invalid count of weights')
+        self.max_t = knots[knots.shape[0] - 1]
+        # same condition as Basis.find_span():
+        self.binary_search = knots[self.degree] == 0.0
+        self.span = -1
+        self.N.resize(order)
+        self.left.resize(order)
+        self.right.resize(order)
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef bint is_span(self, Py_ssize_t span, double u):
+        return self.knots[span] <= u and (
+                span + 1 == self.count or u < self.knots[span + 1])
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef Py_ssize_t find_span(self, double u):
+        cdef const double[:] knots = self.knots
+        cdef Py_ssize_t span = self.span, lo, hi, mid
+        if self.binary_search:
+            # Subdivision and sorted parameter vectors evaluate many points
+            # in the same or in the next knot span:
+            if span >= self.degree:
+                if self.is_span(span, u):
+                    return span
+                if span + 1 < self.count and self.is_span(span + 1, u):
+                    self.span = span + 1
+                    return span + 1
+        # bisect.bisect_right(knots, u, p, count) - 1
+            lo = self.degree
+            hi = self.count
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if u < knots[mid]:
+                    hi = mid
+                else:
+                    lo = mid + 1
+            span = lo - 1
+        else:  # linear search
+            span = self.count - 1
+            for lo in range(self.count):
+                if knots[lo] > u:
+                    span = lo - 1
+                    break
+        self.span = span
+        return span
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef Py_ssize_t basis_funcs(self, double u) except -1:
+        # Source: The NURBS Book: Algorithm A2.2
+        # Stores the (weighted) basis function values in N and returns the
+        # knot span.
+        cdef const double[:] knots = self.knots
+        cdef double *N = self.N.data()
+        cdef double *left = self.left.data()
+        cdef double *right = self.right.data()
+        cdef Py_ssize_t p = self.degree, span, j, r
+        cdef double saved, temp, s
+
+        span = self.find_span(u)
+        if span < p:
+            raise ValueError('invalid knot vector')
+        N[0] = 1.0
+        for j in range(1, p + 1):
+            left[j] = u - knots[span + 1 - j]
+            right[j] = knots[span + j] - u
+            saved = 0.0
+            for r in range(j):
+                temp = N[r] / (right[r + 1] + left[j - r])
+                N[r] = saved + right[r + 1] * temp
+                saved = left[j - r] * temp
+            N[j] = saved
+        if self.is_rational:
+            s = 0.0
+            for j in range(p + 1):
+                N[j] *= self.weights[span - p + j]
+                s += N[j]
+            for j in range(p + 1):
+                N[j] = 0.0 if s == 0.0 else N[j] / s
+        return span
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef Py_ssize_t basis_funcs_derivatives(self, double u,
+                                            Py_ssize_t n) except -1:
+        # Source: The NURBS Book: Algorithm A2.3
+        # Stores the unweighted basis function derivatives up to n <= degree
+        # in ders and returns the knot span.
+        cdef const double[:] knots = self.knots
+        cdef Py_ssize_t order = self.order, p = self.degree
+        cdef Py_ssize_t span, j, r, k, s1, s2, rk, pk, j1, j2
+        cdef double saved, temp, d, factor
+        cdef double *left
+        cdef double *right
+        cdef double *ndu
+        cdef double *a
+        cdef double *ders
+
+        span = self.find_span(u)
+        if span < p:
+            raise ValueError('invalid knot vector')
+        if self.ndu.size() != <size_t> (order * order):
+            self.ndu.resize(order * order)
+            self.a.resize(2 * order)
+            self.ders.resize(order * order)
+        left = self.left.data()
+        right = self.right.data()
+        ndu = self.ndu.data()  # ndu[j][r] = ndu[j * order + r]
+        a = self.a.data()  # a[s][j] = a[s * order + j]
+        ders = self.ders.data()  # ders[k][j] = ders[k * order + j]
+
+        ndu[0] = 1.0
+        for j in range(1, order):
+            left[j] = u - knots[span + 1 - j]
+            right[j] = knots[span + j] - u
+            saved = 0.0
+            for r in range(j):
+                # lower triangle
+                ndu[j * order + r] = right[r + 1] + left[j - r]
+                temp = ndu[r * order + j - 1] / ndu[j * order + r]
+                # upper triangle
+                ndu[r * order + j] = saved + right[r + 1] * temp
+                saved = left[j - r] * temp
+            ndu[j * order + j] = saved
+
+        for j in range(order):
+            ders[j] = ndu[j * order + p]
+
+        for r in range(order):
+            s1 = 0
+            s2 = order
+            a[0] = 1.0
+            for k in range(1, n + 1):
+                d = 0.0
+                rk = r - k
+                pk = p - k
+                if r >= k:
+                    a[s2] = a[s1] / ndu[(pk + 1) * order + rk]
+                    d = a[s2] * ndu[rk * order + pk]
+                j1 = 1 if rk >= -1 else -rk
+                j2 = k - 1 if r - 1 <= pk else p - r
+                for j in range(j1, j2 + 1):
+                    a[s2 + j] = (a[s1 + j] - a[s1 + j - 1]) / \
+                                ndu[(pk + 1) * order + rk + j]
+                    d += a[s2 + j] * ndu[(rk + j) * order + pk]
+                if r <= pk:
+                    a[s2 + k] = -a[s1 + k - 1] / ndu[(pk + 1) * order + r]
+                    d += a[s2 + k] * ndu[r * order + pk]
+                ders[k * order + r] = d
+                s1, s2 = s2, s1
+
+        factor = <double> p
+        for k in range(1, n + 1):
+            for j in range(order):
+                ders[k * order + j] *= factor
+            factor *= p - k
+        return span
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef Point curve_point(self, double u, const double[:] cp) except *:
+        # Source: The NURBS Book: Algorithm A3.1
+        cdef double *N = self.N.data()
+        cdef Py_ssize_t p = self.degree, span, j, index
+        cdef Point result
+
+        if isclose(u, self.max_t, 0.0):
+            u = self.max_t
+        span = self.basis_funcs(u)
+        result.x = 0.0
+        result.y = 0.0
+        result.z = 0.0
+        for j in range(p + 1):
+            index = (span - p + j) * 3
+            result.x += N[j] * cp[index]
+            result.y += N[j] * cp[index + 1]
+            result.z += N[j] * cp[index + 2]
+        return result
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef int curve_derivatives(self, double u, const double[:] cp,
+                               Py_ssize_t n, double *result) except -1:
+        # Source: The NURBS Book: Algorithm A3.2 and A4.2
+        # Stores n + 1 vectors as x, y, z coordinates in result.
+        cdef double *ders
+        cdef Py_ssize_t order = self.order, p = self.degree
+        cdef Py_ssize_t span, j, k, i, index
+        cdef double f, w, x, y, z
+        cdef vector[double] wders
+        cdef vector[double] binomial
+
+        if isclose(u, self.max_t, 0.0):
+            u = self.max_t
+        span = self.basis_funcs_derivatives(u, n)
+        ders = self.ders.data()
+        for k in range(n + 1):
+            x = 0.0
+            y = 0.0
+            z = 0.0
+            w = 0.0
+            for j in range(order):
+                index = span - p + j
+                f = ders[k * order + j]
+                if self.is_rational:
+                    # homogeneous coordinates (x*w, y*w, z*w, w)
+                    f *= self.weights[index]
+                    w += f
+                index *= 3
+                x += f * cp[index]
+                y += f * cp[index + 1]
+                z += f * cp[index + 2]
+            result[k * 3] = x
+            result[k * 3 + 1] = y
+            result[k * 3 + 2] = z
+            if self.is_rational:
+                wders.push_back(w)
+        if not self.is_rational:
+            return 0
+
+        # Pascal's triangle row k: binomial[i] = binomial_coefficient(k, i)
+        binomial.resize(n + 1)
+        binomial[0] = 1.0
+        for k in range(n + 1):
+            if k:
+                for i in range(k, 0, -1):
+                    binomial[i] += binomial[i - 1]
+            for i in range(1, k + 1):
+                f = binomial[i] * wders[i]
+                result[k * 3] -= f * result[(k - i) * 3]
+                result[k * 3 + 1] -= f * result[(k - i) * 3 + 1]
+                result[k * 3 + 2] -= f * result[(k - i) * 3 + 2]
+            result[k * 3] /= wders[0]
+            result[k * 3 + 1] /= wders[0]
+            result[k * 3 + 2] /= wders[0]
+        return 0
+
+cdef Py_ssize_t control_point_count(const double[:] control_points) except -1:
+    if control_points.shape[0] % 3:
+        raise ValueError('invalid control point buffer')
+    return control_points.shape[0] // 3
+
+def bspline_points(const double[:] knots, const double[:] control_points,
+                   const double[:] weights, int order,
+                   const double[:] t) -> array.array:
+    """ Returns the B-spline curve points for all parameters of the
+    parameter vector `t` as flat ``array('d')`` of x, y, z coordinates,
+    the control points are passed as flat array of x, y, z coordinates and
+    `weights` is an empty array for non-rational B-splines.
+    """
+    cdef _Basis basis = _Basis(knots, weights, order,
+                               control_point_count(control_points))
+    cdef Py_ssize_t size = t.shape[0], index
+    cdef array.array result = array.clone(array.array('d'), size * 3,
+                                          zero=False)
+    cdef double *r = result.data.as_doubles
+    cdef Point point
+    for index in range(size):
+        point = basis.curve_point(t[index], control_points)
+        r[index * 3] = point.x
+        r[index * 3 + 1] = point.y
+        r[index * 3 + 2] = point.z
+    return result
+
+def bspline_derivatives(const double[:] knots, const double[:] control_points,
+                        const double[:] weights, int order,
+                        const double[:] t, int n) -> array.array:
+    """ Returns the B-spline curve point and the derivatives up to `n` for
+    all parameters of the parameter vector `t` as flat ``array('d')`` of
+    x, y, z coordinates, n + 1 vectors for each parameter.
+    """
+    cdef _Basis basis = _Basis(knots, weights, order,
+                               control_point_count(control_points))
+    cdef Py_ssize_t size = t.shape[0], index, stride = (n + 1) * 3
+    cdef array.array result
+    if n < 0 or n >= order:
+        raise ValueError(f'invalid derivative {n} for degree {order - 1}')
+    result = array.clone(array.array('d'), size * stride, zero=False)
+    for index in range(size):
+        basis.curve_derivatives(
+            t[index], control_points, n,
+            result.data.as_doubles + index * stride)
+    return result
+
+def basis_functions(const double[:] knots, const double[:] weights, int order,
+                    int count, const double[:] t) -> tuple:
+    """ Returns the non-zero basis function values for all parameters of the
+    parameter vector `t` as sparse matrix rows: the index of the first
+    non-zero column of each row as ``array('i')`` and `order` values for
+    each row as flat ``array('d')``.
+    """
+    cdef _Basis basis = _Basis(knots, weights, order, count)
+    cdef Py_ssize_t size = t.shape[0], index, span, j
+    cdef Py_ssize_t p = basis.degree
+    cdef double *N = basis.N.data()
+    cdef array.array columns = array.clone(array.array('i'), size, zero=False)
+    cdef array.array values = array.clone(array.array('d'), size * order,
+                                          zero=False)
+    cdef double *v = values.data.as_doubles
+    for index in range(size):
+        span = basis.basis_funcs(t[index])
+        columns.data.as_ints[index] = span - p
+        for j in range(order):
+            v[index * order + j] = N[j]
+    return columns, values
+
+cdef double distance_point_chord(Point m, Point s, Point e):
+    # Same calculation as distance_point_line_3d(), returns the distance to
+    # the start point for a degenerated chord:
+    cdef double v1x = m.x - s.x, v1y = m.y - s.y, v1z = m.z - s.z
+    cdef double dx = e.x - s.x, dy = e.y - s.y, dz = e.z - s.z
+    cdef double f, dot, px, py, pz, d
+    if isclose(s.x, e.x, ABS_TOL) and isclose(s.y, e.y, ABS_TOL) and \
+            isclose(s.z, e.z, ABS_TOL):
+        return sqrt(v1x * v1x + v1y * v1y + v1z * v1z)
+    f = 1.0 / sqrt(dx * dx + dy * dy + dz * dz)
+    dx *= f
+    dy *= f
+    dz *= f
+    dot = dx * v1x + dy * v1y + dz * v1z
+    px = dx * dot
+    py = dy * dot
+    pz = dz * dot
+    d = (v1x * v1x + v1y * v1y + v1z * v1z) - (px * px + py * py + pz * pz)
+    return sqrt(d) if d > 0.0 else 0.0
+
+cdef struct Pending:  # end point of a pending subdivision segment
+    Point point
+    double t
+    int depth
+
+cdef void push_point(vector[double] &result, Point p):
+    result.push_back(p.x)
+    result.push_back(p.y)
+    result.push_back(p.z)
+
+def flatten_bspline(const double[:] knots, const double[:] control_points,
+                    const double[:] weights, int order, double distance,
+                    int segments) -> array.array:
+    """ Returns the adaptive flattening of a B-spline as flat ``array('d')``
+    of x, y, z coordinates, the control points are passed as flat array of
+    x, y, z coordinates and `weights` is an empty array for non-rational
+    B-splines.
+    """
+    cdef _Basis curve = _Basis(knots, weights, order,
+                               control_point_count(control_points))
+    cdef vector[double] unique_knots
+    cdef vector[double] result
+    cdef vector[Pending] stack
+    cdef Pending pending
+    cdef Point start_point, end_point, mid_point
+    cdef double t = 0.0, t1, delta, next_t, mid_t
+    cdef Py_ssize_t index, count
+    cdef array.array vertices
+
+    if segments < 1:
+        raise ValueError(segments)
+    for index in range(knots.shape[0]):
+        unique_knots.push_back(knots[index])
+    sort(unique_knots.begin(), unique_knots.end())
+    unique_knots.erase(
+        unique(unique_knots.begin(), unique_knots.end()), unique_knots.end())
+
+    start_point = curve.curve_point(t, control_points)
+    push_point(result, start_point)
+    for index in range(1, unique_knots.size()):
+        t1 = unique_knots[index]
+        delta = (t1 - t) / segments
+        while t < t1:
+            next_t = t + delta
+            if isclose(next_t, t1, 0.0):
+                next_t = t1
+            end_point = curve.curve_point(next_t, control_points)
+            # Iterative implementation of the adaptive recursive subdivision,
+            # the stack contains the pending end points:
+            stack.push_back(Pending(end_point, next_t, 0))
+            while not stack.empty():
+                pending = stack.back()
+                mid_t = (t + pending.t) * 0.5
+                mid_point = curve.curve_point(mid_t, control_points)
+                if pending.depth >= MAX_FLATTENING_DEPTH or \
+                        distance_point_chord(mid_point, start_point,
+                                             pending.point) < distance:
+                    push_point(result, pending.point)
+                    start_point = pending.point
+                    t = pending.t
+                    stack.pop_back()
+                else:  # subdivide into [start, mid] and [mid, end]
+                    stack[stack.size() - 1].depth = pending.depth + 1
+                    stack.push_back(
+                        Pending(mid_point, mid_t, pending.depth + 1))
+
+    count = result.size()
+    vertices = array.clone(array.array('d'), count, zero=False)
+    for index in range(count):
+        vertices.data.as_doubles[index] = result[index]
+    return vertices
@@ -0,0 +1,151 @@
+# cython: language_level=3
+# distutils: language = c++
+# Copyright (c) 2021, Manfred Moitzi
+# License: MIT License
+import cython
+from cpython cimport array
+import array
+from libc.math cimport ceil, sqrt
+
+DEF LINE_TO = 1
+DEF CURVE3_TO = 2
+DEF CURVE4_TO = 3
+
+cdef inline Py_ssize_t segment_count(double distance, Py_ssize_t segments,
+                                     double ddx, double ddy, double ddz,
+                                     double factor) nogil:
+    # Wang's formula, see Python implementation in ezdxf.render.compactpath
+    cdef Py_ssize_t count = <Py_ssize_t> ceil(
+        sqrt(factor * sqrt(ddx * ddx + ddy * ddy + ddz * ddz) / distance))
+    if count < segments:
+        count = segments
+    if count < 1:
+        count = 1
+    return count
+
+cdef inline Py_ssize_t curve3_segment_count(
+        const double *v, double distance, Py_ssize_t segments) nogil:
+    return segment_count(
+        distance, segments, v[0] - 2.0 * v[3] + v[6],
+        v[1] - 2.0 * v[4] + v[7], v[2] - 2.0 * v[5] + v[8], 0.25)
+
+cdef inline Py_ssize_t curve4_segment_count(
+        const double *v, double distance, Py_ssize_t segments) nogil:
+    cdef double ddx1 = v[0] - 2.0 * v[3] + v[6]
+    cdef double ddy1 = v[1] - 2.0 * v[4] + v[7]
+    cdef double ddz1 = v[2] - 2.0 * v[5] + v[8]
+    cdef double ddx2 = v[3] - 2.0 * v[6] + v[9]
+    cdef double ddy2 = v[4] - 2.0 * v[7] + v[10]
+    cdef double ddz2 = v[5] - 2.0 * v[8] + v[11]
+    if (ddx1 * ddx1 + ddy1 * ddy1 + ddz1 * ddz1 >
+            ddx2 * ddx2 + ddy2 * ddy2 + ddz2 * ddz2):
+        return segment_count(distance, segments, ddx1, ddy1, ddz1, 0.75)
+    return segment_count(distance, segments, ddx2, ddy2, ddz2, 0.75)
+
+@cython.boundscheck(False)  # vertex buffer is validated in advance
+@cython.wraparound(False)
+def flatten_path(const unsigned char[:] commands, const double[:] vertices,
+                 double distance, Py_ssize_t segments) -> array.array:
+    cdef array.array result = array.array('d')
+    cdef Py_ssize_t size = commands.shape[0]
+    cdef Py_ssize_t count = vertices.shape[0]
+    cdef Py_ssize_t index = 3, point_count = 1, i, n, n_index, out
+    cdef unsigned char cmd
+    cdef double *r
+    cdef const double *v
+    cdef double t, _t, b0, b1, b2, b3
+
+    if size == 0:
+        return result
+    if count < 3:
+        raise ValueError('invalid vertex buffer')
+
+    # First pass: validation of the commands and count of output vertices.
+    for i in range(size):
+        cmd = commands[i]
+        if cmd == LINE_TO:
+            n = 1
+            index += 3
+        elif cmd == CURVE3_TO:
+            if index + 6 > count:
+                raise ValueError('invalid vertex buffer')
+            v = &vertices[index - 3]
+            n = segments
+            if distance > 0.0:
+                n = curve3_segment_count(v, distance, segments)
+            index += 6
+        elif cmd == CURVE4_TO:
+            if index + 9 > count:
+                raise ValueError('invalid vertex buffer')
+            v = &vertices[index - 3]
+            n = segments
+            if distance > 0.0:
+                n = curve4_segment_count(v, distance, segments)
+            index += 9
+        else:
+            raise ValueError(f'Invalid command: {cmd}')
+        if index > count:  # validates LINE_TO
+            raise ValueError('invalid vertex buffer')
+        point_count += n if n > 0 else 1
+
+    array.resize(result, point_count * 3)
+    r = result.data.as_doubles
+    v = &vertices[0]
+    with nogil:
+        r[0] = v[0]
+        r[1] = v[1]
+        r[2] = v[2]
+        out = 3
+        index = 3
+        for i in range(size):
+            cmd = commands[i]
+            if cmd == LINE_TO:
+                r[out] = v[index]
+                r[out + 1] = v[index + 1]
+                r[out + 2] = v[index + 2]
+                out += 3
+                index += 3
+            elif cmd == CURVE3_TO:
+                v = &vertices[index - 3]
+                n = segments
+                if distance > 0.0:
+                    n = curve3_segment_count(v, distance, segments)
+                for n_index in range(1, n):
+                    t = <double> n_index / <double> n
+                    _t = 1.0 - t
+                    b0 = _t * _t
+                    b1 = 2.0 * t * _t
+                    b2 = t * t
+                    r[out] = b0 * v[0] + b1 * v[3] + b2 * v[6]
+                    r[out + 1] = b0 * v[1] + b1 * v[4] + b2 * v[7]
+                    r[out + 2] = b0 * v[2] + b1 * v[5] + b2 * v[8]
+                    out += 3
+                r[out] = v[6]
+                r[out + 1] = v[7]
+                r[out + 2] = v[8]
+                out += 3
+                v = &vertices[0]
+                index += 6
+            else:  # CURVE4_TO
+                v = &vertices[index - 3]
+                n = segments
+                if distance > 0.0:
+                    n = curve4_segment_count(v, distance, segments)
+                for n_index in range(1, n):
+                    t = <double> n_index / <double> n
+                    _t = 1.0 - t
+                    b0 = _t * _t * _t
+                    b1 = 3.0 * t * _t * _t
+                    b2 = 3.0 * t * t * _t
+                    b3 = t * t * t
+                    r[out] = b0 * v[0] + b1 * v[3] + b2 * v[6] + b3 * v[9]
+                    r[out + 1] = b0 * v[1] + b1 * v[4] + b2 * v[7] + b3 * v[10]
+                    r[out + 2] = b0 * v[2] + b1 * v[5] + b2 * v[8] + b3 * v[11]
+                    out += 3
+                r[out] = v[9]
+                r[out + 1] = v[10]
+                r[out + 2] = v[11]
+                out += 3
+                v = &vertices[0]
+                index += 9
+    return result
@@ -11,6 +11,8 @@ Vec3, v3_normalize, v3_isclose, v3_cross, v3_dot,
 from .vector import X_AXIS, Y_AXIS, Z_AXIS, NULLVEC
 
 from libc.math cimport fabs, sin, cos
+from cpython cimport array
+import array
 
 if TYPE_CHECKING:
     from ezdxf.eztypes import Vertex
@@ -32,6 +34,20 @@ cdef void set_floats(double *m, object values: Iterable[float]) except *:
     if i != 16:
         raise ValueError("invalid argument count")
 
+def float_array(values) -> array.array:
+    try:
+        view = memoryview(values)
+    except TypeError:
+        return array.array('d', values)
+    if view.format == 'd':
+        result = array.array('d')
+        result.frombytes(
+            view.cast('B') if view.c_contiguous else view.tobytes())
+        return result
+    if view.ndim == 1:
+        return array.array('d', view)
+    raise TypeError('multi dimensional buffers require the format "d"')
+
 cdef class Matrix44:
     def __cinit__(self, *args):
         cdef int nargs = len(args)
@@ -539,6 +555,26 @@ cdef class Matrix44:
             res.z = x * m[2] + y * m[6] + z * m[10] + m[14]
             yield res
 
+    def transform_array(self, values) -> array.array:
+        cdef array.array result = float_array(values)
+        cdef Py_ssize_t count = len(result)
+        cdef Py_ssize_t index
+        cdef double *v = result.data.as_doubles
+        cdef double *m = self.m
+        cdef double x, y, z
+
+        if count % 3:
+            raise ValueError('array size has to be a multiple of 3')
+        with nogil:
+            for index in range(0, count, 3):
+                x = v[index]
+                y = v[index + 1]
+                z = v[index + 2]
+                v[index] = x * m[0] + y * m[4] + z * m[8] + m[12]
+                v[index + 1] = x * m[1] + y * m[5] + z * m[9] + m[13]
+                v[index + 2] = x * m[2] + y * m[6] + z * m[10] + m[14]
+        return result
+
     def transform_directions(self, vectors: Iterable['Vertex'],
                              normalize=False) -> Iterable[Vec3]:
         cdef double *m = self.m
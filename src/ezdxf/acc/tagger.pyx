@@ -0,0 +1,195 @@
+# cython: language_level=3
+# distutils: language = c++
+# Copyright (c) 2021, Manfred Moitzi
+# License: MIT License
+from typing import Iterable, Iterator
+from ezdxf.lldxf.types import (
+    DXFTag, DXFVertex, DXFBinaryTag, POINT_CODES, TYPE_TABLE, BINARY_DATA,
+    NONE_TAG,
+)
+from ezdxf.lldxf.const import DXFStructureError
+
+DEF MAX_GROUP_CODE = 1071
+
+# Value types of group codes:
+DEF STR_TYPE = 0
+DEF INT_TYPE = 1
+DEF FLOAT_TYPE = 2
+DEF POINT_TYPE = 3
+DEF BINARY_TYPE = 4
+
+# Replaces the set and dict lookups of the Python implementation by a C array
+# lookup:
+cdef unsigned char GROUP_CODE_TYPES[MAX_GROUP_CODE + 1]
+
+cdef void setup_group_code_types():
+    cdef int code
+    for code in range(MAX_GROUP_CODE + 1):
+        GROUP_CODE_TYPES[code] = STR_TYPE
+    for code, caster in TYPE_TABLE.items():
+        if 0 <= code <= MAX_GROUP_CODE:
+            GROUP_CODE_TYPES[code] = INT_TYPE if caster is int else FLOAT_TYPE
+    # Point and binary codes have priority over the TYPE_TABLE:
+    for code in POINT_CODES:
+        GROUP_CODE_TYPES[code] = POINT_TYPE
+    for code in BINARY_DATA:
+        GROUP_CODE_TYPES[code] = BINARY_TYPE
+
+setup_group_code_types()
+
+cdef inline int group_code_type(long code):
+    if 0 <= code <= MAX_GROUP_CODE:
+        return GROUP_CODE_TYPES[code]
+    return STR_TYPE
+
+cdef object cast_value(int type_, object value):
+    if type_ == FLOAT_TYPE:
+        return float(value)
+    elif type_ == INT_TYPE:
+        return int(value)
+    return value
+
+def internal_tag_compiler(str s) -> Iterable[DXFTag]:
+    """ Yields DXFTag() from trusted (internal) source - relies on
+    well formed and error free DXF format. Does not skip comment
+    tags (group code == 999).
+
+    Args:
+        s: DXF unicode string, lines separated by universal line endings '\n'
+
+    """
+    cdef list lines = s.split('\n')
+    cdef Py_ssize_t pos = 0
+    cdef Py_ssize_t count
+    cdef long code, z_code
+    cdef int type_
+    cdef object value, y, z
+    # split() creates an extra item, if s ends with '\n',
+    # but lines[-1] can be an empty string!!!
+    if s.endswith('\n'):
+        lines.pop()
+    count = len(lines)
+    while pos < count:
+        code = int(lines[pos])
+        value = lines[pos + 1]
+        pos += 2
+        type_ = group_code_type(code)
+        if type_ == POINT_TYPE:
+            # next tag; y-axis is mandatory - internal_tag_compiler relies on
+            # well formed DXF strings:
+            y = lines[pos + 1]
+            pos += 2
+            if pos < count:
+                # next tag; z coordinate just for 3d points
+                z_code = int(lines[pos])
+                z = lines[pos + 1]
+            else:  # if string s ends with a 2d point
+                z_code = -1
+                z = 0.
+            if z_code == code + 20:  # 3d point
+                pos += 2
+                point = (float(value), float(y), float(z))
+            else:  # 2d point
+                point = (float(value), float(y))
+            yield DXFVertex(code, point)  # 2d/3d point
+        elif type_ == BINARY_TYPE:
+            yield DXFBinaryTag.from_string(code, value)
+        else:  # single value tag: int, float or string
+            yield DXFTag(code, cast_value(type_, value))
+
+def tag_compiler(tags: Iterator[DXFTag]) -> Iterable[DXFTag]:
+    """ Compiles DXF tag values imported by ascii_tags_loader() into Python
+    types, same behavior as the Python implementation
+    :func:`ezdxf.lldxf.tagger.tag_compiler`.
+
+    Args:
+        tags: DXF tag generator e.g. ascii_tags_loader()
+
+    Raises:
+        DXFStructureError: Found invalid DXF tag or unexpected coordinate order.
+
+    """
+    cdef long code
+    cdef int type_
+    cdef Py_ssize_t line = 0
+    cdef object x, y, z, value, point
+    cdef object undo_tag = None
+    _DXFVertex = DXFVertex
+    while True:
+        try:
+            if undo_tag is not None:
+                x = undo_tag
+                undo_tag = None
+            else:
+                x = next(tags)
+                line += 2
+            code = x.code
+            type_ = group_code_type(code)
+            if type_ == POINT_TYPE:
+                if type(x) is _DXFVertex:
+                    # Assembled by bulk_ascii_tags_loader():
+                    yield x
+                    continue
+                # y-axis is mandatory
+                y = next(tags)
+                line += 2
+                if y.code != code + 10:  # like 20 for base x-code 10
+                    raise DXFStructureError(
+                        f"Missing required y coordinate near line: {line}.")
+                # z-axis just for 3d points, the tag stream can end with
+                # a 2d point:
+                z = next(tags, NONE_TAG)
+                line += 2
+                try:
+                    # z-axis like (30, 0.0) for base x-code 10
+                    if z.code == code + 20:
+                        point = (float(x.value), float(y.value), float(z.value))
+                    else:
+                        point = (float(x.value), float(y.value))
+                        if z is not NONE_TAG:
+                            undo_tag = z
+                except ValueError:
+                    raise DXFStructureError(
+                        f'Invalid floating point values near line: {line}.')
+                yield _DXFVertex(code, point)
+            elif type_ == BINARY_TYPE:
+                # Maybe pre compiled in low level tagger (binary DXF):
+                if isinstance(x, DXFBinaryTag):
+                    yield x
+                else:
+                    try:
+                        tag = DXFBinaryTag.from_string(code, x.value)
+                    except ValueError:
+                        raise DXFStructureError(
+                            f'Invalid binary data near line: {line}.')
+                    yield tag
+            else:  # Just a single tag
+                value = x.value
+                if type(value) is not str:
+                    # Pre-typed value by bulk_ascii_tags_loader() or
+                    # binary_tags_loader(), just for int and float group codes
+                    yield x
+                    continue
+                if type_ == STR_TYPE:
+                    if code == 0:
+                        value = value.strip()
+                    yield DXFTag(code, value)
+                    continue
+                try:
+                    value = cast_value(type_, value)
+                except ValueError:
+                    # ProE stores int values as floats :((
+                    if type_ == INT_TYPE:
+                        try:
+                            value = int(float(value))
+                        except ValueError:
+                            raise DXFStructureError(error_msg(x, line))
+                    else:
+                        raise DXFStructureError(error_msg(x, line))
+                yield DXFTag(code, value)
+        except StopIteration:
+            return
+
+cdef str error_msg(tag, Py_ssize_t line):
+    return f'Invalid tag (code={tag.code}, value="{tag.value}") ' \
+           f'near line: {line}.'
@@ -12,6 +12,7 @@ from ezdxf.render.path import Path
 
 if TYPE_CHECKING:
     from ezdxf.tools.fonts import FontFace, FontMeasurements
+    from ezdxf.addons.drawing.block_cache import BlockRecording
 
 # Some params are also used by the Frontend() which has access to the backend
 # attributes:
@@ -190,6 +191,24 @@ class Backend(ABC):
         """
         raise NotImplementedError
 
+    def draw_block_instance(self, recording: 'BlockRecording',
+                            m: Matrix44) -> None:
+        """ Draw a block reference by the graphic primitives of the block
+        definition recorded in block coordinates, `m` is the transformation
+        matrix from block coordinates into WCS.
+
+        The same `recording` object is passed for all block references of a
+        block definition with the same block reference properties, therefore
+        backends which support instancing of graphic items can use the
+        `recording` as key to create the graphic items only once and place
+        them by the transformation matrix `m` for each block reference.
+
+        The default implementation draws the transformed primitives by the
+        regular drawing methods of the backend.
+
+        """
+        recording.replay(self, m)
+
     @abstractmethod
     def get_font_measurements(self, cap_height: float,
                               font: 'FontFace' = None) -> 'FontMeasurements':
@@ -0,0 +1,203 @@
+#  Copyright (c) 2021, Manfred Moitzi
+#  License: MIT License
+from typing import TYPE_CHECKING, Iterable, List, Tuple, Any, Optional
+from ezdxf.math import Vec3, Matrix44
+from ezdxf.render.path import Path
+
+if TYPE_CHECKING:
+    from ezdxf.entities import DXFGraphic, Insert
+    from ezdxf.addons.drawing.backend import Backend
+    from ezdxf.addons.drawing.properties import Properties
+    from ezdxf.tools.fonts import FontFace, FontMeasurements
+
+__all__ = ['BlockRecording', 'BlockRecorder', 'is_cacheable_block_reference']
+
+# Entity stack of the block entities, relative to the block reference:
+EntityStack = Tuple[Tuple['DXFGraphic', 'Properties'], ...]
+
+POINT = 0
+LINE = 1
+PATH = 2
+FILLED_PATHS = 3
+FILLED_POLYGON = 4
+TEXT = 5
+
+
+class BlockRecording:
+    """ Backend-neutral graphic primitives of a block definition in block
+    coordinates, recorded by the :class:`BlockRecorder`.
+
+    The :class:`Frontend` renders each block definition only once for the
+    same block reference properties and replays the recorded primitives for
+    each block reference by :meth:`Backend.draw_block_instance`.
+
+    """
+    __slots__ = ('records',)
+
+    def __init__(self):
+        # (entity stack, primitive type, primitive data, properties)
+        self.records: List[Tuple[EntityStack, int, Any, 'Properties']] = []
+
+    def __len__(self) -> int:
+        """ Returns count of recorded primitives. """
+        return len(self.records)
+
+    def replay(self, backend: 'Backend', m: Matrix44) -> None:
+        """ Draw the recorded primitives transformed by the transformation
+        matrix `m` into the given `backend`, the block entities are entered
+        and exited at the `backend` like drawn by the :class:`Frontend`.
+
+        Args:
+            backend: drawing backend
+            m: transformation matrix from block coordinates into WCS
+
+        """
+        current: EntityStack = ()
+        for stack, primitive, data, properties in self.records:
+            if stack is not current:
+                _switch_entity_stack(backend, current, stack)
+                current = stack
+            if primitive == PATH:
+                backend.draw_path(data.transform(m), properties)
+            elif primitive == LINE:
+                backend.draw_line(m.transform(data[0]), m.transform(data[1]),
+                                  properties)
+            elif primitive == FILLED_POLYGON:
+                backend.draw_filled_polygon(
+                    m.transform_vertices(data), properties)
+            elif primitive == TEXT:
+                text, transform, cap_height = data
+                backend.draw_text(text, transform @ m, properties, cap_height)
+            elif primitive == FILLED_PATHS:
+                paths, holes = data
+                backend.draw_filled_paths(
+                    [p.transform(m) for p in paths],
+                    [h.transform(m) for h in holes],
+                    properties
+                )
+            elif primitive == POINT:
+                backend.draw_point(m.transform(data), properties)
+            else:
+                raise TypeError(primitive)
+        _switch_entity_stack(backend, current, ())
+
+
+def _switch_entity_stack(backend: 'Backend', current: EntityStack,
+                         stack: EntityStack) -> None:
+    common = 0
+    for (e1, _), (e2, _) in zip(current, stack):
+        if e1 is not e2:
+            break
+        common += 1
+    for entity, _ in reversed(current[common:]):
+        backend.exit_entity(entity)
+    for entity, properties in stack[common:]:
+        backend.enter_entity(entity, properties)
+
+
+class BlockRecorder:
+    """ Replaces the backend of the :class:`Frontend` while rendering a block
+    definition and records all graphic primitives as :class:`BlockRecording`.
+
+    Entering and exiting entities is recorded like the graphic primitives and
+    is replayed at the real `backend` only if the recording is used. The text
+    measurement methods of the real `backend` are called in the recorded
+    entity scope, all other attributes like the backend configuration are
+    provided by the real `backend`.
+
+    A drawing method of the :class:`Frontend`, which creates output depending
+    on the location or the scaling in WCS, has to set :attr:`is_cacheable`
+    to ``False``.
+
+    """
+
+    def __init__(self, backend: 'Backend'):
+        # Entity scope of a nested block recording, which is not entered at
+        # the real backend:
+        self._scope: EntityStack = ()
+        if isinstance(backend, BlockRecorder):
+            self._scope = backend._scope + backend._stack
+            backend = backend._backend
+        self._backend = backend
+        self._stack: EntityStack = ()
+        self.recording = BlockRecording()
+        self.is_cacheable = True
+
+    def __getattr__(self, name: str):
+        return getattr(self._backend, name)
+
+    @property
+    def current_entity(self) -> Optional['DXFGraphic']:
+        stack = self._scope + self._stack
+        return stack[-1][0] if stack else self._backend.current_entity
+
+    def enter_entity(self, entity: 'DXFGraphic',
+                     properties: 'Properties') -> None:
+        self._stack += ((entity, properties),)
+
+    def exit_entity(self, entity: 'DXFGraphic') -> None:
+        self._stack = self._stack[:-1]
+
+    def _call_in_entity_scope(self, method, *args, **kwargs):
+        # The real backend may use the current entity, without entering and
+        # exiting the entities at the real backend:
+        entity_stack = self._backend.entity_stack
+        size = len(entity_stack)
+        entity_stack.extend(self._scope + self._stack)
+        try:
+            return method(*args, **kwargs)
+        finally:
+            del entity_stack[size:]
+
+    def get_font_measurements(self, cap_height: float,
+                              font: 'FontFace' = None) -> 'FontMeasurements':
+        return self._call_in_entity_scope(
+            self._backend.get_font_measurements, cap_height, font=font)
+
+    def get_text_line_width(self, text: str, cap_height: float,
+                            font: 'FontFace' = None) -> float:
+        return self._call_in_entity_scope(
+            self._backend.get_text_line_width, text, cap_height, font=font)
+
+    def _record(self, primitive: int, data: Any,
+                properties: 'Properties') -> None:
+        self.recording.records.append(
+            (self._stack, primitive, data, properties))
+
+    def draw_point(self, pos: Vec3, properties: 'Properties') -> None:
+        self._record(POINT, Vec3(pos), properties)
+
+    def draw_line(self, start: Vec3, end: Vec3,
+                  properties: 'Properties') -> None:
+        self._record(LINE, (Vec3(start), Vec3(end)), properties)
+
+    def draw_path(self, path: Path, properties: 'Properties') -> None:
+        self._record(PATH, path, properties)
+
+    def draw_filled_paths(self, paths: Iterable[Path], holes: Iterable[Path],
+                          properties: 'Properties') -> None:
+        self._record(FILLED_PATHS, (list(paths), list(holes)), properties)
+
+    def draw_filled_polygon(self, points: Iterable[Vec3],
+                            properties: 'Properties') -> None:
+        self._record(FILLED_POLYGON, Vec3.list(points), properties)
+
+    def draw_text(self, text: str, transform: Matrix44,
+                  properties: 'Properties', cap_height: float) -> None:
+        self._record(TEXT, (text, transform, cap_height), properties)
+
+    def draw_block_instance(self, recording: BlockRecording,
+                            m: Matrix44) -> None:
+        # nested block reference:
+        recording.replay(self, m)
+
+
+def is_cacheable_block_reference(insert: 'Insert') -> bool:
+    """ Returns ``True`` if the block content of `insert` can be rendered in
+    block coordinates and transformed afterwards: requires a uniform and
+    positive scaling and the WCS z-axis as extrusion.
+    """
+    dxf = insert.dxf
+    scale = dxf.xscale
+    return (scale > 0.0 and scale == dxf.yscale == dxf.zscale and
+            Vec3(dxf.extrusion).isclose((0, 0, 1)))
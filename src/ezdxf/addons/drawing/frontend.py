@@ -2,9 +2,12 @@
 # Copyright (c) 2020, Matthew Broadway
 # License: MIT License
 import math
-from typing import Iterable, cast, Union, List, Dict, Callable
+from typing import Iterable, cast, Union, List, Dict, Callable, Optional, Tuple
 from ezdxf.lldxf import const
 from ezdxf.addons.drawing.backend import Backend
+from ezdxf.addons.drawing.block_cache import (
+    BlockRecording, BlockRecorder, is_cacheable_block_reference,
+)
 from ezdxf.addons.drawing.properties import (
     RenderContext, VIEWPORT_COLOR, Properties, set_color_alpha, Filling,
 )
@@ -78,6 +81,14 @@ class Frontend:
         # set to None to disable nested polygon detection:
         self.nested_polygon_detection = nesting.fast_bbox_detection
 
+        # Render cache of block definitions, each block definition is rendered
+        # only once for the same block reference properties and replayed for
+        # each block reference, see draw_composite_entity().
+        # Stores None for block definitions which can not be cached.
+        # Set to None to disable the render cache:
+        self.block_cache: Optional[
+            Dict[Tuple, Optional[BlockRecording]]] = dict()
+
         self._dispatch = self._build_dispatch_table()
 
     def _build_dispatch_table(self) -> Dict[
@@ -130,6 +141,9 @@ class Frontend:
 
     def draw_layout(self, layout: 'Layout', finalize: bool = True) -> None:
         self.parent_stack = []
+        if self.block_cache is not None:
+            # cached block definitions depend on the current layout
+            self.block_cache.clear()
         handle_mapping = list(layout.get_redraw_order())
         if handle_mapping:
             self.draw_entities(reorder.ascending(layout, handle_mapping))
@@ -185,6 +199,8 @@ class Frontend:
             self.out.draw_line(d.start, d.end, properties)
 
         elif dxftype in ('XLINE', 'RAY'):
+            # fixed length in drawing units, independent from block scaling:
+            self._disable_block_caching()
             start = d.start
             delta = d.unit_vector * INFINITE_LINE_LENGTH
             if dxftype == 'XLINE':
@@ -245,6 +261,8 @@ class Frontend:
         if pdmode == 0:
             self.out.draw_point(entity.dxf.location, properties)
         else:
+            # fixed point symbol size, independent from block scaling:
+            self._disable_block_caching()
             for entity in point.virtual_entities(pdsize, pdmode):
                 if entity.dxftype() == 'LINE':
                     start = Vec3(entity.dxf.start)
@@ -285,6 +303,10 @@ class Frontend:
         if not self.out.show_hatch:
             return
 
+        filling = properties.filling
+        if filling and filling.type != Filling.SOLID:
+            # pattern- and gradient angles are transformed by block references
+            self._disable_block_caching()
         hatch = cast(Hatch, entity)
         ocs = hatch.ocs()
         # all OCS coordinates have the same z-axis stored as vector (0, 0, z),
@@ -422,10 +444,17 @@ class Frontend:
 
         def draw_insert(insert: Insert):
             self.draw_entities(insert.attribs)
-            # draw_entities() includes the visibility check:
-            self.draw_entities(insert.virtual_entities(
-                skipped_entity_callback=self.skip_entity)
-            )
+            recording = None
+            if self.block_cache is not None and \
+                    is_cacheable_block_reference(insert):
+                recording = self._get_block_recording(insert, properties)
+            if recording is None:
+                # draw_entities() includes the visibility check:
+                self.draw_entities(insert.virtual_entities(
+                    skipped_entity_callback=self.skip_entity)
+                )
+            else:
+                self.out.draw_block_instance(recording, insert.matrix44())
 
         dxftype = entity.dxftype()
         if dxftype == 'INSERT':
@@ -444,6 +473,40 @@ class Frontend:
         else:
             raise TypeError(dxftype)
 
+    def _get_block_recording(
+            self, insert: Insert,
+            properties: Properties) -> Optional[BlockRecording]:
+        # The resolved properties of the block entities depend only on the
+        # block reference properties used by RenderContext.resolve_all():
+        key = (insert.dxf.name, properties.layer, properties.color,
+               properties.linetype_name, properties.linetype_pattern,
+               properties.lineweight)
+        try:
+            return self.block_cache[key]
+        except KeyError:
+            pass
+        block = insert.block()
+        if block is None:  # virtual_entities() raises the appropriate error
+            return None
+        recorder = BlockRecorder(self.out)
+        out = self.out
+        self.out = recorder
+        try:
+            # draw_entities() includes the visibility check, ATTDEF entities
+            # are not drawn for block references, see virtual_entities():
+            self.draw_entities(
+                e for e in block if e.dxftype() != 'ATTDEF')
+        finally:
+            self.out = out
+        recording = recorder.recording if recorder.is_cacheable else None
+        self.block_cache[key] = recording
+        return recording
+
+    def _disable_block_caching(self) -> None:
+        # Current output depends on the location or scaling in WCS:
+        if isinstance(self.out, BlockRecorder):
+            self.out.is_cacheable = False
+
     def draw_proxy_graphic(self, entity: DXFGraphic) -> None:
         if entity.proxy_graphic:
             gfx = ProxyGraphic(entity.proxy_graphic, entity.doc)
@@ -5,19 +5,25 @@ from typing import (
 )
 from io import StringIO
 from pathlib import Path
-from ezdxf.lldxf.const import DXFStructureError
+from array import array
+from collections import deque
+import mmap
+import pickle
+from ezdxf.lldxf.const import DXFStructureError, DXFValueError
 from ezdxf.lldxf.extendedtags import ExtendedTags, DXFTag
+from ezdxf.lldxf.tags import group_tags
 from ezdxf.lldxf.tagwriter import TagWriter
 from ezdxf.lldxf.tagger import tag_compiler, ascii_tags_loader
 from ezdxf.filemanagement import dxf_file_info
 from ezdxf.lldxf import fileindex
+from ezdxf.lldxf.loader import _unpickle
 
 from ezdxf.entities import DXFGraphic, DXFEntity
 from ezdxf.entities import factory
 from ezdxf.entities.subentity import entity_linker
 from ezdxf.tools.codepage import toencoding
 
-__all__ = ['opendxf', 'single_pass_modelspace', 'modelspace']
+__all__ = ['opendxf', 'single_pass_modelspace', 'modelspace', 'Extraction']
 
 SUPPORTED_TYPES = {
     'ARC', 'LINE', 'CIRCLE', 'ELLIPSE', 'POINT', 'LWPOLYLINE', 'SPLINE',
@@ -28,6 +34,80 @@ SUPPORTED_TYPES = {
 
 Filename = Union[Path, str]
 
+# Count of structure tags of the ENTITIES section processed as one job by a
+# worker process, see IterDXF.modelspace():
+ENTITIES_PER_JOB = 4096
+# Count of pending jobs per worker process, limits the memory usage of loaded
+# but not yet consumed entities:
+JOBS_PER_WORKER = 2
+# Group codes of x-coordinates, extracted as (x, y, z) triples:
+POINT_CODES = frozenset(range(10, 19))
+
+
+class Extraction:
+    """ Columnar data of DXF entities extracted by :meth:`IterDXF.extract`.
+
+    The values of a group code are stored in the order of the entities, the
+    :attr:`counts` of each group code store the count of occurrences for
+    each entity. Points are stored as (x, y, z) triples, z-axis is 0
+    if not present.
+
+    .. attribute:: dxftypes
+
+        List of DXF types, indexed by the :attr:`dxftype` ids.
+
+    .. attribute:: layers
+
+        List of layer names, indexed by the :attr:`layer` ids.
+
+    .. attribute:: dxftype
+
+        DXF type id of each entity as ``array('l')``.
+
+    .. attribute:: layer
+
+        Layer id of each entity as ``array('l')``.
+
+    .. attribute:: values
+
+        Values as ``array('d')`` for each group code.
+
+    .. attribute:: counts
+
+        Count of occurrences for each entity as ``array('l')`` for each
+        group code.
+
+    .. versionadded:: 0.15.2
+
+    """
+
+    def __init__(self, codes: Iterable[int]):
+        self.dxftypes: List[str] = []
+        self.layers: List[str] = []
+        self.dxftype = array('l')
+        self.layer = array('l')
+        self.values: Dict[int, array] = {code: array('d') for code in codes}
+        self.counts: Dict[int, array] = {
+            code: array('l') for code in self.values
+        }
+
+    def __len__(self) -> int:
+        """ Returns the count of extracted entities. """
+        return len(self.dxftype)
+
+    def offsets(self, code: int) -> array:
+        """ Returns the index of the first value of each entity in
+        :attr:`values` of group `code` as ``array('q')``, the index of
+        points refers to the first coordinate of the (x, y, z) triple.
+        """
+        size = 3 if code in POINT_CODES else 1
+        offsets = array('q')
+        offset = 0
+        for count in self.counts[code]:
+            offsets.append(offset)
+            offset += count * size
+        return offsets
+
 
 class IterDXF:
     """ Iterator for DXF entities stored in the modelspace.
@@ -40,20 +120,45 @@ class IterDXF:
             - "ignore" to use the replacement char U+FFFD "\ufffd" for invalid data
             - "strict" to raise an :class:`UnicodeDecodeError`exception  for invalid data
 
+        index: ``True`` to load the file index from the sidecar file
+            "<name>.dxfidx" if present and up to date, otherwise the file
+            index and the entity index are built and stored in the sidecar
+            file
+
     Raises:
         DXFStructureError: invalid or incomplete DXF file
         UnicodeDecodeError: if `errors` is "strict" and a decoding error occurs
 
+    .. versionadded:: 0.15.2
+
+        argument `index`
+
     """
 
-    def __init__(self, name: Filename, errors: str = 'surrogateescape'):
-        self.structure, self.sections = self._load_index(name)
+    def __init__(self, name: Filename, errors: str = 'surrogateescape',
+                 index: bool = False):
+        name = str(name)
+        content = fileindex.load_index(name) if index else None
+        if content is None:
+            self.structure, self.sections = self._load_index(name)
+            self._entity_index: Optional[fileindex.EntityIndex] = None
+        else:
+            self.structure, self.sections, self._entity_index = content
+            self.structure.filename = name
         self.errors = errors
         self.file: BinaryIO = open(name, mode='rb')
+        # read only memory map of the whole file for random access:
+        self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
         if 'ENTITIES' not in self.sections:
             raise DXFStructureError('ENTITIES section not found.')
         if self.structure.version > 'AC1009' and 'OBJECTS' not in self.sections:
             raise DXFStructureError('OBJECTS section not found.')
+        if index and content is None:
+            try:
+                fileindex.save_index(name, (
+                    self.structure, self.sections, self.entity_index))
+            except OSError:  # index is still usable without persistence
+                pass
 
     def _load_index(self, name: str) -> Tuple[
         fileindex.FileStructure, Dict[str, int]]:
@@ -73,6 +178,24 @@ class IterDXF:
     def encoding(self):
         return self.structure.encoding
 
+    @property
+    def entity_index(self) -> fileindex.EntityIndex:
+        """ :class:`~ezdxf.lldxf.fileindex.EntityIndex` of the ENTITIES
+        section, built at the first access if not loaded from the sidecar
+        file.
+
+        .. versionadded:: 0.15.2
+
+        """
+        if self._entity_index is None:
+            start = self.sections['ENTITIES'] + 1
+            end = self.structure.get(0, 'ENDSEC', start)
+            self._entity_index = fileindex.build_entity_index(
+                self.data, self.structure.index[start:end + 1],
+                self.encoding, self.errors,
+            )
+        return self._entity_index
+
     @property
     def dxfversion(self):
         return self.structure.version
@@ -91,9 +214,7 @@ class IterDXF:
         # Copy everything from start of source DXF until the first entity
         # of the ENTITIES section to the new DXF.
         location = self.structure.index[self.sections['ENTITIES'] + 1].location
-        self.file.seek(0)
-        data = self.file.read(location)
-        doc.write_data(data)
+        doc.write_data(self.data[:location])
         return doc
 
     def copy_objects_section(self, f: BinaryIO) -> None:
@@ -105,12 +226,10 @@ class IterDXF:
 
         start_location = self.structure.index[start_index].location
         end_location = self.structure.index[end_index + 1].location
-        count = end_location - start_location
-        self.file.seek(start_location)
-        data = self.file.read(count)
-        f.write(data)
+        f.write(self.data[start_location:end_location])
 
-    def modelspace(self, types: Iterable[str] = None) -> Iterable[DXFGraphic]:
+    def modelspace(self, types: Iterable[str] = None,
+                   workers: int = 0) -> Iterable[DXFGraphic]:
         """ Returns an iterator for all supported DXF entities in the
         modelspace. These entities are regular :class:`~ezdxf.entities.DXFGraphic`
         objects but without a valid document assigned. It is **not**
@@ -125,13 +244,25 @@ class IterDXF:
         Args:
             types: DXF types like ``['LINE', '3DFACE']`` which should be
                 returned, ``None`` returns all supported types.
+            workers: count of worker processes to load the entities, the
+                entities are returned in file order, values < 2 load
+                all entities in the calling process
+
+        .. versionadded:: 0.15.2
+
+            argument `workers`
 
         """
         linked_entity = entity_linker()
         queued = None
         requested_types = _requested_types(types)
-        for entity in self.load_entities(self.sections['ENTITIES'] + 1,
-                                         requested_types):
+        start = self.sections['ENTITIES'] + 1
+        if workers > 1:
+            entities = self.parallel_load_entities(
+                start, requested_types, workers)
+        else:
+            entities = self.load_entities(start, requested_types)
+        for entity in entities:
             if not linked_entity(entity) and entity.dxf.paperspace == 0:
                 # queue one entity for collecting linked entities:
                 # VERTEX, ATTRIB
@@ -141,6 +272,168 @@ class IterDXF:
         if queued:
             yield queued
 
+    def extract(self, types: Iterable[str],
+                fields: Iterable[int]) -> Extraction:
+        """ Extract the values of the group codes `fields` from the model
+        space entities of the given DXF `types` direct from the DXF file,
+        without creating :class:`~ezdxf.entities.DXFGraphic` objects.
+
+        Returns the data as columns of :class:`array.array` objects, which
+        can be converted into NumPy arrays without copying by
+        :func:`numpy.frombuffer`. Group codes 10 - 18 are extracted as
+        (x, y, z) triples, the group codes of the y- and z-axis are
+        collected automatically and can not be requested in the same
+        extraction.
+
+        All occurrences of the group codes in the entity tags are extracted,
+        except in application defined data. Sub-entities like VERTEX or
+        ATTRIB are separated entities and not part of their parent entity.
+
+        Args:
+            types: DXF types like ``['LINE', 'LWPOLYLINE']``
+            fields: group codes like ``[10, 11]`` for the start- and end
+                point of LINE entities
+
+        Raises:
+            DXFValueError: requested group code of the y- or z-axis of a
+                requested point
+
+        .. versionadded:: 0.15.2
+
+        """
+        extraction = Extraction(fields)
+        point_codes = {code for code in extraction.values
+                       if code in POINT_CODES}
+        y_codes = {code + 10: code for code in point_codes}
+        z_codes = {code + 20: code for code in point_codes}
+        values = extraction.values
+        for code in values:
+            point_code = y_codes.get(code, z_codes.get(code))
+            if point_code is not None:
+                raise DXFValueError(
+                    f'Group code {code} is part of the requested point '
+                    f'{point_code}.')
+        counts = extraction.counts
+        type_ids: Dict[str, int] = dict()
+        layer_ids: Dict[bytes, int] = dict()
+        requested_types = set(types)
+        data = self.data
+        index = self.structure.index
+        position = self.sections['ENTITIES'] + 1
+        entry = index[position]
+        while entry.value != 'ENDSEC':
+            position += 1
+            next_entry = index[position]
+            dxftype = entry.value
+            if dxftype not in requested_types:
+                entry = next_entry
+                continue
+            lines = data[entry.location:next_entry.location].split(b'\n')
+            entry = next_entry
+            entity_values: Dict[int, List[float]] = {
+                code: [] for code in values}
+            layer = b'0'
+            paperspace = 0
+            app_data = False
+            for line in range(2, len(lines) - 1, 2):
+                code = int(lines[line])
+                if code == 102:
+                    app_data = lines[line + 1].strip().startswith(b'{')
+                    continue
+                if app_data:
+                    continue
+                if code == 8:
+                    layer = lines[line + 1].rstrip(b'\r')
+                elif code == 67:
+                    paperspace = int(lines[line + 1])
+                elif code in entity_values:
+                    v = entity_values[code]
+                    if code in point_codes:
+                        v.extend((float(lines[line + 1]), 0.0, 0.0))
+                    else:
+                        v.append(float(lines[line + 1]))
+                elif code in y_codes:
+                    v = entity_values[y_codes[code]]
+                    if v:
+                        v[-2] = float(lines[line + 1])
+                elif code in z_codes:
+                    v = entity_values[z_codes[code]]
+                    if v:
+                        v[-1] = float(lines[line + 1])
+            if paperspace:
+                continue
+            try:
+                type_id = type_ids[dxftype]
+            except KeyError:
+                type_id = len(type_ids)
+                type_ids[dxftype] = type_id
+            try:
+                layer_id = layer_ids[layer]
+            except KeyError:
+                layer_id = len(layer_ids)
+                layer_ids[layer] = layer_id
+            extraction.dxftype.append(type_id)
+            extraction.layer.append(layer_id)
+            for code, v in entity_values.items():
+                values[code].extend(v)
+                counts[code].append(
+                    len(v) // 3 if code in point_codes else len(v))
+
+        extraction.dxftypes = list(type_ids)
+        extraction.layers = [
+            layer.decode(self.encoding, errors=self.errors)
+            for layer in layer_ids
+        ]
+        return extraction
+
+    def get(self, handle: str) -> Optional[DXFGraphic]:
+        """ Returns the supported DXF entity `handle` of the ENTITIES section
+        or ``None`` if `handle` does not exist. Loads only this entity and
+        its linked sub-entities like VERTEX or ATTRIB by the
+        :attr:`entity_index`.
+
+        .. versionadded:: 0.15.2
+
+        """
+        entity_index = self.entity_index
+        index = entity_index.find(handle)
+        if index < 0 or entity_index.dxftypes[index] not in SUPPORTED_TYPES:
+            return None
+        return self._load_indexed_entity(index)
+
+    def query(self, types: Iterable[str] = None,
+              layers: Iterable[str] = None) -> Iterable[DXFGraphic]:
+        """ Returns an iterator for all supported DXF entities in the
+        modelspace matching the DXF `types` and `layers`. Loads only the
+        matching entities by the :attr:`entity_index`, all other entities
+        are skipped without reading them.
+
+        Args:
+            types: DXF types like ``['LINE', '3DFACE']`` which should be
+                returned, ``None`` returns all supported types.
+            layers: layer names, case insensitive, ``None`` returns
+                entities of all layers.
+
+        .. versionadded:: 0.15.2
+
+        """
+        requested_types = _requested_types(types)
+        for index in self.entity_index.select(requested_types, layers):
+            yield self._load_indexed_entity(index)
+
+    def _load_indexed_entity(self, index: int) -> DXFGraphic:
+        entity_index = self.entity_index
+        data = self.data[entity_index.starts[index]:entity_index.ends[index]]
+        text = data.decode(
+            self.encoding, errors=self.errors).replace('\r\n', '\n')
+        linked_entity = entity_linker()
+        entity = None
+        for tags in group_tags(tag_compiler(ascii_tags_loader(StringIO(text)))):
+            sub_entity = factory.load(ExtendedTags(tags))
+            if not linked_entity(sub_entity):
+                entity = sub_entity
+        return entity
+
     def load_entities(self, start: int,
                       requested_types: Iterable[str] = None) -> Iterable[
         DXFGraphic]:
@@ -150,22 +443,81 @@ class IterDXF:
 
         index = start
         entry = self.structure.index[index]
-        self.file.seek(entry.location)
+        data = self.data
         while entry.value != 'ENDSEC':
             index += 1
             next_entry = self.structure.index[index]
-            size = next_entry.location - entry.location
-            data = self.file.read(size)
             if entry.value in requested_types:
-                xtags = ExtendedTags.from_text(to_str(data))
+                xtags = ExtendedTags.from_text(
+                    to_str(data[entry.location:next_entry.location]))
                 yield factory.load(xtags)
             entry = next_entry
 
+    def parallel_load_entities(self, start: int,
+                               requested_types: Iterable[str],
+                               workers: int) -> Iterable[DXFGraphic]:
+        """ Load entities by a pool of `workers` processes, returns the
+        entities in file order. Linking sub-entities like VERTEX and ATTRIB
+        is done by the caller, therefore the job boundaries need no special
+        handling.
+        """
+        from concurrent.futures import ProcessPoolExecutor
+        jobs = self._jobs(start, requested_types)
+        args = (self.structure.filename, self.encoding, self.errors)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending = deque()
+            for job in jobs:
+                pending.append(executor.submit(_load_spans, job, *args))
+                if len(pending) >= workers * JOBS_PER_WORKER:
+                    yield from _unpickle(pending.popleft().result())
+            while pending:
+                yield from _unpickle(pending.popleft().result())
+
+    def _jobs(self, start: int,
+              requested_types: Iterable[str]) -> Iterable[array]:
+        """ Yields the file location spans of the requested entities as
+        flat arrays of (start, end) locations.
+        """
+        index = self.structure.index
+        entry = index[start]
+        spans = array('q')
+        count = 0
+        while entry.value != 'ENDSEC':
+            start += 1
+            next_entry = index[start]
+            if entry.value in requested_types:
+                spans.append(entry.location)
+                spans.append(next_entry.location)
+            count += 1
+            if count >= ENTITIES_PER_JOB and spans:
+                yield spans
+                spans = array('q')
+                count = 0
+            entry = next_entry
+        if spans:
+            yield spans
+
     def close(self):
         """ Safe closing source DXF file. """
+        self.data.close()
         self.file.close()
 
 
+def _load_spans(spans: array, filename: str, encoding: str,
+                errors: str) -> bytes:
+    """ Worker process function, returns the entities of the file location
+    `spans` as pickled list.
+    """
+    entities = []
+    with open(filename, mode='rb') as fp, \
+            mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        for index in range(0, len(spans), 2):
+            text = data[spans[index]:spans[index + 1]].decode(
+                encoding, errors=errors).replace('\r\n', '\n')
+            entities.append(factory.load(ExtendedTags.from_text(text)))
+    return pickle.dumps(entities, protocol=pickle.HIGHEST_PROTOCOL)
+
+
 class IterDXFWriter:
     def __init__(self, name: Filename, loader: IterDXF):
         self.name = str(name)
@@ -227,7 +579,8 @@ class IterDXFWriter:
         self.file.close()
 
 
-def opendxf(filename: Filename, errors: str = 'surrogateescape') -> IterDXF:
+def opendxf(filename: Filename, errors: str = 'surrogateescape',
+            index: bool = False) -> IterDXF:
     """ Open DXF file for iterating, be sure to open valid DXF files, no DXF
     structure checks will be applied.
 
@@ -241,12 +594,19 @@ def opendxf(filename: Filename, errors: str = 'surrogateescape') -> IterDXF:
             - "ignore" to use the replacement char U+FFFD "\ufffd" for invalid data
             - "strict" to raise an :class:`UnicodeDecodeError` exception for invalid data
 
+        index: ``True`` to use and maintain the persistent file index in the
+            sidecar file "<filename>.dxfidx", see :class:`IterDXF`
+
     Raises:
         DXFStructureError: invalid or incomplete DXF file
         UnicodeDecodeError: if `errors` is "strict" and a decoding error occurs
 
+    .. versionadded:: 0.15.2
+
+        argument `index`
+
     """
-    return IterDXF(filename, errors=errors)
+    return IterDXF(filename, errors=errors, index=index)
 
 
 def modelspace(filename: Filename,
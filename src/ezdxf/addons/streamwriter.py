@@ -0,0 +1,248 @@
+#  Copyright (c) 2021, Manfred Moitzi
+#  License: MIT License
+from typing import TYPE_CHECKING, TextIO, BinaryIO, Union, Optional
+from contextlib import contextmanager
+import io
+
+import ezdxf
+from ezdxf.entities import factory
+from ezdxf.graphicsfactory import CreatorInterface
+from ezdxf.lldxf.const import (
+    DXF12, DXF2013, DXFVersionError, DXFStructureError,
+)
+from ezdxf.lldxf.tagwriter import TagWriter, BinaryTagWriter
+
+if TYPE_CHECKING:
+    from ezdxf.eztypes import Drawing, DXFGraphic
+
+__all__ = ['streamwriter', 'StreamWriter']
+
+# The $HANDSEED header variable is written as placeholder and patched by
+# StreamWriter.close(), the final value is padded by leading zeros to the
+# same length:
+HANDSEED_WIDTH = 16
+HANDSEED_PLACEHOLDER = 'F' * HANDSEED_WIDTH
+
+
+@contextmanager
+def streamwriter(stream: Union[TextIO, BinaryIO, str],
+                 doc: 'Drawing' = None,
+                 fmt: str = 'asc') -> 'StreamWriter':
+    """ Context manager for writing DXF entities direct to a stream/file
+    without storing them in the DXF document.
+
+    `stream` can be any seekable file like object or just a string for writing
+    the DXF document to the file system. The DXF document `doc` provides
+    all resources like layers, linetypes, text styles and block definitions,
+    a new DXF R2013 document is created if `doc` is ``None``.
+
+    Set argument `fmt` to "asc" to write ASCII DXF file (default) or "bin" to
+    write Binary DXF files. ASCII DXF require a :class:`TextIO` stream, opened
+    with the :attr:`~ezdxf.document.Drawing.output_encoding` and the error
+    handler ``'dxfreplace'``, Binary DXF require a :class:`BinaryIO` stream.
+
+    .. versionadded:: 0.15.2
+
+    """
+    if doc is None:
+        doc = ezdxf.new(DXF2013)
+    _stream = None
+    if not hasattr(stream, 'write'):
+        if fmt.startswith('asc'):
+            _stream = open(stream, 'wt', encoding=doc.output_encoding,
+                           errors='dxfreplace')
+        elif fmt.startswith('bin'):
+            _stream = open(stream, 'wb')
+        else:
+            raise ValueError(f"Unknown format '{fmt}'.")
+        stream = _stream
+
+    writer = StreamWriter(stream, doc, fmt)
+    try:
+        yield writer
+    finally:
+        writer.close()
+        if _stream:
+            _stream.close()
+
+
+class StreamWriter(CreatorInterface):
+    """ Stream writer for DXF R2000 and later, which writes the model space
+    entities direct to the `stream`.
+
+    The HEADER, CLASSES, TABLES and BLOCKS sections and all entities which
+    already exist in the model space and the active paper space of `doc` are
+    written at the instantiation of the :class:`StreamWriter`. All resources
+    like layers, linetypes, text styles, dimension styles and block
+    definitions have to be created before, because these sections are
+    already written. Creating new block definitions after this point raises a
+    :class:`~ezdxf.DXFStructureError`, new table entries will not be exported.
+
+    Supports all factory methods of the layout interface like
+    :meth:`add_line` or :meth:`add_lwpolyline`, except methods which create
+    new block definitions like :meth:`add_auto_blockref` or rendered
+    DIMENSION entities.
+
+    The last added entity is written to the stream when the next entity is
+    added or at closing the writer, until then the returned entity can be
+    modified, e.g. adding boundary paths to a HATCH entity. All written
+    entities are removed from the entity database of the document and
+    should not be used anymore.
+
+    The OBJECTS section is written by :meth:`close` and the $HANDSEED header
+    variable will be updated, therefore `stream` has to be seekable.
+
+    Args:
+        stream: seekable text stream or binary stream
+        doc: DXF document, which provides the resources
+        fmt: ``'asc'`` for ASCII DXF (default) or ``'bin'`` for binary DXF
+
+    .. versionadded:: 0.15.2
+
+    """
+
+    def __init__(self, stream: Union[TextIO, BinaryIO], doc: 'Drawing',
+                 fmt: str = 'asc'):
+        super().__init__(doc)
+        if doc.dxfversion <= DXF12:
+            raise DXFVersionError('Stream writer requires DXF R2000 or later.')
+        if not stream.seekable():
+            raise ValueError('Stream writer requires a seekable stream.')
+        self._stream = stream
+        self._fmt = fmt
+        self._owner = doc.modelspace().block_record_handle
+        self._pending: Optional['DXFGraphic'] = None
+        self._count = 0
+        self._block_count = len(doc.block_records)
+        self._handseed_pos = 0
+        self._closed = False
+        self._tagwriter = self._new_tagwriter(stream)
+        self._write_sections()
+
+    def __len__(self) -> int:
+        """ Returns the count of entities written by the stream writer. """
+        return self._count
+
+    @property
+    def is_closed(self) -> bool:
+        """ ``True`` if the stream writer is closed. """
+        return self._closed
+
+    def _new_tagwriter(self, stream) -> 'TagWriter':
+        doc = self.doc
+        if self._fmt.startswith('asc'):
+            return TagWriter(stream, dxfversion=doc.dxfversion)
+        elif self._fmt.startswith('bin'):
+            return BinaryTagWriter(stream, dxfversion=doc.dxfversion,
+                                   encoding=doc.output_encoding)
+        else:
+            raise ValueError(f"Unknown output format: '{self._fmt}'.")
+
+    def _write_sections(self) -> None:
+        doc = self.doc
+        tagwriter = self._tagwriter
+        doc.classes.add_required_classes(doc.dxfversion)
+        doc._create_appids()
+        doc._update_header_vars()
+        doc._update_metadata()
+        if isinstance(tagwriter, BinaryTagWriter):
+            tagwriter.write_signature()
+        self._write_header()
+        doc.classes.export_dxf(tagwriter)
+        doc.tables.export_dxf(tagwriter)
+        doc.blocks.export_dxf(tagwriter)
+        tagwriter.write_str("  0\nSECTION\n  2\nENTITIES\n")
+        layouts = doc.layouts
+        for layout in (layouts.modelspace(), layouts.active_layout()):
+            layout.entity_space.export_dxf(tagwriter)
+            self._count += len(layout)
+
+    def _write_header(self) -> None:
+        """ Writes the HEADER section with a placeholder for the $HANDSEED
+        value and stores the stream position of the placeholder.
+        """
+        doc = self.doc
+        doc.header['$HANDSEED'] = HANDSEED_PLACEHOLDER
+        is_binary = isinstance(self._tagwriter, BinaryTagWriter)
+        buffer = io.BytesIO() if is_binary else io.StringIO()
+        doc.header.export_dxf(self._new_tagwriter(buffer))
+        data = buffer.getvalue()
+        placeholder = HANDSEED_PLACEHOLDER
+        if is_binary:
+            placeholder = placeholder.encode()
+        index = data.index(placeholder)
+        stream = self._stream
+        stream.write(data[:index])
+        self._handseed_pos = stream.tell()
+        stream.write(data[index:])
+
+    def add_entity(self, entity: 'DXFGraphic') -> None:
+        """ Add an existing :class:`DXFGraphic` entity to the model space,
+        the entity is written to the stream when the next entity is added.
+        Adding entities from a different DXF document is not supported.
+        """
+        if self._closed:
+            raise DXFStructureError('Stream writer is closed.')
+        doc = self.doc
+        # bind virtual entities to the DXF document:
+        if entity.dxf.handle is None:
+            factory.bind(entity, doc)
+        handle = entity.dxf.handle
+        if handle is None or handle not in doc.entitydb:
+            raise DXFStructureError(
+                'Adding entities from a different DXF drawing is not supported.'
+            )
+        self.flush()
+        entity.set_owner(self._owner, paperspace=0)
+        self._pending = entity
+
+    def flush(self) -> None:
+        """ Writes the last added entity to the stream and removes the entity
+        from the entity database.
+        """
+        entity = self._pending
+        if entity is None:
+            return
+        self._pending = None
+        if len(self.doc.block_records) != self._block_count:
+            raise DXFStructureError(
+                'BLOCKS section already written, block definitions have to be '
+                'created before starting the stream writer.'
+            )
+        if entity.is_alive:
+            entity.export_dxf(self._tagwriter)
+            self._count += 1
+            self.doc.entitydb.discard(entity)
+
+    def close(self) -> None:
+        """ Writes the pending entity, the OBJECTS section and patches the
+        $HANDSEED header variable. Call is not necessary when using the
+        context manager :func:`streamwriter`.
+        """
+        if self._closed:
+            return
+        self.flush()
+        self._closed = True
+        doc = self.doc
+        tagwriter = self._tagwriter
+        tagwriter.write_tag2(0, 'ENDSEC')
+        doc.objects.export_dxf(tagwriter)
+        if doc.acdsdata.is_valid:
+            doc.acdsdata.export_dxf(tagwriter)
+        for section in doc.stored_sections:
+            section.export_dxf(tagwriter)
+        tagwriter.write_tag2(0, 'EOF')
+        self._patch_handseed()
+
+    def _patch_handseed(self) -> None:
+        doc = self.doc
+        handseed = str(doc.entitydb.handles)
+        doc.header['$HANDSEED'] = handseed
+        value = handseed.rjust(HANDSEED_WIDTH, '0')
+        if len(value) != HANDSEED_WIDTH:
+            raise DXFStructureError(f'Invalid $HANDSEED value: {handseed}')
+        stream = self._stream
+        stream.seek(self._handseed_pos)
+        stream.write(value.encode() if isinstance(
+            self._tagwriter, BinaryTagWriter) else value)
+        stream.seek(0, io.SEEK_END)
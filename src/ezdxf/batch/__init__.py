@@ -0,0 +1,6 @@
+# Purpose: batch processing of DXF documents
+# Copyright (c) 2021, Manfred Moitzi
+# License: MIT License
+from ezdxf.batch.processor import (
+    BatchProcessor, BatchStats, FileResult, DEFAULT_TASKS_PER_WORKER,
+)
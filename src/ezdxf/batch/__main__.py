@@ -0,0 +1,115 @@
+# Copyright (c) 2021, Manfred Moitzi
+# License: MIT License
+from typing import Iterable, Optional
+import sys
+import argparse
+import glob
+import importlib
+
+import ezdxf
+from ezdxf.batch import BatchProcessor, DEFAULT_TASKS_PER_WORKER
+
+
+def import_function(name: str):
+    """ Import function `name` given as "module:function". """
+    module_name, _, func_name = name.partition(':')
+    if not module_name or not func_name:
+        raise ValueError(
+            f"Invalid function name '{name}', expected 'module:function'.")
+    module = importlib.import_module(module_name)
+    return getattr(module, func_name)
+
+
+def collect_files(patterns: Iterable[str]) -> Iterable[str]:
+    for pattern in patterns:
+        names = list(glob.glob(pattern))
+        if len(names) == 0:
+            print(f"File(s) '{pattern}' not found.")
+        yield from names
+
+
+def main(args: Optional[Iterable[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog='python -m ezdxf.batch',
+        description='load, audit and process many DXF files by a pool of '
+                    'worker processes',
+    )
+    parser.add_argument(
+        '-r', '--recover',
+        dest='recover',
+        action='store_true',
+        help='use recover mode to load files with DXF structure errors'
+    )
+    parser.add_argument(
+        '-f', '--func',
+        dest='func',
+        help='processing function as "module:function", called with the '
+             'arguments (doc, auditor) for each loaded DXF document'
+    )
+    parser.add_argument(
+        '-w', '--workers',
+        dest='workers',
+        type=int,
+        default=None,
+        help='count of worker processes, default is the count of CPUs, '
+             '0 to process all files in the calling process'
+    )
+    parser.add_argument(
+        '-t', '--timeout',
+        dest='timeout',
+        type=float,
+        default=0,
+        help='timeout for each file in seconds, default is no timeout'
+    )
+    parser.add_argument(
+        '--retries',
+        dest='retries',
+        type=int,
+        default=0,
+        help='count of retries for failed files, default is 0'
+    )
+    parser.add_argument(
+        '--tasks-per-worker',
+        dest='tasks_per_worker',
+        type=int,
+        default=DEFAULT_TASKS_PER_WORKER,
+        help=f'count of files processed by a worker process before it is '
+             f'replaced, default is {DEFAULT_TASKS_PER_WORKER}'
+    )
+    parser.add_argument(
+        '-v', '--verbose',
+        dest='verbose',
+        action='store_true',
+        help='print audit errors and fixes of each file'
+    )
+    parser.add_argument(
+        'files',
+        metavar='FILE',
+        nargs='+',
+        help='DXF files to process, supports wildcards'
+    )
+    args = parser.parse_args(sys.argv[1:] if args is None else list(args))
+
+    func = import_function(args.func) if args.func else None
+    ezdxf.options.compress_binary_data = True
+    processor = BatchProcessor(
+        func,
+        workers=args.workers,
+        recover=args.recover,
+        timeout=args.timeout,
+        retries=args.retries,
+        tasks_per_worker=args.tasks_per_worker,
+    )
+    for result in processor.run(collect_files(args.files)):
+        print(str(result))
+        if args.verbose:
+            for code, message in result.errors:
+                print(f'    Issue [{code}]: {message}')
+            for code, message in result.fixes:
+                print(f'    Fixed [{code}]: {message}')
+    print(str(processor.stats))
+    return 1 if processor.stats.failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,302 @@
+#  Copyright (c) 2021, Manfred Moitzi
+#  License: MIT License
+from typing import (
+    TYPE_CHECKING, Iterable, Callable, Any, Optional, List, Tuple, Deque,
+)
+from collections import deque
+from contextlib import contextmanager
+import os
+import signal
+import threading
+import time
+
+import ezdxf
+from ezdxf import recover as _recover
+from ezdxf.lldxf.const import DXFError
+
+if TYPE_CHECKING:
+    from ezdxf.eztypes import Drawing, Auditor
+
+__all__ = ['BatchProcessor', 'BatchStats', 'FileResult']
+
+# Each worker process is replaced after processing this count of documents
+# on average, this limits the memory growth of long running worker processes:
+DEFAULT_TASKS_PER_WORKER = 8
+
+ProcessingFunc = Callable[['Drawing', 'Auditor'], Any]
+AuditReport = List[Tuple[int, str]]
+
+
+class FileResult:
+    """ Processing result of a single DXF document, all attributes are
+    picklable and transferred from the worker process to the calling process.
+
+    .. attribute:: filename
+
+        File name of the processed DXF document.
+
+    .. attribute:: result
+
+        Return value of the processing function or ``None``.
+
+    .. attribute:: error
+
+        Error message as string or ``None`` if processing was successful.
+
+    .. attribute:: errors
+
+        Unfixed audit errors as list of (code, message) tuples.
+
+    .. attribute:: fixes
+
+        Fixed audit errors as list of (code, message) tuples.
+
+    .. attribute:: attempts
+
+        Count of processing attempts.
+
+    .. attribute:: load_time
+
+        Time in seconds to load and audit the DXF document.
+
+    .. attribute:: process_time
+
+        Time in seconds to run the processing function.
+
+    """
+    __slots__ = ('filename', 'result', 'error', 'errors', 'fixes',
+                 'attempts', 'load_time', 'process_time', 'retry')
+
+    def __init__(self, filename: str, attempts: int = 1):
+        self.filename = filename
+        self.result: Any = None
+        self.error: Optional[str] = None
+        self.errors: AuditReport = []
+        self.fixes: AuditReport = []
+        self.attempts = attempts
+        self.load_time = 0.0
+        self.process_time = 0.0
+        # Failed processing can be retried:
+        self.retry = False
+
+    def __str__(self) -> str:
+        if self.error is not None:
+            return f'FAILED {self.filename}: {self.error}'
+        return f'OK {self.filename}: {len(self.errors)} error(s), ' \
+               f'{len(self.fixes)} fix(es), ' \
+               f'{self.load_time + self.process_time:.2f}s'
+
+    @property
+    def ok(self) -> bool:
+        """ ``True`` if processing was successful. """
+        return self.error is None
+
+
+class BatchStats:
+    """ Aggregated statistics of a batch run, updated while processing. """
+
+    def __init__(self):
+        # count of processed files
+        self.files = 0
+        # count of failed files
+        self.failed = 0
+        # count of retried processing attempts
+        self.retries = 0
+        # sum of unfixed audit errors
+        self.audit_errors = 0
+        # sum of fixed audit errors
+        self.audit_fixes = 0
+        # sum of load and audit times in seconds
+        self.load_time = 0.0
+        # sum of processing function times in seconds
+        self.process_time = 0.0
+        # elapsed wall clock time in seconds
+        self.elapsed = 0.0
+
+    def __str__(self) -> str:
+        return f'{self.files} file(s) processed, {self.failed} failed, ' \
+               f'{self.retries} retries, {self.audit_errors} audit error(s), ' \
+               f'{self.audit_fixes} audit fix(es), load time: ' \
+               f'{self.load_time:.2f}s, process time: ' \
+               f'{self.process_time:.2f}s, elapsed: {self.elapsed:.2f}s'
+
+    def add(self, result: FileResult) -> None:
+        self.files += 1
+        if not result.ok:
+            self.failed += 1
+        self.audit_errors += len(result.errors)
+        self.audit_fixes += len(result.fixes)
+        self.load_time += result.load_time
+        self.process_time += result.process_time
+
+
+class BatchProcessor:
+    """ Process many DXF documents by a pool of worker processes.
+
+    Each DXF document is loaded by :func:`ezdxf.readfile` and audited or
+    loaded by :func:`ezdxf.recover.readfile` if `recover` is ``True``.
+    The function `func` is called with the loaded document and the
+    :class:`~ezdxf.audit.Auditor` as arguments, the return value has to be
+    picklable and is transferred as :attr:`FileResult.result` to the calling
+    process. To use a pool of worker processes, `func` has to be picklable,
+    which means a function defined at the top level of a module.
+
+    The files are processed in chunks of `workers` x `tasks_per_worker`
+    files, each chunk by a new pool of worker processes, this limits the
+    memory growth of the worker processes. Failed files are processed again
+    in a later chunk up to `retries` times, except for
+    :class:`~ezdxf.DXFError` exceptions and IO errors, which are not
+    recoverable by another attempt.
+
+    The `timeout` in seconds limits the processing time of each file, this
+    feature requires the ``SIGALRM`` signal and is ignored on Windows.
+
+    Args:
+        func: processing function ``func(doc, auditor)`` or ``None`` for
+            loading and auditing only
+        workers: count of worker processes, ``None`` for the count of CPUs,
+            0 to process all files in the calling process
+        recover: ``True`` to load DXF documents in recover mode
+        timeout: timeout for each file in seconds, 0 for no timeout
+        retries: count of retries for failed files
+        tasks_per_worker: average count of files processed by a worker
+            process before it is replaced
+
+    .. versionadded:: 0.15.2
+
+    """
+
+    def __init__(self, func: ProcessingFunc = None, *,
+                 workers: Optional[int] = None,
+                 recover: bool = False,
+                 timeout: float = 0,
+                 retries: int = 0,
+                 tasks_per_worker: int = DEFAULT_TASKS_PER_WORKER):
+        if workers is not None and workers < 0:
+            raise ValueError('Invalid count of workers.')
+        if tasks_per_worker < 1:
+            raise ValueError('Invalid count of tasks per worker.')
+        self.func = func
+        self.workers = workers
+        self.recover = recover
+        self.timeout = float(timeout)
+        self.retries = int(retries)
+        self.tasks_per_worker = int(tasks_per_worker)
+        self.stats = BatchStats()
+
+    def run(self, filenames: Iterable[str]) -> Iterable[FileResult]:
+        """ Process `filenames` and yields a :class:`FileResult` for each
+        file as soon as the processing is finished, the results are not in
+        the order of `filenames`. The aggregated statistics are available
+        as :attr:`stats` attribute.
+        """
+        stats = BatchStats()
+        self.stats = stats
+        start = time.perf_counter()
+        pending: Deque[Tuple[str, int]] = deque(
+            (str(filename), 1) for filename in filenames)
+        while pending:
+            chunk = [pending.popleft() for _ in
+                     range(min(len(pending), self._chunk_size()))]
+            for result in self._process_chunk(chunk):
+                if result.retry and result.attempts <= self.retries:
+                    pending.append((result.filename, result.attempts + 1))
+                    stats.retries += 1
+                    continue
+                stats.add(result)
+                stats.elapsed = time.perf_counter() - start
+                yield result
+        stats.elapsed = time.perf_counter() - start
+
+    def _chunk_size(self) -> int:
+        workers = self.workers
+        if workers is None:
+            workers = os.cpu_count() or 1
+        return max(workers, 1) * self.tasks_per_worker
+
+    def _process_chunk(
+            self, chunk: List[Tuple[str, int]]) -> Iterable[FileResult]:
+        args = (self.func, self.recover, self.timeout)
+        if self.workers == 0:
+            for filename, attempts in chunk:
+                yield process_file(filename, attempts, *args)
+            return
+
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            futures = {
+                executor.submit(process_file, filename, attempts, *args):
+                    (filename, attempts) for filename, attempts in chunk
+            }
+            for future in as_completed(futures):
+                try:
+                    yield future.result()
+                except Exception as e:
+                    # Crashed worker process or result is not picklable:
+                    result = FileResult(*futures[future])
+                    result.error = _error_message(e)
+                    result.retry = True
+                    yield result
+
+
+def process_file(filename: str, attempts: int, func: Optional[ProcessingFunc],
+                 recover: bool, timeout: float) -> FileResult:
+    """ Load, audit and process a single DXF document. (internal API) """
+    result = FileResult(filename, attempts)
+    t0 = time.perf_counter()
+    t1 = t0
+    try:
+        with _time_limit(timeout):
+            if recover:
+                doc, auditor = _recover.readfile(filename)
+            else:
+                doc = ezdxf.readfile(filename)
+                auditor = doc.audit()
+            result.errors = _audit_report(auditor.errors)
+            result.fixes = _audit_report(auditor.fixes)
+            t1 = time.perf_counter()
+            result.load_time = t1 - t0
+            if func is not None:
+                result.result = func(doc, auditor)
+            result.process_time = time.perf_counter() - t1
+    except Exception as e:
+        result.error = _error_message(e)
+        # DXF structure errors and missing or invalid files can not be fixed
+        # by another attempt:
+        result.retry = isinstance(e, TimeoutError) or not isinstance(
+            e, (DXFError, OSError))
+        if t1 == t0:
+            result.load_time = time.perf_counter() - t0
+        else:
+            result.process_time = time.perf_counter() - t1
+    return result
+
+
+def _audit_report(entries) -> AuditReport:
+    return [(int(entry.code), entry.message) for entry in entries]
+
+
+def _error_message(e: Exception) -> str:
+    return f'{type(e).__name__}: {str(e)}'
+
+
+@contextmanager
+def _time_limit(seconds: float):
+    """ Raises :class:`TimeoutError` in the main thread if the execution
+    time exceeds `seconds`, does nothing if ``SIGALRM`` is not supported.
+    """
+    if (seconds <= 0 or not hasattr(signal, 'SIGALRM') or
+            threading.current_thread() is not threading.main_thread()):
+        yield
+        return
+
+    def timeout(signum, frame):
+        raise TimeoutError(f'processing time exceeded {seconds:g}s')
+
+    previous_handler = signal.signal(signal.SIGALRM, timeout)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous_handler)
@@ -1,25 +1,33 @@
 #  Copyright (c) 2021, Manfred Moitzi
 #  License: MIT License
-from typing import TYPE_CHECKING, Iterable, Dict, Optional
+from typing import TYPE_CHECKING, Iterable, Dict, Optional, Tuple, List, Set
 from ezdxf import disassemble
-from ezdxf.math import BoundingBox
+from ezdxf.math import BoundingBox, Vec3, convex_hull_2d
 
 if TYPE_CHECKING:
-    from ezdxf.eztypes import DXFEntity
+    from ezdxf.eztypes import DXFEntity, Insert, BlockLayout, Drawing
 
 
 class Cache:
     """ Caching object for :class:`ezdxf.math.BoundingBox` objects.
 
+    The cache entries are invalidated automatically by modifications of the
+    DXF entities: changed DXF attributes, transformations, vertex changes of
+    LWPOLYLINE, POLYLINE, SPLINE and MESH entities and for block references
+    (INSERT, DIMENSION) all changes of block definitions. Direct modifications
+    of vertex containers like :attr:`Spline.control_points` are not detected,
+    use :meth:`invalidate` for such cases.
+
     Args:
         uuid: use UUIDs for virtual entities
 
     """
     def __init__(self, uuid=False):
-        self._boxes: Dict[str, BoundingBox] = dict()
+        self._boxes: Dict[str, Tuple[BoundingBox, int]] = dict()
         self._use_uuid = bool(uuid)
         self.hits: int = 0
         self.misses: int = 0
+        self._block_hulls = BlockHulls()
 
     def __str__(self):
         return f"Cache(n={len(self._boxes)}, " \
@@ -32,26 +40,30 @@ class Cache:
         if key is None:
             self.misses += 1
             return None
-        box = self._boxes.get(key)
-        if box is None:
-            self.misses += 1
-        else:
-            self.hits += 1
-        return box
+        data = self._boxes.get(key)
+        if data is not None:
+            box, stamp = data
+            if stamp == modification_stamp(entity):
+                self.hits += 1
+                return box
+            # entity was modified:
+            del self._boxes[key]
+        self.misses += 1
+        return None
 
     def store(self, entity: 'DXFEntity', box: BoundingBox) -> None:
         assert entity is not None
         key = self._get_key(entity)
         if key is None:
             return
-        self._boxes[key] = box
+        self._boxes[key] = (box, modification_stamp(entity))
 
     def invalidate(self, entities: Iterable['DXFEntity']) -> None:
         """ Invalidate cache entries for the given DXF `entities`.
 
-        If entities are changed by the user, it is possible to invalidate
-        individual entities. Use with care - discarding the whole cache is
-        the safer workflow.
+        Modifications of the DXF entities invalidate the cache entries
+        automatically, this is only required for modifications which are not
+        detected, like direct changes of vertex containers.
 
         Ignores entities which are not stored in cache.
 
@@ -61,6 +73,8 @@ class Cache:
                 del self._boxes[self._get_key(entity)]
             except KeyError:
                 pass
+        # Vertex container changes in block definitions are not detected:
+        self._block_hulls.clear()
 
     def _get_key(self, entity: 'DXFEntity') -> Optional[str]:
         if entity.dxftype() == 'HATCH':
@@ -77,6 +91,33 @@ class Cache:
             return key
 
 
+# Entities which extents depend on block definitions:
+BLOCK_REFERENCES = {
+    'INSERT', 'DIMENSION', 'ARC_DIMENSION', 'LARGE_RADIAL_DIMENSION',
+    'ACAD_TABLE',
+}
+
+
+def modification_stamp(entity: 'DXFEntity') -> int:
+    """ Returns the stamp of the last modification of `entity` including the
+    linked VERTEX and ATTRIB entities and for block references the last
+    modification of any block definition.
+    """
+    stamp = entity.modification_stamp
+    dxftype = entity.dxftype()
+    if dxftype == 'POLYLINE':
+        for vertex in entity.vertices:
+            stamp = max(stamp, vertex.modification_stamp)
+    elif dxftype in BLOCK_REFERENCES:
+        if dxftype == 'INSERT':
+            for attrib in entity.attribs:
+                stamp = max(stamp, attrib.modification_stamp)
+        doc = entity.doc
+        if doc is not None and doc.blocks is not None:
+            stamp = max(stamp, doc.blocks.modification_stamp)
+    return stamp
+
+
 def multi_recursive(entities: Iterable['DXFEntity'],
                     cache: Cache = None) -> Iterable[BoundingBox]:
     """ Yields all bounding boxes for the given `entities` **or** all bounding
@@ -131,15 +172,181 @@ def multi_flat(entities: Iterable['DXFEntity'],
             _extends.extend(_box)
         return _extends
 
+    hulls = cache._block_hulls if cache is not None else BlockHulls()
     for entity in entities:
         box = None
         if cache:
             box = cache.get(entity)
 
         if box is None:
-            box = extends_([entity])
+            if entity.dxftype() == 'INSERT':
+                box = _insert_extends(entity, hulls)
+                if box is None:  # requires exact decomposition
+                    box = extends_([entity])
+            else:
+                box = extends_([entity])
             if cache:
                 cache.store(entity, box)
 
         if box.has_data:
             yield box
+
+
+# Entity types, which flattened vertices can be transformed by any affine
+# transformation, including non-uniform scaling:
+LINEAR_TYPES = {
+    'LINE', 'POINT', '3DFACE', 'SOLID', 'TRACE', 'MESH', 'IMAGE', 'WIPEOUT',
+    'VIEWPORT',
+}
+
+
+class BlockHull:
+    """ Vertices of the convex hull of a block definition in block
+    coordinates. (internal class)
+
+    Args:
+        vertices: hull vertices
+        is_linear: ``True`` if the block definition contains only linear
+            entities, which support non-uniform scaling of the hull vertices
+
+    """
+    __slots__ = ('vertices', 'is_linear')
+
+    def __init__(self, vertices: List[Vec3], is_linear: bool):
+        self.vertices = vertices
+        self.is_linear = is_linear
+
+
+class BlockHulls:
+    """ Cache of block definition hulls, key is the BLOCK_RECORD handle.
+    All hulls of a document are discarded by any modification of any block
+    definition. (internal class)
+    """
+
+    def __init__(self):
+        self._hulls: Dict[str, Optional[BlockHull]] = dict()
+        self._doc: Optional['Drawing'] = None
+        self._stamp: int = -1
+
+    def clear(self) -> None:
+        self._hulls.clear()
+        self._doc = None
+        self._stamp = -1
+
+    def get(self, block: 'BlockLayout',
+            stack: Set[str] = None) -> Optional[BlockHull]:
+        """ Returns the hull of `block` or ``None`` for circular block
+        references.
+        """
+        doc = block.doc
+        stamp = doc.blocks.modification_stamp
+        if doc is not self._doc or stamp != self._stamp:
+            self._hulls.clear()
+            self._doc = doc
+            self._stamp = stamp
+        key = block.block_record_handle
+        try:
+            return self._hulls[key]
+        except KeyError:
+            pass
+        if stack is None:
+            stack = set()
+        if key in stack:  # circular block reference
+            return None
+        stack.add(key)
+        hull = self._build(block, stack)
+        stack.discard(key)
+        self._hulls[key] = hull
+        return hull
+
+    def _build(self, block: 'BlockLayout',
+               stack: Set[str]) -> Optional[BlockHull]:
+        vertices: List[Vec3] = []
+        is_linear = True
+        for entity in block:
+            dxftype = entity.dxftype()
+            if dxftype == 'ATTDEF':  # not rendered by block references
+                continue
+            if dxftype == 'INSERT':
+                result = _insert_vertices(entity, self, stack)
+                if result is None:
+                    return None
+                insert_vertices, insert_is_linear = result
+                vertices.extend(insert_vertices)
+                is_linear = is_linear and insert_is_linear
+                continue
+            if dxftype in ('LWPOLYLINE', 'POLYLINE'):
+                is_linear = is_linear and not entity.has_arc
+            elif dxftype not in LINEAR_TYPES:
+                is_linear = False
+            # 2D entities like ARC yield Vec2 vertices:
+            vertices.extend(Vec3.generate(disassemble.to_vertices(
+                disassemble.to_primitives(
+                    disassemble.recursive_decompose([entity])))))
+        return BlockHull(_reduce_vertices(vertices), is_linear)
+
+
+def _reduce_vertices(vertices: List[Vec3]) -> List[Vec3]:
+    """ Returns the 2D convex hull for coplanar vertices parallel to the
+    xy-plane, else the unique vertices.
+    """
+    if not vertices:
+        return vertices
+    z = vertices[0].z
+    if all(v.z == z for v in vertices):
+        try:
+            return [Vec3(v.x, v.y, z) for v in convex_hull_2d(vertices)]
+        except ValueError:  # less than 3 unique vertices
+            pass
+    return list(set(vertices))
+
+
+def _grid_offsets(insert: 'Insert') -> List[Vec3]:
+    """ Returns the WCS offsets of the MINSERT grid corners. The hull of all
+    grid elements is the hull of the grid elements at the corners, because
+    all grid elements are translated copies.
+    """
+    if insert.mcount < 2:
+        return [Vec3()]
+    dxf = insert.dxf
+    col = (dxf.column_count - 1) * dxf.column_spacing
+    row = (dxf.row_count - 1) * dxf.row_spacing
+    ocs = insert.ocs()
+    rotation = dxf.rotation
+    offsets = []
+    for offset in (Vec3(), Vec3(col, 0), Vec3(0, row), Vec3(col, row)):
+        if rotation:
+            offset = offset.rotate_deg(rotation)
+        offsets.append(Vec3(ocs.to_wcs(offset)))
+    return offsets
+
+
+def _insert_vertices(insert: 'Insert', hulls: BlockHulls,
+                     stack: Set[str] = None
+                     ) -> Optional[Tuple[List[Vec3], bool]]:
+    """ Returns the transformed hull vertices of the block reference `insert`
+    including the attached ATTRIB entities and the linear state of the block
+    hull or ``None`` if the block reference requires an exact decomposition.
+    """
+    block = insert.block()
+    if block is None or block.block.is_xref:
+        return None
+    hull = hulls.get(block, stack)
+    if hull is None or not (hull.is_linear or insert.has_uniform_scaling):
+        return None
+    vertices = list(insert.matrix44().transform_vertices(hull.vertices))
+    if insert.attribs:
+        vertices.extend(disassemble.to_vertices(
+            disassemble.to_primitives(insert.attribs)))
+    offsets = _grid_offsets(insert)
+    if len(offsets) > 1:
+        vertices = [v + offset for offset in offsets for v in vertices]
+    return vertices, hull.is_linear
+
+
+def _insert_extends(insert: 'Insert',
+                    hulls: BlockHulls) -> Optional[BoundingBox]:
+    result = _insert_vertices(insert, hulls)
+    if result is None:
+        return None
+    return BoundingBox(result[0])
@@ -1,6 +1,6 @@
 #  Copyright (c) 2021, Manfred Moitzi
 #  License: MIT License
-from typing import Iterable, Optional, cast, TYPE_CHECKING, List
+from typing import Iterable, Optional, cast, TYPE_CHECKING, List, Set
 import abc
 import math
 from ezdxf.entities import DXFEntity
@@ -226,7 +226,7 @@ class TextLinePrimitive(GenericPrimitive):
             if alignment in ('FIT', 'ALIGNED') and not p1.isclose(p2):
                 return (p2 - p1).angle
             else:
-                return math.degrees(text.dxf.rotation)
+                return math.radians(text.dxf.rotation)
 
         def get_insert() -> Vec3:
             if alignment == 'LEFT':
@@ -466,11 +466,21 @@ def recursive_decompose(entities: Iterable[DXFEntity]) -> Iterable[DXFEntity]:
 
     Decomposition of XREF, UNDERLAY and ACAD_TABLE entities is not supported.
 
+    Nested block references are decomposed recursively, circular block
+    references are ignored at the first repetition of a block.
+
     """
+    return _recursive_decompose(entities, set())
+
+
+def _recursive_decompose(entities: Iterable[DXFEntity],
+                         stack: Set[str]) -> Iterable[DXFEntity]:
+    # The stack contains the names of the currently decomposed blocks to
+    # detect circular block references.
 
     def insert(i: 'Insert') -> Iterable[DXFEntity]:
         yield from i.attribs
-        yield from i.virtual_entities()
+        yield from _recursive_decompose(i.virtual_entities(), stack)
 
     for entity in entities:
         dxftype = entity.dxftype()
@@ -479,14 +489,19 @@ def recursive_decompose(entities: Iterable[DXFEntity]) -> Iterable[DXFEntity]:
             yield entity
         elif dxftype == 'INSERT':
             entity = cast('Insert', entity)
+            name = entity.dxf.name
+            if name in stack:  # circular block reference
+                continue
+            stack.add(name)
             if entity.mcount > 1:
                 for virtual_insert in entity.multi_insert():
                     yield from insert(virtual_insert)
             else:
                 yield from insert(entity)
+            stack.discard(name)
         elif hasattr(entity, 'virtual_entities'):
             # could contain block references:
-            yield from recursive_decompose(entity.virtual_entities())
+            yield from _recursive_decompose(entity.virtual_entities(), stack)
         # As long as MLeader.virtual_entities() is not implemented,
         # use existing proxy graphic:
         elif dxftype in ('MLEADER', 'MULTILEADER') and entity.proxy_graphic:
@@ -265,7 +265,8 @@ class Drawing:
         return version
 
     @classmethod
-    def read(cls, stream: TextIO) -> 'Drawing':
+    def read(cls, stream: TextIO, *, lazy: bool = False,
+             compact: bool = False) -> 'Drawing':
         """ Open an existing drawing. Package users should use the factory
         function :func:`ezdxf.read`. To preserve possible binary data in
         XRECORD entities use :code:`errors='surrogateescape'` as error handler
@@ -273,25 +274,30 @@ class Drawing:
 
         Args:
              stream: text stream yielding text (unicode) strings by readline()
+             lazy: load the content of simple graphical entities at first usage
+             compact: store loaded DXF tags in memory efficient containers
 
         """
         from .lldxf.tagger import ascii_tags_loader
         tag_loader = ascii_tags_loader(stream)
-        return cls.load(tag_loader)
+        return cls.load(tag_loader, lazy=lazy, compact=compact)
 
     @classmethod
-    def load(cls, tag_loader: Iterable['DXFTag']) -> 'Drawing':
+    def load(cls, tag_loader: Iterable['DXFTag'], *,
+             lazy: bool = False, compact: bool = False) -> 'Drawing':
         """ Load DXF document from a DXF tag loader, in general an external
         untrusted source.
 
         Args:
             tag_loader: DXF tag loader
+            lazy: load the content of simple graphical entities at first usage
+            compact: store loaded DXF tags in memory efficient containers
 
         """
         from .lldxf.tagger import tag_compiler
         tag_loader = tag_compiler(tag_loader)
         doc = cls()
-        doc._load(tag_loader)
+        doc._load(tag_loader, lazy=lazy, compact=compact)
         return doc
 
     @classmethod
@@ -301,15 +307,17 @@ class Drawing:
         doc._load(tagger=compiled_tags)
         return doc
 
-    def _load(self, tagger: Optional[Iterable['DXFTag']]) -> None:
+    def _load(self, tagger: Optional[Iterable['DXFTag']],
+              lazy: bool = False, compact: bool = False) -> None:
         # 1st Loading stage: load complete DXF entity structure
         self.is_loading = True
-        sections = loader.load_dxf_structure(tagger)
+        sections = loader.load_dxf_structure(tagger, compact=compact)
         if 'THUMBNAILIMAGE' in sections:
             del sections['THUMBNAILIMAGE']
-        self._load_section_dict(sections)
+        self._load_section_dict(sections, lazy=lazy)
 
-    def _load_section_dict(self, sections: loader.SectionDict) -> None:
+    def _load_section_dict(self, sections: loader.SectionDict,
+                           lazy: bool = False) -> None:
         """ Internal API to load a DXF document from a section dict. """
         self.is_loading = True
         # Create header section:
@@ -334,7 +342,7 @@ class Drawing:
         self.entitydb.handles.reset(_validate_handle_seed(seed))
 
         # Store all necessary DXF entities in the entity database:
-        loader.load_and_bind_dxf_content(sections, self)
+        loader.load_and_bind_dxf_content(sections, self, lazy=lazy)
 
         # End of 1. loading stage, all entities of the DXF file are
         # stored in the entity database.
@@ -396,6 +404,12 @@ class Drawing:
         """
         db = self.entitydb
         for entity in db.values():
+            if entity.is_lazy or \
+                    entity.__dict__.get('has_deferred_post_load_hook'):
+                # The post_load_hook() of lazy loaded entities is called when
+                # the content is loaded or is deferred until the document is
+                # fully initialized.
+                continue
             # The post_load_hook() can return a callable, which should be
             # executed, when the DXF document is fully initialized.
             cmd = entity.post_load_hook(self)
@@ -422,7 +436,7 @@ class Drawing:
             self.block_records.new('*Paper_Space')
 
     def saveas(self, filename: str, encoding: str = None,
-               fmt: str = 'asc') -> None:
+               fmt: str = 'asc', workers: int = 0) -> None:
         """ Set :class:`Drawing` attribute :attr:`filename` to `filename` and
         write drawing to the file system. Override file encoding by argument
         `encoding`, handle with care, but this option allows you to create DXF
@@ -433,12 +447,19 @@ class Drawing:
             filename: file name as string
             encoding: override default encoding as Python encoding string like ``'utf-8'``
             fmt: ``'asc'`` for ASCII DXF (default) or ``'bin'`` for Binary DXF
+            workers: count of worker processes to export the ENTITIES and
+                BLOCKS sections, see :meth:`write`
+
+        .. versionadded:: 0.15.2
+
+            argument `workers`
 
         """
         self.filename = filename
-        self.save(encoding=encoding, fmt=fmt)
+        self.save(encoding=encoding, fmt=fmt, workers=workers)
 
-    def save(self, encoding: str = None, fmt: str = 'asc') -> None:
+    def save(self, encoding: str = None, fmt: str = 'asc',
+             workers: int = 0) -> None:
         """ Write drawing to file-system by using the :attr:`filename` attribute
         as filename. Override file encoding by argument `encoding`, handle with
         care, but this option allows you to create DXF files for applications
@@ -447,6 +468,12 @@ class Drawing:
         Args:
             encoding: override default encoding as Python encoding string like ``'utf-8'``
             fmt: ``'asc'`` for ASCII DXF (default) or ``'bin'`` for Binary DXF
+            workers: count of worker processes to export the ENTITIES and
+                BLOCKS sections, see :meth:`write`
+
+        .. versionadded:: 0.15.2
+
+            argument `workers`
 
         """
         # DXF R12, R2000, R2004 - ASCII encoding
@@ -469,7 +496,7 @@ class Drawing:
         else:
             raise ValueError(f"Unknown output format: '{fmt}'.")
         try:
-            self.write(fp, fmt=fmt)
+            self.write(fp, fmt=fmt, workers=workers)
         finally:
             fp.close()
 
@@ -477,7 +504,8 @@ class Drawing:
         """ Encode string `s` with correct encoding and error handler. """
         return s.encode(encoding=self.output_encoding, errors='dxfreplace')
 
-    def write(self, stream: Union[TextIO, BinaryIO], fmt: str = 'asc') -> None:
+    def write(self, stream: Union[TextIO, BinaryIO], fmt: str = 'asc',
+              workers: int = 0) -> None:
         """ Write drawing as ASCII DXF to a text stream or as Binary DXF to a
         binary stream. For DXF R2004 (AC1018) and prior open stream with
         drawing :attr:`encoding` and :code:`mode='wt'`. For DXF R2007 (AC1021)
@@ -491,9 +519,22 @@ class Drawing:
 
             binary = doc.encode(stream.get_value())
 
+        The ENTITIES and BLOCKS sections of large documents can be exported by
+        a pool of worker processes, if `workers` > 1, the result is the same
+        as the export by a single process. The worker processes are created by
+        forking the calling process, on platforms without support for the
+        "fork" start method, like Windows, the export is done by the calling
+        process, see also :func:`ezdxf.lldxf.tagwriter.parallel_export_dxf`.
+
         Args:
             stream: output text stream or binary stream
             fmt: ``'asc'`` for ASCII DXF (default) or ``'bin'`` for binary DXF
+            workers: count of worker processes to export the ENTITIES and
+                BLOCKS sections
+
+        .. versionadded:: 0.15.2
+
+            argument `workers`
 
         """
         dxfversion = self.dxfversion
@@ -520,7 +561,7 @@ class Drawing:
         else:
             raise ValueError(f"Unknown output format: '{fmt}'.")
 
-        self.export_sections(tagwriter)
+        self.export_sections(tagwriter, workers)
 
     def encode_base64(self) -> bytes:
         """ Returns DXF document as base64 encoded binary data. """
@@ -531,15 +572,16 @@ class Drawing:
         # Create Windows line endings and do base64 encoding:
         return base64.encodebytes(binary_data.replace(b'\n', b'\r\n'))
 
-    def export_sections(self, tagwriter: 'TagWriter') -> None:
+    def export_sections(self, tagwriter: 'TagWriter',
+                        workers: int = 0) -> None:
         """ DXF export sections. (internal API) """
         dxfversion = tagwriter.dxfversion
         self.header.export_dxf(tagwriter)
         if dxfversion > DXF12:
             self.classes.export_dxf(tagwriter)
         self.tables.export_dxf(tagwriter)
-        self.blocks.export_dxf(tagwriter)
-        self.entities.export_dxf(tagwriter)
+        self.blocks.export_dxf(tagwriter, workers)
+        self.entities.export_dxf(tagwriter, workers)
         if dxfversion > DXF12:
             self.objects.export_dxf(tagwriter)
         if self.acdsdata.is_valid:
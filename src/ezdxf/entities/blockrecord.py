@@ -2,6 +2,7 @@
 # License: MIT License
 from typing import TYPE_CHECKING, Optional
 import logging
+import weakref
 from ezdxf.lldxf import validator
 from ezdxf.lldxf.attributes import (
     DXFAttr, DXFAttributes, DefSubclass, RETURN_DEFAULT, group_code_mapping
@@ -22,6 +23,8 @@ if TYPE_CHECKING:
         TagWriter, DXFNamespace, Block, EndBlk, DXFGraphic,
         EntitySpace, BlockLayout,
     )
+    from ezdxf.query import QueryIndex
+    from ezdxf.spatial import SpatialIndex
 
 __all__ = ['BlockRecord']
 
@@ -68,6 +71,8 @@ class BlockRecord(DXFEntity):
     DXFTYPE = 'BLOCK_RECORD'
     DXFATTRIBS = DXFAttributes(base_class, acdb_symbol_table_record,
                                acdb_blockrec)
+    # Cached is_block_layout state, None if not calculated yet:
+    _is_block_definition: Optional[bool] = None
 
     def __init__(self):
         from ezdxf.entitydb import EntitySpace
@@ -79,6 +84,10 @@ class BlockRecord(DXFEntity):
         self.endblk: Optional[EndBlk] = None
         # stores also the block layout structure
         self.block_layout: Optional[BlockLayout] = None
+        # optional secondary index of the entity space for queries:
+        self.query_index: Optional[QueryIndex] = None
+        # optional spatial indices of the entity space, created on demand:
+        self._spatial_indices: Optional[weakref.WeakSet] = None
 
     def set_block(self, block: 'Block', endblk: 'EndBlk'):
         self.block = block
@@ -148,6 +157,8 @@ class BlockRecord(DXFEntity):
         del self.block
         del self.endblk
         del self.block_layout
+        self.query_index = None
+        self._spatial_indices = None
         super().destroy()
 
     @property
@@ -177,6 +188,29 @@ class BlockRecord(DXFEntity):
         """
         return not self.is_any_layout
 
+    def mark_modified(self) -> None:
+        """ Set a new modification stamp, a modification of a block
+        definition is also stored as modification of the BLOCKS section,
+        because block references (INSERT) of this block can reside in other
+        blocks.
+
+        (internal API)
+        """
+        super().mark_modified()
+        doc = self.doc
+        if doc is None or doc.blocks is None:
+            return
+        is_block_definition = self._is_block_definition
+        if is_block_definition is None:
+            is_block_definition = self.is_block_layout
+            self._is_block_definition = is_block_definition
+        if is_block_definition:
+            doc.blocks.modification_stamp = self.modification_stamp
+
+    def on_name_change(self, name: str) -> None:
+        # Reset cached block definition state, see mark_modified():
+        self._is_block_definition = None
+
     def add_entity(self, entity: 'DXFGraphic') -> None:
         """ Add an existing DXF entity to BLOCK_RECORD.
 
@@ -190,7 +224,22 @@ class BlockRecord(DXFEntity):
                              paperspace=int(self.is_any_paperspace))
         else:
             logger.debug('Unexpected entity {}'.format(entity))
+        self.mark_modified()
         self.entity_space.add(entity)
+        if self.query_index is not None:
+            self.query_index.insert(entity)
+        if self._spatial_indices:
+            for index in self._spatial_indices:
+                index.insert(entity)
+
+    def register_spatial_index(self, index: 'SpatialIndex') -> None:
+        """ Register `index` to be updated by :meth:`add_entity` and
+        :meth:`unlink_entity`, the BLOCK_RECORD holds only a weak reference
+        to the `index`. (internal API)
+        """
+        if self._spatial_indices is None:
+            self._spatial_indices = weakref.WeakSet()
+        self._spatial_indices.add(index)
 
     def unlink_entity(self, entity: 'DXFGraphic') -> None:
         """ Unlink `entity` from BLOCK_RECORD.
@@ -204,7 +253,13 @@ class BlockRecord(DXFEntity):
         """
         if entity.is_alive:
             self.entity_space.remove(entity)
+            if self.query_index is not None:
+                self.query_index.remove(entity)
+            if self._spatial_indices:
+                for index in self._spatial_indices:
+                    index.remove(entity)
             entity.set_owner(None)
+            self.mark_modified()
 
     def delete_entity(self, entity: 'DXFGraphic') -> None:
         """ Delete `entity` from BLOCK_RECORD entity space and drawing database.
@@ -29,7 +29,7 @@ from ezdxf.lldxf.attributes import DXFAttr, DXFAttributes, DefSubclass
 from ezdxf.tools import set_flag_state
 from . import factory
 from .appdata import AppData, Reactors
-from .dxfns import DXFNamespace, SubclassProcessor
+from .dxfns import DXFNamespace, LazyDXFNamespace, SubclassProcessor
 from .xdata import XData, EmbeddedObjects
 from .xdict import ExtensionDict
 
@@ -57,6 +57,27 @@ base_class = DefSubclass(None, {
 
 T = TypeVar('T', bound='DXFEntity')
 
+# Global source of modification stamps, a later modification has always a
+# greater stamp, regardless of the modified entity, 0 is the stamp of
+# unmodified entities:
+_modification_stamp = 0
+
+
+def next_modification_stamp() -> int:
+    """ Returns a new modification stamp, which is greater than all stamps
+    of previous modifications. (internal API)
+    """
+    global _modification_stamp
+    _modification_stamp += 1
+    return _modification_stamp
+
+
+def current_modification_stamp() -> int:
+    """ Returns the stamp of the last modification without issuing a new
+    stamp. (internal API)
+    """
+    return _modification_stamp
+
 
 class DXFEntity:
     """ Common super class for all DXF entities. """
@@ -70,6 +91,9 @@ class DXFEntity:
     # an existing object in the dxf namespace.
     DEFAULT_ATTRIBS: Dict = {}
     MIN_DXF_VERSION_FOR_EXPORT = const.DXF12
+    # Stamp of the last modification, 0 for unmodified entities, storing the
+    # default value as class var needs no memory for unmodified entities:
+    modification_stamp: int = 0
 
     def __init__(self):
         """ Default constructor. (internal API)"""
@@ -106,6 +130,16 @@ class DXFEntity:
             self._uuid = uuid_
         return uuid_
 
+    def mark_modified(self) -> None:
+        """ Set a new modification stamp, which invalidates cached data
+        derived from the entity content, like bounding boxes. Called by the
+        DXF namespace for changed DXF attributes and by entity methods which
+        modify data outside of the DXF namespace, like vertices.
+
+        (internal API)
+        """
+        self.modification_stamp = next_modification_stamp()
+
     @classmethod
     def new(cls: Type[T], handle: str = None, owner: str = None,
             dxfattribs: Dict = None, doc: 'Drawing' = None) -> T:
@@ -196,6 +230,54 @@ class DXFEntity:
         entity.load_tags(tags, dxfversion=dxfversion)
         return entity
 
+    @classmethod
+    def lazy_load(cls: Type[T], tags: Tags) -> T:
+        """ Constructor to generate lazy loaded entities from an external
+        source.
+
+        Stores just the raw DXF `tags`, only the handle and the owner handle
+        are available without loading the entity content. The returned entity
+        is an instance of a lazy subclass of `cls`, which loads the content at
+        the first access of a DXF attribute or any other entity data and
+        becomes an instance of `cls` afterwards. The entity type has to support
+        a simple :meth:`post_load_hook`, see also :class:`LazyEntity`.
+
+        Args:
+            tags: DXF tags as :class:`Tags`
+
+        (internal API)
+        """
+        entity = lazy_class(cls).__new__(lazy_class(cls))
+        entity._lazy_tags = tags
+        entity.doc = None
+        entity.dxf = LazyDXFNamespace(tags, entity)
+        return entity
+
+    @property
+    def is_lazy(self) -> bool:
+        """ Returns ``True`` if the content of a lazy loaded entity is not
+        loaded yet. (internal API)
+        """
+        return False
+
+    def load_lazy_content(self) -> bool:
+        """ Load the content of a lazy loaded entity, returns ``False`` if
+        the entity is not lazy loaded or the content is already loaded.
+
+        (internal API)
+        """
+        return False
+
+    def run_deferred_post_load_hook(self) -> None:
+        """ Run the :meth:`post_load_hook` of an entity, which content was
+        loaded lazy while the DXF document was loading, after the document
+        is fully initialized. (internal API)
+        """
+        if self.__dict__.pop('has_deferred_post_load_hook', False):
+            cmd = self.post_load_hook(self.doc)
+            if cmd is not None:
+                cmd()
+
     def load_tags(self, tags: ExtendedTags, dxfversion: str = None) -> None:
         """ Generic tag loading interface, called if DXF document is loaded
         from external sources.
@@ -516,6 +598,8 @@ class DXFEntity:
         del self.embedded_objects  # todo: remove
         del self.doc
         del self.dxf  # check mark for is_alive
+        # Destruction is a modification for observers like the SpatialIndex:
+        self.modification_stamp = next_modification_stamp()
 
     def preprocess_export(self, tagwriter: 'TagWriter') -> bool:
         """ Pre requirement check and pre processing for export.
@@ -815,6 +899,89 @@ class DXFEntity:
             self.reactors.discard(handle)
 
 
+class LazyEntity:
+    """ Mixin class for lazy loaded entities, the lazy entity class is a
+    subclass of the real entity class created by :func:`lazy_class`, which
+    keeps :func:`isinstance` checks intact. Loading the content changes the
+    class of the entity into the real entity class, therefore only not yet
+    loaded entities have the :meth:`__getattr__` hook.
+
+    (internal class)
+    """
+    # The real entity class:
+    _entity_class: Type[DXFEntity] = DXFEntity
+
+    @property
+    def is_lazy(self) -> bool:
+        return '_lazy_tags' in self.__dict__
+
+    def load_lazy_content(self) -> bool:
+        tags = self.__dict__.pop('_lazy_tags', None)
+        if tags is None:
+            return False
+        namespace: LazyDXFNamespace = self.__dict__['dxf']
+        doc = self.__dict__['doc']
+        self.__class__ = self._entity_class
+        self.__init__()
+        self.doc = doc
+        self.load_tags(ExtendedTags(tags))
+        namespace.update(self.dxf)
+        if doc is None:
+            return True
+        if doc.is_loading:
+            # Lazy loaded entities are excluded from the 2nd loading stage of
+            # the document, run the post_load_hook() when the document is
+            # fully initialized:
+            self.has_deferred_post_load_hook = True
+            doc._post_init_commands.append(self.run_deferred_post_load_hook)
+        else:
+            cmd = self.post_load_hook(doc)
+            if cmd is not None:
+                cmd()
+        return True
+
+    def __getattr__(self, key: str) -> Any:
+        """ Called if attribute `key` does not exist, loads the content of a
+        lazy loaded entity at the first access.
+        """
+        # no magic for protocols like pickle or copy:
+        if not key.startswith('__') and self.load_lazy_content():
+            return getattr(self, key)
+        raise AttributeError(
+            f"'{self.__class__.__name__}' object has no attribute '{key}'")
+
+    def copy(self) -> DXFEntity:
+        self.load_lazy_content()
+        return self.copy()
+
+    def __reduce_ex__(self, protocol):
+        return _new_lazy_entity, (self._entity_class,), self.__dict__
+
+
+_LAZY_CLASSES: Dict[Type[DXFEntity], Type[DXFEntity]] = dict()
+
+
+def lazy_class(cls: Type[DXFEntity]) -> Type[DXFEntity]:
+    """ Returns the lazy loading subclass of entity class `cls`.
+    (internal API)
+    """
+    try:
+        return _LAZY_CLASSES[cls]
+    except KeyError:
+        lazy = type('Lazy' + cls.__name__, (LazyEntity, cls), {
+            '_entity_class': cls,
+            '__module__': cls.__module__,
+        })
+        _LAZY_CLASSES[cls] = lazy
+        return lazy
+
+
+def _new_lazy_entity(cls: Type[DXFEntity]) -> DXFEntity:
+    # pickle support of lazy loaded entities
+    lazy = lazy_class(cls)
+    return lazy.__new__(lazy)
+
+
 @factory.set_default_class
 class DXFTagStorage(DXFEntity):
     """ Just store all the tags as they are. (internal class) """
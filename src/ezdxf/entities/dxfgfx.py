@@ -181,6 +181,43 @@ class DXFGraphic(DXFEntity):
                     f'Linetype "{self.dxf.linetype}" not defined.'
                 )
 
+    def mark_modified(self) -> None:
+        """ Set a new modification stamp and marks the BLOCK_RECORD as
+        modified, if the entity resides in a block definition.
+
+        (internal API)
+        """
+        super().mark_modified()
+        doc = self.doc
+        if doc is None:
+            return
+        # New entities have no owner until they are added to a layout:
+        owner = self.dxf.owner
+        if owner is not None:
+            block_record = doc.entitydb.get(owner)
+            # Modifications of the modelspace and paperspace layouts do not
+            # change block definitions:
+            if block_record is not None and \
+                    block_record.DXFTYPE == 'BLOCK_RECORD' and \
+                    block_record._is_block_definition is not False:
+                block_record.mark_modified()
+
+    def update_query_index(self) -> None:
+        """ Update the :class:`~ezdxf.query.QueryIndex` of the owner layout
+        after changing an indexed DXF attribute.
+
+        (internal API)
+        """
+        doc = self.doc
+        if doc is None:
+            return
+        block_record = doc.entitydb.get(self.dxf.owner)
+        # The owner of sub-entities like VERTEX or ATTRIB is not a
+        # BLOCK_RECORD:
+        query_index = getattr(block_record, 'query_index', None)
+        if query_index is not None:
+            query_index.update(self)
+
     @property
     def rgb(self) -> Optional[Tuple[int, int, int]]:
         """ Returns RGB true color as (r, g, b) tuple or None if true_color is
@@ -1,11 +1,17 @@
 # Copyright (c) 2020, Manfred Moitzi
 # License: MIT License
-from typing import Any, Optional, Union, Iterable, List, TYPE_CHECKING, Dict
+from typing import (
+    Any, Optional, Union, Iterable, List, TYPE_CHECKING, Dict, Callable,
+)
 import logging
 from ezdxf import options
 from ezdxf.lldxf import const
-from ezdxf.lldxf.attributes import XType, DXFAttributes, DefSubclass, DXFAttr
-from ezdxf.lldxf.types import cast_value, dxftag
+from ezdxf.lldxf.attributes import (
+    XType, DXFAttributes, DefSubclass, DXFAttr, ExportItem, EXPORT_POINT,
+    EXPORT_POINT2D, EXPORT_BINARY, EXPORT_CALLBACK, EXPORT_INVALID,
+)
+from ezdxf.lldxf.types import cast_value, dxftag, DXFVertex
+from ezdxf.math import Vec3
 from ezdxf.lldxf.tags import Tags
 
 logger = logging.getLogger('ezdxf')
@@ -13,7 +19,7 @@ logger = logging.getLogger('ezdxf')
 if TYPE_CHECKING:
     from ezdxf.eztypes import ExtendedTags, DXFEntity, TagWriter
 
-__all__ = ['DXFNamespace', 'SubclassProcessor']
+__all__ = ['DXFNamespace', 'LazyDXFNamespace', 'SubclassProcessor']
 
 ERR_INVALID_DXF_ATTRIB = 'Invalid DXF attribute "{}" for entity {}'
 ERR_DXF_ATTRIB_NOT_EXITS = 'DXF attribute "{}" does not exist'
@@ -28,6 +34,7 @@ SETTER_EVENTS = {
     'linetype': 'on_linetype_change',
     'style': 'on_style_change',
     'dimstyle': 'on_dimstyle_change',
+    'name': 'on_name_change',
 }
 
 
@@ -78,6 +85,13 @@ class DXFNamespace:
     def __deepcopy__(self, memodict: dict = None):
         return self.copy(self._entity)
 
+    def __getstate__(self):
+        return self.__dict__
+
+    def __setstate__(self, state):
+        # bypass __setattr__() and __getattr__() while unpickling
+        self.__dict__.update(state)
+
     def reset_handles(self):
         """ Reset handle and owner to None. """
         self.__dict__['handle'] = None
@@ -166,6 +180,18 @@ class DXFNamespace:
             handler = getattr(self._entity, SETTER_EVENTS[key], None)
             if handler:
                 handler(value)
+        self._mark_modified(key)
+
+    def _mark_modified(self, key: str) -> None:
+        # DXFNamespace is maybe not assigned to the entity yet:
+        entity = self._entity
+        mark_modified = getattr(entity, 'mark_modified', None)
+        if mark_modified:
+            mark_modified()
+        if key in const.INDEXED_DXF_ATTRIBS:
+            update_query_index = getattr(entity, 'update_query_index', None)
+            if update_query_index:
+                update_query_index()
 
     def __delattr__(self, key: str) -> None:
         """ Delete DXF attribute `key`.
@@ -176,6 +202,7 @@ class DXFNamespace:
         """
         if self.hasattr(key):
             del self.__dict__[key]
+            self._mark_modified(key)
         else:
             raise const.DXFAttributeError(ERR_DXF_ATTRIB_NOT_EXITS.format(key))
 
@@ -237,6 +264,8 @@ class DXFNamespace:
             del self.__dict__[key]
         except KeyError:
             pass
+        else:
+            self._mark_modified(key)
 
     def is_supported(self, key: str) -> bool:
         """ Returns True if DXF attribute `key` is supported else False.
@@ -276,65 +305,206 @@ class DXFNamespace:
         value. DXF version check is always on: does not export DXF attribs
         which are not supported by tagwriter.dxfversion.
 
+        The export is done by a compiled export function for each combination
+        of attribute names and DXF version, see :func:`compile_exporter`.
+
         Args:
             tagwriter: tag writer object
             attribs: DXF attribute name as string or an iterable of names
 
         """
         if isinstance(attribs, str):
-            self._export_dxf_attribute_optional(tagwriter, attribs)
+            attribs = (attribs,)
+        elif not isinstance(attribs, tuple):
+            attribs = tuple(attribs)
+        key = (attribs, tagwriter.dxfversion, tagwriter.force_optional)
+        dxfattribs = self.dxfattribs
+        try:
+            exporter = dxfattribs.exporters[key]
+        except KeyError:
+            exporter = compile_exporter(dxfattribs.export_plan(*key))
+            dxfattribs.exporters[key] = exporter
+        exporter(self, tagwriter)
+
+
+def _export_point2d(tagwriter: 'TagWriter', code: int, value) -> None:
+    # Just export x, y for 2D points, if value is a 3D point
+    if len(value) > 2:
+        try:  # Vec3
+            value = (value.x, value.y)
+        except AttributeError:
+            value = value[:2]
+    tagwriter.write_tag(DXFVertex(code, value))
+
+
+def _invalid_attrib(namespace: DXFNamespace, name: str) -> None:
+    raise const.DXFAttributeError(
+        ERR_INVALID_DXF_ATTRIB.format(name, namespace.dxftype))
+
+
+def compile_exporter(
+        plan: Iterable[ExportItem]
+) -> Callable[[DXFNamespace, 'TagWriter'], None]:
+    """ Returns a specialized export function for an export plan created by
+    :meth:`DXFAttributes.export_plan`. The function has the signature
+    ``exporter(namespace, tagwriter)`` and writes the DXF attributes of the
+    `namespace` without any lookup of the DXF attribute definitions.
+
+    (internal API)
+    """
+    source = [
+        'def exporter(namespace, tagwriter):',
+        '    values = namespace.__dict__',
+        '    write_tag2 = tagwriter.write_tag2',
+    ]
+    constants = {
+        'Vec3': Vec3,
+        'DXFVertex': DXFVertex,
+        'dxftag': dxftag,
+        '_export_point2d': _export_point2d,
+        '_invalid_attrib': _invalid_attrib,
+    }
+    for index, item in enumerate(plan):
+        name, code, kind, cast, fallback, check_default, default = item
+        if kind == EXPORT_INVALID:
+            source.append(f'    _invalid_attrib(namespace, {name!r})')
+            continue
+        fallback_name = f'fallback{index}'
+        default_name = f'default{index}'
+        cast_name = f'cast{index}'
+        constants[fallback_name] = fallback
+        constants[default_name] = default
+        constants[cast_name] = cast
+        if kind == EXPORT_CALLBACK:
+            source.append(
+                f'    value = namespace.get({name!r}, {fallback_name})')
         else:
-            for name in attribs:
-                self._export_dxf_attribute_optional(tagwriter, name)
+            source.append(f'    value = values.get({name!r}, {fallback_name})')
+        # Do not export None values and do not write explicit optional
+        # attribs if equal to default value:
+        condition = 'value is not None'
+        if check_default:
+            condition += f' and not {default_name} == value'
+        source.append(f'    if {condition}:')
+        if kind == EXPORT_POINT:
+            source.extend([
+                '        if isinstance(value, Vec3):',
+                f'            tagwriter.write_vertex({code}, value)',
+                '        else:',
+                f'            tagwriter.write_tag(DXFVertex({code}, value))',
+            ])
+        elif kind == EXPORT_POINT2D:
+            source.append(f'        _export_point2d(tagwriter, {code}, value)')
+        elif kind == EXPORT_BINARY:
+            source.append(f'        tagwriter.write_tag(dxftag({code}, value))')
+        elif cast is str:  # all tag writers convert values to strings
+            source.extend([
+                '        if isinstance(value, str):',
+                '            assert "\\n" not in value, '
+                '"line break \'\\\\n\' not allowed"',
+                '            assert "\\r" not in value, '
+                '"line break \'\\\\r\' not allowed"',
+                f'        write_tag2({code}, value)',
+            ])
+        else:
+            source.append(f'        write_tag2({code}, {cast_name}(value))')
+    exec('\n'.join(source), constants)
+    return constants['exporter']
 
-    def _export_dxf_attribute_optional(self, tagwriter: 'TagWriter',
-                                       name: str) -> None:
-        """ Exports DXF attribute `name` by `tagwriter`. Optional tags are only
-        written if different to default value.
 
-        Args:
-            tagwriter: tag writer object
-            name: DXF attribute name
+class LazyDXFNamespace:
+    """ Placeholder for the :class:`DXFNamespace` of a lazy loaded entity.
 
-        """
-        export_dxf_version = tagwriter.dxfversion
-        not_force_optional = not tagwriter.force_optional
-        attrib: Optional['DXFAttr'] = self.dxfattribs.get(name)
+    Knows only the handle and the owner handle, which are required to store
+    the entity in the entity database and in a layout. Changes of the handle,
+    the owner and the paperspace flag are stored until the entity content is
+    loaded, any other attribute access loads the entity content and is
+    forwarded to the real :class:`DXFNamespace`.
 
-        if attrib:
-            optional = attrib.optional
-            default = attrib.default
-            value = self.get(name, None)
-            # Force default value e.g. layer
-            if value is None and not optional:
-                # Default value could be None
-                value = default
-
-                # Do not export None values
-            if ((value is not None) and
-                    (export_dxf_version >= attrib.dxfversion)):
-                # Do not write explicit optional attribs if equal to default
-                # value
-                if (optional
-                        and not_force_optional
-                        and default is not None
-                        and default == value):
-                    return
-                    # Just export x, y for 2D points, if value is a 3D point
-                if attrib.xtype == XType.point2d and len(value) > 2:
-                    try:  # Vec3
-                        value = (value.x, value.y)
-                    except AttributeError:
-                        value = value[:2]
-
-                if isinstance(value, str):
-                    assert '\n' not in value, "line break '\\n' not allowed"
-                    assert '\r' not in value, "line break '\\r' not allowed"
-                tag = dxftag(attrib.code, value)
-                tagwriter.write_tag(tag)
+    (internal class)
+    """
+    __slots__ = ('_entity', 'handle', 'owner', '_paperspace')
+
+    def __init__(self, tags: Tags, entity: 'DXFEntity'):
+        handle = None
+        owner = None
+        appdata = False
+        # Scan only the base class, which ends at the first subclass marker:
+        for tag in tags:
+            code = tag.code
+            if code == 5:
+                handle = tag.value
+            elif code == 330:
+                # ignore the reactor handles in app data "{ACAD_REACTORS"
+                if owner is None and not appdata:
+                    owner = tag.value
+            elif code == 102:
+                appdata = tag.value.startswith('{')
+            elif code == 100:
+                break
+        # bypass __setattr__()
+        setattr_ = object.__setattr__
+        setattr_(self, '_entity', entity)
+        setattr_(self, 'handle', handle)
+        setattr_(self, 'owner', owner)
+        setattr_(self, '_paperspace', None)
+
+    def __getstate__(self):
+        return {name: getattr(self, name) for name in self.__slots__
+                if name not in ('handle', 'owner') or self._entity.is_lazy}
+
+    def __setstate__(self, state):
+        # bypass __setattr__() and __getattr__() while unpickling
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
+    def _namespace(self) -> DXFNamespace:
+        entity = self._entity
+        entity.load_lazy_content()
+        return entity.dxf
+
+    def __getattr__(self, key: str) -> Any:
+        if key.startswith('__'):  # no magic for protocols like pickle or copy
+            raise AttributeError(key)
+        entity = self._entity
+        if key == 'paperspace' and entity.is_lazy:
+            # required to assign entities without owner handle (DXF R12)
+            # to a layout
+            paperspace = self._paperspace
+            if paperspace is None:
+                paperspace = entity._lazy_tags.get_first_value(67, 0)
+            return paperspace
+        return getattr(self._namespace(), key)
+
+    def __setattr__(self, key: str, value: Any) -> None:
+        if key in ('handle', 'owner') and self._entity.is_lazy:
+            object.__setattr__(self, key, value)
+        elif key == 'paperspace' and self._entity.is_lazy:
+            object.__setattr__(self, '_paperspace', int(value))
         else:
-            raise const.DXFAttributeError(
-                ERR_INVALID_DXF_ATTRIB.format(name, self.dxftype))
+            setattr(self._namespace(), key, value)
+
+    def discard(self, key: str) -> None:
+        """ Delete DXF attribute `key` silently without any exception. """
+        if key == 'paperspace' and self._entity.is_lazy:
+            object.__setattr__(self, '_paperspace', 0)
+        else:
+            self._namespace().discard(key)
+
+    def update(self, dxf: DXFNamespace) -> None:
+        """ Transfer stored changes to the loaded namespace `dxf` and forward
+        further access of handle and owner to the loaded namespace.
+        (internal API)
+        """
+        dxf.unprotected_set('handle', self.handle)
+        dxf.unprotected_set('owner', self.owner)
+        paperspace = self._paperspace
+        if paperspace:
+            dxf.paperspace = paperspace
+        elif paperspace is not None:
+            dxf.discard('paperspace')
+        object.__delattr__(self, 'handle')
+        object.__delattr__(self, 'owner')
 
 
 BASE_CLASS_CODES = {0, 5, 102, 330}
@@ -3,11 +3,11 @@
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from ezdxf.eztypes import Drawing, DXFEntity, ExtendedTags
+    from ezdxf.eztypes import Drawing, DXFEntity, ExtendedTags, Tags
 
 __all__ = [
     'register_entity', 'ENTITY_CLASSES', 'replace_entity',
-    'new', 'cls', 'is_bound', 'create_db_entry', 'load', 'bind'
+    'new', 'cls', 'is_bound', 'create_db_entry', 'load', 'lazy_load', 'bind'
 ]
 # Stores all registered classes:
 ENTITY_CLASSES = {}
@@ -58,6 +58,13 @@ def load(tags: 'ExtendedTags') -> 'DXFEntity':
     return entity.cast() if hasattr(entity, 'cast') else entity
 
 
+def lazy_load(tags: 'Tags') -> 'DXFEntity':
+    """ Returns a lazy loaded entity, which stores just the raw `tags` until
+    the entity content is used, see :meth:`DXFEntity.lazy_load`.
+    """
+    return cls(tags[0].value).lazy_load(tags)
+
+
 def cls(dxftype: str) -> 'DXFEntity':
     """ Returns registered class for `dxftype`. """
     return ENTITY_CLASSES.get(dxftype, DEFAULT_CLASS)
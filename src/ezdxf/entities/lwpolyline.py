@@ -196,10 +196,12 @@ class LWPolyline(DXFGraphic):
 
         """
         self.lwpoints[index] = compile_array(value)
+        self.mark_modified()
 
     def __delitem__(self, index: int) -> None:
         """ Delete point at position `index`, supports extended slicing. """
         del self.lwpoints[index]
+        self.mark_modified()
 
     def vertices(self) -> Iterable[Tuple[float, float]]:
         """
@@ -238,6 +240,7 @@ class LWPolyline(DXFGraphic):
 
         """
         self.lwpoints.append(point, format=format)
+        self.mark_modified()
 
     def insert(self, pos: int, point: Sequence[float],
                format: str = DEFAULT_FORMAT) -> None:
@@ -254,6 +257,7 @@ class LWPolyline(DXFGraphic):
         """
         data = compile_array(point, format=format)
         self.lwpoints.insert(pos, data)
+        self.mark_modified()
 
     def append_points(self, points: Iterable[Sequence[float]],
                       format: str = DEFAULT_FORMAT) -> None:
@@ -271,6 +275,7 @@ class LWPolyline(DXFGraphic):
         """
         for point in points:
             self.lwpoints.append(point, format=format)
+        self.mark_modified()
 
     @contextmanager
     def points(self, format: str = DEFAULT_FORMAT) -> List[Sequence[float]]:
@@ -318,6 +323,7 @@ class LWPolyline(DXFGraphic):
     def clear(self) -> None:
         """ Remove all points. """
         self.lwpoints.clear()
+        self.mark_modified()
 
     def transform(self, m: 'Matrix44') -> 'LWPolyline':
         """ Transform LWPOLYLINE entity by transformation matrix `m` inplace.
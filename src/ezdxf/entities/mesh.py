@@ -303,6 +303,7 @@ class Mesh(DXFGraphic):
     @vertices.setter
     def vertices(self, points: Iterable['Vertex']) -> None:
         self._vertices = VertexArray(chain.from_iterable(points))
+        self.mark_modified()
 
     @property
     def edges(self):
@@ -355,6 +356,7 @@ class Mesh(DXFGraphic):
 
         """
         self._vertices.transform(m)
+        self.mark_modified()
         return self
 
 
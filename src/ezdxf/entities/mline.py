@@ -839,11 +839,7 @@ class MLineStyle(DXFObject):
         """
         if self.doc:
             handle = self.dxf.handle
-            mlines = (
-                e for e in self.doc.entitydb.values()
-                if e.dxftype() == 'MLINE'
-            )
-            for mline in mlines:
+            for mline in self.doc.entitydb.by_type('MLINE'):
                 if mline.dxf.style_handle == handle:
                     mline.update_geometry()
 
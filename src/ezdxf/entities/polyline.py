@@ -293,6 +293,24 @@ class Polyline(LinkedEntities):
         """
         return self.vertices[pos]
 
+    def __delitem__(self, pos) -> None:
+        """ Delete :class:`Vertex` entity at position `pos`, supports
+        ``list`` slicing. The deleted vertices are destroyed.
+
+        .. versionadded:: 0.15.2
+
+        """
+        vertices = self.vertices[pos]
+        del self.vertices[pos]
+        if not isinstance(vertices, list):
+            vertices = [vertices]
+        db = self.doc.entitydb if self.doc else None
+        for vertex in vertices:
+            if db is not None:
+                db.discard(vertex)
+            vertex.destroy()
+        self.mark_modified()
+
     def points(self) -> Iterable[Vec3]:
         """ Returns iterable of all polyline vertices as ``(x, y, z)`` tuples,
         not as :class:`Vertex` objects.
@@ -301,6 +319,7 @@ class Polyline(LinkedEntities):
 
     def _append_vertex(self, vertex: 'DXFVertex') -> None:
         self.vertices.append(vertex)
+        self.mark_modified()
 
     def append_vertices(self, points: Iterable['Vertex'],
                         dxfattribs: Dict = None) -> None:
@@ -371,6 +390,7 @@ class Polyline(LinkedEntities):
         dxfattribs = dxfattribs or {}
         self.vertices[pos:pos] = list(
             self._build_dxf_vertices(points, dxfattribs))
+        self.mark_modified()
 
     def _build_dxf_vertices(self, points: Iterable['Vertex'],
                             dxfattribs: dict) -> List['DXFVertex']:
@@ -623,6 +643,7 @@ class Polyface(Polyline):
         polyface_builder = PolyfaceBuilder(faces, precision=precision)
         self._sub_entities = []
         self._sub_entities = polyface_builder.get_vertices()
+        self.mark_modified()
         self.update_count(polyface_builder.nvertices, polyface_builder.nfaces)
 
     def update_count(self, nvertices: int, nfaces: int) -> None:
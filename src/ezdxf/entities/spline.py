@@ -190,6 +190,7 @@ class Spline(DXFGraphic):
     @knots.setter
     def knots(self, values: Iterable[float]) -> None:
         self._knots = array.array('d', values)
+        self.mark_modified()
 
     # DXF callback attribute Spline.dxf.n_knots
     def knot_count(self) -> int:
@@ -204,6 +205,7 @@ class Spline(DXFGraphic):
     @weights.setter
     def weights(self, values: Iterable[float]) -> None:
         self._weights = array.array('d', values)
+        self.mark_modified()
 
     @property
     def control_points(self) -> VertexArray:
@@ -216,6 +218,7 @@ class Spline(DXFGraphic):
     def control_points(self, points: Iterable['Vertex']) -> None:
         self._control_points = VertexArray(
             chain.from_iterable(Vec3.generate(points)))
+        self.mark_modified()
 
     # DXF callback attribute Spline.dxf.n_control_points
     def control_point_count(self) -> int:
@@ -233,6 +236,7 @@ class Spline(DXFGraphic):
     def fit_points(self, points: Iterable['Vertex']) -> None:
         self._fit_points = VertexArray(
             chain.from_iterable(Vec3.generate(points)))
+        self.mark_modified()
 
     # DXF callback attribute Spline.dxf.n_fit_points
     def fit_point_count(self) -> int:
@@ -426,6 +430,7 @@ class Spline(DXFGraphic):
         """
         self._control_points.transform(m)
         self._fit_points.transform(m)
+        self.mark_modified()
         # Transform optional attributes if they exist
         dxf = self.dxf
         for name in ('start_tangent', 'end_tangent', 'extrusion'):
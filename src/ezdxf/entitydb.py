@@ -26,13 +26,17 @@ class EntityDB:
     DXFEntity or inherited types, this entities are stored in the
     DXF document database, database-key is the `handle` as string.
 
+    The database maintains a table of entities for each DXF type to speed up
+    type scans and the highest handle in use as integer value, so new handles
+    can be allocated without testing each candidate.
+
     """
 
     class Trashcan:
         """ Store handles to entities which should be deleted later. """
 
         def __init__(self, db: 'EntityDB'):
-            self._database = db._database
+            self._db = db
             self._handles: Set[str] = set()
 
         def add(self, handle: str):
@@ -45,19 +49,22 @@ class EntityDB:
             """ Remove handles in trashcan from database and destroy entities if
             still alive.
             """
-            db = self._database
+            db = self._db
             for handle in self._handles:
                 entity = db.get(handle)
                 if entity and entity.is_alive:
                     entity.destroy()
-
-                if handle in db:
-                    del db[handle]
+                db._remove(handle)
 
             self._handles.clear()
 
     def __init__(self):
         self._database: Dict[str, DXFEntity] = {}
+        # Entities of the same DXF type, the DXF type is the key, the values
+        # are dicts like the main database in insertion order:
+        self._types: Dict[str, Dict[str, DXFEntity]] = {}
+        # Highest handle ever stored in the database as integer value:
+        self._max_handle: int = 0
         # DXF handles of entities to delete later:
         self.handles = HandleGenerator()
         self.locked: bool = False  # used only for debugging
@@ -78,7 +85,22 @@ class EntityDB:
 
         if handle == '0' or not is_valid_handle(handle):
             raise ValueError(f'Invalid handle {handle}.')
-        self._database[handle] = entity
+        database = self._database
+        old_entity = database.get(handle)
+        if old_entity is entity:
+            return
+        if old_entity is not None:
+            self._remove(handle)
+        else:
+            value = int(handle, 16)
+            if value > self._max_handle:
+                self._max_handle = value
+        database[handle] = entity
+        dxftype = entity.dxftype()
+        try:
+            self._types[dxftype][handle] = entity
+        except KeyError:
+            self._types[dxftype] = {handle: entity}
 
     def __delitem__(self, handle: str) -> None:
         """ Delete entity by `handle`. Removes entity only from database, does
@@ -86,7 +108,20 @@ class EntityDB:
         """
         if self.locked:
             raise DXFInternalEzdxfError('Locked entity database.')
-        del self._database[handle]
+        if self._remove(handle) is None:
+            raise KeyError(handle)
+
+    def _remove(self, handle: str) -> Optional[DXFEntity]:
+        """ Remove `handle` from all tables, returns the removed entity or
+        ``None`` if `handle` does not exist. (internal API)
+        """
+        entity = self._database.pop(handle, None)
+        if entity is not None:
+            entities = self._types[entity.dxftype()]
+            del entities[handle]
+            if not entities:
+                del self._types[entity.dxftype()]
+        return entity
 
     def __contains__(self, handle: str) -> bool:
         """ ``True`` if database contains `handle`. """
@@ -113,10 +148,13 @@ class EntityDB:
 
     def next_handle(self) -> str:
         """ Returns next unique handle."""
-        while True:
-            handle = self.handles.next()
-            if handle not in self._database:
-                return handle
+        handles = self.handles
+        if int(handles) <= self._max_handle:
+            # The handle generator can be reset to a lower value, e.g. by an
+            # invalid $HANDSEED, all handles above the highest handle in use
+            # are free:
+            handles.reset('%X' % (self._max_handle + 1))
+        return handles.next()
 
     def keys(self) -> Iterable[str]:
         """ Iterable of all handles, does filter destroyed entities.
@@ -126,7 +164,8 @@ class EntityDB:
     def values(self) -> Iterable[DXFEntity]:
         """ Iterable of all entities, does filter destroyed entities.
         """
-        return (entity for handle, entity in self.items())
+        return (entity for entity in self._database.values()
+                if entity.is_alive)
 
     def items(self) -> Iterable[Tuple[str, DXFEntity]]:
         """ Iterable of all (handle, entities) pairs, does filter destroyed
@@ -137,6 +176,22 @@ class EntityDB:
             if entity.is_alive
         )
 
+    def by_type(self, *dxftypes: str) -> Iterable[DXFEntity]:
+        """ Iterable of all entities of the given DXF types without scanning
+        the whole database, does filter destroyed entities. The entities of
+        each DXF type are returned in insertion order, one type after the
+        other.
+
+        .. versionadded:: 0.15.2
+
+        """
+        types = self._types
+        for dxftype in dxftypes:
+            entities = types.get(dxftype)
+            if entities:
+                # copy to allow modifications of the database while iterating:
+                yield from [e for e in entities.values() if e.is_alive]
+
     def add(self, entity: DXFEntity) -> None:
         """ Add `entity` to database, assigns a new handle to the `entity`
         if :attr:`entity.dxf.handle` is ``None``. Adding the same entity
@@ -172,11 +227,8 @@ class EntityDB:
                 entity.process_sub_entities(lambda e: self.discard(e))
 
             handle = entity.dxf.handle
-            try:
-                del self._database[handle]
+            if handle is not None and self._remove(handle) is not None:
                 entity.dxf.handle = None
-            except KeyError:
-                pass
 
     def duplicate_entity(self, entity: DXFEntity) -> DXFEntity:
         """ Duplicates `entity` and its sub entities (VERTEX, ATTRIB, SEQEND)
@@ -209,7 +261,7 @@ class EntityDB:
         add_entities = []
 
         with self.trashcan() as trash:
-            for handle, entity in self.items():
+            for handle, entity in list(self.items()):
                 # Destroyed entities are already filtered!
                 if not is_valid_handle(handle):
                     auditor.fixed_error(
@@ -221,8 +273,7 @@ class EntityDB:
                 if handle != entity.dxf.get('handle'):
                     # database handle != stored entity handle
                     # prevent entity from being destroyed:
-                    self._database[handle] = None
-                    trash.add(handle)
+                    self._remove(handle)
                     add_entities.append(entity)
 
         # Remove all destroyed entities from database:
@@ -267,17 +318,18 @@ class EntityDB:
         """ Remove all destroyed entities from database, but does not empty the
         trashcan.
         """
-        # Important: operate on underlying data structure:
-        db = self._database
         dead_handles = [
-            handle for handle, entity in db.items()
+            handle for handle, entity in self._database.items()
             if not entity.is_alive
         ]
         for handle in dead_handles:
-            del db[handle]
+            self._remove(handle)
 
     def dxf_types_in_use(self) -> Set[str]:
-        return set(entity.dxftype() for entity in self.values())
+        return set(
+            dxftype for dxftype, entities in self._types.items()
+            if any(e.is_alive for e in entities.values())
+        )
 
 
 class EntitySpace:
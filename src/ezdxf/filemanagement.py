@@ -1,14 +1,16 @@
 # Copyright (C) 2018-2020, Manfred Moitzi
 # License: MIT License
-from typing import TextIO, TYPE_CHECKING, Union, Sequence
+from typing import TextIO, TYPE_CHECKING, Union, Sequence, Optional
 import base64
 import io
+import mmap
 from ezdxf.tools.standards import setup_drawing
 from ezdxf.lldxf.const import DXF2013
 from ezdxf.document import Drawing
 
 if TYPE_CHECKING:
     from ezdxf.eztypes import DXFInfo
+    from ezdxf.lldxf.cache import ParseCache
 
 
 def new(dxfversion: str = DXF2013,
@@ -94,7 +96,10 @@ def read(stream: TextIO) -> 'Drawing':
 
 
 def readfile(filename: str, encoding: str = None,
-             errors: str = 'surrogateescape') -> 'Drawing':
+             errors: str = 'surrogateescape', *,
+             use_mmap: bool = False, workers: int = 0,
+             lazy: bool = False, compact: bool = False,
+             cache: 'ParseCache' = None) -> 'Drawing':
     """  Read the DXF document `filename` from the file-system.
 
     This is the preferred method to load existing ASCII or Binary DXF files,
@@ -119,6 +124,32 @@ def readfile(filename: str, encoding: str = None,
             - "ignore" to use the replacement char U+FFFD "\ufffd" for invalid data
             - "strict" to raise an :class:`UnicodeDecodeError` exception for invalid data
 
+        use_mmap: ``True`` to memory map ASCII DXF files and split them into
+            DXF tags by a fast bytes-level scanner, see
+            :func:`~ezdxf.lldxf.tagger.bulk_ascii_tags_loader`
+        workers: count of worker processes to load the ENTITIES, BLOCKS and
+            OBJECTS sections of ASCII DXF files in parallel, 0 to load the
+            file by the calling process, this mode requires memory mapping
+            of the file and ignores the `use_mmap` argument. On platforms
+            which start new processes by "spawn", like Windows and macOS,
+            the main module has to be guarded by
+            :code:`if __name__ == '__main__':`
+        lazy: ``True`` to store simple graphical entities like LINE, CIRCLE
+            or TEXT of the ENTITIES and BLOCKS section as raw DXF tags, the
+            entity content will be loaded at the first usage of the entity,
+            the DXF type, handle and owner are available without loading the
+            content. This mode is ignored for entities loaded by worker
+            processes.
+        compact: ``True`` to store the loaded DXF tags as
+            :class:`~ezdxf.lldxf.tags.CompactTags`, reduces the peak memory
+            usage while loading and the memory usage of lazy loaded entities,
+            but loading is slower. This mode is ignored for worker processes.
+        cache: an optional :class:`~ezdxf.lldxf.cache.ParseCache` to store
+            the loaded DXF structure on disk, loading the same file again
+            skips the tag parsing and the entity loading of the ENTITIES,
+            BLOCKS and OBJECTS sections. The arguments `workers`, `lazy` and
+            `compact` are ignored if a cache is used.
+
     Raises:
         IOError: not a DXF file or file does not exist
         DXFStructureError: for invalid or corrupted DXF structures
@@ -129,17 +160,24 @@ def readfile(filename: str, encoding: str = None,
         argument `legacy_mode`, use module :mod:`ezdxf.recover`
         to load DXF documents with structural flaws.
 
+    .. versionadded:: 0.15.2
+
+        arguments `use_mmap`, `workers`, `lazy`, `compact` and `cache`
+
     """
     from ezdxf.lldxf.validator import is_dxf_file, is_binary_dxf_file
     from ezdxf.tools.codepage import is_supported_encoding
     from ezdxf.lldxf.tagger import binary_tags_loader
 
     filename = str(filename)
+    if cache is not None:
+        return _load_cached(filename, encoding, errors, use_mmap, cache)
+
     if is_binary_dxf_file(filename):
         with open(filename, 'rb') as fp:
             data = fp.read()
             loader = binary_tags_loader(data, errors=errors)
-            return Drawing.load(loader)
+            return Drawing.load(loader, lazy=lazy, compact=compact)
 
     if not is_dxf_file(filename):
         raise IOError(f"File '{filename}' is not a DXF file.")
@@ -148,9 +186,13 @@ def readfile(filename: str, encoding: str = None,
     if encoding is not None:
         # override default encodings if absolute necessary
         info.encoding = encoding
-    with open(filename, mode='rt', encoding=info.encoding,
-              errors=errors) as fp:
-        doc = read(fp)
+    if use_mmap or workers > 0:
+        doc = _load_mmap(
+            filename, info.encoding, errors, workers, lazy, compact)
+    else:
+        with open(filename, mode='rt', encoding=info.encoding,
+                  errors=errors) as fp:
+            doc = Drawing.read(fp, lazy=lazy, compact=compact)
 
     doc.filename = filename
     if encoding is not None and is_supported_encoding(encoding):
@@ -161,6 +203,74 @@ def readfile(filename: str, encoding: str = None,
     return doc
 
 
+def _load_mmap(filename: str, encoding: str, errors: str,
+               workers: int = 0, lazy: bool = False,
+               compact: bool = False) -> 'Drawing':
+    from ezdxf.lldxf.tagger import bulk_ascii_tags_loader
+    from ezdxf.lldxf.loader import parallel_load_dxf_structure
+    with open(filename, mode='rb') as fp, \
+            mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        if workers > 0:
+            sections = parallel_load_dxf_structure(
+                data, encoding=encoding, errors=errors, workers=workers)
+            doc = Drawing()
+            doc._load_section_dict(sections, lazy=lazy)
+            return doc
+        loader = bulk_ascii_tags_loader(data, encoding=encoding, errors=errors)
+        return Drawing.load(loader, lazy=lazy, compact=compact)
+
+
+def _load_cached(filename: str, encoding: Optional[str], errors: str,
+                 use_mmap: bool, cache: 'ParseCache') -> 'Drawing':
+    from ezdxf.lldxf.validator import is_dxf_file, is_binary_dxf_file
+    from ezdxf.lldxf.tagger import (
+        binary_tags_loader, ascii_tags_loader, bulk_ascii_tags_loader,
+        tag_compiler,
+    )
+    from ezdxf.lldxf.loader import load_dxf_structure
+    from ezdxf.lldxf.cache import preload_dxf_entities
+    from ezdxf.tools.codepage import is_supported_encoding
+
+    override = None
+    binary = is_binary_dxf_file(filename)
+    if binary:
+        encoding = ''  # not required for binary DXF files
+    elif not is_dxf_file(filename):
+        raise IOError(f"File '{filename}' is not a DXF file.")
+    elif encoding is None:
+        encoding = dxf_file_info(filename).encoding
+    else:
+        override = encoding
+
+    key = cache.key(filename, encoding, errors)
+    sections = cache.get(key)
+    if sections is None:
+        if binary:
+            with open(filename, 'rb') as fp:
+                sections = load_dxf_structure(tag_compiler(
+                    binary_tags_loader(fp.read(), errors=errors)))
+        elif use_mmap:
+            with open(filename, mode='rb') as fp, \
+                    mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                sections = load_dxf_structure(tag_compiler(
+                    bulk_ascii_tags_loader(data, encoding, errors)))
+        else:
+            with open(filename, mode='rt', encoding=encoding,
+                      errors=errors) as fp:
+                sections = load_dxf_structure(tag_compiler(
+                    ascii_tags_loader(fp)))
+        sections.pop('THUMBNAILIMAGE', None)
+        preload_dxf_entities(sections)
+        cache.put(key, sections)
+    doc = Drawing()
+    doc._load_section_dict(sections)
+    if not binary:
+        doc.filename = filename
+        if override is not None and is_supported_encoding(override):
+            doc.encoding = override
+    return doc
+
+
 def dxf_file_info(filename: str) -> 'DXFInfo':
     """ Reads basic file information from a DXF document: DXF version, encoding
     and handle seed.
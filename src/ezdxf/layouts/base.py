@@ -6,7 +6,7 @@ from ezdxf.entities import factory
 from ezdxf.lldxf.const import (
     DXFValueError, DXFStructureError, LATEST_DXF_VERSION, DXFTypeError,
 )
-from ezdxf.query import EntityQuery
+from ezdxf.query import EntityQuery, QueryIndex, compile_query
 from ezdxf.groupby import groupby
 from ezdxf.entitydb import EntityDB, EntitySpace
 from ezdxf.graphicsfactory import CreatorInterface
@@ -15,6 +15,8 @@ if TYPE_CHECKING:
     from ezdxf.eztypes import (
         BlockRecord, DXFGraphic, KeyFunc, ExtensionDict,
     )
+    from ezdxf.bbox import Cache
+    from ezdxf.spatial import SpatialIndex
 
 SUPPORTED_FOREIGN_ENTITY_TYPES = {
     'ARC', 'LINE', 'CIRCLE', 'ELLIPSE', 'POINT', 'LWPOLYLINE', 'SPLINE',
@@ -264,6 +266,62 @@ class BaseLayout(_AbstractLayout):
         for entity in list(self):
             self.delete_entity(entity)
 
+    def query(self, query: str = '*') -> EntityQuery:
+        """
+        Get all DXF entities matching the :ref:`entity query string`.
+
+        Uses the :class:`~ezdxf.query.QueryIndex` of the layout if available,
+        see :meth:`build_query_index`.
+
+        """
+        query_index = self.block_record.query_index
+        if query_index is not None and query != '*':
+            candidates = query_index.candidates(compile_query(query))
+            if candidates is not None:
+                return EntityQuery(candidates, query)
+        return EntityQuery(iter(self), query)
+
+    def build_query_index(self) -> QueryIndex:
+        """ Returns the :class:`~ezdxf.query.QueryIndex` of this layout,
+        creates a new index if necessary. The index is used by :meth:`query`
+        and is updated automatically by :meth:`add_entity`,
+        :meth:`unlink_entity`, :meth:`delete_entity` and by changing the
+        indexed DXF attributes `layer`, `color` and `linetype`.
+
+        .. versionadded:: 0.15.2
+
+        """
+        block_record = self.block_record
+        if block_record.query_index is None:
+            block_record.query_index = QueryIndex(self)
+        return block_record.query_index
+
+    def discard_query_index(self) -> None:
+        """ Remove the :class:`~ezdxf.query.QueryIndex` of this layout.
+
+        .. versionadded:: 0.15.2
+
+        """
+        self.block_record.query_index = None
+
+    def spatial_index(self, cache: 'Cache' = None) -> 'SpatialIndex':
+        """ Returns a new :class:`~ezdxf.spatial.SpatialIndex` of all
+        entities in this layout. The index is updated automatically by
+        :meth:`add_entity`, :meth:`unlink_entity` and :meth:`delete_entity`
+        of any layout object of the same BLOCK_RECORD, modified and destroyed
+        entities are detected by the index at the next query.
+
+        Args:
+            cache: optional :class:`ezdxf.bbox.Cache` for the bounding boxes
+
+        .. versionadded:: 0.15.2
+
+        """
+        from ezdxf.spatial import SpatialIndex
+        index = SpatialIndex(self, cache=cache)
+        self.block_record.register_spatial_index(index)
+        return index
+
     def move_to_layout(self, entity: 'DXFGraphic',
                        layout: 'BaseLayout') -> None:
         """ Move entity to another layout.
@@ -6,6 +6,7 @@ from typing import (
     Optional, Dict, Tuple, TYPE_CHECKING, Iterable, Callable, Any,
 )
 from .const import DXFAttributeError, DXF12
+from .types import TYPE_TABLE, POINT_CODES, BINARY_DATA
 import copy
 
 if TYPE_CHECKING:
@@ -56,6 +57,17 @@ def group_code_mapping(subclass: DefSubclass, *,
 # Unique object as marker
 RETURN_DEFAULT = object()
 
+# Export kinds of DXF attributes, see DXFAttributes.export_plan():
+EXPORT_TAG = 0
+EXPORT_POINT = 1
+EXPORT_POINT2D = 2
+EXPORT_BINARY = 3
+EXPORT_CALLBACK = 4
+EXPORT_INVALID = 5
+
+# Export plan item: (name, code, kind, cast, fallback, check_default, default)
+ExportItem = Tuple[str, int, int, Callable, Any, bool, Any]
+
 
 class DXFAttr:
     """ Represents a DXF attribute for an DXF entity, accessible by the
@@ -200,10 +212,12 @@ class DXFAttr:
 
 
 class DXFAttributes:
-    __slots__ = ('_attribs',)
+    __slots__ = ('_attribs', 'exporters')
 
     def __init__(self, *subclassdefs: DefSubclass):
         self._attribs: Dict[str, DXFAttr] = dict()
+        # Cache for compiled export functions, managed by the DXFNamespace:
+        self.exporters: Dict[Tuple, Callable] = dict()
         for subclass in subclassdefs:
             for name, dxfattrib in subclass.attribs.items():
                 dxfattrib.name = name
@@ -220,6 +234,51 @@ class DXFAttributes:
     def get(self, key: str) -> Optional[DXFAttr]:
         return self._attribs.get(key)
 
+    def export_plan(self, names: Iterable[str], dxfversion: str,
+                    force_optional: bool = False) -> Tuple[ExportItem, ...]:
+        """ Returns the export plan for the DXF attributes `names` and the
+        export `dxfversion`. All decisions which do not depend on the actual
+        attribute values are made by the plan: DXF version checks, default
+        values of required attributes, default value checks of optional
+        attributes and the tag type casting function.
+
+        Attributes not supported by `dxfversion` are not included.
+
+        (internal API)
+        """
+        plan = []
+        for name in names:
+            attrib = self._attribs.get(name)
+            if attrib is None:
+                plan.append((name, 0, EXPORT_INVALID, None, None, False, None))
+                continue
+            if dxfversion < attrib.dxfversion:
+                continue
+            code = attrib.code
+            default = attrib.default
+            optional = attrib.optional
+            if attrib.xtype == XType.callback:
+                kind = EXPORT_CALLBACK
+            elif code in POINT_CODES:
+                if attrib.xtype == XType.point2d:
+                    kind = EXPORT_POINT2D
+                else:
+                    kind = EXPORT_POINT
+            elif code in BINARY_DATA:
+                kind = EXPORT_BINARY
+            else:
+                kind = EXPORT_TAG
+            plan.append((
+                name, code, kind, TYPE_TABLE.get(code, str),
+                # required attributes are exported with the default value:
+                None if optional else default,
+                # optional attributes equal to the default value are
+                # not exported:
+                optional and not force_optional and default is not None,
+                default,
+            ))
+        return tuple(plan)
+
     def build_group_code_items(
             self, func=lambda x: True) -> Iterable[Tuple[int, str]]:
         for name, attrib in self._attribs.items():
@@ -0,0 +1,177 @@
+# Copyright (c) 2021, Manfred Moitzi
+# License: MIT License
+from typing import Optional, List, Tuple
+import hashlib
+import os
+import pickle
+import tempfile
+
+from ezdxf.version import __version__
+from .loader import (
+    SectionDict, PARALLEL_SECTIONS, load_dxf_entities, _unpickle,
+)
+
+__all__ = ['ParseCache']
+
+CACHE_FILE_EXT = '.dxfcache'
+DEFAULT_MAX_SIZE = 256 * 1024 * 1024  # 256 MB
+BLOCK_SIZE = 1024 * 1024
+
+
+class ParseCache:
+    """ Persistent on-disk cache of loaded DXF structures.
+
+    The cache stores the structure of a loaded DXF document as pickled file
+    in `directory`, the key of a cache entry is the hash of the DXF file
+    content, the ezdxf version and the decoding parameters. The entities of
+    the ENTITIES, BLOCKS and OBJECTS sections are stored as loaded but unbound
+    :class:`DXFEntity` objects, so a cache hit skips the tag parsing and the
+    entity loading of these sections.
+
+    If the total size of all cache files exceeds `max_size` in bytes, the least
+    recently used cache entries are removed.
+
+    Args:
+        directory: cache directory, will be created if not exist
+        max_size: max. total size of all cache files in bytes
+
+    """
+
+    def __init__(self, directory: str, max_size: int = DEFAULT_MAX_SIZE):
+        self.directory = str(directory)
+        self.max_size = int(max_size)
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(self.directory, exist_ok=True)
+
+    def key(self, filename: str, encoding: str = 'cp1252',
+            errors: str = 'surrogateescape') -> str:
+        """ Returns the cache key for DXF file `filename`. """
+        from ezdxf.acc import USE_C_EXT
+        h = hashlib.sha256()
+        with open(filename, 'rb') as fp:
+            while True:
+                data = fp.read(BLOCK_SIZE)
+                if not data:
+                    break
+                h.update(data)
+        # The pickled data depends on the ezdxf version and the usage of the
+        # C extensions (e.g. Vec3):
+        h.update(f'{__version__}:{USE_C_EXT}:{encoding}:{errors}'.encode())
+        return h.hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + CACHE_FILE_EXT)
+
+    def __contains__(self, key: str) -> bool:
+        return os.path.exists(self._path(key))
+
+    def get(self, key: str) -> Optional[SectionDict]:
+        """ Returns the cached DXF structure for `key` or ``None`` if `key`
+        does not exist or the cache entry is not readable.
+        """
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as fp:
+                data = fp.read()
+        except OSError:
+            self.misses += 1
+            return None
+        try:
+            sections = _unpickle(data)
+        except Exception:
+            # Invalid cache entry, e.g. data of an incompatible Python version
+            self.discard(key)
+            self.misses += 1
+            return None
+        try:
+            # Update the modification time as last usage time for the LRU
+            # eviction:
+            os.utime(path)
+        except OSError:
+            pass
+        self.hits += 1
+        return sections
+
+    def put(self, key: str, sections: SectionDict) -> None:
+        """ Store DXF structure `sections` as `key`. The entities of the
+        sections have to be unbound, bound entities are referencing the
+        whole DXF document.
+        """
+        data = pickle.dumps(sections, protocol=pickle.HIGHEST_PROTOCOL)
+        # Write to a temporary file and rename it, concurrent readers never
+        # see incomplete cache entries:
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as fp:
+                fp.write(data)
+            os.replace(tmp_path, self._path(key))
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        self.evict()
+
+    def discard(self, key: str) -> None:
+        """ Remove cache entry `key`. """
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            pass
+
+    def clear(self) -> None:
+        """ Remove all cache entries and reset the hit and miss counters. """
+        for _, _, path in self._entries():
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def size(self) -> int:
+        """ Returns the total size of all cache files in bytes. """
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self) -> None:
+        """ Remove the least recently used cache entries until the total size
+        of all cache files is below `max_size`.
+        """
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_size:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+
+    def _entries(self) -> List[Tuple[float, int, str]]:
+        """ Returns (mtime, size, path) of all cache files. """
+        entries = []
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if not entry.name.endswith(CACHE_FILE_EXT):
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:  # removed by another process
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return entries
+
+
+def preload_dxf_entities(sections: SectionDict) -> SectionDict:
+    """ Load the entities of the ENTITIES, BLOCKS and OBJECTS sections as
+    unbound :class:`DXFEntity` objects, like
+    :func:`~ezdxf.lldxf.loader.parallel_load_dxf_structure`, this is the
+    structure stored by the :class:`ParseCache`.
+    """
+    for name in PARALLEL_SECTIONS:
+        if name in sections:
+            sections[name] = list(load_dxf_entities(sections[name]))
+    return sections
+
@@ -622,3 +622,7 @@ MLINESTYLE_START_ROUND = 64
 MLINESTYLE_END_SQUARE = 256
 MLINESTYLE_END_INNER_ARC = 512
 MLINESTYLE_END_ROUND = 1024
+
+# DXF attributes managed by the ezdxf.query.QueryIndex, changes of this
+# attributes are reported to the index by the DXF namespace:
+INDEXED_DXF_ATTRIBS = ('layer', 'color', 'linetype')
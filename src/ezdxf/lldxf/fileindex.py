@@ -1,12 +1,23 @@
-# Copyright (c) 2020, Manfred Moitzi
+# Copyright (c) 2020-2021, Manfred Moitzi
 # License: MIT License
-from typing import Tuple, List, Iterable
+from typing import Tuple, List, Iterable, Sequence, Dict, Optional, Any
 from collections import namedtuple
+from array import array
+import os
+import pickle
+import tempfile
 from .const import DXFStructureError
 from ezdxf.tools.codepage import toencoding
 
 IndexEntry = namedtuple('IndexEntry', field_names='code value location line')
 
+# Sidecar file of a DXF file to persist indices, see save_index():
+INDEX_FILE_EXT = '.dxfidx'
+# Increment if the layout of the persisted data changes:
+INDEX_FORMAT = 1
+# Sub-entities are stored in the file location span of their parent entity:
+LINKED_TYPES = {'VERTEX', 'ATTRIB', 'SEQEND'}
+
 
 class FileStructure:
     """
@@ -149,3 +160,206 @@ def load(filename: str) -> FileStructure:
         file_structure.encoding = 'utf-8'
     file_structure.index = index
     return file_structure
+
+
+class EntityIndex:
+    """ Index of the entities of the ENTITIES section as columns of the
+    entity handle, DXF type, layer, owner handle, paperspace flag and the
+    file locations of the first and behind the last byte of each entity.
+
+    Sub-entities like VERTEX, ATTRIB and SEQEND are not indexed, their file
+    locations are included in the location span of the parent entity
+    (POLYLINE, INSERT). Handles and owner handles are empty strings for
+    DXF R12 files without handles.
+
+    """
+
+    def __init__(self):
+        self.handles: List[str] = []
+        self.dxftypes: List[str] = []
+        self.layers: List[str] = []
+        self.owners: List[str] = []
+        self.paperspace = array('B')
+        self.starts = array('q')
+        self.ends = array('q')
+        self._handle_map: Optional[Dict[str, int]] = None
+
+    def __len__(self) -> int:
+        return len(self.handles)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_handle_map'] = None
+        return state
+
+    def append(self, handle: str, dxftype: str, layer: str, owner: str,
+               paperspace: int, start: int, end: int) -> None:
+        self.handles.append(handle)
+        self.dxftypes.append(dxftype)
+        self.layers.append(layer)
+        self.owners.append(owner)
+        self.paperspace.append(1 if paperspace else 0)
+        self.starts.append(start)
+        self.ends.append(end)
+        self._handle_map = None
+
+    def find(self, handle: str) -> int:
+        """ Returns the index of `handle` or -1 if `handle` does not exist.
+        """
+        if self._handle_map is None:
+            self._handle_map = {
+                h.upper(): index for index, h in enumerate(self.handles) if h
+            }
+        return self._handle_map.get(handle.upper(), -1)
+
+    def select(self, types: Iterable[str] = None, layers: Iterable[str] = None,
+               paperspace: int = 0) -> Iterable[int]:
+        """ Yields the indices of all entities matching the DXF `types` and
+        the `layers` in file order, ``None`` matches all types or layers.
+        Layer names are case insensitive.
+        """
+        if types is not None:
+            types = set(types)
+        if layers is not None:
+            layers = set(layer.lower() for layer in layers)
+        flags = self.paperspace
+        index_layers = self.layers
+        for index, dxftype in enumerate(self.dxftypes):
+            if types is not None and dxftype not in types:
+                continue
+            if flags[index] != paperspace:
+                continue
+            if layers is not None and \
+                    index_layers[index].lower() not in layers:
+                continue
+            yield index
+
+
+def build_entity_index(data: bytes, entries: Sequence[IndexEntry],
+                       encoding: str = 'cp1252',
+                       errors: str = 'surrogateescape') -> EntityIndex:
+    """ Build the :class:`EntityIndex` of the ENTITIES section.
+
+    Args:
+        data: content of the DXF file as bytes like object, e.g. mmap
+        entries: structure tags (0, ...) of the ENTITIES section, from the
+            first entity up to and including the (0, ENDSEC) tag
+        encoding: text encoding of the DXF file
+        errors: decoding error handler
+
+    """
+    index = EntityIndex()
+    count = len(entries) - 1
+    for i in range(count):
+        entry = entries[i]
+        start = entry.location
+        end = entries[i + 1].location
+        if entry.value in LINKED_TYPES and len(index):
+            index.ends[-1] = end
+            continue
+        handle, layer, owner, paperspace = _scan_entity_head(
+            data, start, end)
+        index.append(
+            handle.decode(encoding, errors),
+            entry.value,
+            layer.decode(encoding, errors),
+            owner.decode(encoding, errors),
+            paperspace, start, end,
+        )
+    return index
+
+
+def _scan_entity_head(data: bytes, start: int,
+                      end: int) -> Tuple[bytes, bytes, bytes, int]:
+    """ Returns handle, layer, owner handle and paperspace flag of the entity
+    stored in the location span `start` to `end` of `data`. Stops scanning
+    at the first geometry tag behind the layer tag.
+    """
+    handle = layer = owner = b''
+    paperspace = 0
+    app_data = False
+    pos = data.find(b'\n', start, end) + 1  # skip (0, type) tag
+    pos = data.find(b'\n', pos, end) + 1
+    while 0 < pos < end:
+        line_end = data.find(b'\n', pos, end)
+        if line_end < 0:
+            break
+        value_end = data.find(b'\n', line_end + 1, end)
+        if value_end < 0:
+            value_end = end
+        try:
+            code = int(data[pos:line_end])
+        except ValueError:
+            break
+        value = data[line_end + 1:value_end].rstrip(b'\r')
+        pos = value_end + 1
+        if code == 102:
+            app_data = value.startswith(b'{')
+        elif app_data:
+            continue
+        elif code == 5 or code == 105:
+            handle = value
+        elif code == 330 and not owner:
+            owner = value
+        elif code == 67:
+            paperspace = int(value)
+        elif code == 8:
+            layer = value
+        elif 10 <= code < 60 and layer:
+            break
+    return handle.strip(), layer, owner.strip(), paperspace
+
+
+def index_filename(filename: str) -> str:
+    """ Returns the file name of the index sidecar file. """
+    return str(filename) + INDEX_FILE_EXT
+
+
+def _file_stamp(filename: str) -> Tuple[int, int]:
+    stat = os.stat(filename)
+    return stat.st_size, stat.st_mtime_ns
+
+
+def save_index(filename: str, content: Any) -> None:
+    """ Persist the picklable index `content` of the DXF file `filename` in
+    a sidecar file, stored with the size and the modification time of the DXF
+    file to detect outdated indices.
+
+    Raises:
+        OSError: sidecar file is not writable
+
+    """
+    from ezdxf.version import __version__
+    data = pickle.dumps(
+        (INDEX_FORMAT, __version__, _file_stamp(filename), content),
+        protocol=pickle.HIGHEST_PROTOCOL,
+    )
+    path = index_filename(filename)
+    # Write to a temporary file and rename it, concurrent readers never
+    # see incomplete index files:
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.',
+                                    suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as fp:
+            fp.write(data)
+        os.replace(tmp_path, path)
+    except OSError:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def load_index(filename: str) -> Optional[Any]:
+    """ Returns the persisted index content of the DXF file `filename` or
+    ``None`` if the sidecar file does not exist or is outdated.
+    """
+    from ezdxf.version import __version__
+    try:
+        with open(index_filename(filename), 'rb') as fp:
+            fmt, version, stamp, content = pickle.load(fp)
+        valid = (fmt == INDEX_FORMAT and version == __version__ and
+                 tuple(stamp) == _file_stamp(filename))
+    except Exception:
+        # missing, unreadable or incompatible sidecar file
+        return None
+    return content if valid else None
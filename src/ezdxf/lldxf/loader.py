@@ -1,12 +1,18 @@
 # Copyright (c) 2018-2020, Manfred Moitzi
 # License: MIT License
 import logging
-from typing import Dict, Iterable, List, Union, TYPE_CHECKING
+from typing import Dict, Iterable, List, Union, Tuple, TYPE_CHECKING
 from collections import OrderedDict
+import bisect
+import gc
+import itertools
+import pickle
+import re
 
 from .const import DXFStructureError
 from .tags import group_tags, DXFTag, Tags
 from .extendedtags import ExtendedTags
+from .tagger import bulk_ascii_tags_loader, tag_compiler
 from ezdxf.entities import factory
 
 if TYPE_CHECKING:
@@ -17,7 +23,8 @@ SectionDict = Dict[str, List[Union[Tags, ExtendedTags]]]
 
 
 def load_dxf_structure(tagger: Iterable[DXFTag],
-                       ignore_missing_eof: bool = False) -> SectionDict:
+                       ignore_missing_eof: bool = False,
+                       compact: bool = False) -> SectionDict:
     """ Divide input tag stream from tagger into DXF structure entities.
     Each DXF structure entity starts with a DXF structure (0, ...) tag,
     and ends before the next DXF structure tag.
@@ -61,6 +68,8 @@ def load_dxf_structure(tagger: Iterable[DXFTag],
         tagger: generates DXFTag() entities from input data
         ignore_missing_eof: raises DXFStructureError() if False and EOF tag is
             not present, set to True only in tests
+        compact: store DXF structure entities as memory efficient
+            :class:`~ezdxf.lldxf.tags.CompactTags` objects
 
     Returns:
         dict of sections, each section is a list of DXF structure entities
@@ -85,7 +94,7 @@ def load_dxf_structure(tagger: Iterable[DXFTag],
     # DXF file, to load messy DXF files exist an (future) add-on
     # called 'recover'.
 
-    for entity in group_tags(tagger):
+    for entity in group_tags(tagger, compact=compact):
         tag = entity[0]
         if tag == (0, 'SECTION'):
             if inside_section():
@@ -127,18 +136,218 @@ def load_dxf_structure(tagger: Iterable[DXFTag],
     return sections
 
 
-def load_dxf_entities(entities: Iterable[Tags]) -> Iterable['DXFEntity']:
+# Sections and entity types which support lazy loading, these entity types
+# are not linked to other entities at loading stage and need no special
+# 2nd loading stage:
+LAZY_SECTIONS = {'ENTITIES', 'BLOCKS'}
+LAZY_ENTITIES = {
+    'LINE', 'POINT', 'CIRCLE', 'ARC', 'ELLIPSE', 'LWPOLYLINE', 'SPLINE',
+    'TEXT', 'MTEXT', 'SOLID', 'TRACE', '3DFACE', 'HATCH', 'RAY', 'XLINE',
+}
+
+
+def load_dxf_entities(entities: Iterable[Tags],
+                      lazy: bool = False) -> Iterable['DXFEntity']:
     for entity in entities:
-        yield factory.load(ExtendedTags(entity))
+        if isinstance(entity, Tags):
+            if lazy and entity[0].value in LAZY_ENTITIES:
+                yield factory.lazy_load(entity)
+            else:
+                yield factory.load(ExtendedTags(entity))
+        else:  # already loaded by parallel_load_dxf_structure()
+            yield entity
 
 
-def load_and_bind_dxf_content(sections: Dict, doc: 'Drawing') -> None:
+def load_and_bind_dxf_content(sections: Dict, doc: 'Drawing',
+                              lazy: bool = False) -> None:
     # HEADER has no database entries.
     for name in ['TABLES', 'CLASSES', 'ENTITIES', 'BLOCKS', 'OBJECTS']:
         if name in sections:
             section = sections[name]
-            for index, entity in enumerate(load_dxf_entities(section)):
+            entities = load_dxf_entities(
+                section, lazy=lazy and name in LAZY_SECTIONS)
+            for index, entity in enumerate(entities):
                 # Replace Tags() by DXFEntity() objects
                 section[index] = entity
                 # Bind entities to the DXF document:
                 factory.bind(entity, doc)
+
+
+# Sections loaded by worker processes:
+PARALLEL_SECTIONS = {'ENTITIES', 'BLOCKS', 'OBJECTS'}
+CHUNKS_PER_WORKER = 4
+
+# Structure tag (0, name): a value line "0" is always followed by a group
+# code line, which is an integer, a group code line "0" is followed by the
+# structure name, which is never an integer. The lookahead does not consume
+# the following line, which maybe a group code line "0".
+STRUCTURE_TAG = re.compile(rb'^[ \t]*0[ \t]*\r?\n(?=([^\r\n]*))', re.M)
+INTEGER = re.compile(rb'[ \t]*[+-]?\d+[ \t]*')
+
+
+def parallel_load_dxf_structure(data: bytes,
+                                encoding: str = 'cp1252',
+                                errors: str = 'surrogateescape',
+                                workers: int = 2) -> SectionDict:
+    """ Divide ASCII DXF `data` into DXF structure entities like
+    :func:`load_dxf_structure`, but the entities of the ENTITIES, BLOCKS and
+    OBJECTS sections are loaded as :class:`DXFEntity` objects by a pool of
+    `workers` processes.
+
+    The structure tags (0, ...) are located by a regular expression search in
+    the raw `data`. The large sections are split into chunks at entity
+    boundaries, each chunk is tokenized and loaded by a worker process, which
+    returns the pickled entities. The entities of each section are stored in
+    the original order of the DXF file, ready for
+    :func:`load_and_bind_dxf_content`. All other sections are loaded by the
+    calling process. The chunks are processed by the calling process if
+    `workers` < 2.
+
+    Args:
+        data: ASCII DXF data as bytes or memory mapped file
+        encoding: text encoding of the DXF data
+        errors: specify decoding error handler
+        workers: count of worker processes
+
+    Raises:
+        DXFStructureError: invalid or incomplete DXF structure
+
+    """
+    sections: SectionDict = OrderedDict()
+    jobs = []
+    for name, start, end, offsets in _locate_sections(data):
+        if name == 'THUMBNAILIMAGE':
+            continue
+        if name in PARALLEL_SECTIONS and len(offsets) > 1:
+            # The section head (0, SECTION) (2, name) is loaded by the calling
+            # process:
+            sections[name] = _load_tags(data[start:offsets[1]], encoding,
+                                        errors)
+            jobs.extend(
+                (name, data[chunk_start:chunk_end])
+                for chunk_start, chunk_end in
+                _chunks(offsets[1:], end, workers * CHUNKS_PER_WORKER)
+            )
+        else:
+            sections[name] = _load_tags(data[start:end], encoding, errors)
+
+    if workers < 2:
+        for name, chunk in jobs:
+            sections[name].extend(_load_entities(chunk, encoding, errors))
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        names = [name for name, _ in jobs]
+        chunks = [chunk for _, chunk in jobs]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(
+                _load_pickled_entities, chunks, itertools.repeat(encoding),
+                itertools.repeat(errors),
+            )
+            for name, result in zip(names, results):
+                sections[name].extend(_unpickle(result))
+    return sections
+
+
+def _locate_sections(data: bytes) -> Iterable[Tuple[str, int, int, List[int]]]:
+    """ Yields (name, start, end, offsets) for all sections in `data`, the
+    `start` offset is the location of the (0, SECTION) tag, the `end` offset
+    is the location of the (0, ENDSEC) tag and `offsets` are the locations of
+    all structure tags in the section including the (0, SECTION) tag.
+    """
+    offsets: List[int] = []
+    name_location = 0
+    eof = False
+    outside_section = False
+    for match in STRUCTURE_TAG.finditer(data):
+        name = match.group(1)
+        if INTEGER.fullmatch(name):
+            continue
+        name = name.strip()
+        location = match.start()
+        if name == b'SECTION':
+            if offsets:
+                raise DXFStructureError(
+                    "DXFStructureError: missing ENDSEC tag.")
+            offsets.append(location)
+            name_location = match.end()
+        elif name == b'ENDSEC':
+            if not offsets:
+                raise DXFStructureError(
+                    "DXFStructureError: found ENDSEC tag without previous "
+                    "SECTION tag.")
+            yield _section_name(data, name_location), offsets[0], location, \
+                offsets
+            offsets = []
+        elif name == b'EOF':
+            if eof:
+                logger.warning(
+                    'DXF Structure Warning: found more than one EOF tags.')
+            eof = True
+        elif offsets:
+            offsets.append(location)
+        elif not outside_section:
+            logger.warning(
+                'DXF Structure Warning: found tags outside a SECTION, '
+                'ignored by ezdxf.')
+            outside_section = True
+    if offsets:
+        raise DXFStructureError("DXFStructureError: missing ENDSEC tag.")
+    if not eof:
+        raise DXFStructureError('DXFStructureError: missing EOF tag.')
+
+
+def _section_name(data: bytes, start: int) -> str:
+    """ Returns the section name, `start` is the location of the "SECTION"
+    value line, which is followed by the (2, name) tag.
+    """
+    lines = data[start:start + 256].splitlines()
+    try:
+        if int(lines[1]) == 2:
+            return lines[2].strip().decode(errors='ignore')
+    except (IndexError, ValueError):
+        pass
+    raise DXFStructureError(
+        'DXFStructureError: missing required section NAME tag '
+        '(2, name) at start of section.')
+
+
+def _chunks(offsets: List[int], end: int,
+            count: int) -> Iterable[Tuple[int, int]]:
+    """ Yields (start, end) locations of `count` chunks of nearly equal size,
+    split at the given entity `offsets`.
+    """
+    start = offsets[0]
+    size = max((end - start) // max(count, 1), 1)
+    while start < end:
+        index = bisect.bisect_left(offsets, start + size)
+        chunk_end = offsets[index] if index < len(offsets) else end
+        yield start, chunk_end
+        start = chunk_end
+
+
+def _load_tags(data: bytes, encoding: str, errors: str) -> List[Tags]:
+    tags = tag_compiler(iter(bulk_ascii_tags_loader(data, encoding, errors)))
+    return list(group_tags(tags))
+
+
+def _load_entities(data: bytes, encoding: str,
+                   errors: str) -> List['DXFEntity']:
+    return list(load_dxf_entities(_load_tags(data, encoding, errors)))
+
+
+def _load_pickled_entities(data: bytes, encoding: str, errors: str) -> bytes:
+    """ Worker process function. """
+    entities = _load_entities(data, encoding, errors)
+    return pickle.dumps(entities, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _unpickle(data: bytes) -> List['DXFEntity']:
+    # Unpickling many objects triggers the garbage collector very often,
+    # without any benefit, because the new objects are referenced:
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return pickle.loads(data)
+    finally:
+        if enabled:
+            gc.enable()
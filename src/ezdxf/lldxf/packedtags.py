@@ -211,6 +211,9 @@ class VertexArray:
         .. versionadded:: 0.13
 
         """
+        if self.VERTEX_SIZE == 3:
+            self.values = m.transform_array(self.values)
+            return
         values = array('d')
         for vertex in m.transform_vertices(self):
             values.extend(vertex)
@@ -13,9 +13,13 @@ diffuse map) using same group codes with different meanings.
 
 """
 from typing import Iterable, List, TYPE_CHECKING, Tuple
+from array import array
+from sys import intern
 
 from .const import DXFStructureError, DXFValueError, STRUCTURE_MARKER
-from .types import DXFTag, EMBEDDED_OBJ_MARKER, EMBEDDED_OBJ_STR
+from .types import (
+    DXFTag, DXFVertex, DXFBinaryTag, EMBEDDED_OBJ_MARKER, EMBEDDED_OBJ_STR,
+)
 from .tagger import internal_tag_compiler
 
 if TYPE_CHECKING:
@@ -271,12 +275,274 @@ class Tags(list):
         return cls((tag for tag in tags if tag.code not in frozenset(codes)))
 
 
+# CompactTags stores the group code and the tag kind as a single packed
+# integer: code << KIND_BITS | kind
+KIND_BITS = 3
+KIND_MASK = 7
+TAG_KIND = 0  # value stored in values list
+FLOAT_KIND = 1  # value stored in doubles array
+VERTEX_2D_KIND = 2  # x, y stored in doubles array
+VERTEX_3D_KIND = 3  # x, y, z stored in doubles array
+BINARY_TAG_KIND = 4  # value stored in values list
+OBJECT_KIND = 5  # unknown tag types are stored as they are in values list
+VALUE_KINDS = {TAG_KIND, BINARY_TAG_KIND, OBJECT_KIND}
+
+
+class CompactTags(Tags):
+    """ Memory efficient variant of :class:`Tags`, stores group codes and tag
+    types as packed integers in an ``array('i')``, floats and vertex
+    components in an ``array('d')`` and all other values in a ``list``, string
+    values are interned.
+
+    The :class:`~ezdxf.lldxf.types.DXFTag` objects are created on demand by
+    iteration and index access, therefore accessing the same tag twice returns
+    two different but equal objects. The first index access creates an
+    ``array('i')`` of the storage locations of all tags, use iteration to
+    process all tags.
+
+    The inherited ``list`` storage is not used, all list operations are
+    reimplemented and operations like concatenation, repetition, slicing and
+    :meth:`copy` return :class:`CompactTags`.
+
+    This container stores large amounts of loaded DXF tags, changing the
+    content is supported but slow.
+
+    .. versionadded:: 0.15.2
+
+    """
+    __slots__ = ('codes', 'values', 'doubles', '_locations')
+
+    def __init__(self, tags: Iterable[DXFTag] = None):
+        super().__init__()
+        self.codes = array('i')
+        self.values = []
+        self.doubles = array('d')
+        # Index of each tag in the values list or the doubles array, created
+        # on demand by index access. Appending tags does not invalidate
+        # existing locations, all other modifications rebuild the container:
+        self._locations = array('i')
+        if tags is not None:
+            self.extend(tags)
+
+    def __reduce__(self):
+        return self.__class__, (list(self),)
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __iter__(self) -> Iterable[DXFTag]:
+        values = iter(self.values)
+        doubles = self.doubles
+        index = 0  # of doubles
+        for packed in self.codes:
+            kind = packed & KIND_MASK
+            code = packed >> KIND_BITS
+            if kind == TAG_KIND:
+                yield DXFTag(code, next(values))
+            elif kind == FLOAT_KIND:
+                yield DXFTag(code, doubles[index])
+                index += 1
+            elif kind == VERTEX_3D_KIND or kind == VERTEX_2D_KIND:
+                end = index + kind
+                yield DXFVertex(code, doubles[index:end])
+                index = end
+            elif kind == BINARY_TAG_KIND:
+                yield DXFBinaryTag(code, next(values))
+            else:
+                yield next(values)
+
+    def __reversed__(self) -> Iterable[DXFTag]:
+        return reversed(list(self))
+
+    def _update_locations(self) -> array:
+        locations = self._locations
+        codes = self.codes
+        start = len(locations)
+        if start < len(codes):
+            # Locate the appended tags, counted backwards from the end of
+            # the values list and the doubles array:
+            kinds = [packed & KIND_MASK for packed in codes[start:]]
+            value_index = len(self.values)
+            double_index = len(self.doubles)
+            for kind in kinds:
+                if kind in VALUE_KINDS:
+                    value_index -= 1
+                else:  # count of stored doubles == kind
+                    double_index -= kind
+            for kind in kinds:
+                if kind in VALUE_KINDS:
+                    locations.append(value_index)
+                    value_index += 1
+                else:
+                    locations.append(double_index)
+                    double_index += kind
+        return locations
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.__class__(list(self)[index])
+        codes = self.codes
+        if index < 0:
+            index += len(codes)
+        packed = codes[index]  # raises IndexError
+        location = self._update_locations()[index]
+        kind = packed & KIND_MASK
+        code = packed >> KIND_BITS
+        if kind == TAG_KIND:
+            return DXFTag(code, self.values[location])
+        elif kind == FLOAT_KIND:
+            return DXFTag(code, self.doubles[location])
+        elif kind == VERTEX_3D_KIND or kind == VERTEX_2D_KIND:
+            return DXFVertex(code, self.doubles[location:location + kind])
+        elif kind == BINARY_TAG_KIND:
+            return DXFBinaryTag(code, self.values[location])
+        else:
+            return self.values[location]
+
+    def __eq__(self, other) -> bool:
+        try:
+            return list(self) == list(other)
+        except TypeError:
+            return NotImplemented
+
+    def __ne__(self, other) -> bool:
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    def __contains__(self, tag) -> bool:
+        return any(t == tag for t in self)
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+    def append(self, tag: DXFTag) -> None:
+        """ Append `tag` at the end of the container. """
+        type_ = type(tag)
+        if type_ is DXFTag:
+            value = tag._value
+            type_ = type(value)
+            if type_ is float:
+                self.codes.append(tag.code << KIND_BITS | FLOAT_KIND)
+                self.doubles.append(value)
+                return
+            if type_ is str:
+                value = intern(value)
+            self.codes.append(tag.code << KIND_BITS)
+            self.values.append(value)
+        elif type_ is DXFVertex and 1 < len(tag._value) < 4:
+            vertex = tag._value
+            self.codes.append(tag.code << KIND_BITS | len(vertex))
+            self.doubles.extend(vertex)
+        elif type_ is DXFBinaryTag:
+            self.codes.append(tag.code << KIND_BITS | BINARY_TAG_KIND)
+            self.values.append(tag._value)
+        else:
+            self.codes.append(OBJECT_KIND)
+            self.values.append(tag)
+
+    def extend(self, tags: Iterable[DXFTag]) -> None:
+        """ Append all `tags` at the end of the container. """
+        append = self.append
+        for tag in tags:
+            append(tag)
+
+    def __iadd__(self, tags: Iterable[DXFTag]) -> 'CompactTags':
+        self.extend(tags)
+        return self
+
+    def __add__(self, tags: Iterable[DXFTag]) -> 'CompactTags':
+        result = self.__class__(self)
+        result.extend(tags)
+        return result
+
+    def __radd__(self, tags: Iterable[DXFTag]) -> 'CompactTags':
+        result = self.__class__(tags)
+        result.extend(self)
+        return result
+
+    def __mul__(self, count: int) -> 'CompactTags':
+        return self.__class__(list(self) * count)
+
+    __rmul__ = __mul__
+
+    def __imul__(self, count: int) -> 'CompactTags':
+        def mul(tags):
+            tags[:] = tags * count
+
+        self._modify(mul)
+        return self
+
+    def __lt__(self, other) -> bool:
+        return list(self) < list(other)
+
+    def __le__(self, other) -> bool:
+        return list(self) <= list(other)
+
+    def __gt__(self, other) -> bool:
+        return list(self) > list(other)
+
+    def __ge__(self, other) -> bool:
+        return list(self) >= list(other)
+
+    def clear(self) -> None:
+        """ Remove all tags. """
+        del self.codes[:]
+        del self.values[:]
+        del self.doubles[:]
+        del self._locations[:]
+
+    def _modify(self, func):
+        # Rebuild the container after modifying the content as list:
+        tags = list(self)
+        result = func(tags)
+        self.clear()
+        self.extend(tags)
+        return result
+
+    def __setitem__(self, index, tags) -> None:
+        def set_item(_tags):
+            _tags[index] = tags
+
+        self._modify(set_item)
+
+    def __delitem__(self, index) -> None:
+        def del_item(tags):
+            del tags[index]
+
+        self._modify(del_item)
+
+    def insert(self, index: int, tag: DXFTag) -> None:
+        self._modify(lambda tags: tags.insert(index, tag))
+
+    def pop(self, index: int = -1) -> DXFTag:
+        return self._modify(lambda tags: tags.pop(index))
+
+    def remove(self, tag: DXFTag) -> None:
+        self._modify(lambda tags: tags.remove(tag))
+
+    def reverse(self) -> None:
+        self._modify(lambda tags: tags.reverse())
+
+    def sort(self, *args, **kwargs) -> None:
+        self._modify(lambda tags: tags.sort(*args, **kwargs))
+
+    def index(self, tag: DXFTag, *args) -> int:
+        return list(self).index(tag, *args)
+
+    def count(self, tag: DXFTag) -> int:
+        return list(self).count(tag)
+
+    def copy(self) -> 'CompactTags':
+        return self.__class__(self)
+
+
 def text2tags(text: str) -> Tags:
     return Tags.from_text(text)
 
 
 def group_tags(tags: Iterable[DXFTag],
-               splitcode: int = STRUCTURE_MARKER) -> Iterable[Tags]:
+               splitcode: int = STRUCTURE_MARKER,
+               compact: bool = False) -> Iterable[Tags]:
     """ Group of tags starts with a SplitTag and ends before the next SplitTag.
     A SplitTag is a tag with code == splitcode, like (0, 'SECTION') for
     splitcode == 0.
@@ -284,8 +550,10 @@ def group_tags(tags: Iterable[DXFTag],
     Args:
         tags: iterable of :class:`DXFTag`
         splitcode: group code of split tag
+        compact: ``True`` to yield the groups as :class:`CompactTags`
 
     """
+    tags_class = CompactTags if compact else Tags
 
     # first do nothing, skip tags in front of the first split tag
     def append(tag):
@@ -296,7 +564,7 @@ def group_tags(tags: Iterable[DXFTag],
         if tag.code == splitcode:
             if group is not None:
                 yield group
-            group = Tags([tag])
+            group = tags_class([tag])
             append = group.append  # redefine append: add tags to this group
         else:
             append(tag)
@@ -1,7 +1,12 @@
 # Copyright (c) 2018-2020, Manfred Moitzi
 # License: MIT License
-from typing import Any, TextIO, TYPE_CHECKING, Union, List, Iterable, BinaryIO
+from typing import (
+    Any, TextIO, TYPE_CHECKING, Union, List, Iterable, BinaryIO, Sequence,
+    Optional,
+)
 import abc
+import io
+import multiprocessing
 from .types import TAG_STRING_FORMAT, cast_tag_value, DXFVertex
 from .types import BYTES, INT16, INT32, INT64, DOUBLE, BINARY_DATA
 from .tags import DXFTag, Tags
@@ -14,7 +19,7 @@ if TYPE_CHECKING:
 
 __all__ = [
     'TagWriter', 'BinaryTagWriter', 'TagCollector', 'basic_tags_from_text',
-    'AbstractTagWriter',
+    'AbstractTagWriter', 'parallel_export_dxf',
 ]
 CRLF = b'\r\n'
 
@@ -61,6 +66,20 @@ class TagWriter(AbstractTagWriter):
         self.write_handles = write_handles
         self.force_optional = False
 
+    @property
+    def stream(self) -> TextIO:
+        """ Returns the output stream. """
+        return self._stream
+
+    def memory_writer(self) -> 'TagWriter':
+        """ Returns a new :class:`TagWriter` with the same export options,
+        which writes into an :class:`io.StringIO` stream.
+        """
+        writer = TagWriter(io.StringIO(), dxfversion=self.dxfversion,
+                           write_handles=self.write_handles)
+        writer.force_optional = self.force_optional
+        return writer
+
     # Start of low level interface:
     def write_tag(self, tag: DXFTag) -> None:
         self._stream.write(tag.dxfstr())
@@ -110,6 +129,19 @@ class BinaryTagWriter(AbstractTagWriter):
         self._encoding = encoding  # output encoding
         self._r12 = self.dxfversion <= 'AC1009'
 
+    @property
+    def stream(self) -> BinaryIO:
+        """ Returns the output stream. """
+        return self._stream
+
+    def memory_writer(self) -> 'BinaryTagWriter':
+        """ Returns a new :class:`BinaryTagWriter` with the same export
+        options, which writes into an :class:`io.BytesIO` stream.
+        """
+        return BinaryTagWriter(io.BytesIO(), dxfversion=self.dxfversion,
+                               write_handles=self.write_handles,
+                               encoding=self._encoding)
+
     def write_signature(self) -> None:
         self._stream.write(b'AutoCAD Binary DXF\r\n\x1a\x00')
 
@@ -236,3 +268,74 @@ def basic_tags_from_text(text: str) -> List[DXFTag]:
     collector = TagCollector()
     collector.write_tags(Tags.from_text(text))
     return collector.tags
+
+
+# Minimum count of DXF objects for a parallel export:
+MIN_PARALLEL_EXPORT = 1000
+CHUNKS_PER_WORKER = 4
+
+
+def parallel_export_dxf(objects: Sequence, tagwriter: AbstractTagWriter,
+                        workers: int = 2) -> None:
+    """ Export DXF `objects` by a pool of `workers` processes in the same
+    order as :code:`obj.export_dxf(tagwriter)` for each object would do.
+
+    The `objects` are split into chunks, each chunk is exported by a worker
+    process into a string or a bytes object, which are written in order to
+    the output stream of `tagwriter`. The worker processes inherit the
+    `objects` by forking the calling process, the `objects` are not pickled.
+    Supports the :class:`TagWriter` and the :class:`BinaryTagWriter`.
+
+    The `objects` are exported by the calling process, if `workers` < 2, the
+    count of objects is too small, the `tagwriter` is not supported or the
+    platform does not support the "fork" start method.
+
+    Args:
+        objects: sequence of DXF objects which implement the
+            :code:`export_dxf(tagwriter)` method
+        tagwriter: output tag writer
+        workers: count of worker processes
+
+    """
+    count = len(objects)
+    if (not isinstance(tagwriter, (TagWriter, BinaryTagWriter)) or
+            workers < 2 or count < MIN_PARALLEL_EXPORT or
+            'fork' not in multiprocessing.get_all_start_methods()):
+        for obj in objects:
+            obj.export_dxf(tagwriter)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+    chunk_size = -(-count // (workers * CHUNKS_PER_WORKER))
+    starts = range(0, count, chunk_size)
+    stops = [min(start + chunk_size, count) for start in starts]
+    stream = tagwriter.stream
+    # The arguments of the initializer are inherited by forking the calling
+    # process and are not pickled:
+    with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context('fork'),
+            initializer=_init_export_worker,
+            initargs=(objects, tagwriter)) as executor:
+        for data in executor.map(_export_chunk, starts, stops):
+            stream.write(data)
+
+
+# DXF objects and tag writer of a worker process, set by the initializer
+# of the worker process:
+_worker_objects: Sequence = tuple()
+_worker_tagwriter: Optional[Union[TagWriter, BinaryTagWriter]] = None
+
+
+def _init_export_worker(objects: Sequence,
+                        tagwriter: Union[TagWriter, BinaryTagWriter]) -> None:
+    global _worker_objects, _worker_tagwriter
+    _worker_objects = objects
+    _worker_tagwriter = tagwriter
+
+
+def _export_chunk(start: int, stop: int) -> Union[str, bytes]:
+    tagwriter = _worker_tagwriter.memory_writer()
+    for obj in _worker_objects[start:stop]:
+        obj.export_dxf(tagwriter)
+    return tagwriter.stream.getvalue()
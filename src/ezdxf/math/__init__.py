@@ -27,6 +27,7 @@ from .linalg import (
     gauss_vector_solver, gauss_matrix_solver, freeze_matrix,
     tridiagonal_matrix_solver, tridiagonal_vector_solver, detect_banded_matrix,
     compact_banded_matrix, BandedMatrixLU, banded_matrix,
+    banded_matrix_from_rows,
 )
 from .parametrize import estimate_tangents, estimate_end_tangent_magnitude
 from .bspline import (
@@ -1,7 +1,8 @@
 # Copyright (c) 2010-2020 Manfred Moitzi
 # License: MIT License
-from typing import TYPE_CHECKING, Iterable, Union, Sequence, Tuple
+from typing import TYPE_CHECKING, Iterable, Union, Sequence, Tuple, List
 import math
+from array import array
 from functools import lru_cache
 # The pure Python implementation can't import from ._ctypes or ezdxf.math!
 from ._vector import Vec3, Vec2
@@ -12,11 +13,18 @@ if TYPE_CHECKING:
     from ezdxf.eztypes import Vertex
     from ezdxf.math.ellipse import ConstructionEllipse
 
+AnyVec = Union[Vec3, Vec2]
+
 __all__ = [
     'Bezier4P', 'cubic_bezier_arc_parameters',
     'cubic_bezier_from_arc', 'cubic_bezier_from_ellipse',
 ]
 
+# Each subdivision level reduces the flattening error by about 1/4, the
+# depth limit stops endless subdivision for a distance below the precision
+# of the curve points:
+MAX_FLATTENING_DEPTH = 16
+
 
 def check_if_in_valid_range(t: float):
     if not (0 <= t <= 1.):
@@ -123,7 +131,7 @@ class Bezier4P:
 
     def flattening(self, distance: float,
                    segments: int = 4) -> Iterable[Union[Vec3, Vec2]]:
-        """ Adaptive recursive flattening. The argument `segments` is the
+        """ Adaptive flattening. The argument `segments` is the
         minimum count of approximation segments, if the distance from the center
         of the approximation segment to the curve is bigger than `distance` the
         segment will be subdivided.
@@ -139,18 +147,9 @@ class Bezier4P:
 
         """
 
-        def subdiv(start_point, end_point, start_t: float, end_t: float):
-            mid_t = (start_t + end_t) * 0.5
-            mid_point = self._get_curve_point(mid_t)
-            chk_point = start_point.lerp(end_point)
-            # center point point is faster than projecting mid point onto
-            # vector start -> end:
-            if chk_point.distance(mid_point) < distance:
-                yield end_point
-            else:
-                yield from subdiv(start_point, mid_point, start_t, mid_t)
-                yield from subdiv(mid_point, end_point, mid_t, end_t)
-
+        # The stack contains the pending end points of the iterative
+        # implementation of the adaptive recursive subdivision:
+        stack: List[Tuple[float, AnyVec, int]] = []
         dt = 1.0 / segments
         t0 = 0.0
         start_point = self._control_points[0]
@@ -162,9 +161,35 @@ class Bezier4P:
                 t1 = 1.0
             else:
                 end_point = self._get_curve_point(t1)
-            yield from subdiv(start_point, end_point, t0, t1)
-            t0 = t1
-            start_point = end_point
+            stack.append((t1, end_point, 0))
+            while stack:
+                end_t, end_point, depth = stack[-1]
+                mid_t = (t0 + end_t) * 0.5
+                mid_point = self._get_curve_point(mid_t)
+                # center point point is faster than projecting mid point onto
+                # vector start -> end:
+                if depth >= MAX_FLATTENING_DEPTH or start_point.lerp(
+                        end_point).distance(mid_point) < distance:
+                    yield end_point
+                    stack.pop()
+                    t0 = end_t
+                    start_point = end_point
+                else:  # subdivide into [start, mid] and [mid, end]
+                    depth += 1
+                    stack[-1] = (end_t, end_point, depth)
+                    stack.append((mid_t, mid_point, depth))
+
+    def flattening_array(self, distance: float, segments: int = 4) -> array:
+        """ Returns the vertices of :meth:`flattening` as flat ``array('d')``
+        of x, y, z coordinates.
+
+        .. versionadded:: 0.15.2
+
+        """
+        result = array('d')
+        for point in self.flattening(distance, segments):
+            result.extend(Vec3(point).xyz)
+        return result
 
     def _get_curve_point(self, t: float) -> Union[Vec3, Vec2]:
         b1, b2, b3, b4 = self._control_points
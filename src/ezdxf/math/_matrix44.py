@@ -8,6 +8,7 @@ from typing import Sequence, Iterable, List, Tuple, TYPE_CHECKING
 import math
 from math import sin, cos, tan
 from itertools import chain
+from array import array
 # The pure Python implementation can't import from ._ctypes or ezdxf.math!
 from ._vector import Vec3, X_AXIS, Y_AXIS, Z_AXIS, NULLVEC
 
@@ -24,6 +25,25 @@ def floats(items: Iterable) -> List[float]:
     return [float(v) for v in items]
 
 
+def float_array(values) -> array:
+    """ Returns a copy of `values` as flat ``array('d')``. Accepts any
+    iterable of floats and C-contiguous buffers of doubles like multi
+    dimensional :mod:`numpy` arrays of type float64.
+    """
+    try:
+        view = memoryview(values)
+    except TypeError:
+        return array('d', values)
+    if view.format == 'd':
+        result = array('d')
+        result.frombytes(
+            view.cast('B') if view.c_contiguous else view.tobytes())
+        return result
+    if view.ndim == 1:
+        return array('d', view)
+    raise TypeError('multi dimensional buffers require the format "d"')
+
+
 class Matrix44:
     """
     This is a pure Python implementation for 4x4 transformation matrices, to
@@ -510,6 +530,30 @@ class Matrix44:
                 x * m2 + y * m6 + z * m10 + m14
             )
 
+    def transform_array(self, values: Iterable[float]) -> array:
+        """ Returns the transformed vertices of a flat array of x, y, z
+        coordinates as new ``array('d')``, the input array is not modified.
+
+        Accepts any iterable of floats and buffers of doubles like
+        ``array('d')`` or :mod:`numpy` arrays of shape (N, 3) and type float64.
+        Convert the result into a :mod:`numpy` array without copying by
+        ``numpy.frombuffer(result).reshape(-1, 3)``.
+
+        .. versionadded:: 0.15.2
+
+        """
+        result = float_array(values)
+        count = len(result)
+        if count % 3:
+            raise ValueError('array size has to be a multiple of 3')
+        m0, m1, m2, m3, m4, m5, m6, m7, m8, m9, m10, m11, m12, m13, m14, m15 = self._matrix
+        for index in range(0, count, 3):
+            x, y, z = result[index:index + 3]
+            result[index] = x * m0 + y * m4 + z * m8 + m12
+            result[index + 1] = x * m1 + y * m5 + z * m9 + m13
+            result[index + 2] = x * m2 + y * m6 + z * m10 + m14
+        return result
+
     def transform_directions(self, vectors: Iterable['Vertex'],
                              normalize=False) -> Iterable[Vec3]:
         """ Returns an iterable of transformed direction vectors without
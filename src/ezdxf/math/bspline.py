@@ -22,20 +22,20 @@ from typing import (
 )
 import math
 import bisect
+from array import array
 from ezdxf.math import Vec3, NULLVEC
 from .parametrize import (
     create_t_vector, estimate_tangents,
     estimate_end_tangent_magnitude,
 )
 from .linalg import (
-    LUDecomposition, Matrix, BandedMatrixLU, compact_banded_matrix,
-    detect_banded_matrix,
+    LUDecomposition, BandedMatrixLU, banded_matrix_from_rows, SparseRow,
     quadratic_equation, binomial_coefficient,
 )
 from .construct2d import linspace
-from .construct3d import distance_point_line_3d
 from ezdxf.lldxf.const import DXFValueError
 from ezdxf import PYPY
+from ezdxf.acc import USE_C_EXT
 
 if TYPE_CHECKING:
     from ezdxf.eztypes import Vertex
@@ -48,6 +48,11 @@ if TYPE_CHECKING:
 USE_BANDED_MATRIX_SOLVER_CPYTHON_LIMIT = 15
 USE_BANDED_MATRIX_SOLVER_PYPY_LIMIT = 60
 
+# Each subdivision level reduces the flattening error by about 1/4, the
+# depth limit stops endless subdivision for a distance below the precision
+# of the curve points:
+MAX_FLATTENING_DEPTH = 16
+
 __all__ = [
     # High level functions:
     'fit_points_to_cad_cv', 'global_bspline_interpolation',
@@ -163,6 +168,9 @@ def global_bspline_interpolation(
     Returns:
         :class:`BSpline`
 
+    Raises:
+        DXFValueError: degree > 4 for a tangent at each fit point
+
     """
     fit_points = Vec3.list(fit_points)
     count = len(fit_points)
@@ -184,6 +192,14 @@ def global_bspline_interpolation(
                 fit_points, tangents[0], tangents[1], degree, t_vector,
                 knot_generation_method)
         elif len(tangents) == len(fit_points):
+            if degree > 4:
+                # double_knots() does not create a valid knot vector for
+                # degree > 4, the solvable equation system returns invalid
+                # control points
+                raise DXFValueError(
+                    'Interpolation with a tangent for each fit point supports '
+                    'only degree 2, 3 and 4.'
+                )
             control_points, knots = global_bspline_interpolation_first_derivatives(
                 fit_points, tangents, degree, t_vector)
         else:
@@ -505,28 +521,36 @@ def double_knots(n: int, p: int, t: Sequence[float]) -> List[float]:
     return u
 
 
-def _get_best_solver(matrix: Union[List, Matrix], degree: int):
+def _get_best_solver(rows: List[SparseRow], degree: int):
     """ Returns best suited linear equation solver depending on matrix
-    configuration and python interpreter.
+    configuration and python interpreter, the square matrix is given by sparse
+    rows.
     """
-    A = matrix if isinstance(matrix, Matrix) else Matrix(matrix=matrix)
+    n = len(rows)
     if PYPY:
         limit = USE_BANDED_MATRIX_SOLVER_PYPY_LIMIT
     else:
         limit = USE_BANDED_MATRIX_SOLVER_CPYTHON_LIMIT
-    if A.nrows < limit:  # use default equation solver
-        lu = LUDecomposition(A)
+    if n < limit:  # use default equation solver
+        lu = LUDecomposition(_dense_rows(rows, n))
     else:
         # Theory: band parameters m1, m2 are at maximum degree-1, for
         # B-spline interpolation and approximation:
         # m1 = m2 = degree-1
-        # But the speed gain is not that big and just to be sure:
-        m1, m2 = detect_banded_matrix(A, check_all=False)
-        A = compact_banded_matrix(A, m1, m2)
+        # The compact banded matrix is build from the sparse rows without
+        # the full matrix, which would require n² values.
+        A, m1, m2 = banded_matrix_from_rows(rows)
         lu = BandedMatrixLU(A, m1, m2)
     return lu
 
 
+def _dense_rows(rows: Iterable[SparseRow], count: int) -> List[List[float]]:
+    return [
+        ([0.0] * column) + list(values) + [0.0] * (count - column - len(values))
+        for column, values in rows
+    ]
+
+
 def unconstrained_global_bspline_interpolation(
         fit_points: Sequence['Vertex'],
         degree: int,
@@ -554,7 +578,7 @@ def unconstrained_global_bspline_interpolation(
                                        knot_generation_method,
                                        constrained=False)
     N = Basis(knots=knots, order=degree + 1, count=len(fit_points))
-    solver = _get_best_solver([N.basis_vector(t) for t in t_vector], degree)
+    solver = _get_best_solver(N.sparse_basis_matrix(t_vector), degree)
     control_points = solver.solve_matrix(fit_points)
     return Vec3.list(control_points.rows()), knots
 
@@ -596,10 +620,9 @@ def global_bspline_interpolation_end_tangents(
                                        knot_generation_method, constrained=True)
 
     N = Basis(knots=knots, order=p + 1, count=n + 3)
-    rows = [N.basis_vector(u) for u in t_vector]
-    spacing = [0.0] * (n + 1)
-    rows.insert(1, [-1.0, +1.0] + spacing)
-    rows.insert(-1, spacing + [-1.0, +1.0])
+    rows = N.sparse_basis_matrix(t_vector)
+    rows.insert(1, (0, [-1.0, +1.0]))
+    rows.insert(-1, (n + 1, [-1.0, +1.0]))
     fit_points.insert(1, start_tangent * (knots[p + 1] / p))
     fit_points.insert(-1, end_tangent * ((1.0 - knots[-(p + 2)]) / p))
 
@@ -631,27 +654,23 @@ def global_bspline_interpolation_first_derivatives(
 
     """
 
-    def nbasis(t: float):
-        span = N.find_span(t)
-        front = span - p
-        back = count + p + 1 - span
-        for basis in N.basis_funcs_derivatives(span, t, n=1):
-            yield [0.0] * front + basis + [0.0] * back
-
     p = degree
     n = len(fit_points) - 1
     knots = double_knots(n, p, t_vector)
     count = len(fit_points) * 2
     N = Basis(knots=knots, order=p + 1, count=count)
     A = [
-        [1.0] + [0.0] * (count - 1),  # Q0
-        [-1.0, +1.0] + [0.0] * (count - 2),  # D0
+        (0, [1.0]),  # Q0
+        (0, [-1.0, +1.0]),  # D0
     ]
-    for f in (nbasis(t) for t in t_vector[1:-1]):
-        A.extend(f)  # Qi, Di
+    for t in t_vector[1:-1]:
+        span = N.find_span(t)
+        # Qi, Di
+        A.extend((span - p, basis) for basis in
+                 N.basis_funcs_derivatives(span, t, n=1))
     # swapped equations!
-    A.append([0.0] * (count - 2) + [-1.0, +1.0])  # Dn
-    A.append([0.0] * (count - 1) + [+1.0])  # Qn
+    A.append((count - 2, [-1.0, +1.0]))  # Dn
+    A.append((count - 1, [+1.0]))  # Qn
 
     # Build right handed matrix B
     B = []
@@ -747,6 +766,36 @@ class Basis:
         basis = self.basis_funcs(span, t)
         return ([0.0] * front) + basis + ([0.0] * back)
 
+    def basis_matrix(self, t: Sequence[float]) -> List[List[float]]:
+        """ Returns the expanded basis vectors for all parameters of the
+        parameter vector `t`.
+        """
+        return _dense_rows(self.sparse_basis_matrix(t), self.count)
+
+    def sparse_basis_matrix(self, t: Sequence[float]) -> List[SparseRow]:
+        """ Returns the basis vectors for all parameters of the parameter
+        vector `t` as sparse rows, each row is a tuple of the column index of
+        the first non-zero basis function and the values of all `order` basis
+        functions of the knot span. Evaluated by a single function call if C
+        extensions are enabled.
+        """
+        p = self.order - 1
+        # The C implementation supports only clamped knot vectors:
+        if basis_functions is None or any(self.knots[:self.order]):
+            rows = []
+            for u in t:
+                span = self.find_span(u)
+                rows.append((span - p, self.basis_funcs(span, u)))
+            return rows
+        order = self.order
+        columns, values = basis_functions(
+            array('d', self.knots), array('d', self.weights or []), order,
+            self.count, array('d', t))
+        return [
+            (column, values[index: index + order].tolist())
+            for column, index in zip(columns, range(0, len(values), order))
+        ]
+
     def find_span(self, u: float) -> int:
         """ Determine the knot span index. """
         # Linear search is more reliable than binary search of the Algorithm A2.1
@@ -1068,7 +1117,7 @@ class BSpline:
 
     def flattening(self, distance: float,
                    segments: int = 4) -> Iterable[Vec3]:
-        """ Adaptive recursive flattening. The argument `segments` is the
+        """ Adaptive flattening. The argument `segments` is the
         minimum count of approximation segments between two knots, if the
         distance from the center of the approximation segment to the curve is
         bigger than `distance` the segment will be subdivided.
@@ -1081,16 +1130,42 @@ class BSpline:
         .. versionadded:: 0.15
 
         """
+        if flatten_bspline is None or not self.is_clamped:
+            yield from self._flattening(distance, segments)
+        else:
+            v = self.flattening_array(distance, segments)
+            for index in range(0, len(v), 3):
+                yield Vec3(v[index], v[index + 1], v[index + 2])
 
-        def subdiv(s: Vec3, e: Vec3, start_t: float, end_t: float):
-            mid_t = (start_t + end_t) * 0.5
-            m = self.point(mid_t)
-            if distance_point_line_3d(m, s, e) < distance:
-                yield e
-            else:
-                yield from subdiv(s, m, start_t, mid_t)
-                yield from subdiv(m, e, mid_t, end_t)
+    def flattening_array(self, distance: float, segments: int = 4) -> array:
+        """ Returns the vertices of :meth:`flattening` as flat ``array('d')``
+        of x, y, z coordinates.
 
+        .. versionadded:: 0.15.2
+
+        """
+        # The C implementation supports only clamped B-splines:
+        if flatten_bspline is None or not self.is_clamped:
+            result = array('d')
+            for point in self._flattening(distance, segments):
+                result.extend(point.xyz)
+            return result
+        return flatten_bspline(*self._kernel_args(), distance, segments)
+
+    def _kernel_args(self) -> Tuple[array, array, array, int]:
+        # knots, control points as flat array of x, y, z coordinates, weights
+        # and order as arguments for the C implementations:
+        control_points = array('d')
+        for point in self.control_points:
+            control_points.extend(point.xyz)
+        basis = self.basis
+        return (array('d', basis.knots), control_points,
+                array('d', basis.weights or []), self.order)
+
+    def _flattening(self, distance: float, segments: int) -> Iterable[Vec3]:
+        # The stack contains the pending end points of the iterative
+        # implementation of the adaptive recursive subdivision:
+        stack: List[Tuple[float, Vec3, int]] = []
         knots = sorted(set(self.knots()))
         t = 0.0
         start_point = self.point(t)
@@ -1101,10 +1176,21 @@ class BSpline:
                 next_t = t + delta
                 if math.isclose(next_t, t1):
                     next_t = t1
-                end_point = self.point(next_t)
-                yield from subdiv(start_point, end_point, t, next_t)
-                t = next_t
-                start_point = end_point
+                stack.append((next_t, self.point(next_t), 0))
+                while stack:
+                    end_t, end_point, depth = stack[-1]
+                    mid_t = (t + end_t) * 0.5
+                    mid_point = self.point(mid_t)
+                    if depth >= MAX_FLATTENING_DEPTH or _distance_point_chord(
+                            mid_point, start_point, end_point) < distance:
+                        yield end_point
+                        stack.pop()
+                        t = end_t
+                        start_point = end_point
+                    else:  # subdivide into [start, mid] and [mid, end]
+                        depth += 1
+                        stack[-1] = (end_t, end_point, depth)
+                        stack.append((mid_t, mid_point, depth))
 
     def params(self, segments: int) -> Iterable[float]:
         """ Yield evenly spaced parameters from 0 to max_t for given segment count. """
@@ -1130,8 +1216,32 @@ class BSpline:
             t: parameters in range [0, max_t]
 
         """
-        for u in t:
-            yield self.point(u)
+        if bspline_points is None or not self.is_clamped:
+            for u in t:
+                yield self.point(u)
+        else:
+            v = self.points_array(t)
+            for index in range(0, len(v), 3):
+                yield Vec3(v[index], v[index + 1], v[index + 2])
+
+    def points_array(self, t: Iterable[float]) -> array:
+        """ Returns the points for parameter vector `t` as flat
+        ``array('d')`` of x, y, z coordinates, all points are evaluated by a
+        single function call if C extensions are enabled.
+
+        Args:
+            t: parameters in range [0, max_t]
+
+        .. versionadded:: 0.15.2
+
+        """
+        # The C implementation supports only clamped B-splines:
+        if bspline_points is None or not self.is_clamped:
+            result = array('d')
+            for u in t:
+                result.extend(self.point(u).xyz)
+            return result
+        return bspline_points(*self._kernel_args(), array('d', t))
 
     def derivative(self, t: float, n: int = 2) -> List[Vec3]:
         """
@@ -1166,8 +1276,17 @@ class BSpline:
             List of n+1 values as :class:`Vec3` objects
 
         """
-        for u in t:
-            yield self.derivative(u, n)
+        # The C implementation supports only clamped B-splines:
+        if bspline_derivatives is None or not self.is_clamped or \
+                n > self.degree:
+            for u in t:
+                yield self.derivative(u, n)
+            return
+        v = bspline_derivatives(*self._kernel_args(), array('d', t), n)
+        stride = (n + 1) * 3
+        for start in range(0, len(v), stride):
+            yield [Vec3(v[index], v[index + 1], v[index + 2])
+                   for index in range(start, start + stride, 3)]
 
     def insert_knot(self, t: float) -> None:
         """
@@ -1391,6 +1510,16 @@ class BSplineClosed(BSplineU):
         super().__init__(points, order=order, knots=None, weights=weights)
 
 
+def _distance_point_chord(point: Vec3, start: Vec3, end: Vec3) -> float:
+    # Same as distance_point_line_3d(), but without exceptions for degenerated
+    # chords and negative rounding errors:
+    if start.isclose(end):
+        return point.distance(start)
+    v1 = point - start
+    v2 = (end - start).project(v1)
+    return math.sqrt(max(v1.magnitude_square - v2.magnitude_square, 0.0))
+
+
 def rational_spline_from_arc(
         center: Vec3 = (0, 0), radius: float = 1, start_angle: float = 0,
         end_angle: float = 360,
@@ -1582,3 +1711,17 @@ def bspline_basis_vector(u: float, count: int, degree: int,
         -1]):  # pick up last point ??? why is this necessary ???
         basis[-1] = 1.
     return basis
+
+
+flatten_bspline = None
+bspline_points = None
+bspline_derivatives = None
+basis_functions = None
+if USE_C_EXT:
+    try:
+        from ezdxf.acc.bspline import (
+            flatten_bspline, bspline_points, bspline_derivatives,
+            basis_functions,
+        )
+    except ImportError:  # C extension built before the bspline module existed
+        pass
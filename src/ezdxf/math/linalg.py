@@ -10,7 +10,7 @@ __all__ = [
     'Matrix', 'gauss_vector_solver', 'gauss_matrix_solver', 'gauss_jordan_solver', 'gauss_jordan_inverse',
     'LUDecomposition', 'freeze_matrix', 'tridiagonal_vector_solver', 'tridiagonal_matrix_solver',
     'detect_banded_matrix', 'compact_banded_matrix', 'BandedMatrixLU', 'banded_matrix', 'quadratic_equation',
-    'binomial_coefficient',
+    'binomial_coefficient', 'banded_matrix_from_rows',
 ]
 
 
@@ -22,6 +22,9 @@ def zip_to_list(*args) -> Iterable[List]:
 MatrixData = List[List[float]]
 FrozenMatrixData = Tuple[Tuple[float, ...]]
 Shape = Tuple[int, int]
+# Sparse matrix row: column index of the first value and the values of the
+# consecutive columns, all other columns are 0:
+SparseRow = Tuple[int, Sequence[float]]
 
 
 def copy_float_matrix(A) -> MatrixData:
@@ -870,6 +873,41 @@ def banded_matrix(A: Matrix, check_all=True) -> Tuple[Matrix, int, int]:
     return m, m1, m2
 
 
+def banded_matrix_from_rows(
+        rows: Sequence[SparseRow]) -> Tuple[Matrix, int, int]:
+    """
+    Returns the compact banded matrix representation of a square matrix
+    given by sparse rows as :class:`Matrix` object and lower- and upper band
+    count m1 and m2, without building the full matrix. Each row is a tuple
+    of the column index of the first value and the values of the
+    consecutive columns, all other columns are 0.
+
+    Args:
+        rows: sparse rows as (column index, values) tuples
+
+    .. versionadded:: 0.15.2
+
+    """
+    m1 = 0
+    m2 = 0
+    for index, (column, values) in enumerate(rows):
+        m1 = max(m1, index - column)
+        m2 = max(m2, column + len(values) - 1 - index)
+
+    n = len(rows)
+    mm = m1 + m2 + 1
+    matrix = []
+    for index, (column, values) in enumerate(rows):
+        if column < 0 or column + len(values) > n:
+            raise ValueError('Square matrix required.')
+        # column k of the compact row is column index - m1 + k of matrix A
+        start = column - index + m1
+        row = [0.0] * mm
+        row[start: start + len(values)] = values
+        matrix.append(row)
+    return Matrix(matrix=matrix), m1, m2
+
+
 def detect_banded_matrix(A: Matrix, check_all=True) -> Tuple[int, int]:
     """
     Returns lower- and upper band count m1 and m2.
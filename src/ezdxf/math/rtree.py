@@ -0,0 +1,223 @@
+#  Copyright (c) 2021, Manfred Moitzi
+#  License: MIT License
+from typing import (
+    TYPE_CHECKING, Iterable, List, Tuple, Any, Sequence, Optional,
+)
+import heapq
+import math
+
+from ezdxf.math import Vec3
+from ezdxf.math.bbox import BoundingBox
+
+if TYPE_CHECKING:
+    from ezdxf.eztypes import Vertex
+
+__all__ = ['RTree']
+
+# Extents as (xmin, ymin, zmin, xmax, ymax, zmax) tuple:
+Extents = Tuple[float, float, float, float, float, float]
+
+
+class _Node:
+    __slots__ = ('extents', 'children', 'is_leaf')
+
+    def __init__(self, children: List, is_leaf: bool):
+        self.children = children
+        self.is_leaf = is_leaf
+        self.extents = _union(child[0] if is_leaf else child.extents
+                              for child in children)
+
+
+class RTree:
+    """ Immutable R-tree of 3D bounding boxes, bulk loaded by the
+    Sort-Tile-Recursive (STR) algorithm. The tiles are sorted in the
+    xy-plane, the z-axis is just part of the box tests.
+
+    Each `item` is stored with its bounding box, the same item can be stored
+    multiple times. Items with empty bounding boxes are ignored.
+
+    Args:
+        items: iterable of (:class:`BoundingBox`, item) tuples
+        max_node_size: max. count of children per node
+
+    .. versionadded:: 0.15.2
+
+    """
+
+    def __init__(self, items: Iterable[Tuple[BoundingBox, Any]],
+                 max_node_size: int = 16):
+        if max_node_size < 2:
+            raise ValueError('max_node_size has to be >= 2')
+        self.max_node_size = int(max_node_size)
+        leaf_items = [
+            (_extents(box), item) for box, item in items if box.has_data
+        ]
+        self._count = len(leaf_items)
+        self._root = _str_pack(leaf_items, self.max_node_size)
+
+    def __len__(self) -> int:
+        """ Returns the count of stored items. """
+        return self._count
+
+    @property
+    def extents(self) -> BoundingBox:
+        """ Returns the bounding box of all stored items. """
+        if self._root is None:
+            return BoundingBox()
+        e = self._root.extents
+        return BoundingBox([e[:3], e[3:]])
+
+    def __iter__(self) -> Iterable[Tuple[BoundingBox, Any]]:
+        """ Yields all (:class:`BoundingBox`, item) tuples. """
+        for e, item in self._leaf_items():
+            yield BoundingBox([e[:3], e[3:]]), item
+
+    def _leaf_items(self) -> Iterable[Tuple[Extents, Any]]:
+        if self._root is None:
+            return
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if node.is_leaf:
+                yield from node.children
+            else:
+                stack.extend(node.children)
+
+    def intersecting(self, box: BoundingBox) -> Iterable[Any]:
+        """ Yields all items, which bounding boxes intersect the query `box`,
+        touching boxes do intersect.
+        """
+        if self._root is None or not box.has_data:
+            return
+        xmin, ymin, zmin, xmax, ymax, zmax = _extents(box)
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            e = node.extents
+            if e[0] > xmax or e[3] < xmin or e[1] > ymax or e[4] < ymin or \
+                    e[2] > zmax or e[5] < zmin:
+                continue
+            if node.is_leaf:
+                for e, item in node.children:
+                    if e[0] > xmax or e[3] < xmin or e[1] > ymax or \
+                            e[4] < ymin or e[2] > zmax or e[5] < zmin:
+                        continue
+                    yield item
+            else:
+                stack.extend(node.children)
+
+    def inside(self, box: BoundingBox) -> Iterable[Any]:
+        """ Yields all items, which bounding boxes are completely inside the
+        query `box`, boxes at the border of the query box are inside.
+        """
+        if self._root is None or not box.has_data:
+            return
+        xmin, ymin, zmin, xmax, ymax, zmax = _extents(box)
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            e = node.extents
+            if e[0] > xmax or e[3] < xmin or e[1] > ymax or e[4] < ymin or \
+                    e[2] > zmax or e[5] < zmin:
+                continue
+            if node.is_leaf:
+                for e, item in node.children:
+                    if xmin <= e[0] and e[3] <= xmax and \
+                            ymin <= e[1] and e[4] <= ymax and \
+                            zmin <= e[2] and e[5] <= zmax:
+                        yield item
+            else:
+                stack.extend(node.children)
+
+    def nearest(self, point: 'Vertex', k: int = 1) -> List[Tuple[float, Any]]:
+        """ Returns the `k` nearest items to `point` as list of
+        (distance, item) tuples, sorted by ascending distance. The distance is
+        the distance from `point` to the bounding box of the item, which is 0
+        for points inside the bounding box.
+        """
+        result: List[Tuple[float, Any]] = []
+        if self._root is None or k < 1:
+            return result
+        x, y, z = Vec3(point).xyz
+        counter = 0  # tie breaker, nodes and items are not comparable
+        heap = [(0., counter, False, self._root)]
+        while heap:
+            distance, _, is_item, content = heapq.heappop(heap)
+            if is_item:
+                result.append((distance, content))
+                if len(result) >= k:
+                    break
+                continue
+            if content.is_leaf:
+                for e, item in content.children:
+                    counter += 1
+                    heapq.heappush(
+                        heap, (_distance(e, x, y, z), counter, True, item))
+            else:
+                for node in content.children:
+                    counter += 1
+                    heapq.heappush(
+                        heap,
+                        (_distance(node.extents, x, y, z), counter, False, node)
+                    )
+        return result
+
+
+def _extents(box: BoundingBox) -> Extents:
+    return (*Vec3(box.extmin).xyz, *Vec3(box.extmax).xyz)
+
+
+def _union(extents: Iterable[Extents]) -> Extents:
+    extents = list(extents)
+    return (
+        min(e[0] for e in extents), min(e[1] for e in extents),
+        min(e[2] for e in extents), max(e[3] for e in extents),
+        max(e[4] for e in extents), max(e[5] for e in extents),
+    )
+
+
+def _distance(e: Extents, x: float, y: float, z: float) -> float:
+    dx = max(e[0] - x, 0., x - e[3])
+    dy = max(e[1] - y, 0., y - e[4])
+    dz = max(e[2] - z, 0., z - e[5])
+    return math.sqrt(dx * dx + dy * dy + dz * dz)
+
+
+def _center_x(child) -> float:
+    e = child[0] if type(child) is tuple else child.extents
+    return e[0] + e[3]
+
+
+def _center_y(child) -> float:
+    e = child[0] if type(child) is tuple else child.extents
+    return e[1] + e[4]
+
+
+def _str_pack(children: List, size: int) -> Optional[_Node]:
+    """ Returns the root node of the Sort-Tile-Recursive packed tree. """
+    if not children:
+        return None
+    is_leaf = True
+    while True:
+        nodes = [
+            _Node(group, is_leaf) for group in _str_tiles(children, size)
+        ]
+        if len(nodes) == 1:
+            return nodes[0]
+        children = nodes
+        is_leaf = False
+
+
+def _str_tiles(children: List, size: int) -> Iterable[Sequence]:
+    count = len(children)
+    if count <= size:
+        yield children
+        return
+    node_count = math.ceil(count / size)
+    slice_count = math.ceil(math.sqrt(node_count))
+    slice_size = slice_count * size
+    children = sorted(children, key=_center_x)
+    for start in range(0, count, slice_size):
+        tile = sorted(children[start:start + slice_size], key=_center_y)
+        for index in range(0, len(tile), size):
+            yield tile[index:index + size]
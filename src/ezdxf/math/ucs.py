@@ -1,7 +1,9 @@
 # Copyright (c) 2018-2020 Manfred Moitzi
 # License: MIT License
 from typing import TYPE_CHECKING, Tuple, Sequence, Iterable
+from array import array
 from ezdxf.math import Vec3, X_AXIS, Y_AXIS, Z_AXIS, Matrix44
+from ezdxf.math._matrix44 import float_array
 
 
 if TYPE_CHECKING:
@@ -84,6 +86,32 @@ class OCS:
         else:
             yield from points
 
+    def points_to_wcs_array(self, values: Iterable[float]) -> array:
+        """ Returns WCS vertices for a flat array of OCS x, y, z coordinates
+        as new ``array('d')``, see :meth:`Matrix44.transform_array`.
+
+        .. versionadded:: 0.15.2
+
+        """
+        if self.transform:
+            return self.matrix.transform_array(values)
+        else:
+            return float_array(values)
+
+    def points_from_wcs_array(self, values: Iterable[float]) -> array:
+        """ Returns OCS vertices for a flat array of WCS x, y, z coordinates
+        as new ``array('d')``, see :meth:`Matrix44.transform_array`.
+
+        .. versionadded:: 0.15.2
+
+        """
+        if self.transform:
+            m = self.matrix.copy()
+            m.transpose()
+            return m.transform_array(values)
+        else:
+            return float_array(values)
+
     def render_axis(self, layout: 'BaseLayout', length: float = 1, colors: Tuple[int, int, int] = (1, 3, 5)):
         """ Render axis as 3D lines into a `layout`. """
         render_axis(
@@ -177,6 +205,15 @@ class UCS:
         """ Returns iterable of WCS vectors for UCS `points`. """
         return self.matrix.transform_vertices(points)
 
+    def points_to_wcs_array(self, values: Iterable[float]) -> array:
+        """ Returns WCS vertices for a flat array of UCS x, y, z coordinates
+        as new ``array('d')``, see :meth:`Matrix44.transform_array`.
+
+        .. versionadded:: 0.15.2
+
+        """
+        return self.matrix.transform_array(values)
+
     def direction_to_wcs(self, vector: 'Vec3') -> 'Vec3':
         """ Returns WCS direction for UCS `vector` without origin adjustment. """
         return self.matrix.transform_direction(vector)
@@ -191,6 +228,17 @@ class UCS:
         for point in points:
             yield from_wcs(point)
 
+    def points_from_wcs_array(self, values: Iterable[float]) -> array:
+        """ Returns UCS vertices for a flat array of WCS x, y, z coordinates
+        as new ``array('d')``, see :meth:`Matrix44.transform_array`.
+
+        .. versionadded:: 0.15.2
+
+        """
+        m = self.matrix.copy()
+        m.inverse()
+        return m.transform_array(values)
+
     def direction_from_wcs(self, vector: 'Vec3') -> 'Vec3':
         """ Returns UCS vector for WCS `vector` without origin adjustment. """
         return self.matrix.ucs_direction_from_wcs(vector)
@@ -2,13 +2,19 @@
 # Created: 27.04.13
 # Copyright (C) 2013, Manfred Moitzi
 # License: MIT License
-from typing import TYPE_CHECKING, Iterable, Callable, Hashable, Dict, List, Any, Sequence, Union
+from typing import (
+    TYPE_CHECKING, Iterable, Callable, Hashable, Dict, List, Any, Sequence,
+    Union, Optional, FrozenSet, Tuple, Set,
+)
 import re
 import operator
+import functools
+import itertools
 
 from collections import abc
 from ezdxf.queryparser import EntityQueryParser
 from ezdxf.groupby import groupby
+from ezdxf.lldxf.const import INDEXED_DXF_ATTRIBS
 
 if TYPE_CHECKING:  # import forward references
     from ezdxf.eztypes import DXFEntity
@@ -152,21 +158,70 @@ class EntityQuery(abc.Sequence):
         return groupby(self.entities, dxfattrib, key)
 
 
-def entity_matcher(query: str) -> Callable[['DXFEntity'], bool]:
+# Count of compiled query strings stored in the LRU cache:
+QUERY_CACHE_SIZE = 512
+
+
+class CompiledQuery:
+    """ Compiled query string, the :attr:`match` function tests a single DXF
+    entity. The attributes :attr:`names` and :attr:`equal` are the hints for
+    the :class:`QueryIndex` lookup: :attr:`names` is the set of included DXF
+    types or ``None`` for all DXF types and :attr:`equal` contains the
+    (attribute name, value) pairs of all equality tests which are required for
+    a match.
+
+    (internal API)
+    """
+    __slots__ = ('match', 'names', 'equal')
+
+    def __init__(self, match: Callable[['DXFEntity'], bool],
+                 names: Optional[FrozenSet[str]],
+                 equal: Tuple[Tuple[str, Any], ...]):
+        self.match = match
+        self.names = names
+        self.equal = equal
+
+
+@functools.lru_cache(maxsize=QUERY_CACHE_SIZE)
+def compile_query(query: str) -> CompiledQuery:
+    """ Returns the :class:`CompiledQuery` for the `query` string, the
+    compiled queries are stored in a LRU cache.
+
+    (internal API)
+    """
     query_args = EntityQueryParser.parseString(query, parseAll=True)
-    entity_matcher_ = build_entity_name_matcher(query_args.EntityQuery)
-    attrib_matcher = build_entity_attributes_matcher(query_args.AttribQuery, query_args.AttribQueryOptions)
+    names = list(query_args.EntityQuery)
+    entity_matcher_ = build_entity_name_matcher(names)
+    attrib_tokens = query_args.AttribQuery
+    attrib_matcher = build_entity_attributes_matcher(
+        attrib_tokens, query_args.AttribQueryOptions)
+
+    if len(attrib_tokens):
+        def matcher(entity: 'DXFEntity') -> bool:
+            return entity_matcher_(entity) and attrib_matcher(entity)
+
+        equal = tuple(_equality_terms(attrib_tokens))
+    else:
+        matcher = entity_matcher_
+        equal = tuple()
+
+    if '*' in names:
+        included_names = None
+    else:
+        included_names = frozenset(name.upper() for name in names)
+    return CompiledQuery(matcher, included_names, equal)
 
-    def matcher(entity: 'DXFEntity') -> bool:
-        return entity_matcher_(entity) and attrib_matcher(entity)
 
-    return matcher
+def entity_matcher(query: str) -> Callable[['DXFEntity'], bool]:
+    return compile_query(query).match
 
 
 def build_entity_name_matcher(names: Sequence[str]) -> Callable[['DXFEntity'], bool]:
     def match(e: 'DXFEntity') -> bool:
         return _match(e.dxftype())
 
+    if list(names) == ['*']:
+        return lambda e: True
     _match = name_matcher(query=' '.join(names))
     return match
 
@@ -261,12 +316,70 @@ def build_entity_attributes_matcher(tokens: Sequence, options: str) -> Callable[
     if not len(tokens):
         return lambda x: True
     ignore_case = 'i' == options  # at this time just one option is supported
-    expr = BoolExpression(_compile_tokens(tokens, ignore_case))
+    return _compile_expression(_compile_tokens(tokens, ignore_case))
+
+
+def _compile_expression(
+        expr: Union[Relation, BoolExpression]) -> Callable[['DXFEntity'], bool]:
+    """ Returns a closure which evaluates `expr` like
+    :meth:`BoolExpression.evaluate`, but the bool operators are resolved only
+    once.
+    """
+    if isinstance(expr, Relation):
+        return expr.evaluate
+    if isinstance(expr.tokens, Relation):
+        return expr.tokens.evaluate
+
+    values = []  # first in, first out
+    operators = []  # first in, first out
+    for token in expr:
+        if hasattr(token, 'evaluate'):
+            values.append(_compile_expression(token))
+        else:  # bool operator
+            operators.append(token)
+    values.reverse()
+    for op in operators:  # as queue -> first in, first out
+        if op == '!':
+            values.append(_not(values.pop()))
+        elif op == '&':
+            values.append(_and(values.pop(), values.pop()))
+        else:
+            values.append(_or(values.pop(), values.pop()))
+    return values.pop()
+
+
+def _not(a: Callable) -> Callable[['DXFEntity'], bool]:
+    return lambda entity: not a(entity)
+
+
+def _and(a: Callable, b: Callable) -> Callable[['DXFEntity'], bool]:
+    return lambda entity: a(entity) and b(entity)
+
+
+def _or(a: Callable, b: Callable) -> Callable[['DXFEntity'], bool]:
+    return lambda entity: a(entity) or b(entity)
 
-    def match_bool_expr(entity: 'DXFEntity') -> bool:
-        return expr.evaluate(entity)
 
-    return match_bool_expr
+def _is_relation(tokens: Sequence) -> bool:
+    return len(tokens) == 3 and tokens[1] in Relation.VALID_CMP_OPERATORS
+
+
+def _equality_terms(tokens: Union[str, Sequence]) -> Iterable[Tuple[str, Any]]:
+    """ Yields all (name, value) pairs of equality relations, which are
+    required to match the attribute query `tokens`.
+    """
+    if isinstance(tokens, str):
+        return
+    tokens = tuple(tokens)
+    if _is_relation(tokens):
+        name, op, value = tokens
+        if op == '==':
+            yield name, value
+    elif len(tokens) == 1:
+        yield from _equality_terms(tokens[0])
+    elif all(isinstance(op, str) and op == '&' for op in tokens[1::2]):
+        for term in tokens[0::2]:
+            yield from _equality_terms(term)
 
 
 def unique_entities(entities: Iterable['DXFEntity']) -> Iterable['DXFEntity']:
@@ -300,12 +413,6 @@ def name_query(names: Iterable[str], query: str = "*") -> Iterable[str]:
 
 
 def name_matcher(query: str = "*") -> Callable[[str], bool]:
-    def match(e: str) -> bool:
-        if take_all:
-            return e not in exclude
-        else:
-            return e in include
-
     match_strings = set(query.upper().split())
     take_all = False
     exclude = set()
@@ -318,7 +425,10 @@ def name_matcher(query: str = "*") -> Callable[[str], bool]:
         else:
             include.add(name)
 
-    return match
+    if take_all:
+        return lambda e: e not in exclude
+    else:
+        return include.__contains__
 
 
 def new(entities: Iterable['DXFEntity'] = None, query: str = '*') -> EntityQuery:
@@ -328,3 +438,128 @@ def new(entities: Iterable['DXFEntity'] = None, query: str = '*') -> EntityQuery
 
     """
     return EntityQuery(entities, query)
+
+
+# Marker for not supported DXF attributes:
+_NOT_SUPPORTED = object()
+
+
+class QueryIndex:
+    """ Secondary index of DXF entities by DXF type, layer, color and
+    linetype to speed up queries of a layout, see
+    :meth:`ezdxf.layouts.BaseLayout.build_query_index`.
+
+    The index returns all candidates of a query in the original order of the
+    indexed entities. A query can use the index, if the query string selects
+    entities by DXF type names or if the attribute query requires an equality
+    test of an indexed DXF attribute, like ``'*[layer=="WALLS"]'`` or
+    ``'LINE[layer=="WALLS" & color==1]'``, otherwise all entities are
+    candidates.
+
+    .. versionadded:: 0.15.2
+
+    """
+
+    def __init__(self, entities: Iterable['DXFEntity'] = None):
+        self._counter = itertools.count()
+        # key is id(entity), value is (sequence number, entity, index keys):
+        self._entries: Dict[int, Tuple[int, 'DXFEntity', Tuple]] = dict()
+        # first bucket is the DXF type, followed by the INDEXED_DXF_ATTRIBS:
+        self._buckets: List[Dict[Any, Set[int]]] = [
+            dict() for _ in range(len(INDEXED_DXF_ATTRIBS) + 1)
+        ]
+        if entities is not None:
+            for entity in entities:
+                self.insert(entity)
+
+    def __len__(self) -> int:
+        """ Returns the count of indexed entities. """
+        return len(self._entries)
+
+    def __contains__(self, entity: 'DXFEntity') -> bool:
+        """ Returns ``True`` if `entity` is indexed. """
+        return id(entity) in self._entries
+
+    def insert(self, entity: 'DXFEntity') -> None:
+        """ Add `entity` as last entity to the index. """
+        key = id(entity)
+        if key in self._entries:
+            self.remove(entity)
+        self._add(key, next(self._counter), entity)
+
+    def remove(self, entity: 'DXFEntity') -> None:
+        """ Remove `entity` from the index, ignores not indexed entities. """
+        key = id(entity)
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for bucket, value in zip(self._buckets, entry[2]):
+            ids = bucket[value]
+            ids.discard(key)
+            if not ids:
+                del bucket[value]
+
+    def update(self, entity: 'DXFEntity') -> None:
+        """ Update the index keys of `entity` after changing the DXF type or
+        an indexed DXF attribute, the order of the entity is preserved.
+        """
+        key = id(entity)
+        entry = self._entries.get(key)
+        if entry is None:
+            return
+        self.remove(entity)
+        self._add(key, entry[0], entity)
+
+    def _add(self, key: int, number: int, entity: 'DXFEntity') -> None:
+        index_keys = _index_keys(entity)
+        self._entries[key] = (number, entity, index_keys)
+        for bucket, value in zip(self._buckets, index_keys):
+            ids = bucket.get(value)
+            if ids is None:
+                bucket[value] = {key}
+            else:
+                ids.add(key)
+
+    def candidates(self, query: CompiledQuery) -> Optional[List['DXFEntity']]:
+        """ Returns all candidates of a compiled `query` in the order of
+        insertion, the candidates have to be checked by the
+        :attr:`CompiledQuery.match` function. Returns ``None`` if the query
+        can not use the index.
+        """
+        selections: List[Set[int]] = []
+        if query.names is not None:
+            types = self._buckets[0]
+            ids = set()
+            for name in query.names:
+                ids.update(types.get(name, ()))
+            selections.append(ids)
+        for name, value in query.equal:
+            try:
+                index = INDEXED_DXF_ATTRIBS.index(name)
+            except ValueError:
+                continue
+            try:
+                ids = self._buckets[index + 1].get(to_lower(value), set())
+            except TypeError:  # unhashable value
+                continue
+            selections.append(ids)
+        if not selections:
+            return None
+        selections.sort(key=len)
+        ids = selections[0]
+        if len(selections) > 1:
+            ids = ids.intersection(*selections[1:])
+        entries = self._entries
+        result = sorted(entries[key][:2] for key in ids)
+        return [entity for _, entity in result if entity.is_alive]
+
+
+def _index_keys(entity: 'DXFEntity') -> Tuple:
+    keys = [entity.dxftype()]
+    for name in INDEXED_DXF_ATTRIBS:
+        try:
+            value = to_lower(entity.get_dxf_attrib(name))
+        except AttributeError:  # entity does not support this attribute
+            value = _NOT_SUPPORTED
+        keys.append(value)
+    return tuple(keys)
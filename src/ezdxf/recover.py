@@ -4,6 +4,7 @@ from typing import (
     TYPE_CHECKING, BinaryIO, Iterable, List, Callable, Tuple, Dict, Union,
 )
 import itertools
+import mmap
 import re
 from collections import defaultdict
 
@@ -18,6 +19,7 @@ from ezdxf.lldxf.types import (
     MAX_GROUP_CODE,
 )
 from ezdxf.lldxf.tags import group_tags, Tags
+from ezdxf.lldxf.tagger import bulk_chunks
 from ezdxf.lldxf.validator import entity_structure_validator
 from ezdxf.tools.codepage import toencoding
 from ezdxf.audit import Auditor, AuditError
@@ -33,7 +35,8 @@ EXCLUDE_STRUCTURE_CHECK = {
 
 
 def readfile(filename: str,
-             errors: str = 'surrogateescape') -> Tuple['Drawing', 'Auditor']:
+             errors: str = 'surrogateescape', *,
+             use_mmap: bool = False) -> Tuple['Drawing', 'Auditor']:
     """ Read a DXF document from file system similar to :func:`ezdxf.readfile`,
     but this function will repair as much flaws as possible, runs the required
     audit process automatically the DXF document and the :class:`Auditor`.
@@ -46,13 +49,27 @@ def readfile(filename: str,
             - "ignore" to use the replacement char U+FFFD "\ufffd" for invalid data
             - "strict" to raise an :class:`UnicodeDecodeError` exception for invalid data
 
+        use_mmap: ``True`` to memory map the DXF file and split it into
+            DXF tags by a fast bytes-level scanner, see
+            :func:`bulk_bytes_loader`
+
     Raises:
         DXFStructureError: for invalid or corrupted DXF structures
         UnicodeDecodeError: if `errors` is "strict" and a decoding error occurs
 
+    .. versionadded:: 0.15.2
+
+        argument `use_mmap`
+
     """
     with open(filename, mode='rb') as fp:
-        doc, auditor = read(fp, errors=errors)
+        if use_mmap:
+            with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                recover_tool = Recover.run(
+                    data, loader=bulk_bytes_loader, errors=errors)
+                doc, auditor = _load_and_audit_document(recover_tool)
+        else:
+            doc, auditor = read(fp, errors=errors)
     doc.filename = filename
     return doc, auditor
 
@@ -491,6 +508,42 @@ def bytes_loader(stream: BinaryIO) -> Iterable[DXFTag]:
             return
 
 
+def bulk_bytes_loader(data: bytes) -> Iterable[DXFTag]:
+    """ Yields :class:``DXFTag`` objects from `data` (untrusted external
+    source), skips all comment tags (group code == 999).
+
+    Same result as :func:`bytes_loader`, but `data` has to be a ``bytes``
+    object or a memory mapped file (:class:`mmap.mmap`), which is split into
+    lines by a bytes-level pass over large chunks of the data instead of
+    reading line by line.
+
+    Raises:
+        DXFStructureError: Found invalid group code.
+
+    .. versionadded:: 0.15.2
+
+    """
+    line = 1
+    for lines in bulk_chunks(data):
+        count = len(lines)
+        pos = 0
+        while pos < count:
+            code = lines[pos]
+            try:
+                code = int(code)
+            except ValueError:
+                try:  # harder to find an int
+                    code = _search_int(code)
+                except ValueError:
+                    code = code.decode(errors='ignore')
+                    raise const.DXFStructureError(
+                        f'Invalid group code "{code}" at line {line + pos}.')
+            if code != 999:
+                yield DXFTag(code, lines[pos + 1].rstrip(b'\r'))
+            pos += 2
+        line += count
+
+
 def synced_bytes_loader(stream: BinaryIO) -> Iterable[DXFTag]:
     """ Yields :class:``DXFTag`` objects from a bytes `stream`
     (untrusted external source), skips all comment tags (group code == 999).
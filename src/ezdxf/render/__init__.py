@@ -6,3 +6,4 @@ from .curves import Bezier, EulerSpiral, Spline, random_2d_path, random_3d_path
 from .mesh import MeshBuilder, MeshVertexMerger, MeshTransformer, MeshAverageVertexMerger
 from .trace import TraceBuilder
 from .path import Path, Command, has_path_support, make_path, from_matplotlib_path
+from .compactpath import CompactPath
@@ -0,0 +1,337 @@
+#  Copyright (c) 2021, Manfred Moitzi
+#  License: MIT License
+from typing import TYPE_CHECKING, Iterable, List
+from array import array
+import math
+
+from ezdxf.math import Vec3, NULLVEC, BoundingBox
+from .path import Path, Command
+
+if TYPE_CHECKING:
+    from ezdxf.eztypes import Vertex, Matrix44
+
+__all__ = ['CompactPath']
+
+LINE_TO = int(Command.LINE_TO)
+CURVE3_TO = int(Command.CURVE3_TO)
+CURVE4_TO = int(Command.CURVE4_TO)
+
+# Count of vertices stored in the vertex buffer for each command:
+VERTEX_COUNT = {
+    LINE_TO: 1,
+    CURVE3_TO: 2,
+    CURVE4_TO: 3,
+}
+
+
+class CompactPath:
+    """ Memory efficient :class:`~ezdxf.render.path.Path` representation,
+    the command codes are stored in an ``array('B')`` and all vertices in a
+    single flat ``array('d')`` of x, y, z coordinates.
+
+    The vertex buffer starts with the start point followed by the vertices
+    of each command in the order of :meth:`Path.control_vertices`:
+    LINE_TO (end), CURVE3_TO (ctrl, end) and CURVE4_TO (ctrl1, ctrl2, end),
+    therefore the control points of each Bézier curve are consecutive
+    coordinates of the vertex buffer, starting at the end point of the
+    previous command.
+
+    The methods :meth:`approximate`, :meth:`flattening`, :meth:`transform`
+    and :meth:`bbox` process all segments at once by a single function call,
+    implemented by a Cython kernel if C extensions are enabled.
+
+    .. versionadded:: 0.15.2
+
+    """
+    __slots__ = ('commands', 'vertices')
+
+    def __init__(self, start: 'Vertex' = NULLVEC):
+        # command codes as defined by ezdxf.render.path.Command
+        self.commands = array('B')
+        # flat array of x, y, z coordinates
+        self.vertices = array('d', Vec3(start).xyz)
+
+    def __len__(self) -> int:
+        """ Returns count of path commands. """
+        return len(self.commands)
+
+    def __copy__(self) -> 'CompactPath':
+        return self._new(array('B', self.commands), array('d', self.vertices))
+
+    clone = __copy__
+
+    @classmethod
+    def _new(cls, commands: array, vertices: array) -> 'CompactPath':
+        path = cls.__new__(cls)
+        path.commands = commands
+        path.vertices = vertices
+        return path
+
+    @classmethod
+    def from_path(cls, path: Path) -> 'CompactPath':
+        """ Returns a new :class:`CompactPath` from a
+        :class:`~ezdxf.render.path.Path` object.
+        """
+        compact = cls(path.start)
+        compact.commands.extend(cmd.type for cmd in path)
+        vertices = compact.vertices
+        for vertex in list(path.control_vertices())[1:]:
+            vertices.extend(vertex.xyz)
+        return compact
+
+    def to_path(self) -> Path:
+        """ Returns a new :class:`~ezdxf.render.path.Path` object. """
+        vertices = self._vertices()
+        path = Path(vertices[0])
+        index = 1
+        for cmd in self.commands:
+            if cmd == LINE_TO:
+                path.line_to(vertices[index])
+            elif cmd == CURVE3_TO:
+                path.curve3_to(vertices[index + 1], vertices[index])
+            elif cmd == CURVE4_TO:
+                path.curve4_to(vertices[index + 2], vertices[index],
+                               vertices[index + 1])
+            else:
+                raise ValueError(f'Invalid command: {cmd}')
+            index += VERTEX_COUNT[cmd]
+        return path
+
+    @property
+    def start(self) -> Vec3:
+        """ :class:`CompactPath` start point, resetting the start point of an
+        empty path is possible.
+        """
+        return Vec3(self.vertices[0:3])
+
+    @start.setter
+    def start(self, location: 'Vertex') -> None:
+        if len(self.commands):
+            raise ValueError('Requires an empty path.')
+        self.vertices = array('d', Vec3(location).xyz)
+
+    @property
+    def end(self) -> Vec3:
+        """ :class:`CompactPath` end point. """
+        return Vec3(self.vertices[-3:])
+
+    @property
+    def is_closed(self) -> bool:
+        """ Returns ``True`` if the start point is close to the end point. """
+        return self.start.isclose(self.end)
+
+    def line_to(self, location: 'Vertex') -> None:
+        """ Add a line from actual path end point to `location`. """
+        self.commands.append(LINE_TO)
+        self.vertices.extend(Vec3(location).xyz)
+
+    def curve3_to(self, location: 'Vertex', ctrl: 'Vertex') -> None:
+        """ Add a quadratic Bèzier-curve from actual path end point to
+        `location`, `ctrl` is the control point for the quadratic Bèzier-curve.
+        """
+        self.commands.append(CURVE3_TO)
+        self.vertices.extend(Vec3(ctrl).xyz)
+        self.vertices.extend(Vec3(location).xyz)
+
+    def curve4_to(self, location: 'Vertex', ctrl1: 'Vertex',
+                  ctrl2: 'Vertex') -> None:
+        """ Add a cubic Bèzier-curve from actual path end point to `location`,
+        `ctrl1` and `ctrl2` are the control points for the cubic Bèzier-curve.
+        """
+        self.commands.append(CURVE4_TO)
+        self.vertices.extend(Vec3(ctrl1).xyz)
+        self.vertices.extend(Vec3(ctrl2).xyz)
+        self.vertices.extend(Vec3(location).xyz)
+
+    def close(self) -> None:
+        """ Close path by adding a line segment from the end point to the start
+        point.
+        """
+        if not self.is_closed:
+            self.line_to(self.start)
+
+    def control_vertices(self) -> List[Vec3]:
+        """ Returns all path control vertices in consecutive order. """
+        if len(self.commands):
+            return self._vertices()
+        return []
+
+    def _vertices(self) -> List[Vec3]:
+        v = self.vertices
+        return [Vec3(v[i], v[i + 1], v[i + 2]) for i in range(0, len(v), 3)]
+
+    def transform(self, m: 'Matrix44') -> 'CompactPath':
+        """ Returns a new transformed path.
+
+        Args:
+             m: transformation matrix of type :class:`~ezdxf.math.Matrix44`
+
+        """
+        return self._new(array('B', self.commands),
+                         m.transform_array(self.vertices))
+
+    def approximate_array(self, segments: int = 20) -> array:
+        """ Returns the vertices of :meth:`approximate` as flat
+        ``array('d')`` of x, y, z coordinates.
+        """
+        return flatten_path(self.commands, self.vertices, 0.0, segments)
+
+    def approximate(self, segments: int = 20) -> Iterable[Vec3]:
+        """ Approximate path by vertices, `segments` is the count of
+        approximation segments for each Bézier curve.
+
+        Does not yield any vertices for empty paths, where only a start point
+        is present!
+
+        """
+        return _to_vec3(self.approximate_array(segments))
+
+    def flattening_array(self, distance: float,
+                         segments: int = 16) -> array:
+        """ Returns the vertices of :meth:`flattening` as flat
+        ``array('d')`` of x, y, z coordinates.
+        """
+        if distance <= 0.0:
+            raise ValueError('distance has to be > 0')
+        return flatten_path(self.commands, self.vertices, distance, segments)
+
+    def flattening(self, distance: float,
+                   segments: int = 16) -> Iterable[Vec3]:
+        """ Approximate path by vertices, the count of approximation segments
+        for each Bézier curve is determined in advance by the flatness of
+        its control polygon (Wang's formula), so that the maximum distance
+        between the curve and the approximation segments is not bigger than
+        `distance`. The vertices are not the same as the vertices of
+        :meth:`Path.flattening`, which uses adaptive recursive subdivision.
+
+        Does not yield any vertices for empty paths, where only a start point
+        is present!
+
+        Args:
+            distance: maximum distance between the curve and the
+                approximation segments
+            segments: minimum segment count per Bézier curve
+
+        """
+        return _to_vec3(self.flattening_array(distance, segments))
+
+    def bbox(self, precise=True, distance: float = 0.01,
+             segments: int = 16) -> BoundingBox:
+        """ Returns the :class:`~ezdxf.math.BoundingBox` of the path.
+
+        Args:
+            precise: ``True`` for bounding box of the flattened path and
+                ``False`` for bounding box of the control vertices.
+            distance: flattening distance, default is 0.01
+            segments: minimal segment count for flattening
+
+        """
+        if not len(self.commands):
+            return BoundingBox()
+        if precise:
+            v = self.flattening_array(distance, segments)
+        else:
+            v = self.vertices
+        x = v[0::3]
+        y = v[1::3]
+        z = v[2::3]
+        return BoundingBox([(min(x), min(y), min(z)), (max(x), max(y), max(z))])
+
+
+def _to_vec3(v: array) -> Iterable[Vec3]:
+    for index in range(0, len(v), 3):
+        yield Vec3(v[index], v[index + 1], v[index + 2])
+
+
+def _segment_count(distance: float, segments: int, ddx: float, ddy: float,
+                   ddz: float, factor: float) -> int:
+    # Wang's formula: the max distance between a Bézier curve of degree d and
+    # the approximation by n segments is less than or equal to
+    # d * (d - 1) / 8 * max(|P[i] - 2 * P[i + 1] + P[i + 2]|) / n²
+    count = math.ceil(
+        math.sqrt(factor * math.sqrt(ddx * ddx + ddy * ddy + ddz * ddz) /
+                  distance))
+    return max(count, segments, 1)
+
+
+def flatten_path(commands: array, vertices: array, distance: float,
+                 segments: int) -> array:
+    """ Returns the approximation of the path given by the command codes
+    `commands` and the flat vertex buffer `vertices` as flat ``array('d')``
+    of x, y, z coordinates. Each Bézier curve is approximated by `segments`
+    segments if `distance` is 0, else by the count of segments required for
+    the max. `distance` between curve and approximation, but at least
+    `segments`. (internal API)
+    """
+    result = array('d')
+    if len(commands) == 0:
+        return result
+    result.extend(vertices[0:3])
+    index = 3
+    for cmd in commands:
+        if cmd == LINE_TO:
+            result.extend(vertices[index:index + 3])
+            index += 3
+        elif cmd == CURVE3_TO:
+            x0, y0, z0, x1, y1, z1, x2, y2, z2 = vertices[index - 3:index + 6]
+            count = segments
+            if distance > 0.0:
+                count = _segment_count(
+                    distance, segments, x0 - 2.0 * x1 + x2,
+                    y0 - 2.0 * y1 + y2, z0 - 2.0 * z1 + z2, 0.25)
+            for i in range(1, count):
+                t = i / count
+                _t = 1.0 - t
+                b0 = _t * _t
+                b1 = 2.0 * t * _t
+                b2 = t * t
+                result.append(b0 * x0 + b1 * x1 + b2 * x2)
+                result.append(b0 * y0 + b1 * y1 + b2 * y2)
+                result.append(b0 * z0 + b1 * z1 + b2 * z2)
+            result.extend((x2, y2, z2))
+            index += 6
+        elif cmd == CURVE4_TO:
+            x0, y0, z0, x1, y1, z1, x2, y2, z2, x3, y3, z3 = \
+                vertices[index - 3:index + 9]
+            count = segments
+            if distance > 0.0:
+                ddx1 = x0 - 2.0 * x1 + x2
+                ddy1 = y0 - 2.0 * y1 + y2
+                ddz1 = z0 - 2.0 * z1 + z2
+                ddx2 = x1 - 2.0 * x2 + x3
+                ddy2 = y1 - 2.0 * y2 + y3
+                ddz2 = z1 - 2.0 * z2 + z3
+                if (ddx1 * ddx1 + ddy1 * ddy1 + ddz1 * ddz1 >
+                        ddx2 * ddx2 + ddy2 * ddy2 + ddz2 * ddz2):
+                    count = _segment_count(
+                        distance, segments, ddx1, ddy1, ddz1, 0.75)
+                else:
+                    count = _segment_count(
+                        distance, segments, ddx2, ddy2, ddz2, 0.75)
+            for i in range(1, count):
+                t = i / count
+                _t = 1.0 - t
+                b0 = _t * _t * _t
+                b1 = 3.0 * t * _t * _t
+                b2 = 3.0 * t * t * _t
+                b3 = t * t * t
+                result.append(b0 * x0 + b1 * x1 + b2 * x2 + b3 * x3)
+                result.append(b0 * y0 + b1 * y1 + b2 * y2 + b3 * y3)
+                result.append(b0 * z0 + b1 * z1 + b2 * z2 + b3 * z3)
+            result.extend((x3, y3, z3))
+            index += 9
+        else:
+            raise ValueError(f'Invalid command: {cmd}')
+    return result
+
+
+# The Python implementation is always available by this name:
+py_flatten_path = flatten_path
+
+from ezdxf.acc import USE_C_EXT
+
+if USE_C_EXT:
+    try:
+        from ezdxf.acc.compactpath import flatten_path
+    except ImportError:  # C extension built before the compactpath module
+        pass
@@ -5,6 +5,7 @@ from ezdxf.lldxf.const import (
     DXFStructureError, DXFBlockInUseError, DXFTableEntryError, DXFKeyError,
 )
 from ezdxf.lldxf import const
+from ezdxf.lldxf.tagwriter import parallel_export_dxf
 from ezdxf.entities import factory, entity_linker
 from ezdxf.layouts.blocklayout import BlockLayout
 from ezdxf.render.arrows import ARROWS
@@ -55,6 +56,9 @@ class BlocksSection:
     e.g. 'Test' == 'TEST'.
 
     """
+    # Stamp of the last modification of any block definition, see
+    # BlockRecord.mark_modified():
+    modification_stamp: int = 0
 
     def __init__(self, doc: 'Drawing' = None,
                  entities: List['DXFEntity'] = None):
@@ -162,12 +166,30 @@ class BlocksSection:
                 block_record.set_block(block, endblk)
                 self.add(block_record)
 
-    def export_dxf(self, tagwriter: 'TagWriter') -> None:
+    def export_dxf(self, tagwriter: 'TagWriter', workers: int = 0) -> None:
         tagwriter.write_str("  0\nSECTION\n  2\nBLOCKS\n")
-        for block_record in self.block_records:  # type: BlockRecord
-            block_record.export_block_definition(tagwriter)
+        if workers > 1:
+            parallel_export_dxf(self._export_objects(), tagwriter, workers)
+        else:
+            for block_record in self.block_records:  # type: BlockRecord
+                block_record.export_block_definition(tagwriter)
         tagwriter.write_tag2(0, "ENDSEC")
 
+    def _export_objects(self) -> List['DXFEntity']:
+        """ Returns all DXF objects of the BLOCKS section in export order,
+        BLOCK, block entities and ENDBLK of all block definitions.
+        """
+        objects = []
+        for block_record in self.block_records:  # type: BlockRecord
+            if block_record.block_layout is not None:
+                block_record.block_layout.update_block_flags()
+            objects.append(block_record.block)
+            if not (block_record.is_modelspace or
+                    block_record.is_active_paperspace):
+                objects.extend(block_record.entity_space)
+            objects.append(block_record.endblk)
+        return objects
+
     def add(self, block_record: 'BlockRecord') -> 'BlockLayout':
         """ Add or replace a block layout object defined by its block record.
         (internal API)
@@ -203,6 +225,8 @@ class BlocksSection:
         its content, raises :class:`DXFKeyError` if `name` not exist.
         """
         if name in self:
+            # Block references of the deleted block change their extents:
+            self.block_records.get(name).mark_modified()
             self.block_records.remove(name)
         else:
             raise DXFKeyError(name)
@@ -378,15 +402,12 @@ class BlocksSection:
         active_references = set()
         active_anonymous_blocks = set()
 
-        for entity in self.doc.entitydb.values():
-            dxftype = entity.dxftype()
-            if dxftype == 'INSERT':
-                active_references.add(entity.dxf.name)
-            elif entity.dxftype() in {
-                'DIMENSION', 'ARC_DIMENSION', 'LARGE_RADIAL_DIMENSION',
-                'ACAD_TABLE',
-            }:
-                active_anonymous_blocks.add(entity.dxf.geometry)
+        db = self.doc.entitydb
+        for entity in db.by_type('INSERT'):
+            active_references.add(entity.dxf.name)
+        for entity in db.by_type('DIMENSION', 'ARC_DIMENSION',
+                                 'LARGE_RADIAL_DIMENSION', 'ACAD_TABLE'):
+            active_anonymous_blocks.add(entity.dxf.geometry)
 
         for block in self:
             name = block.name
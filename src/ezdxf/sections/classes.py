@@ -1,7 +1,7 @@
 # Copyright (c) 2011-2020, Manfred Moitzi
 # License: MIT License
 from typing import TYPE_CHECKING, Iterator, Iterable, Union, cast
-from collections import Counter, OrderedDict
+from collections import OrderedDict
 
 from ezdxf.lldxf.const import DXFStructureError, DXF2004, DXF2000, DXFKeyError
 from ezdxf.entities.dxfclass import DXFClass
@@ -268,10 +268,7 @@ class ClassesSection:
         """
         if self.doc.dxfversion < DXF2004:
             return  # instance counter not supported
-        counter = Counter()
-        # count all entities in the entity database
-        for entity in self.doc.entitydb.values():
-            counter[entity.dxftype()] += 1
-
+        db = self.doc.entitydb
         for dxfclass in self.classes.values():
-            dxfclass.dxf.instance_count = counter[dxfclass.dxf.name]
+            dxfclass.dxf.instance_count = sum(
+                1 for _ in db.by_type(dxfclass.dxf.name))
@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING, Iterable, List, Iterator
 from itertools import chain
 
 from ezdxf.lldxf.tags import DXFStructureError
+from ezdxf.lldxf.tagwriter import parallel_export_dxf
 from ezdxf.entities import entity_linker
 
 if TYPE_CHECKING:
@@ -83,11 +84,14 @@ class EntitySection:
             if not linked_entities(entity):
                 add(entity)
 
-    def export_dxf(self, tagwriter: 'TagWriter') -> None:
+    def export_dxf(self, tagwriter: 'TagWriter', workers: int = 0) -> None:
         layouts = self.doc.layouts
         tagwriter.write_str("  0\nSECTION\n  2\nENTITIES\n")
         # Just write *Model_Space and the active *Paper_Space into the
         # ENTITIES section.
-        layouts.modelspace().entity_space.export_dxf(tagwriter)
-        layouts.active_layout().entity_space.export_dxf(tagwriter)
+        if workers > 1:
+            parallel_export_dxf(list(self), tagwriter, workers)
+        else:
+            layouts.modelspace().entity_space.export_dxf(tagwriter)
+            layouts.active_layout().entity_space.export_dxf(tagwriter)
         tagwriter.write_tag2(0, "ENDSEC")
@@ -0,0 +1,222 @@
+#  Copyright (c) 2021, Manfred Moitzi
+#  License: MIT License
+from typing import TYPE_CHECKING, Iterable, Dict, Tuple, List, Optional
+from ezdxf import bbox
+from ezdxf.math import BoundingBox
+from ezdxf.math.rtree import RTree
+from ezdxf.entities.dxfentity import current_modification_stamp
+
+if TYPE_CHECKING:
+    from ezdxf.eztypes import DXFGraphic, Vertex
+
+__all__ = ['SpatialIndex']
+
+# The RTree is rebuild, if the count of changed entities exceeds this
+# ratio of the indexed entities:
+REBUILD_RATIO = 0.1
+REBUILD_MIN_COUNT = 64
+
+
+class SpatialIndex:
+    """ Spatial index of DXF entities for window and nearest neighbor queries,
+    based on the bounding boxes calculated by the :mod:`ezdxf.bbox` module.
+
+    The entities are stored in a bulk loaded :class:`~ezdxf.math.rtree.RTree`,
+    changed entities are managed by a second small RTree and both trees are
+    merged if the count of changes exceeds 10% of the indexed entities.
+
+    The index can be created from any iterable of DXF entities, like a layout
+    or an :class:`~ezdxf.query.EntityQuery`. An index created by
+    :meth:`ezdxf.layouts.BaseLayout.spatial_index` is updated automatically
+    when entities are added, unlinked or deleted by the layout API.
+
+    Modified and destroyed entities are detected by their modification stamps
+    at the next query, modifications which do not set a new modification
+    stamp, like direct changes of vertex containers, have to be reported by
+    :meth:`update`.
+
+    Args:
+        entities: iterable of DXF entities
+        cache: optional :class:`ezdxf.bbox.Cache` for the bounding boxes
+        max_node_size: max. count of children per RTree node
+
+    .. versionadded:: 0.15.2
+
+    """
+
+    def __init__(self, entities: Iterable['DXFGraphic'] = None,
+                 cache: bbox.Cache = None, max_node_size: int = 16):
+        self.cache = cache
+        self.max_node_size = max_node_size
+        # Modification stamps of all tracked entities including entities
+        # without bounding box, key is id(entity):
+        self._stamps: Dict[int, Tuple[int, 'DXFGraphic']] = dict()
+        # Bounding boxes of all indexed entities, key is id(entity):
+        self._boxes: Dict[int, Tuple[BoundingBox, 'DXFGraphic']] = dict()
+        # Entities stored in the main tree but removed or updated:
+        self._stale = set()
+        # Entities added or updated after building the main tree:
+        self._changed: Dict[int, Tuple[BoundingBox, 'DXFGraphic']] = dict()
+        self._changes_tree: Optional[RTree] = None
+        if entities is not None:
+            for entity in entities:
+                key = id(entity)
+                self._stamps[key] = (bbox.modification_stamp(entity), entity)
+                box = self._bbox(entity)
+                if box.has_data:
+                    self._boxes[key] = (box, entity)
+        self._tree = RTree(self._boxes.values(), max_node_size)
+        # Last issued modification stamp at the last check for modified
+        # entities:
+        self._checked = current_modification_stamp()
+
+    def __len__(self) -> int:
+        """ Returns the count of indexed entities. """
+        self._remove_stale_entries()
+        return len(self._boxes)
+
+    def __contains__(self, entity: 'DXFGraphic') -> bool:
+        """ Returns ``True`` if `entity` is indexed. """
+        self._remove_stale_entries()
+        return id(entity) in self._boxes
+
+    def _bbox(self, entity: 'DXFGraphic') -> BoundingBox:
+        return bbox.extends([entity], self.cache)
+
+    def bbox(self, entity: 'DXFGraphic') -> Optional[BoundingBox]:
+        """ Returns the indexed bounding box of `entity` or ``None`` if
+        `entity` is not indexed.
+        """
+        self._remove_stale_entries()
+        data = self._boxes.get(id(entity))
+        return None if data is None else data[0]
+
+    def insert(self, entity: 'DXFGraphic') -> None:
+        """ Add `entity` to the index, entities with an empty bounding box are
+        ignored.
+        """
+        key = id(entity)
+        if key in self._stamps:
+            self.remove(entity)
+        self._stamps[key] = (bbox.modification_stamp(entity), entity)
+        box = self._bbox(entity)
+        if not box.has_data:
+            return
+        self._boxes[key] = (box, entity)
+        self._changed[key] = (box, entity)
+        self._changes_tree = None
+        self._rebuild_if_required()
+
+    def remove(self, entity: 'DXFGraphic') -> None:
+        """ Remove `entity` from the index, ignores not indexed entities. """
+        key = id(entity)
+        self._stamps.pop(key, None)
+        if key not in self._boxes:
+            return
+        del self._boxes[key]
+        if key in self._changed:
+            del self._changed[key]
+            self._changes_tree = None
+        else:
+            self._stale.add(key)
+        self._rebuild_if_required()
+
+    def update(self, entity: 'DXFGraphic') -> None:
+        """ Update the bounding box of `entity` after modifications of the
+        entity geometry. The bounding box cache entry of `entity` is
+        invalidated.
+        """
+        if self.cache is not None:
+            self.cache.invalidate([entity])
+        self.insert(entity)
+
+    def rebuild(self) -> None:
+        """ Rebuild the index for all indexed entities, does not recalculate
+        the bounding boxes.
+        """
+        self._tree = RTree(self._boxes.values(), self.max_node_size)
+        self._stale.clear()
+        self._changed.clear()
+        self._changes_tree = None
+
+    def _rebuild_if_required(self):
+        changes = len(self._stale) + len(self._changed)
+        if changes > max(REBUILD_MIN_COUNT, len(self._tree) * REBUILD_RATIO):
+            self.rebuild()
+
+    def _remove_stale_entries(self) -> None:
+        """ Update modified entities and remove destroyed entities. The
+        entity stamps are checked only if any entity was modified since the
+        last check.
+        """
+        stamp = current_modification_stamp()
+        if stamp <= self._checked:
+            # no modifications since the last check
+            return
+        for key, (entity_stamp, entity) in list(self._stamps.items()):
+            if not entity.is_alive:
+                self.remove(entity)
+            elif entity_stamp != bbox.modification_stamp(entity):
+                self.insert(entity)
+        self._checked = stamp
+
+    def _trees(self) -> Iterable[Tuple[RTree, bool]]:
+        """ Yields (tree, filter stale entities) tuples. """
+        self._remove_stale_entries()
+        yield self._tree, bool(self._stale)
+        if self._changed:
+            if self._changes_tree is None:
+                self._changes_tree = RTree(
+                    self._changed.values(), self.max_node_size)
+            yield self._changes_tree, False
+
+    def intersecting(self, box: BoundingBox) -> List['DXFGraphic']:
+        """ Returns all entities which bounding boxes intersect the query
+        `box`, touching boxes do intersect.
+        """
+        result = []
+        for tree, filter_stale in self._trees():
+            if filter_stale:
+                stale = self._stale
+                result.extend(e for e in tree.intersecting(box)
+                              if id(e) not in stale)
+            else:
+                result.extend(tree.intersecting(box))
+        return result
+
+    def inside(self, box: BoundingBox) -> List['DXFGraphic']:
+        """ Returns all entities which bounding boxes are completely inside the
+        query `box`, including entities at the border of the query box.
+        """
+        result = []
+        for tree, filter_stale in self._trees():
+            if filter_stale:
+                stale = self._stale
+                result.extend(e for e in tree.inside(box)
+                              if id(e) not in stale)
+            else:
+                result.extend(tree.inside(box))
+        return result
+
+    def nearest(self, point: 'Vertex', k: int = 1) -> List['DXFGraphic']:
+        """ Returns the `k` nearest entities to `point` sorted by ascending
+        distance. The distance is measured from `point` to the bounding box of
+        the entity.
+        """
+        candidates = []
+        for tree, filter_stale in self._trees():
+            if filter_stale:
+                stale = self._stale
+                # The stale entities are included in the result of the main
+                # tree:
+                candidates.extend(
+                    (distance, id(e), e) for distance, e in
+                    tree.nearest(point, k + len(stale)) if id(e) not in stale
+                )
+            else:
+                candidates.extend(
+                    (distance, id(e), e) for distance, e in
+                    tree.nearest(point, k)
+                )
+        candidates.sort(key=lambda c: c[:2])
+        return [e for _, _, e in candidates[:k]]
@@ -12,6 +12,9 @@ class HandleGenerator:
     def __str__(self):
         return "%X" % self._handle
 
+    def __int__(self):
+        return self._handle
+
     def next(self) -> str:
         next_handle = str(self)
         self._handle += 1
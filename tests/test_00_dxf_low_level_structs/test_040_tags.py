@@ -2,9 +2,12 @@
 # Copyright (c) 2011-2019, Manfred Moitzi
 # License: MIT License
 import pytest
+import pickle
+import sys
 from io import StringIO
 from copy import deepcopy
-from ezdxf.lldxf.tags import Tags, DXFTag
+from ezdxf.lldxf.tags import Tags, CompactTags, DXFTag
+from ezdxf.lldxf.types import DXFVertex, DXFBinaryTag
 from ezdxf.lldxf.tagwriter import TagWriter
 from ezdxf.lldxf.const import DXFValueError
 
@@ -89,9 +92,11 @@ class HandlesMock:
 
 
 class TestTags:
+    tags_class = Tags
+
     @pytest.fixture
     def tags(self):
-        return Tags.from_text(TEST_TAGREADER)
+        return self.tags_class.from_text(TEST_TAGREADER)
 
     def test_from_text(self, tags):
         assert 8, len(tags)
@@ -129,11 +134,11 @@ class TestTags:
             tags.get_first_value(1234)
 
     def test_get_handle_5(self):
-        tags = Tags.from_text(TESTHANDLE5)
+        tags = self.tags_class.from_text(TESTHANDLE5)
         assert 'F5' == tags.get_handle()
 
     def test_get_handle_105(self):
-        tags = Tags.from_text(TESTHANDLE105)
+        tags = self.tags_class.from_text(TESTHANDLE105)
         assert 'F105' == tags.get_handle()
 
     def test_get_handle_create_new(self, tags):
@@ -141,18 +146,18 @@ class TestTags:
             tags.get_handle()
 
     def test_find_all(self):
-        tags = Tags.from_text(TESTFINDALL)
+        tags = self.tags_class.from_text(TESTFINDALL)
         assert 3 == len(tags.find_all(0))
 
     def test_tag_index(self):
-        tags = Tags.from_text(TESTFINDALL)
+        tags = self.tags_class.from_text(TESTFINDALL)
         index = tags.tag_index(0)
         assert 0 == index
         index = tags.tag_index(0, index + 1)
         assert 1 == index
 
     def test_find_first_value_error(self):
-        tags = Tags.from_text(TESTFINDALL)
+        tags = self.tags_class.from_text(TESTFINDALL)
         with pytest.raises(DXFValueError):
             tags.tag_index(1)
 
@@ -167,7 +172,7 @@ class TestTags:
         assert self.tags != clone
 
     def test_deepcopy(self):
-        tags = Tags.from_text(TAGS_WITH_VERTEX)
+        tags = self.tags_class.from_text(TAGS_WITH_VERTEX)
         assert len(tags) == 2
         v = tags[1]
         assert v.value == (1., 2., 3.)
@@ -179,12 +184,12 @@ class TestTags:
         assert id(v) == id(tags[1])
 
     def test_replace_handle_5(self):
-        tags = Tags.from_text(TESTHANDLE5)
+        tags = self.tags_class.from_text(TESTHANDLE5)
         tags.replace_handle('AA')
         assert 'AA' == tags.get_handle()
 
     def test_replace_handle_105(self):
-        tags = Tags.from_text(TESTHANDLE105)
+        tags = self.tags_class.from_text(TESTHANDLE105)
         tags.replace_handle('AA')
         assert 'AA' == tags.get_handle()
 
@@ -199,7 +204,7 @@ class TestTags:
 
     def test_strip_tags(self, tags):
         tags.remove_tags(codes=(0,))
-        result = Tags.strip(tags, codes=(0,))
+        result = self.tags_class.strip(tags, codes=(0,))
         assert 5 == len(result)
         assert isinstance(result, Tags)
 
@@ -210,7 +215,7 @@ class TestTags:
         assert tags.has_tag(7) is False
 
     def test_pop_tags(self):
-        tags = Tags([
+        tags = self.tags_class([
             DXFTag(1, 'name1'),
             DXFTag(40, 1),
             DXFTag(40, 2),
@@ -231,6 +236,115 @@ class TestTags:
         assert tags[-1] == (1, 'name4')
 
 
+class TestCompactTags(TestTags):
+    tags_class = CompactTags
+
+    def test_deepcopy(self):
+        tags = CompactTags.from_text(TAGS_WITH_VERTEX)
+        tags2 = deepcopy(tags)
+        assert id(tags) != id(tags2)
+        assert tags == tags2, "same content"
+        assert isinstance(tags2, CompactTags)
+
+    def test_tag_types(self):
+        tags = CompactTags([
+            DXFTag(0, 'TEST'),
+            DXFTag(40, 1.5),
+            DXFTag(70, 7),
+            DXFVertex(10, (1, 2)),
+            DXFVertex(11, (3, 4, 5)),
+            DXFBinaryTag(310, b'\xfe\xfe'),
+            DXFTag(41, -2.5),
+        ])
+        assert len(tags) == 7
+        assert list(tags) == [
+            (0, 'TEST'), (40, 1.5), (70, 7), (10, (1, 2)), (11, (3, 4, 5)),
+            (310, b'\xfe\xfe'), (41, -2.5),
+        ]
+        assert type(tags[3]) is DXFVertex
+        assert type(tags[5]) is DXFBinaryTag
+        assert tags[-1] == (41, -2.5)
+        assert tags[1:3] == [(40, 1.5), (70, 7)]
+        assert isinstance(tags[1:3], CompactTags)
+        assert len(tags.doubles) == 7, 'floats and vertices'
+        assert len(tags.values) == 3
+
+    def test_negative_group_codes(self):
+        tags = CompactTags([DXFTag(-1, 'TEST'), DXFTag(-2, 1.0)])
+        assert list(tags) == [(-1, 'TEST'), (-2, 1.0)]
+
+    def test_index_error(self):
+        tags = CompactTags([DXFTag(0, 'TEST')])
+        with pytest.raises(IndexError):
+            _ = tags[1]
+
+    def test_modify_tags(self):
+        tags = CompactTags([DXFTag(0, 'TEST'), DXFVertex(10, (1, 2))])
+        tags[0] = DXFTag(0, 'MODIFIED')
+        tags.insert(1, DXFTag(40, 1.0))
+        assert tags == [(0, 'MODIFIED'), (40, 1.0), (10, (1, 2))]
+        del tags[1]
+        assert tags == [(0, 'MODIFIED'), (10, (1, 2))]
+        assert tags.pop() == (10, (1, 2))
+        assert tags == [(0, 'MODIFIED')]
+
+    def test_index_access_after_append(self):
+        tags = CompactTags([DXFTag(0, 'TEST'), DXFVertex(10, (1, 2))])
+        assert tags[1] == (10, (1, 2))
+        tags.append(DXFTag(40, 1.5))
+        tags.append(DXFTag(1, 'TEXT'))
+        assert tags[2] == (40, 1.5)
+        assert tags[3] == (1, 'TEXT')
+        assert [tags[i] for i in range(len(tags))] == list(tags)
+
+    def test_concatenation(self):
+        tags = CompactTags([DXFTag(0, 'TEST'), DXFVertex(10, (1, 2))])
+        tag = DXFTag(40, 1.5)
+        result = tags + [tag]
+        assert isinstance(result, CompactTags)
+        assert result == [(0, 'TEST'), (10, (1, 2)), (40, 1.5)]
+        result = [tag] + tags
+        assert isinstance(result, CompactTags)
+        assert result == [(40, 1.5), (0, 'TEST'), (10, (1, 2))]
+        assert Tags(tags) + tags == list(tags) * 2
+        assert len(tags) == 2, 'operands are not modified'
+
+    def test_in_place_concatenation(self):
+        tags = CompactTags([DXFTag(0, 'TEST')])
+        tags += [DXFTag(40, 1.5)]
+        assert isinstance(tags, CompactTags)
+        assert tags == [(0, 'TEST'), (40, 1.5)]
+
+    def test_repetition(self):
+        tags = CompactTags([DXFTag(0, 'TEST'), DXFTag(40, 1.5)])
+        expected = [(0, 'TEST'), (40, 1.5)] * 2
+        assert isinstance(tags * 2, CompactTags)
+        assert tags * 2 == expected
+        assert 2 * tags == expected
+        tags *= 2
+        assert isinstance(tags, CompactTags)
+        assert tags == expected
+        assert tags[3] == (40, 1.5)
+
+    def test_copy_and_slicing(self):
+        tags = CompactTags([DXFTag(0, 'TEST'), DXFTag(40, 1.5)])
+        for result in (tags.copy(), tags[:], tags[::-1]):
+            assert isinstance(result, CompactTags)
+            assert len(result) == 2
+        assert tags[::-1] == [(40, 1.5), (0, 'TEST')]
+
+    def test_string_values_are_interned(self):
+        name = ''.join(['Ac', 'DbEntity'])
+        tags = CompactTags([DXFTag(100, name)])
+        assert tags[0].value is sys.intern(name)
+
+    def test_pickle(self):
+        tags = CompactTags.from_text(TAGS_WITH_VERTEX)
+        tags2 = pickle.loads(pickle.dumps(tags))
+        assert isinstance(tags2, CompactTags)
+        assert tags2 == tags
+
+
 DUPLICATETAGS = """  0
 FIRST
   0
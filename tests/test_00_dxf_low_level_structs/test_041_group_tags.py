@@ -2,7 +2,7 @@
 # Copyright (C) 2011-2019, Manfred Moitzi
 # License: MIT License
 import pytest
-from ezdxf.lldxf.tags import group_tags, internal_tag_compiler
+from ezdxf.lldxf.tags import group_tags, internal_tag_compiler, CompactTags
 
 
 @pytest.fixture
@@ -29,6 +29,13 @@ def test_last_group(groups):
     assert 1 == len(groups[-1])
 
 
+def test_compact_groups(groups):
+    compact_groups = list(
+        group_tags(internal_tag_compiler(TESTTAGS), compact=True))
+    assert all(isinstance(group, CompactTags) for group in compact_groups)
+    assert compact_groups == groups
+
+
 TESTTAGS = """  0
 SECTION
   2
@@ -3,7 +3,9 @@
 import pytest
 from io import StringIO
 
+from ezdxf.lldxf import tagger
 from ezdxf.lldxf.tagger import internal_tag_compiler, ascii_tags_loader, tag_compiler, DXFStructureError
+from ezdxf.lldxf.tagger import bulk_ascii_tags_loader, bulk_chunks
 from ezdxf.lldxf.types import strtag, DXFTag, DXFVertex
 from ezdxf.math import Vec3
 
@@ -126,6 +128,11 @@ def test_ext_read_2D_points():
     assert 'check mark 2' == tag.value
 
 
+def test_2D_point_at_end_of_stream():
+    tags = list(tag_compiler(iter([DXFTag(10, '1'), DXFTag(20, '2')])))
+    assert tags == [(10, (1, 2))]
+
+
 def test_ext_error_tag():
     tags = list(external_tag_compiler(TAGS_WITH_ERROR))
     assert 1 == len(tags)
@@ -437,3 +444,69 @@ AVE_ENTITY_MATERIAL
 1002
 }
 """
+
+
+def bulk_tag_compiler(text):
+    return tag_compiler(iter(bulk_ascii_tags_loader(text.encode())))
+
+
+class TestBulkTagsLoader:
+    def test_skip_comments(self):
+        tags = list(bulk_ascii_tags_loader(b'999\ncomment\n0\nEOF\n'))
+        assert tags == [(0, 'EOF')]
+
+    def test_not_skip_comments(self):
+        tags = list(bulk_ascii_tags_loader(
+            b'999\ncomment\n0\nEOF\n', skip_comments=False))
+        assert tags == [(999, 'comment'), (0, 'EOF')]
+
+    def test_pre_typed_values(self):
+        tags = list(bulk_ascii_tags_loader(b'70\n7\n40\n1.5\n1\ntext\n'))
+        assert tags == [(70, 7), (40, 1.5), (1, 'text')]
+        assert type(tags[0].value) is int
+        assert type(tags[1].value) is float
+
+    def test_windows_line_endings(self):
+        tags = list(bulk_ascii_tags_loader(b'0\r\nLINE\r\n40\r\n1.5\r\n'))
+        assert tags == [(0, 'LINE'), (40, 1.5)]
+
+    def test_decoding(self):
+        tags = list(bulk_ascii_tags_loader(
+            '1\nÄÖÜ\n'.encode('cp1252'), encoding='cp1252'))
+        assert tags == [(1, 'ÄÖÜ')]
+
+    def test_binary_data_as_bytes(self):
+        tags = list(bulk_ascii_tags_loader(b'310\nFFFE\n'))
+        assert tags == [(310, b'FFFE')]
+
+    def test_invalid_group_code(self):
+        with pytest.raises(DXFStructureError) as e:
+            list(bulk_ascii_tags_loader(b'0\nLINE\nx\nEOF\n'))
+        assert 'line 3' in str(e.value)
+
+    @pytest.mark.parametrize('text', [
+        TEST_TAGREADER, POINT_TAGS, XDATA_COORDS, POINT_2D_TAGS,
+        FLOAT_FOR_INT_TAGS, POLYLINE_WITH_XDATA,
+    ])
+    def test_same_result_as_ascii_tags_loader(self, text):
+        assert list(bulk_tag_compiler(text)) == list(
+            external_tag_compiler(text))
+
+    @pytest.mark.parametrize('chunk_size', [1, 7, 30, 100])
+    def test_vertices_split_by_chunks(self, chunk_size, monkeypatch):
+        monkeypatch.setattr(tagger, 'BULK_CHUNK_SIZE', chunk_size)
+        assert list(bulk_tag_compiler(POLYLINE_WITH_XDATA)) == list(
+            external_tag_compiler(POLYLINE_WITH_XDATA))
+
+    def test_coord_error_tag(self):
+        with pytest.raises(DXFStructureError):
+            list(bulk_tag_compiler(TAGS_WITH_COORD_ERROR))
+
+
+@pytest.mark.parametrize('chunk_size', [1, 5, 16, 1000])
+def test_bulk_chunks_contain_code_value_pairs(chunk_size):
+    data = b'0\nSECTION\n2\nHEADER\n0\nENDSEC\n0\nEOF\n'
+    chunks = list(bulk_chunks(data, chunk_size))
+    assert all(len(lines) % 2 == 0 for lines in chunks)
+    lines = [line for chunk in chunks for line in chunk]
+    assert lines == data.split(b'\n')[:-1]
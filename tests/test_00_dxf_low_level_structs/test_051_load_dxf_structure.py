@@ -3,8 +3,11 @@
 # License: MIT License
 import pytest
 from ezdxf.lldxf.tagger import internal_tag_compiler
-from ezdxf.lldxf.loader import load_dxf_structure
+from ezdxf.lldxf.loader import (
+    load_dxf_structure, parallel_load_dxf_structure,
+)
 from ezdxf.lldxf.const import DXFStructureError
+from ezdxf.lldxf.tags import CompactTags
 
 
 def test_loader():
@@ -31,6 +34,15 @@ def test_loader():
     assert entities_header[1] == (2, 'ENTITIES')
 
 
+def test_compact_loader():
+    sections = load_dxf_structure(
+        internal_tag_compiler(ENTITIES), compact=True)
+    entities = sections['ENTITIES']
+    assert all(isinstance(e, CompactTags) for e in entities)
+    assert entities == load_dxf_structure(
+        internal_tag_compiler(ENTITIES))['ENTITIES']
+
+
 def test_error_section():
     with pytest.raises(DXFStructureError):
         load_dxf_structure(internal_tag_compiler(SECTION_INVALID_NAME_TAG))
@@ -81,6 +93,47 @@ def test_missing_section():
         validator("  0\nENDSEC\n  0\nSECTION\n  2\nCLASSES\n  0\nENDSEC\n  0\nEOF\n")
 
 
+class TestParallelLoader:
+    @staticmethod
+    def load(text: str, workers=1):
+        return parallel_load_dxf_structure(text.encode(), workers=workers)
+
+    def test_loader(self):
+        sections = self.load(TEST_HEADER)
+        assert list(sections) == ['HEADER', 'TABLES', 'ENTITIES']
+        assert sections['HEADER'][0][-1] == (3, 'ANSI_1252')
+        assert sections['ENTITIES'][0] == [(0, 'SECTION'), (2, 'ENTITIES')]
+
+    @pytest.mark.parametrize('workers', [1, 2])
+    def test_load_entities(self, workers):
+        sections = self.load(ENTITIES, workers)
+        entities = sections['ENTITIES']
+        assert entities[0] == [(0, 'SECTION'), (2, 'ENTITIES')]
+        # Entities are loaded in file order:
+        assert [e.dxftype() for e in entities[1:]] == ['LINE', 'POINT', 'LINE']
+        assert [e.dxf.handle for e in entities[1:]] == ['A', 'B', 'C']
+        assert entities[2].dxf.location == (1, 2)
+        assert entities[3].dxf.end == (1, 0)
+
+    def test_error_section(self):
+        with pytest.raises(DXFStructureError):
+            self.load(SECTION_INVALID_NAME_TAG)
+        with pytest.raises(DXFStructureError):
+            self.load(SECTION_NO_NAME_TAG)
+
+    @pytest.mark.parametrize('text', [
+        "999\ncomment",
+        "  0\nSECTION\n 2\nHEADER\n  0\nSECTION\n  2\nCLASSES\n  0\n"
+        "ENDSEC\n  0\nEOF\n",
+        "  0\nSECTION\n 2\nHEADER\n  0\nENDSEC\n  0\nSECTION\n  2\n"
+        "CLASSES\n",
+        "  0\nENDSEC\n  0\nSECTION\n  2\nCLASSES\n  0\nENDSEC\n  0\nEOF\n",
+    ])
+    def test_invalid_structures(self, text):
+        with pytest.raises(DXFStructureError):
+            self.load(text)
+
+
 TEST_HEADER = """  0
 SECTION
   2
@@ -124,3 +177,55 @@ SECTION
   0
 ENDSEC
 """
+
+ENTITIES = """  0
+SECTION
+  2
+ENTITIES
+  0
+LINE
+  5
+A
+  8
+0
+ 10
+0.0
+ 20
+0.0
+ 30
+0.0
+ 11
+1.0
+ 21
+1.0
+ 31
+0.0
+  0
+POINT
+  5
+B
+  8
+0
+ 10
+1.0
+ 20
+2.0
+  0
+LINE
+  5
+C
+  8
+0
+ 10
+0.0
+ 20
+0.0
+ 11
+1.0
+ 21
+0
+  0
+ENDSEC
+  0
+EOF
+"""
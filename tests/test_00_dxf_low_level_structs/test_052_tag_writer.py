@@ -1,9 +1,13 @@
 # Copyright (c) 2010-2020 Manfred Moitzi
 # License: MIT License
 import pytest
-from io import StringIO
-from ezdxf.lldxf.tagwriter import TagWriter, TagCollector
+from io import StringIO, BytesIO
+from ezdxf.lldxf import tagwriter as tagwriter_module
+from ezdxf.lldxf.tagwriter import (
+    TagWriter, TagCollector, BinaryTagWriter, parallel_export_dxf,
+)
 from ezdxf.lldxf.types import DXFTag, DXFVertex
+from ezdxf.lldxf.const import DXF12
 
 
 def setup_stream():
@@ -72,3 +76,65 @@ class TestTagCollector:
         assert t.tags[0] == (10, 7.)
         assert t.tags[1] == (20, 8.)
         assert t.tags[2] == (30, 9.)
+
+
+def test_ascii_memory_writer():
+    tagwriter = TagWriter(StringIO(), dxfversion=DXF12, write_handles=False)
+    writer = tagwriter.memory_writer()
+    assert writer.stream is not tagwriter.stream
+    assert writer.dxfversion == DXF12
+    assert writer.write_handles is False
+    writer.write_tag2(0, 'LINE')
+    assert writer.stream.getvalue() == '  0\nLINE\n'
+    assert tagwriter.stream.getvalue() == ''
+
+
+def test_binary_memory_writer():
+    tagwriter = BinaryTagWriter(BytesIO(), dxfversion=DXF12, encoding='cp1252')
+    writer = tagwriter.memory_writer()
+    assert writer.stream is not tagwriter.stream
+    assert writer.dxfversion == DXF12
+    writer.write_tag2(1, 'Ä')
+    assert writer.stream.getvalue() == b'\x01\xc4\x00'
+
+
+class Numbered:
+    """ Mockup """
+    def __init__(self, number: int):
+        self.number = number
+
+    def export_dxf(self, tagwriter):
+        tagwriter.write_tag2(0, 'NUMBER')
+        tagwriter.write_tag2(90, self.number)
+
+
+class TestParallelExport:
+    @pytest.fixture(autouse=True)
+    def small_chunks(self, monkeypatch):
+        monkeypatch.setattr(tagwriter_module, 'MIN_PARALLEL_EXPORT', 0)
+
+    @pytest.fixture
+    def objects(self):
+        return [Numbered(n) for n in range(100)]
+
+    @pytest.mark.parametrize('workers', [0, 2])
+    def test_ascii_export_order(self, objects, workers):
+        stream = StringIO()
+        parallel_export_dxf(objects, TagWriter(stream), workers)
+        expected = ''.join(f'  0\nNUMBER\n 90\n{n}\n' for n in range(100))
+        assert stream.getvalue() == expected
+
+    def test_binary_export_order(self, objects):
+        stream = BytesIO()
+        parallel_export_dxf(objects, BinaryTagWriter(stream), workers=2)
+        expected = BytesIO()
+        tagwriter = BinaryTagWriter(expected)
+        for obj in objects:
+            obj.export_dxf(tagwriter)
+        assert stream.getvalue() == expected.getvalue()
+
+    def test_unsupported_tagwriter_exports_by_calling_process(self, objects):
+        collector = TagCollector()
+        parallel_export_dxf(objects, collector, workers=2)
+        assert len(collector.tags) == 200
+        assert collector.tags[-1] == (90, 99)
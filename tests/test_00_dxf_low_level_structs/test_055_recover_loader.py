@@ -4,7 +4,7 @@ import pytest
 from io import BytesIO
 from ezdxf.recover import (
     bytes_loader, detect_encoding, synced_bytes_loader, _detect_dxf_version,
-    _search_int, _search_float, byte_tag_compiler
+    _search_int, _search_float, byte_tag_compiler, bulk_bytes_loader,
 )
 from ezdxf.lldxf import const
 
@@ -81,6 +81,20 @@ class TestBytesLoader:
         assert tags[3] == (1, b'AC1027')
 
 
+class TestBulkBytesLoader:
+    @pytest.mark.parametrize('data', [
+        HEADER.encode('latin1'), MALFORMED_GROUP_CODES,
+        b"0\r\n1\r\n0\r\n2\r\n",
+    ])
+    def test_same_result_as_bytes_loader(self, data):
+        assert list(bulk_bytes_loader(data)) == list(
+            bytes_loader(BytesIO(data)))
+
+    def test_invalid_group_code(self):
+        with pytest.raises(const.DXFStructureError):
+            list(bulk_bytes_loader(b"0\nSECTION\nxxx\nHEADER\n"))
+
+
 MALFORMED_VALUE_TAGS = b"""  70 # int value
   42xyz
 40 # float value
@@ -0,0 +1,68 @@
+# Copyright (c) 2021, Manfred Moitzi
+# License: MIT License
+import os
+import time
+import pytest
+import ezdxf
+from ezdxf.lldxf.cache import ParseCache
+
+
+@pytest.fixture
+def cache(tmpdir):
+    return ParseCache(tmpdir.join('cache'))
+
+
+@pytest.fixture(scope='module')
+def dxf(tmpdir_factory):
+    doc = ezdxf.new()
+    doc.modelspace().add_line((0, 0), (1, 0))
+    filename = str(tmpdir_factory.mktemp('cache').join('test.dxf'))
+    doc.saveas(filename)
+    return filename
+
+
+def test_key_depends_on_content_and_encoding(cache, dxf, tmpdir):
+    key = cache.key(dxf)
+    assert key == cache.key(dxf)
+    assert key != cache.key(dxf, encoding='utf8')
+    copy = tmpdir.join('copy.dxf')
+    with open(dxf, 'rb') as fp:
+        copy.write_binary(fp.read() + b'\n')
+    assert key != cache.key(copy)
+
+
+def test_hit_and_miss_counters(cache):
+    assert cache.get('key') is None
+    assert cache.misses == 1
+    cache.put('key', {'HEADER': []})
+    assert 'key' in cache
+    assert cache.get('key') == {'HEADER': []}
+    assert cache.hits == 1
+    cache.clear()
+    assert 'key' not in cache
+    assert cache.hits == cache.misses == 0
+
+
+def test_invalid_cache_entry_is_a_miss(cache):
+    cache.put('key', {'HEADER': []})
+    with open(os.path.join(cache.directory, 'key.dxfcache'), 'wb') as fp:
+        fp.write(b'invalid')
+    assert cache.get('key') is None
+    assert cache.misses == 1
+    assert 'key' not in cache
+
+
+def test_lru_eviction(cache):
+    data = {'HEADER': ['x' * 1000]}
+    cache.put('a', data)
+    cache.put('b', data)
+    size = cache.size
+    past = time.time() - 100
+    os.utime(os.path.join(cache.directory, 'a.dxfcache'), (past, past))
+    os.utime(os.path.join(cache.directory, 'b.dxfcache'), (past, past - 10))
+    cache.get('b')  # 'b' is now the most recently used entry
+    cache.max_size = size
+    cache.put('c', data)
+    assert 'a' not in cache
+    assert 'b' in cache
+    assert 'c' in cache
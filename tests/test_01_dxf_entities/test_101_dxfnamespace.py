@@ -167,6 +167,18 @@ def test_deepcopy_usage(entity, processor):
     assert attribs2.color == 13
 
 
+def test_pickle_entity_namespace():
+    import pickle
+    from ezdxf.entities import Line
+    line = Line.new(handle='ABBA', dxfattribs={'color': 7, 'end': (1, 2, 3)})
+    line2 = pickle.loads(pickle.dumps(line))
+    assert line2.dxf._entity is line2
+    assert line2.dxf.handle == 'ABBA'
+    assert line2.dxf.color == 7
+    assert line2.dxf.end == (1, 2, 3)
+    assert line2.dxf.hasattr('thickness') is False
+
+
 def test_dxf_export_one_attribute(entity, processor):
     attribs = DXFNamespace(processor, entity)
     tagwriter = TagCollector()
@@ -186,6 +198,76 @@ def test_dxf_export_two_attribute(entity, processor):
     assert tagwriter.tags[1] == (330, 'ABBA')
 
 
+class TestCompiledExporter:
+    @pytest.fixture
+    def ns(self, entity, processor):
+        return DXFNamespace(processor, entity)
+
+    def test_export_required_attribute_default_value(self, ns):
+        tagwriter = TagCollector(optional=False)
+        ns.export_dxf_attribs(tagwriter, ['layer', 'color'])
+        # layer is required and exported with default value, color is
+        # optional and not exported if equal to the default value:
+        assert tagwriter.tags == [(8, '0')]
+
+    def test_force_optional_attributes(self, ns):
+        ns.color = 256
+        tagwriter = TagCollector(optional=True)
+        ns.export_dxf_attribs(tagwriter, ['layer', 'color'])
+        assert tagwriter.tags == [(8, '0'), (62, 256)]
+
+    def test_skip_optional_attribute_equal_to_default_value(self, ns):
+        ns.color = 256
+        tagwriter = TagCollector(optional=False)
+        ns.export_dxf_attribs(tagwriter, 'color')
+        assert tagwriter.tags == []
+        ns.color = 1
+        ns.export_dxf_attribs(tagwriter, 'color')
+        assert tagwriter.tags == [(62, 1)]
+
+    def test_skip_unsupported_dxf_version(self, ns):
+        ns.true_color = 0xff00ff
+        tagwriter = TagCollector(dxfversion='AC1009')
+        ns.export_dxf_attribs(tagwriter, ['handle', 'true_color'])
+        assert tagwriter.tags == [(5, 'FFFF')]
+
+    def test_export_point(self, ns):
+        ns.start = (1, 2, 3)
+        ns.end = Vec3(4, 5, 6)
+        tagwriter = TagCollector()
+        ns.export_dxf_attribs(tagwriter, ('start', 'end'))
+        assert tagwriter.tags == [
+            (10, 1), (20, 2), (30, 3), (11, 4), (21, 5), (31, 6)
+        ]
+
+    def test_reuse_compiled_exporter(self, ns):
+        dxfattribs = ns.dxfattribs
+        dxfattribs.exporters.clear()
+        tagwriter = TagCollector()
+        ns.export_dxf_attribs(tagwriter, ['handle', 'owner'])
+        ns.export_dxf_attribs(tagwriter, ('handle', 'owner'))
+        assert len(dxfattribs.exporters) == 1
+        assert tagwriter.tags[:2] == tagwriter.tags[2:]
+
+    def test_invalid_attribute_raises_exception(self, ns):
+        with pytest.raises(DXFAttributeError):
+            ns.export_dxf_attribs(TagCollector(), ['handle', 'mozman'])
+
+
+def test_export_point2d_attribute():
+    class Entity2d:
+        DXFTYPE = 'ENTITY2D'
+        DXFATTRIBS = DXFAttributes(DefSubclass('AcDbTest', {
+            'location': DXFAttr(10, xtype=XType.point2d),
+        }))
+
+    ns = DXFNamespace(entity=Entity2d())
+    ns.location = Vec3(1, 2, 3)
+    tagwriter = TagCollector()
+    ns.export_dxf_attribs(tagwriter, 'location')
+    assert tagwriter.tags == [(10, 1), (20, 2)]
+
+
 @pytest.fixture
 def subclass():
     return DefSubclass('AcDbTest', {
@@ -8,6 +8,7 @@ from ezdxf.lldxf.const import DXFAttributeError, DXF12, DXFValueError
 from ezdxf.lldxf.tagwriter import TagCollector
 from ezdxf.entities.dxfentity import DXFEntity
 from ezdxf.lldxf.extendedtags import DXFTag
+from ezdxf.lldxf.tags import Tags
 from ezdxf.entities.line import Line
 
 ENTITY = """0
@@ -389,3 +390,114 @@ class TestGetLayout:
         circle = msp.add_circle(center=(0, 0), radius=1)
         msp.unlink_entity(circle)
         assert circle.get_layout() is None
+
+
+class TestLazyLoading:
+    @pytest.fixture
+    def entity(self):
+        return Line.lazy_load(Tags.from_text(LAZY_LINE))
+
+    def test_handle_and_owner_without_loading(self, entity):
+        assert entity.is_lazy is True
+        assert entity.dxftype() == 'LINE'
+        assert entity.dxf.handle == 'ABBA'
+        assert entity.dxf.owner == 'FEFE', 'ignore reactor handles'
+        assert entity.is_lazy is True
+
+    def test_load_content_at_first_access(self, entity):
+        assert entity.dxf.layer == 'LAZY'
+        assert entity.is_lazy is False
+        assert entity.dxf.end == (1, 1, 1)
+        assert entity.get_reactors() == ['BEEF']
+        assert entity.dxf.handle == 'ABBA'
+        assert entity.dxf.owner == 'FEFE'
+
+    def test_lazy_entity_class(self, entity):
+        assert isinstance(entity, Line)
+        assert type(entity) is not Line
+        assert entity.dxf.layer == 'LAZY'
+        assert type(entity) is Line
+
+    def test_missing_attribute_of_loaded_entity(self, entity):
+        with pytest.raises(AttributeError):
+            _ = entity.xyz
+        assert entity.is_lazy is False
+        with pytest.raises(AttributeError):
+            _ = entity.xyz
+        with pytest.raises(AttributeError):
+            _ = Line().xyz
+
+    def test_copy_lazy_entity(self, entity):
+        line = entity.copy()
+        assert type(line) is Line
+        assert line.dxf.layer == 'LAZY'
+
+    def test_load_content_by_entity_attribute(self, entity):
+        assert entity.has_reactors() is True
+        assert entity.is_lazy is False
+
+    def test_change_owner_without_loading(self, entity):
+        entity.set_owner('CAFE', paperspace=1)
+        assert entity.dxf.owner == 'CAFE'
+        assert entity.is_lazy is True
+        assert entity.dxf.paperspace == 1
+        assert entity.is_lazy is True
+        assert entity.dxf.layer == 'LAZY'
+        assert entity.is_lazy is False
+        assert entity.dxf.owner == 'CAFE'
+        assert entity.dxf.paperspace == 1
+
+    def test_dxf_namespace_reference_after_loading(self, entity):
+        dxf = entity.dxf
+        assert dxf.layer == 'LAZY'
+        assert entity.dxf is not dxf
+        dxf.handle = 'FFFF'
+        assert entity.dxf.handle == 'FFFF'
+
+    def test_pickle_lazy_entity(self, entity):
+        import pickle
+        entity2 = pickle.loads(pickle.dumps(entity))
+        assert entity2.is_lazy is True
+        assert entity2.dxf.handle == 'ABBA'
+        assert entity2.dxf.layer == 'LAZY'
+        assert entity2.dxf._entity is entity2
+
+    def test_export_lazy_entity(self, entity):
+        collector = TagCollector()
+        entity.export_dxf(collector)
+        expected = TagCollector()
+        Line.from_text(LAZY_LINE).export_dxf(expected)
+        assert collector.tags == expected.tags
+
+
+LAZY_LINE = """  0
+LINE
+  5
+ABBA
+102
+{ACAD_REACTORS
+330
+BEEF
+102
+}
+330
+FEFE
+100
+AcDbEntity
+  8
+LAZY
+100
+AcDbLine
+ 10
+0.0
+ 20
+0.0
+ 30
+0.0
+ 11
+1.0
+ 21
+1.0
+ 31
+1.0
+"""
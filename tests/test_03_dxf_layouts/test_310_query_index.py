@@ -0,0 +1,122 @@
+#  Copyright (c) 2021, Manfred Moitzi
+#  License: MIT License
+import pytest
+import ezdxf
+from ezdxf.query import EntityQuery, QueryIndex, compile_query
+
+
+@pytest.fixture
+def msp():
+    doc = ezdxf.new()
+    msp = doc.modelspace()
+    for index in range(20):
+        layer = 'Walls' if index % 2 else 'Doors'
+        msp.add_line((index, 0), (index, 1),
+                     dxfattribs={'layer': layer, 'color': index % 3})
+        msp.add_circle((index, 0), 1, dxfattribs={'layer': layer})
+        msp.add_text(str(index), dxfattribs={'linetype': 'DASHED'})
+    return msp
+
+
+QUERIES = [
+    'LINE',
+    'LINE CIRCLE',
+    '* !LINE',
+    '*[layer=="Walls"]',
+    '*[layer=="walls"]',
+    '*[layer=="walls"]i',
+    'LINE[layer=="Walls" & color==1]',
+    'LINE[color==1 & layer=="Walls" & color==1]',
+    'LINE[layer=="Walls" | color==1]',
+    'LINE[!layer=="Walls"]',
+    'CIRCLE[layer ? "W.*"]',
+    '*[(layer=="Doors") & !(color==2)]',
+    '*[linetype=="DASHED"]',
+    '*[color==256]',
+    '*[text=="7"]',
+    'TEXT[layer=="Walls"]',
+]
+
+
+@pytest.mark.parametrize('query', QUERIES)
+def test_indexed_query_matches_full_scan(msp, query):
+    expected = EntityQuery(iter(msp), query).entities
+    msp.build_query_index()
+    assert msp.query(query).entities == expected
+
+
+def test_query_hints():
+    compiled = compile_query('LINE CIRCLE[layer=="0" & (color==1 | color==2)]')
+    assert compiled.names == {'LINE', 'CIRCLE'}
+    assert compiled.equal == (('layer', '0'),)
+
+
+def test_no_hints_for_or_expressions():
+    compiled = compile_query('*[layer=="0" | color==1]')
+    assert compiled.names is None
+    assert compiled.equal == tuple()
+
+
+def test_compiled_queries_are_cached():
+    assert compile_query('LINE[color==1]') is compile_query('LINE[color==1]')
+
+
+def test_index_can_not_be_used():
+    index = QueryIndex()
+    assert index.candidates(compile_query('*[color < 7]')) is None
+
+
+def test_build_query_index_returns_existing_index(msp):
+    index = msp.build_query_index()
+    assert len(index) == 60
+    assert msp.build_query_index() is index
+    msp.discard_query_index()
+    assert msp.build_query_index() is not index
+
+
+class TestIndexUpdate:
+    @pytest.fixture
+    def index(self, msp):
+        return msp.build_query_index()
+
+    def test_change_indexed_attribute(self, msp, index):
+        line = msp.query('LINE[layer=="Doors"]').first
+        line.dxf.layer = 'Windows'
+        assert msp.query('*[layer=="Windows"]').entities == [line]
+        assert line not in msp.query('LINE[layer=="Doors"]')
+
+    def test_delete_indexed_attribute(self, msp, index):
+        line = msp.query('LINE[color==1]').first
+        del line.dxf.color
+        assert line not in msp.query('LINE[color==1]')
+        line.dxf.color = 1
+        assert line in msp.query('LINE[color==1]')
+
+    def test_preserve_entity_order(self, msp, index):
+        lines = msp.query('LINE').entities
+        lines[5].dxf.layer = 'X'
+        lines[5].dxf.layer = 'Walls'
+        assert msp.query('LINE').entities == lines
+
+    def test_add_entity(self, msp, index):
+        point = msp.add_point((0, 0), dxfattribs={'layer': 'Walls'})
+        assert point in index
+        assert msp.query('*[layer=="Walls"]').last is point
+
+    def test_unlink_and_delete_entity(self, msp, index):
+        line, circle = msp.query('LINE CIRCLE[layer=="Walls"]')[:2]
+        msp.unlink_entity(line)
+        msp.delete_entity(circle)
+        assert line not in index
+        assert circle not in index
+        assert len(msp.query('LINE CIRCLE[layer=="Walls"]')) == 18
+
+    def test_move_to_other_layout(self, msp, index):
+        line = msp.query('LINE').first
+        block = msp.doc.blocks.new('BLOCK')
+        block_index = block.build_query_index()
+        msp.move_to_layout(line, block)
+        assert line not in index
+        assert line in block_index
+        line.dxf.layer = 'Block'
+        assert block.query('*[layer=="Block"]').first is line
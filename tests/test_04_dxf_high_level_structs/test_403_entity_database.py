@@ -1,8 +1,9 @@
-# Copyright (c) 2011-2020, Manfred Moitzi
+# Copyright (c) 2011-2021, Manfred Moitzi
 # License: MIT License
 import pytest
 from ezdxf.entitydb import EntityDB
 from ezdxf.entities.dxfentity import DXFEntity
+from ezdxf.entities import Line, Circle
 from ezdxf.audit import Auditor
 
 ENTITY = DXFEntity.new(handle='FFFF')
@@ -193,3 +194,72 @@ def test_trashcan_context_manager():
     assert len(db) == 3
     assert entities[0].is_alive is False
     assert entities[1].is_alive is False
+
+
+def test_next_handle_skips_used_handles():
+    db = EntityDB()
+    db['FF'] = DXFEntity.new(handle='FF')
+    db.handles.reset('FE')
+    assert db.next_handle() == '100'
+    assert db.next_handle() == '101'
+
+
+def test_next_handle_does_not_reuse_deleted_handles():
+    db = EntityDB()
+    e = DXFEntity()
+    db.add(e)
+    handle = e.dxf.handle
+    db.delete_entity(e)
+    db.handles.reset(handle)
+    assert db.next_handle() != handle
+
+
+class TestTypeTables:
+    def test_by_type(self):
+        db = EntityDB()
+        lines = [Line() for _ in range(3)]
+        circle = Circle()
+        for e in lines[:2] + [circle] + lines[2:]:
+            db.add(e)
+        assert list(db.by_type('LINE')) == lines
+        assert list(db.by_type('CIRCLE', 'LINE')) == [circle] + lines
+        assert list(db.by_type('ARC')) == []
+
+    def test_by_type_filters_destroyed_entities(self):
+        db = EntityDB()
+        e1, e2 = Line(), Line()
+        db.add(e1)
+        db.add(e2)
+        e1.destroy()
+        assert list(db.by_type('LINE')) == [e2]
+
+    def test_dxf_types_in_use(self):
+        db = EntityDB()
+        line, circle = Line(), Circle()
+        db.add(line)
+        db.add(circle)
+        assert db.dxf_types_in_use() == {'LINE', 'CIRCLE'}
+        circle.destroy()
+        assert db.dxf_types_in_use() == {'LINE'}
+        db.delete_entity(line)
+        assert db.dxf_types_in_use() == set()
+
+    def test_replace_entity(self):
+        db = EntityDB()
+        line, circle = Line(), Circle()
+        db['ABBA'] = line
+        db['ABBA'] = circle
+        assert list(db.by_type('LINE')) == []
+        assert list(db.by_type('CIRCLE')) == [circle]
+
+    def test_discard_and_audit(self):
+        db = EntityDB()
+        line, circle = Line(), Circle()
+        db.add(line)
+        db.add(circle)
+        db.discard(line)
+        assert list(db.by_type('LINE')) == []
+        circle.dxf.handle = 'FEFE'
+        db.audit(auditor)
+        assert list(db.by_type('CIRCLE')) == [circle]
+        assert 'FEFE' in db
@@ -2,6 +2,7 @@
 #  License: MIT License
 
 import pytest
+import ezdxf
 from ezdxf.math import Vec3
 from ezdxf import disassemble
 from ezdxf.entities import factory
@@ -13,6 +14,26 @@ def test_do_nothing():
     assert list(disassemble.to_vertices([])) == []
 
 
+def test_decompose_nested_block_references():
+    doc = ezdxf.new()
+    doc.blocks.new('Inner').add_line((0, 0), (1, 0))
+    doc.blocks.new('Outer').add_blockref('Inner', (5, 0))
+    insert = doc.modelspace().add_blockref('Outer', (0, 0))
+    entities = list(disassemble.recursive_decompose([insert]))
+    assert [e.dxftype() for e in entities] == ['LINE']
+    assert entities[0].dxf.start.isclose((5, 0))
+
+
+def test_decompose_circular_block_references():
+    doc = ezdxf.new()
+    blk = doc.blocks.new('Loop')
+    blk.add_line((0, 0), (1, 0))
+    blk.add_blockref('Loop', (5, 0))
+    insert = doc.modelspace().add_blockref('Loop', (0, 0))
+    entities = list(disassemble.recursive_decompose([insert, insert]))
+    assert [e.dxftype() for e in entities] == ['LINE', 'LINE']
+
+
 def test_convert_unsupported_entity_to_primitive():
     p = disassemble.make_primitive(factory.new('3DSOLID'))
     assert p.path is None
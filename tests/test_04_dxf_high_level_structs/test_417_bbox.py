@@ -5,6 +5,7 @@ import pytest
 import ezdxf
 from ezdxf.layouts import VirtualLayout
 from ezdxf import bbox, disassemble
+from ezdxf.math import BoundingBox
 from ezdxf.render.forms import square, translate
 
 
@@ -79,7 +80,8 @@ def test_cache_usage_for_flat_multi_boxes(msp_solids, func):
 
     # This works because flat processing has not to yield bounding boxes for
     # sub entities, caching top level bounding boxes works well.
-    assert cache.misses == 2 + 2  # first 2xINSERT, 2xSOLID in INSERT
+    # The block definition hull is calculated without the bounding box cache.
+    assert cache.misses == 2  # first 2xINSERT
     assert cache.hits == 9 * 2  # 9 x 2xINSERT
 
 
@@ -140,3 +142,215 @@ def test_cache_usage_with_uuids_for_reused_virtual_entities(msp_solids, func):
 
 if __name__ == '__main__':
     pytest.main([__file__])
+
+
+class TestCacheInvalidation:
+    @pytest.fixture
+    def doc(self):
+        doc = ezdxf.new()
+        blk = doc.blocks.new('Square')
+        blk.add_lwpolyline(square(1), close=True)
+        return doc
+
+    def test_changed_dxf_attribute(self, doc):
+        cache = bbox.Cache()
+        circle = doc.modelspace().add_circle((0, 0), radius=1)
+        assert bbox.extends([circle], cache).extmax.isclose((1, 1, 0), abs_tol=0.01)
+        assert bbox.extends([circle], cache).extmax.isclose((1, 1, 0), abs_tol=0.01)
+        assert cache.hits == 1
+        circle.dxf.radius = 2
+        assert bbox.extends([circle], cache).extmax.isclose((2, 2, 0), abs_tol=0.01)
+
+    def test_transformed_entity(self, doc):
+        cache = bbox.Cache()
+        line = doc.modelspace().add_line((0, 0), (1, 0))
+        bbox.extends([line], cache)
+        line.translate(1, 2, 3)
+        assert bbox.extends([line], cache).extmax == (2, 2, 3)
+
+    def test_lwpolyline_vertex_edit(self, doc):
+        cache = bbox.Cache()
+        lwpolyline = doc.modelspace().add_lwpolyline([(0, 0), (1, 1)])
+        bbox.extends([lwpolyline], cache)
+        lwpolyline.append((5, 5))
+        assert bbox.extends([lwpolyline], cache).extmax == (5, 5, 0)
+        lwpolyline[2] = (7, 7)
+        assert bbox.extends([lwpolyline], cache).extmax == (7, 7, 0)
+
+    def test_polyline_vertex_edit(self, doc):
+        cache = bbox.Cache()
+        polyline = doc.modelspace().add_polyline3d([(0, 0, 0), (1, 1, 1)])
+        bbox.extends([polyline], cache)
+        polyline.vertices[1].dxf.location = (3, 3, 3)
+        assert bbox.extends([polyline], cache).extmax == (3, 3, 3)
+        polyline.append_vertex((4, 4, 4))
+        assert bbox.extends([polyline], cache).extmax == (4, 4, 4)
+
+    def test_polyline_vertex_deletion(self, doc):
+        cache = bbox.Cache()
+        polyline = doc.modelspace().add_polyline3d(
+            [(0, 0, 0), (1, 1, 1), (2, 2, 2), (4, 4, 4)])
+        bbox.extends([polyline], cache)
+        vertex = polyline[3]
+        del polyline[3]
+        assert vertex.is_alive is False
+        assert bbox.extends([polyline], cache).extmax == (2, 2, 2)
+        del polyline[:1]
+        assert len(polyline) == 2
+        assert bbox.extends([polyline], cache).extmin == (1, 1, 1)
+
+    def test_spline_control_points(self, doc):
+        cache = bbox.Cache()
+        spline = doc.modelspace().add_open_spline(
+            [(0, 0), (1, 1), (2, 0), (3, 1)])
+        bbox.extends([spline], cache)
+        spline.control_points = [(0, 0), (1, 1), (2, 0), (5, 1)]
+        assert bbox.extends([spline], cache).extmax.x == pytest.approx(5)
+
+    def test_block_redefinition(self, doc):
+        cache = bbox.Cache()
+        insert = doc.modelspace().add_blockref('Square', (0, 0))
+        assert bbox.extends([insert], cache).extmax.isclose((1, 1, 0), abs_tol=0.01)
+        blk = doc.blocks.get('Square')
+        circle = blk.add_circle((10, 10), radius=1)
+        assert bbox.extends([insert], cache).extmax.isclose((11, 11, 0), abs_tol=0.01)
+        circle.dxf.radius = 2
+        assert bbox.extends([insert], cache).extmax.isclose((12, 12, 0), abs_tol=0.01)
+        blk.delete_entity(circle)
+        assert bbox.extends([insert], cache).extmax.isclose((1, 1, 0), abs_tol=0.01)
+
+    def test_unchanged_block_reference_is_cached(self, doc):
+        cache = bbox.Cache()
+        msp = doc.modelspace()
+        insert = msp.add_blockref('Square', (0, 0))
+        bbox.extends([insert], cache)
+        msp.add_line((0, 0), (1, 0))  # modelspace changes do not matter
+        hits = cache.hits
+        bbox.extends([insert], cache)
+        assert cache.hits == hits + 1
+
+
+class TestBlockReferenceExtents:
+    @pytest.fixture
+    def doc(self):
+        doc = ezdxf.new()
+        blk = doc.blocks.new('Symbol')
+        blk.add_line((0, 0), (4, 0))
+        blk.add_line((0, 0), (0, 2))
+        blk.add_circle((4, 2), radius=1)
+        blk.add_attdef('TAG', (100, 100))  # not rendered by INSERT
+        return doc
+
+    @staticmethod
+    def decomposed(entity):
+        box = BoundingBox()
+        for b in bbox.multi_recursive([entity]):
+            box.extend(b)
+        return box
+
+    @pytest.mark.parametrize('rotation', [0, 30, 145, 270])
+    @pytest.mark.parametrize('scale', [1, 2.5, -1])
+    def test_uniform_scaled_insert(self, doc, rotation, scale):
+        insert = doc.modelspace().add_blockref('Symbol', (7, 3), dxfattribs={
+            'rotation': rotation,
+            'xscale': scale, 'yscale': scale, 'zscale': scale,
+        })
+        box = bbox.extends([insert])
+        expected = self.decomposed(insert)
+        assert box.extmin.isclose(expected.extmin, abs_tol=0.05)
+        assert box.extmax.isclose(expected.extmax, abs_tol=0.05)
+
+    def test_non_uniform_scaled_insert_is_decomposed(self, doc):
+        insert = doc.modelspace().add_blockref('Symbol', (0, 0), dxfattribs={
+            'rotation': 45, 'xscale': 1, 'yscale': 3,
+        })
+        box = bbox.extends([insert])
+        expected = self.decomposed(insert)
+        assert box.extmin == expected.extmin
+        assert box.extmax == expected.extmax
+
+    def test_non_uniform_scaled_linear_block(self, doc):
+        blk = doc.blocks.new('Lines')
+        blk.add_lwpolyline([(0, 0), (4, 0), (4, 2)])
+        insert = doc.modelspace().add_blockref('Lines', (0, 0), dxfattribs={
+            'rotation': 45, 'xscale': 1, 'yscale': 3,
+        })
+        box = bbox.extends([insert])
+        expected = self.decomposed(insert)
+        assert box.extmin.isclose(expected.extmin)
+        assert box.extmax.isclose(expected.extmax)
+
+    def test_minsert(self, doc):
+        insert = doc.modelspace().add_blockref('Symbol', (0, 0), dxfattribs={
+            'rotation': 90,
+            'row_count': 3, 'row_spacing': 10,
+            'column_count': 4, 'column_spacing': 20,
+        })
+        box = bbox.extends([insert])
+        expected = self.decomposed(insert)
+        assert box.extmin.isclose(expected.extmin, abs_tol=0.01)
+        assert box.extmax.isclose(expected.extmax, abs_tol=0.01)
+
+    def test_attribs(self, doc):
+        insert = doc.modelspace().add_blockref('Symbol', (0, 0))
+        insert.add_attrib('TAG', 'value', (20, 20))
+        box = bbox.extends([insert])
+        assert box.extmax.isclose(self.decomposed(insert).extmax)
+
+    def test_nested_block_reference(self, doc):
+        blk = doc.blocks.new('Outer')
+        blk.add_blockref('Symbol', (10, 0), dxfattribs={'rotation': 90})
+        insert = doc.modelspace().add_blockref('Outer', (0, 0))
+        box = bbox.extends([insert])
+        assert box.extmin.isclose((7, 0, 0), abs_tol=0.01)
+        assert box.extmax.isclose((10, 5, 0), abs_tol=0.01)
+
+    def test_circular_block_reference_is_decomposed(self, doc):
+        blk = doc.blocks.new('Loop')
+        blk.add_line((0, 0), (1, 1))
+        blk.add_blockref('Loop', (5, 5))
+        msp = doc.modelspace()
+        insert = msp.add_blockref('Loop', (0, 0))
+        # The circular block reference is ignored at the first repetition:
+        assert bbox.extends([insert]).extmax.isclose((1, 1, 0))
+        insert = msp.add_blockref('Loop', (0, 0), dxfattribs={
+            'xscale': 1, 'yscale': 2,
+        })
+        assert bbox.extends([insert]).extmax.isclose((1, 2, 0))
+
+    @pytest.mark.parametrize('yscale', [1, 2])
+    def test_non_uniform_scaled_nested_block_reference(self, doc, yscale):
+        blk = doc.blocks.new('Outer')
+        blk.add_blockref('Symbol', (10, 0))
+        insert = doc.modelspace().add_blockref('Outer', (0, 0), dxfattribs={
+            'xscale': 1, 'yscale': yscale,
+        })
+        box = bbox.extends([insert])
+        # The exact decomposition resolves nested block references like the
+        # block hulls:
+        assert box.extmin.isclose((10, 0, 0), abs_tol=0.01)
+        assert box.extmax.isclose((15, 3 * yscale, 0), abs_tol=0.01)
+
+    def test_block_with_arc(self, doc):
+        blk = doc.blocks.new('Arc')
+        blk.add_arc((0, 0), 1, 0, 180)
+        insert = doc.modelspace().add_blockref('Arc', (0, 0))
+        box = bbox.extends([insert])
+        assert box.extmin.isclose((-1, 0, 0), abs_tol=0.01)
+        assert box.extmax.isclose((1, 1, 0), abs_tol=0.01)
+
+    def test_block_hull_is_reused(self, doc):
+        cache = bbox.Cache()
+        msp = doc.modelspace()
+        for x in range(10):
+            msp.add_blockref('Symbol', (x * 10, 0))
+        box = bbox.extends(msp, cache)
+        assert box.extmax.isclose((95, 3, 0), abs_tol=0.01)
+        assert len(cache._block_hulls._hulls) == 1
+
+    def test_block_redefinition_updates_hull(self, doc):
+        cache = bbox.Cache()
+        insert = doc.modelspace().add_blockref('Symbol', (0, 0))
+        bbox.extends([insert], cache)
+        doc.blocks.get('Symbol').add_line((0, 0), (10, 10))
+        assert bbox.extends([insert], cache).extmax.isclose((10, 10, 0))
@@ -0,0 +1,154 @@
+#  Copyright (c) 2021, Manfred Moitzi
+#  License: MIT License
+import pytest
+import ezdxf
+from ezdxf import bbox
+from ezdxf.math import BoundingBox
+from ezdxf.spatial import SpatialIndex
+
+
+@pytest.fixture
+def doc():
+    doc = ezdxf.new()
+    msp = doc.modelspace()
+    for x in range(10):
+        for y in range(10):
+            msp.add_circle((x * 10, y * 10), radius=1)
+    return doc
+
+
+def window(x, y, size=2):
+    return BoundingBox([(x - size / 2, y - size / 2), (x + size / 2,
+                                                       y + size / 2)])
+
+
+def centers(entities):
+    return {tuple(e.dxf.center)[:2] for e in entities}
+
+
+def test_index_of_entity_query(doc):
+    circles = doc.modelspace().query('CIRCLE')
+    index = SpatialIndex(circles, cache=bbox.Cache())
+    assert len(index) == 100
+    assert circles[0] in index
+    assert centers(index.intersecting(window(20, 30))) == {(20, 30)}
+    assert centers(index.inside(window(25, 35, size=12))) == {
+        (20, 30), (20, 40), (30, 30), (30, 40)}
+    assert centers(index.inside(window(25, 35, size=11.9))) == set()
+    assert centers(index.nearest((41, 42), k=1)) == {(40, 40)}
+
+
+def test_layout_index_tracks_add_and_delete(doc):
+    msp = doc.modelspace()
+    index = msp.spatial_index()
+    assert len(index) == 100
+    line = msp.add_line((200, 200), (201, 201))
+    assert line in index
+    assert index.intersecting(window(200, 200)) == [line]
+
+    circle = index.intersecting(window(0, 0))[0]
+    msp.delete_entity(circle)
+    assert circle not in index
+    assert index.intersecting(window(0, 0)) == []
+
+    msp.unlink_entity(line)
+    assert index.intersecting(window(200, 200)) == []
+    assert len(index) == 99
+
+
+def test_index_is_registered_at_the_block_record(doc):
+    index = doc.modelspace().spatial_index()
+    # new layout object of the same BLOCK_RECORD:
+    msp = doc.layout('Model')
+    line = msp.add_line((200, 200), (201, 201))
+    assert line in index
+    msp.delete_entity(line)
+    assert line not in index
+
+
+def test_block_layout_index_tracks_add_and_delete():
+    doc = ezdxf.new()
+    index = doc.blocks.new('TEST').spatial_index()
+    line = doc.blocks.get('TEST').add_line((0, 0), (1, 1))
+    assert index.intersecting(window(0, 0)) == [line]
+    doc.blocks.get('TEST').unlink_entity(line)
+    assert len(index) == 0
+
+
+def test_update_transformed_entity(doc):
+    msp = doc.modelspace()
+    index = msp.spatial_index(cache=bbox.Cache())
+    circle = index.intersecting(window(0, 0))[0]
+    circle.translate(500, 0, 0)
+    index.update(circle)
+    assert index.intersecting(window(0, 0)) == []
+    assert index.intersecting(window(500, 0)) == [circle]
+    assert index.nearest((510, 0), k=1) == [circle]
+
+
+@pytest.mark.parametrize('cache', [None, bbox.Cache()])
+def test_detect_modified_entity_at_query(doc, cache):
+    msp = doc.modelspace()
+    index = msp.spatial_index(cache=cache)
+    circle = index.intersecting(window(0, 0))[0]
+    circle.translate(500, 0, 0)
+    assert index.intersecting(window(0, 0)) == []
+    assert index.intersecting(window(500, 0)) == [circle]
+    assert index.nearest((510, 0), k=1) == [circle]
+
+
+def test_interleaved_queries_do_not_check_unmodified_entities(
+        doc, monkeypatch):
+    msp = doc.modelspace()
+    index1 = msp.spatial_index()
+    index2 = msp.spatial_index()
+    checks = []
+    modification_stamp = bbox.modification_stamp
+
+    def counting_modification_stamp(entity):
+        checks.append(entity)
+        return modification_stamp(entity)
+
+    monkeypatch.setattr(bbox, 'modification_stamp',
+                        counting_modification_stamp)
+    for _ in range(10):
+        assert len(index1.intersecting(window(0, 0))) == 1
+        assert len(index2.intersecting(window(0, 0))) == 1
+    assert checks == []
+
+    circle = index1.intersecting(window(0, 0))[0]
+    circle.translate(500, 0, 0)
+    assert index1.intersecting(window(500, 0)) == [circle]
+    assert index2.intersecting(window(500, 0)) == [circle]
+    checks.clear()
+    index1.intersecting(window(0, 0))
+    index2.intersecting(window(0, 0))
+    assert checks == []
+
+
+def test_detect_destroyed_entity_at_query(doc):
+    index = SpatialIndex(doc.modelspace().query('CIRCLE'))
+    circle = index.intersecting(window(0, 0))[0]
+    doc.entitydb.delete_entity(circle)
+    assert index.intersecting(window(0, 0)) == []
+    assert len(index) == 99
+
+
+def test_detect_entity_with_new_bounding_box(doc):
+    msp = doc.modelspace()
+    text = msp.add_text('')
+    index = SpatialIndex([text])
+    assert len(index) == 0
+    text.dxf.text = 'TEXT'
+    assert index.intersecting(window(0, 0)) == [text]
+
+
+def test_many_changes_rebuild_the_tree(doc):
+    msp = doc.modelspace()
+    index = msp.spatial_index()
+    lines = [msp.add_line((x, -50), (x, -49)) for x in range(100)]
+    assert len(index) == 200
+    assert len(index._changed) < 100  # rebuild happened
+    assert set(index.intersecting(
+        BoundingBox([(-1, -51), (100, -48)]))) == set(lines)
+    assert index.nearest((0, 0), k=3)[0].dxf.center == (0, 0)
@@ -27,3 +27,115 @@ def test_load_dxf(dxf):
     psp = doc.layout()
     assert len(psp) == 1
     assert psp[0].dxftype() == 'CIRCLE'
+
+
+def test_load_dxf_by_mmap(dxf):
+    doc = ezdxf.readfile(dxf, use_mmap=True)
+    msp = doc.modelspace()
+    assert len(msp) == 1
+    assert msp[0].dxftype() == 'LINE'
+
+    psp = doc.layout()
+    assert len(psp) == 1
+    assert psp[0].dxftype() == 'CIRCLE'
+
+
+def test_recover_dxf_by_mmap(dxf):
+    from ezdxf import recover
+    doc, auditor = recover.readfile(dxf, use_mmap=True)
+    assert doc.filename == dxf
+    assert len(doc.modelspace()) == 1
+    assert len(doc.layout()) == 1
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_load_dxf_by_worker_processes(dxf, workers):
+    doc = ezdxf.readfile(dxf, workers=workers)
+    msp = doc.modelspace()
+    assert len(msp) == 1
+    assert msp[0].dxftype() == 'LINE'
+    assert msp[0].doc is doc
+
+    psp = doc.layout()
+    assert len(psp) == 1
+    assert psp[0].dxftype() == 'CIRCLE'
+
+
+def test_lazy_loading(dxf):
+    doc = ezdxf.readfile(dxf, lazy=True)
+    msp = doc.modelspace()
+    assert len(msp.query('LINE')) == 1
+    line = msp[0]
+    assert line.is_lazy is True
+    assert line.dxf.owner == msp.layout_key
+    assert line.dxf.handle in doc.entitydb
+    assert line.is_lazy is True
+    assert line.dxf.end == (1, 0)
+    assert line.is_lazy is False
+
+    circle = doc.layout()[0]
+    assert circle.is_lazy is True
+    assert circle.dxf.paperspace == 1
+    assert circle.is_lazy is True
+    assert circle.dxf.radius == 1
+    assert circle.is_lazy is False
+    assert circle.dxf.paperspace == 1
+
+
+@pytest.mark.parametrize('lazy', [False, True])
+def test_load_compact_tags(dxf, lazy):
+    doc = ezdxf.readfile(dxf, compact=True, lazy=lazy)
+    msp = doc.modelspace()
+    assert len(msp) == 1
+    assert msp[0].dxf.end == (1, 0)
+    assert doc.layout()[0].dxf.radius == 1
+
+
+@pytest.mark.parametrize('use_mmap', [False, True])
+def test_load_dxf_by_parse_cache(dxf, tmpdir, use_mmap):
+    from ezdxf.lldxf.cache import ParseCache
+    cache = ParseCache(tmpdir.join('cache'))
+    for _ in range(2):
+        doc = ezdxf.readfile(dxf, cache=cache, use_mmap=use_mmap)
+        assert doc.filename == dxf
+        msp = doc.modelspace()
+        assert len(msp) == 1
+        assert msp[0].dxftype() == 'LINE'
+        assert msp[0].doc is doc
+
+        psp = doc.layout()
+        assert len(psp) == 1
+        assert psp[0].dxftype() == 'CIRCLE'
+    assert cache.misses == 1
+    assert cache.hits == 1
+
+
+def test_lazy_loading_while_document_is_loading(tmpdir, monkeypatch):
+    from ezdxf.document import Drawing
+    from ezdxf.entities import Dictionary
+    doc = ezdxf.new()
+    line = doc.modelspace().add_line((0, 0), (1, 0))
+    line.new_extension_dict()
+    filename = tmpdir.join('xdict.dxf')
+    doc.saveas(filename)
+
+    loaded_entities = []
+    stage2 = Drawing._2nd_loading_stage
+
+    def load_content_after_2nd_loading_stage(self):
+        stage2(self)
+        assert self.is_loading is True
+        for entity in list(self.entitydb.values()):
+            if entity.is_lazy:
+                entity.load_lazy_content()
+                loaded_entities.append(entity)
+
+    monkeypatch.setattr(Drawing, '_2nd_loading_stage',
+                        load_content_after_2nd_loading_stage)
+    doc = ezdxf.readfile(filename, lazy=True)
+    assert len(loaded_entities) == 1
+    line = loaded_entities[0]
+    assert line.is_lazy is False
+    # post_load_hook() loaded the extension dictionary:
+    assert isinstance(line.get_extension_dict().dictionary, Dictionary)
+
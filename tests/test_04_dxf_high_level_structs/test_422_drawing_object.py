@@ -1,8 +1,10 @@
 # Copyright (c) 2011-2019, Manfred Moitzi
 # License: MIT License
 import pytest
+import ezdxf
 from ezdxf.lldxf.tagger import internal_tag_compiler
 from ezdxf.document import Drawing
+from ezdxf.lldxf import tagwriter
 from ezdxf import DXFValueError, decode_base64
 
 
@@ -248,3 +250,25 @@ ENDSEC
   0
 EOF
 """
+
+
+@pytest.mark.parametrize('fmt', ['asc', 'bin'])
+def test_export_by_worker_processes(fmt, monkeypatch):
+    from io import StringIO, BytesIO
+    monkeypatch.setattr(tagwriter, 'MIN_PARALLEL_EXPORT', 0)
+    monkeypatch.setattr(ezdxf.options, 'write_fixed_meta_data_for_testing',
+                        True)
+    doc = Drawing.new('AC1015')
+    block = doc.blocks.new('WORKERS')
+    for x in range(50):
+        block.add_line((x, 0), (x, 1))
+    msp = doc.modelspace()
+    for x in range(50):
+        msp.add_circle((x, 0), radius=1)
+        msp.add_blockref('WORKERS', (x, 0)).add_attrib('TAG', str(x))
+    results = []
+    for workers in (0, 2):
+        stream = StringIO() if fmt == 'asc' else BytesIO()
+        doc.write(stream, fmt=fmt, workers=workers)
+        results.append(stream.getvalue())
+    assert results[0] == results[1]
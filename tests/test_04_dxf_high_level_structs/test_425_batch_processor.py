@@ -0,0 +1,113 @@
+#  Copyright (c) 2021, Manfred Moitzi
+#  License: MIT License
+import pytest
+import os
+import time
+import ezdxf
+from ezdxf.batch import BatchProcessor
+from ezdxf.batch.__main__ import main
+
+
+def count_lines(doc, auditor):
+    return len(doc.modelspace().query('LINE'))
+
+
+def crash_once(doc, auditor):
+    # Fails at the first attempt of each file:
+    marker = doc.filename + '.crashed'
+    if os.path.exists(marker):
+        return True
+    open(marker, 'w').close()
+    raise RuntimeError('crashed')
+
+
+def sleep(doc, auditor):
+    time.sleep(10)
+
+
+@pytest.fixture(scope='module')
+def files(tmpdir_factory):
+    path = tmpdir_factory.mktemp('batch')
+    names = []
+    for count in range(5):
+        doc = ezdxf.new()
+        msp = doc.modelspace()
+        for x in range(count):
+            msp.add_line((x, 0), (x, 1))
+        name = str(path.join(f'lines{count}.dxf'))
+        doc.saveas(name)
+        names.append(name)
+    invalid = path.join('invalid.dxf')
+    invalid.write('no DXF content')
+    return names, str(invalid)
+
+
+@pytest.mark.parametrize('workers', [0, 2])
+def test_process_files(files, workers):
+    names, _ = files
+    processor = BatchProcessor(count_lines, workers=workers,
+                               tasks_per_worker=2)
+    results = {r.filename: r for r in processor.run(names)}
+    assert len(results) == 5
+    for count, name in enumerate(names):
+        result = results[name]
+        assert result.ok is True
+        assert result.result == count
+        assert result.attempts == 1
+    stats = processor.stats
+    assert stats.files == 5
+    assert stats.failed == 0
+    assert stats.elapsed > 0
+
+
+def test_load_and_audit_only(files):
+    names, _ = files
+    processor = BatchProcessor(workers=0, recover=True)
+    results = list(processor.run(names[:1]))
+    assert results[0].ok is True
+    assert results[0].result is None
+
+
+def test_failed_files_are_not_retried_for_dxf_errors(files):
+    _, invalid = files
+    processor = BatchProcessor(workers=0, retries=2)
+    result, = processor.run([invalid])
+    assert result.ok is False
+    assert result.attempts == 1
+    assert processor.stats.failed == 1
+
+
+@pytest.mark.parametrize('workers', [0, 2])
+def test_retry_failed_files(tmpdir, workers):
+    name = str(tmpdir.join('retry.dxf'))
+    ezdxf.new().saveas(name)
+    processor = BatchProcessor(crash_once, workers=workers, retries=1)
+    result, = processor.run([name])
+    assert result.ok is True
+    assert result.attempts == 2
+    assert processor.stats.retries == 1
+
+
+@pytest.mark.skipif(not hasattr(__import__('signal'), 'SIGALRM'),
+                    reason='requires SIGALRM')
+def test_timeout(files):
+    names, _ = files
+    processor = BatchProcessor(sleep, workers=0, timeout=0.1)
+    result, = processor.run(names[:1])
+    assert result.error.startswith('TimeoutError')
+
+
+def test_command_line_interface(files, capsys):
+    names, invalid = files
+    assert main(['-w', '0', *names]) == 0
+    assert main(['-w', '0', invalid]) == 1
+    output = capsys.readouterr().out
+    assert '5 file(s) processed, 0 failed' in output
+    assert f'FAILED {invalid}' in output
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        BatchProcessor(workers=-1)
+    with pytest.raises(ValueError):
+        BatchProcessor(tasks_per_worker=0)
@@ -5,7 +5,7 @@ import pytest
 import math
 from ezdxf.math import (
     Matrix, detect_banded_matrix, compact_banded_matrix, BandedMatrixLU,
-    gauss_vector_solver, banded_matrix,
+    gauss_vector_solver, banded_matrix, banded_matrix_from_rows,
 )
 
 BANDED_MATRIX = Matrix(matrix=[
@@ -61,6 +61,21 @@ def test_compact_banded_matrix():
     assert m.col(3) == [1, 5, 5, 9, 2, 6, 0]
 
 
+def test_banded_matrix_from_sparse_rows():
+    rows = []
+    for index, row in enumerate(BANDED_MATRIX.rows()):
+        start = max(index - 2, 0)
+        rows.append((start, row[start:index + 2]))
+    m, m1, m2 = banded_matrix_from_rows(rows)
+    assert (m1, m2) == (2, 1)
+    assert m == compact_banded_matrix(BANDED_MATRIX, m1, m2)
+
+
+def test_banded_matrix_from_invalid_sparse_rows():
+    with pytest.raises(ValueError):
+        banded_matrix_from_rows([(0, [1]), (1, [1, 1])])
+
+
 B1 = [5, 3, 2, 6, 8, 2, 1]
 B2 = [9, 1, 7, 6, 4, 5, 0]
 B3 = [0, 9, 3, 7, 1, 9, 9]
@@ -2,6 +2,7 @@
 # License: MIT License
 import pytest
 import pickle
+from array import array
 from math import radians, sin, cos, pi, isclose
 # Import from 'ezdxf.math._matrix44' to test Python implementation
 from ezdxf.math._matrix44 import Matrix44
@@ -245,6 +246,30 @@ class TestMatrix44:
         p2 = c.transform_vertices(points)
         assert equal_vectors(p1, p2) is True
 
+    def test_transform_array(self, m44):
+        m = m44.chain(m44.scale(2, 3, 4), m44.z_rotate(1), m44.translate(1, 2, 3))
+        points = [(23., 97., .5), (2., 7., 13.)]
+        expected = list(m.transform_vertices(points))
+        values = array('d', [23., 97., .5, 2., 7., 13.])
+        result = m.transform_array(values)
+        assert isinstance(result, array)
+        assert values[0] == 23.  # input is not modified
+        assert expected[0].isclose(result[0:3])
+        assert expected[1].isclose(result[3:6])
+
+    def test_transform_array_accepts_iterables_and_buffers(self, m44):
+        m = m44.translate(1, 2, 3)
+        assert list(m.transform_array([0, 0, 0])) == [1, 2, 3]
+        assert list(m.transform_array(iter([0., 0., 0.]))) == [1, 2, 3]
+        view = memoryview(array('d', [0, 0, 0, 9, 9, 9])).cast('B').cast(
+            'd', (2, 3))
+        assert list(m.transform_array(view)) == [1, 2, 3, 10, 11, 12]
+        assert len(m.transform_array([])) == 0
+
+    def test_transform_array_invalid_size(self, m44):
+        with pytest.raises(ValueError):
+            m44().transform_array([1, 2])
+
     def test_transform(self, m44):
         t = m44.scale(2., .5, 1.)
         r = t.transform((10., 20., 30.))
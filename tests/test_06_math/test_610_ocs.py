@@ -20,6 +20,7 @@ center point, (-5.53851623, 8.87677359, 5.87096886)
 Extrusion direction relative to UCS: X=0.70819791  Y=0.07548520  Z=0.70196702
 
 """
+from array import array
 from ezdxf.math import OCS, Matrix44, Vec3
 
 EXTRUSION = (0.7081979129501316, 0.0754851955385861, 0.7019670229772758)
@@ -99,3 +100,24 @@ def test_matrix44_to_wcs():
         (-9.56460754, 8.44764172, 9.97894327),
         places=6,
     )
+
+
+def test_points_to_wcs_array():
+    ocs = OCS(EXTRUSION)
+    points = [Vec3(1, 2, 3), Vec3(-4, 5, -6)]
+    values = array('d', [1, 2, 3, -4, 5, -6])
+    result = ocs.points_to_wcs_array(values)
+    for index, wcs in enumerate(ocs.points_to_wcs(points)):
+        assert wcs.isclose(result[index * 3:index * 3 + 3])
+    back = ocs.points_from_wcs_array(result)
+    for index, point in enumerate(points):
+        assert point.isclose(back[index * 3:index * 3 + 3])
+
+
+def test_points_to_wcs_array_without_transformation():
+    ocs = OCS()
+    values = array('d', [1, 2, 3])
+    result = ocs.points_to_wcs_array(values)
+    assert result == values
+    assert result is not values
+    assert ocs.points_from_wcs_array(values) == values
@@ -1,6 +1,7 @@
 # Copyright (c) 2018 Manfred Moitzi
 # License: MIT License
 from math import isclose, radians, pi
+from array import array
 from ezdxf.math import UCS, Vec3, X_AXIS, Y_AXIS, Z_AXIS, Matrix44
 
 
@@ -239,3 +240,14 @@ def test_moveto():
     assert ucs.origin == (1, 2, 3)
     ucs.moveto((3, 2, 1))
     assert ucs.origin == (3, 2, 1)
+
+
+def test_points_to_wcs_array():
+    ucs = UCS(origin=(1, 2, 3)).rotate_local_z(pi / 2)
+    points = [Vec3(1, 2, 3), Vec3(-4, 5, -6)]
+    result = ucs.points_to_wcs_array(array('d', [1, 2, 3, -4, 5, -6]))
+    for index, wcs in enumerate(ucs.points_to_wcs(points)):
+        assert wcs.isclose(result[index * 3:index * 3 + 3])
+    back = ucs.points_from_wcs_array(result)
+    for index, point in enumerate(points):
+        assert point.isclose(back[index * 3:index * 3 + 3])
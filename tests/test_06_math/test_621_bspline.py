@@ -292,3 +292,46 @@ def test_flattening():
     fitpoints = [(0, 0), (1, 3), (2, 0), (3, 3)]
     bspline = BSpline.from_fit_points(fitpoints)
     assert list(bspline.flattening(0.01, segments=4)) == EXPECTED_FLATTENING
+
+
+@pytest.mark.parametrize('weights', [None, [1, 0.5, 2, 1]])
+def test_flattening_implementations_are_equal(weights):
+    bspline = BSpline([(0, 0), (1, 3), (2, 0), (3, 3)], weights=weights)
+    expected = list(bspline._flattening(0.001, segments=4))
+    assert len(expected) > 10
+    assert list(bspline.flattening(0.001, segments=4)) == expected
+    array = bspline.flattening_array(0.001, segments=4)
+    assert [Vec3(array[i:i + 3]) for i in range(0, len(array), 3)] == expected
+
+
+def test_flattening_of_degenerated_segments():
+    # start- and end point of the first segment are coincident:
+    bspline = BSpline([(0, 0), (1, 1), (-1, 1), (0, 0)])
+    vertices = list(bspline.flattening(0.01, segments=1))
+    assert len(vertices) > 10
+    assert vertices[0].isclose((0, 0))
+    assert vertices[-1].isclose((0, 0))
+
+
+@pytest.mark.parametrize('weights', [None, [1, 0.5, 2, 1, 1.5]])
+def test_batch_evaluation(weights):
+    bspline = BSpline(DEFPOINTS, order=4, weights=weights)
+    t = [0, 0.1, 0.25, 0.5, 0.2, 0.75, 1.0]
+    points = list(bspline.points(t))
+    assert len(points) == len(t)
+    for point, u in zip(points, t):
+        assert point.isclose(bspline.point(u))
+    array = bspline.points_array(t)
+    assert [Vec3(array[i:i + 3]) for i in range(0, len(array), 3)] == points
+    for n in range(4):
+        for derivatives, u in zip(bspline.derivatives(t, n), t):
+            expected = bspline.derivative(u, n)
+            assert len(derivatives) == n + 1
+            for d, e in zip(derivatives, expected):
+                assert d.isclose(e, abs_tol=1e-9)
+
+
+def test_basis_matrix():
+    basis = BSpline(DEFPOINTS, order=3).basis
+    t = [0, 0.3, 0.5, 0.7, 1.0]
+    assert basis.basis_matrix(t) == [basis.basis_vector(u) for u in t]
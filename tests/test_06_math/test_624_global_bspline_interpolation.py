@@ -245,3 +245,28 @@ def test_check_values():
     for p1, p2 in zip(result, expected):
         assert isclose(p1[0], p2[0], abs_tol=1e-6)
         assert isclose(p1[1], p2[1], abs_tol=1e-6)
+
+
+@pytest.mark.parametrize('degree', [3, 4])
+def test_interpolation_by_banded_matrix_solver(degree):
+    # more fit points than USE_BANDED_MATRIX_SOLVER_CPYTHON_LIMIT
+    points = Vec3.list(
+        (x, math.sin(x / 3), math.cos(x / 5)) for x in range(100))
+    tangents = estimate_tangents(points)
+    for spline in (
+            global_bspline_interpolation(points, degree),
+            global_bspline_interpolation(points, degree, tangents=[
+                tangents[0], tangents[-1]]),
+            global_bspline_interpolation(points, degree, tangents=tangents),
+    ):
+        for point, fit_point in zip(spline.points(spline.t_array), points):
+            assert point.isclose(fit_point, abs_tol=1e-9)
+
+
+@pytest.mark.parametrize('degree', [5, 6])
+def test_unsupported_degree_for_tangent_at_each_fit_point(degree):
+    points = Vec3.list(
+        (x, math.sin(x / 3), math.cos(x / 5)) for x in range(100))
+    tangents = estimate_tangents(points)
+    with pytest.raises(ezdxf.DXFValueError):
+        global_bspline_interpolation(points, degree, tangents=tangents)
@@ -5,6 +5,7 @@ import pickle
 import math
 from ezdxf.math import Vec3, Vec2, Matrix44, ConstructionEllipse
 # Import from 'ezdxf.math._bezier4p' to test Python implementation
+from ezdxf.math import _bezier4p
 from ezdxf.math._bezier4p import Bezier4P
 from ezdxf.math._bezier4p import cubic_bezier_arc_parameters
 from ezdxf.math._bezier4p import cubic_bezier_from_arc
@@ -108,6 +109,24 @@ def test_flattening(bezier):
     assert len(list(curve.flattening(0.1, segments=4))) == 7
 
 
+def test_flattening_array(bezier):
+    curve = bezier([(0, 0), (1, 1), (2, -1), (3, 0)])
+    vertices = list(curve.flattening(0.01, segments=4))
+    array = curve.flattening_array(0.01, segments=4)
+    assert len(array) == len(vertices) * 3
+    assert [Vec3(array[i:i + 3]) for i in range(0, len(array), 3)] == vertices
+
+
+def test_flattening_depth_limit(bezier, monkeypatch):
+    if bezier is Bezier4P:  # reduce runtime of the Python implementation
+        monkeypatch.setattr(_bezier4p, 'MAX_FLATTENING_DEPTH', 10)
+    # A distance below the precision of the curve points does not exhaust
+    # the stack or the recursion limit:
+    curve = bezier([(0, 0), (1, 1e6), (2, 1e6), (3, 0)])
+    count = len(list(curve.flattening(1e-30, segments=1)))
+    assert 100 < count <= 2 ** 16 + 1
+
+
 def test_pickle_support(bezier):
     curve = bezier(DEFPOINTS3D)
     pickled_curve = pickle.loads(pickle.dumps(curve))
@@ -4,6 +4,7 @@ import pytest
 import pickle
 from ezdxf.math import Vec3, Vec2, Matrix44
 # Import from 'ezdxf.math._bezier3p' to test Python implementation
+from ezdxf.math import _bezier3p
 from ezdxf.math._bezier3p import Bezier3P
 from ezdxf.acc import USE_C_EXT
 
@@ -76,6 +77,24 @@ def test_flattening(bezier):
     assert len(list(curve.flattening(0.1, segments=4))) == 9
 
 
+def test_flattening_array(bezier):
+    curve = bezier([(0, 0), (1, 1), (2, 0)])
+    vertices = list(curve.flattening(0.01, segments=4))
+    array = curve.flattening_array(0.01, segments=4)
+    assert len(array) == len(vertices) * 3
+    assert [Vec3(array[i:i + 3]) for i in range(0, len(array), 3)] == vertices
+
+
+def test_flattening_depth_limit(bezier, monkeypatch):
+    if bezier is Bezier3P:  # reduce runtime of the Python implementation
+        monkeypatch.setattr(_bezier3p, 'MAX_FLATTENING_DEPTH', 10)
+    # A distance below the precision of the curve points does not exhaust
+    # the stack or the recursion limit:
+    curve = bezier([(0, 0), (1, 1e6), (2, 0)])
+    count = len(list(curve.flattening(1e-30, segments=1)))
+    assert 100 < count <= 2 ** 16 + 1
+
+
 def test_approximated_length(bezier):
     length = bezier(DEFPOINTS3D).approximated_length(64)
     assert length == pytest.approx(127.12269127455725)
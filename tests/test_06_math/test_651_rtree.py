@@ -0,0 +1,99 @@
+#  Copyright (c) 2021, Manfred Moitzi
+#  License: MIT License
+import random
+import pytest
+from ezdxf.math import BoundingBox, Vec3
+from ezdxf.math.rtree import RTree
+
+
+def box(x, y, size=1.0):
+    return BoundingBox([(x, y, 0), (x + size, y + size, 0)])
+
+
+@pytest.fixture(scope='module')
+def grid():
+    return [(box(x, y), (x, y)) for x in range(20) for y in range(20)]
+
+
+def test_empty_tree():
+    tree = RTree([])
+    assert len(tree) == 0
+    assert tree.extents.is_empty
+    assert list(tree.intersecting(box(0, 0))) == []
+    assert list(tree.inside(box(0, 0))) == []
+    assert tree.nearest((0, 0)) == []
+
+
+def test_empty_boxes_are_ignored():
+    tree = RTree([(BoundingBox(), 'empty'), (box(0, 0), 'box')])
+    assert len(tree) == 1
+
+
+def test_invalid_node_size():
+    with pytest.raises(ValueError):
+        RTree([], max_node_size=1)
+
+
+@pytest.mark.parametrize('size', [2, 4, 16])
+def test_all_items_stored(grid, size):
+    tree = RTree(grid, max_node_size=size)
+    assert len(tree) == 400
+    assert sorted(item for _, item in tree) == sorted(
+        item for _, item in grid)
+    assert tree.extents.extmin.isclose((0, 0, 0))
+    assert tree.extents.extmax.isclose((20, 20, 0))
+
+
+def test_intersecting(grid):
+    tree = RTree(grid, max_node_size=4)
+    # touching boxes do intersect
+    result = set(tree.intersecting(box(5, 5)))
+    assert result == {(x, y) for x in (4, 5, 6) for y in (4, 5, 6)}
+
+
+def test_inside(grid):
+    tree = RTree(grid, max_node_size=4)
+    result = set(tree.inside(box(5, 5, size=2)))
+    assert result == {(5, 5), (5, 6), (6, 5), (6, 6)}
+
+
+def test_z_axis():
+    tree = RTree([(BoundingBox([(0, 0, 5), (1, 1, 6)]), 'a')])
+    assert list(tree.intersecting(box(0, 0))) == []
+    assert list(tree.intersecting(
+        BoundingBox([(0, 0, 0), (1, 1, 5)]))) == ['a']
+
+
+def test_nearest(grid):
+    tree = RTree(grid, max_node_size=4)
+    result = tree.nearest((-2, 5.5), k=3)
+    assert [item for _, item in result] == [(0, 5), (0, 4), (0, 6)]
+    assert result[0][0] == pytest.approx(2.0)
+    assert tree.nearest((5.5, 5.5))[0] == (0, (5, 5))
+
+
+def test_random_queries_against_brute_force():
+    random.seed(0)
+    items = []
+    for index in range(500):
+        x, y = random.uniform(0, 100), random.uniform(0, 100)
+        items.append((box(x, y, random.uniform(0.1, 5)), index))
+    tree = RTree(items, max_node_size=8)
+    for _ in range(20):
+        q = box(random.uniform(0, 100), random.uniform(0, 100), 10)
+        qmin, qmax = q.extmin, q.extmax
+        expected = {
+            item for b, item in items
+            if b.extmin.x <= qmax.x and b.extmax.x >= qmin.x and
+            b.extmin.y <= qmax.y and b.extmax.y >= qmin.y
+        }
+        assert set(tree.intersecting(q)) == expected
+
+        p = Vec3(random.uniform(0, 100), random.uniform(0, 100))
+        distances = sorted(
+            (max(b.extmin.x - p.x, 0, p.x - b.extmax.x) ** 2 +
+             max(b.extmin.y - p.y, 0, p.y - b.extmax.y) ** 2) ** 0.5
+            for b, _ in items
+        )
+        result = tree.nearest(p, k=5)
+        assert [d for d, _ in result] == pytest.approx(distances[:5])
@@ -0,0 +1,140 @@
+# Copyright (c) 2021, Manfred Moitzi
+# License: MIT License
+import pytest
+from array import array
+from ezdxf.render.path import Path, bbox
+from ezdxf.render import compactpath
+from ezdxf.render.compactpath import CompactPath
+from ezdxf.math import Vec3, Matrix44, Bezier4P, Bezier3P
+
+KERNELS = [compactpath.py_flatten_path]
+if compactpath.flatten_path is not compactpath.py_flatten_path:
+    KERNELS.append(compactpath.flatten_path)
+
+
+@pytest.fixture
+def path():
+    p = Path((0, 0, 0))
+    p.line_to((1, 0))
+    p.curve3_to((2, 2), (2, 0))
+    p.curve4_to((0, 5, 1), (3, 4), (1, 6))
+    p.close()
+    return p
+
+
+def test_init():
+    path = CompactPath()
+    assert path.start == (0, 0)
+    assert len(path) == 0
+    assert path.end == (0, 0)
+    assert list(path.approximate()) == []
+    assert path.bbox().has_data is False
+
+
+def test_vertex_buffer_layout():
+    path = CompactPath((1, 2, 3))
+    path.line_to((4, 5, 6))
+    path.curve3_to((10, 0), (5, 5))
+    path.curve4_to((1, 2, 3), (0, 1, 0), (0, 2, 0))
+    assert list(path.commands) == [1, 2, 3]
+    assert list(path.vertices) == [
+        1, 2, 3, 4, 5, 6, 5, 5, 0, 10, 0, 0, 0, 1, 0, 0, 2, 0, 1, 2, 3]
+    assert path.end == (1, 2, 3)
+    assert path.is_closed is True
+
+
+def test_start_of_non_empty_path_is_immutable():
+    path = CompactPath()
+    path.start = (1, 2)
+    assert path.start == (1, 2)
+    path.line_to((3, 4))
+    with pytest.raises(ValueError):
+        path.start = (0, 0)
+
+
+def test_path_conversion(path):
+    compact = CompactPath.from_path(path)
+    assert len(compact) == len(path)
+    assert compact.control_vertices() == list(path.control_vertices())
+    assert list(compact.to_path().control_vertices()) == \
+           list(path.control_vertices())
+
+
+def test_approximate(path):
+    compact = CompactPath.from_path(path)
+    vertices = list(compact.approximate(10))
+    expected = list(path.approximate(10))
+    assert len(vertices) == len(expected)
+    assert all(v.isclose(e) for v, e in zip(vertices, expected))
+
+
+def test_transform(path):
+    m = Matrix44.chain(Matrix44.z_rotate(1.0), Matrix44.translate(3, 4, 5))
+    compact = CompactPath.from_path(path).transform(m)
+    expected = path.transform(m).control_vertices()
+    assert all(v.isclose(e) for v, e in
+               zip(compact.control_vertices(), expected))
+
+
+def test_bbox(path):
+    compact = CompactPath.from_path(path)
+    box = compact.bbox(precise=False)
+    assert box.extmin == (0, 0, 0)
+    assert box.extmax == (3, 6, 1)
+    box = compact.bbox()
+    expected = bbox([path])
+    assert box.extmin.isclose(expected.extmin, abs_tol=1e-3)
+    assert box.extmax.isclose(expected.extmax, abs_tol=1e-3)
+
+
+@pytest.mark.parametrize('kernel', KERNELS)
+def test_flattening_distance(kernel):
+    distance = 0.01
+    curve4 = Bezier4P([(0, 0), (3, 4), (1, 6), (0, 5)])
+    curve3 = Bezier3P([(0, 5), (2, 0), (2, 2)])
+    path = CompactPath()
+    path.curve4_to((0, 5), (3, 4), (1, 6))
+    path.curve3_to((2, 2), (2, 0))
+    v = kernel(path.commands, path.vertices, distance, 4)
+    vertices = [Vec3(v[i:i + 3]) for i in range(0, len(v), 3)]
+    assert vertices[0] == (0, 0)
+    assert vertices[-1] == (2, 2)
+    index = vertices.index(Vec3(0, 5))
+    for curve, points in ((curve4, vertices[:index + 1]),
+                          (curve3, vertices[index:])):
+        count = len(points) - 1
+        assert count > 4
+        for i in range(count):
+            # distance of the chord center to the curve point at the same
+            # parameter is a lower bound of the approximation error:
+            mid = curve.point((i + 0.5) / count)
+            assert mid.distance(points[i].lerp(points[i + 1])) < distance
+
+
+@pytest.mark.parametrize('kernel', KERNELS)
+def test_flattening_min_segments(kernel):
+    path = CompactPath()
+    path.curve4_to((3, 0), (1, 0), (2, 0))  # straight line
+    v = kernel(path.commands, path.vertices, 0.01, 8)
+    assert len(v) == 9 * 3
+
+
+@pytest.mark.parametrize('kernel', KERNELS)
+def test_kernels_are_equal(kernel, path):
+    compact = CompactPath.from_path(path)
+    expected = compactpath.py_flatten_path(
+        compact.commands, compact.vertices, 0.001, 4)
+    assert kernel(compact.commands, compact.vertices, 0.001, 4) == expected
+
+
+@pytest.mark.parametrize('kernel', KERNELS)
+def test_invalid_data(kernel):
+    with pytest.raises(ValueError):
+        kernel(array('B', [7]), array('d', [0, 0, 0, 1, 1, 1]), 0, 4)
+    with pytest.raises(ValueError):
+        kernel(array('B', [3]), array('d', [0, 0, 0, 1, 1, 1]), 0, 4)
+
+
+def test_invalid_flattening_distance():
+    with pytest.raises(ValueError):
+        CompactPath().flattening_array(0)
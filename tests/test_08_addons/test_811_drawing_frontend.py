@@ -3,6 +3,7 @@
 from typing import Optional, List, Set
 import pytest
 import ezdxf
+from ezdxf.lldxf import const
 from ezdxf.addons.drawing import Frontend, RenderContext, Properties
 from ezdxf.addons.drawing.backend import Backend
 from ezdxf.tools.fonts import FontMeasurements
@@ -476,5 +477,167 @@ def test_override_filter(msp, ctx):
     assert result[3].layer == 'T2'
 
 
+def _add_title_block(doc: Drawing):
+    block = doc.blocks.new(name='title-block', base_point=(1, 1))
+    block.add_line((0, 0), (10, 0), dxfattribs={'color': const.BYBLOCK})
+    block.add_arc((5, 5), radius=2, start_angle=10, end_angle=280,
+                  dxfattribs={'layer': 'Test1'})
+    block.add_lwpolyline([(0, 0, 0.5), (5, 0, 0.5), (5, 5, 0.5)],
+                         format='xyw')
+    block.add_text('TITLE', dxfattribs={'height': 2.0, 'rotation': 30})
+    block.add_attdef('NAME', (0, 5), dxfattribs={'height': 1.0})
+    hatch = block.add_hatch(color=const.BYBLOCK)
+    hatch.paths.add_polyline_path([(0, 0), (3, 0), (3, 3)])
+    nested = doc.blocks.new(name='nested-block')
+    nested.add_line((0, 0), (1, 1))
+    nested.add_point((1, 0))
+    block.add_blockref('nested-block', (2, 2), dxfattribs={
+        'rotation': 45, 'xscale': 2, 'yscale': 2, 'zscale': 2})
+
+
+def _draw_modelspace(doc: Drawing, block_cache: bool):
+    backend = BasicBackend()
+    frontend = Frontend(RenderContext(doc), backend)
+    if not block_cache:
+        frontend.block_cache = None
+    frontend.draw_layout(doc.modelspace())
+    return backend.collector, frontend.block_cache
+
+
+def _isclose(a, b) -> bool:
+    if isinstance(a, Vec3):
+        return a.isclose(b, abs_tol=1e-9)
+    elif isinstance(a, Properties):
+        return (a.color, a.layer, a.linetype_name, a.lineweight) == \
+               (b.color, b.layer, b.linetype_name, b.lineweight)
+    else:
+        return a == b
+
+
+@pytest.mark.parametrize('dxfattribs', [
+    {},
+    {'rotation': 30, 'xscale': 2, 'yscale': 2, 'zscale': 2, 'color': 3},
+    {'column_count': 2, 'row_count': 3, 'column_spacing': 20,
+     'row_spacing': 15, 'layer': 'Test1'},
+])
+def test_block_cache_is_equal_to_virtual_entities(doc, dxfattribs):
+    _add_title_block(doc)
+    msp = doc.modelspace()
+    msp.add_blockref('title-block', (100, 50), dxfattribs=dxfattribs)
+    msp.add_blockref('title-block', (0, 0)).add_auto_attribs({'NAME': 'x'})
+
+    cached, cache = _draw_modelspace(doc, block_cache=True)
+    expected, _ = _draw_modelspace(doc, block_cache=False)
+    assert all(recording is not None for recording in cache.values())
+    assert len(cached) == len(expected)
+    for record, expected_record in zip(cached, expected):
+        assert record[0] == expected_record[0]
+        if record[0] == 'filled_polygon':
+            record = (record[0], list(record[1]), record[2])
+        elif record[0] == 'text':
+            # The cached text transformation includes the block scaling,
+            # the cap height is not scaled:
+            record = (record[0], record[1], record[2].origin)
+            expected_record = (expected_record[0], expected_record[1],
+                               expected_record[2].origin)
+        for value, expected_value in zip(record[1:], expected_record[1:]):
+            if isinstance(value, list):
+                assert all(_isclose(v, e) for v, e in
+                           zip(value, expected_value))
+            else:
+                assert _isclose(value, expected_value)
+
+
+def test_block_cache_key(doc):
+    _add_title_block(doc)
+    msp = doc.modelspace()
+    for color in (1, 1, 2):
+        msp.add_blockref('title-block', (0, 0), dxfattribs={'color': color})
+    _, cache = _draw_modelspace(doc, block_cache=True)
+    # color of the block reference is used by BYBLOCK entities:
+    assert len([key for key in cache if key[0] == 'title-block']) == 2
+    # nested block reference has always the same properties:
+    assert len([key for key in cache if key[0] == 'nested-block']) == 1
+
+
+def test_block_cache_ignores_non_uniform_scaling(doc):
+    _add_title_block(doc)
+    doc.modelspace().add_blockref('title-block', (0, 0), dxfattribs={
+        'xscale': 2, 'yscale': 1})
+    _, cache = _draw_modelspace(doc, block_cache=True)
+    assert len(cache) == 0
+
+
+def test_block_cache_ignores_location_dependent_entities(doc):
+    block = doc.blocks.new(name='xline-block')
+    block.add_xline((0, 0), (1, 0))
+    doc.modelspace().add_blockref('xline-block', (0, 0))
+    cached, cache = _draw_modelspace(doc, block_cache=True)
+    assert list(cache.values()) == [None]
+    assert unique_types(cached) == {'line', 'bgcolor'}
+
+
+class ScopeBackend(BasicBackend):
+    """ Records the entity scope calls and the current entity of the draw
+    and measurement calls.
+    """
+
+    def enter_entity(self, entity, properties) -> None:
+        super().enter_entity(entity, properties)
+        self.collector.append(('enter', entity.dxftype()))
+
+    def exit_entity(self, entity) -> None:
+        super().exit_entity(entity)
+        self.collector.append(('exit', entity.dxftype()))
+
+    def draw_line(self, start, end, properties) -> None:
+        self.collector.append(('line', self.current_entity.dxftype()))
+
+    def draw_point(self, pos, properties) -> None:
+        self.collector.append(('point', self.current_entity.dxftype()))
+
+    def draw_filled_polygon(self, points, properties) -> None:
+        self.collector.append(('polygon', self.current_entity.dxftype()))
+
+    def draw_text(self, text, transform, properties, cap_height) -> None:
+        self.collector.append(('text', self.current_entity.dxftype()))
+
+    def get_text_line_width(self, text, cap_height, font=None) -> float:
+        self.collector.append(('measure', self.current_entity.dxftype()))
+        return len(text)
+
+
+def _record_scopes(doc: Drawing, block_cache: bool):
+    backend = ScopeBackend()
+    frontend = Frontend(RenderContext(doc), backend)
+    if not block_cache:
+        frontend.block_cache = None
+    frontend.draw_layout(doc.modelspace())
+    assert backend.entity_stack == []
+    return backend.collector
+
+
+def test_block_cache_replays_entity_scopes(doc):
+    _add_title_block(doc)
+    msp = doc.modelspace()
+    msp.add_blockref('title-block', (100, 50))
+    msp.add_blockref('title-block', (0, 0))
+    cached = _record_scopes(doc, block_cache=True)
+    expected = _record_scopes(doc, block_cache=False)
+    # Text measurement is done only once for the cached block definition:
+    assert [r for r in cached if r[0] != 'measure'] == \
+           [r for r in expected if r[0] != 'measure']
+    assert set(r for r in cached if r[0] == 'measure') == {('measure', 'TEXT')}
+
+
+def test_not_cacheable_block_enters_entities_once(doc):
+    block = doc.blocks.new(name='xline-block')
+    block.add_xline((0, 0), (1, 0))
+    block.add_line((0, 0), (1, 0))
+    doc.modelspace().add_blockref('xline-block', (0, 0))
+    assert _record_scopes(doc, block_cache=True) == \
+           _record_scopes(doc, block_cache=False)
+
+
 if __name__ == '__main__':
     pytest.main([__file__])
@@ -0,0 +1,110 @@
+#  Copyright (c) 2021, Manfred Moitzi
+#  License: MIT License
+import pytest
+import io
+import ezdxf
+from ezdxf.addons.streamwriter import streamwriter, StreamWriter
+from ezdxf.lldxf.const import DXFStructureError, DXFVersionError
+from ezdxf.lldxf.tagger import ascii_tags_loader
+
+
+@pytest.fixture
+def doc():
+    doc = ezdxf.new('R2000')
+    doc.layers.new('LAYER1', dxfattribs={'color': 1})
+    block = doc.blocks.new('BLOCK1')
+    block.add_circle((0, 0), radius=1)
+    return doc
+
+
+def stream_lines(doc, count):
+    stream = io.StringIO()
+    with streamwriter(stream, doc) as writer:
+        for x in range(count):
+            writer.add_line((x, 0), (x, 1), dxfattribs={'layer': 'LAYER1'})
+    return stream
+
+
+def test_written_entities_are_not_stored_in_the_document(doc):
+    writer = StreamWriter(io.StringIO(), doc)
+    count = len(doc.entitydb)
+    for x in range(100):
+        writer.add_line((x, 0), (x, 1))
+    writer.close()
+    assert len(writer) == 100
+    assert len(doc.entitydb) == count
+    assert len(doc.modelspace()) == 0
+
+
+def test_load_streamed_document(doc):
+    stream = stream_lines(doc, 100)
+    doc2 = ezdxf.read(io.StringIO(stream.getvalue()))
+    lines = doc2.modelspace().query('LINE')
+    assert len(lines) == 100
+    assert lines[7].dxf.start == (7, 0)
+    assert lines[7].dxf.layer == 'LAYER1'
+    assert doc2.layers.get('LAYER1').color == 1
+    assert 'BLOCK1' in doc2.blocks
+
+
+def test_handseed_is_the_next_unused_handle(doc):
+    stream = stream_lines(doc, 100)
+    tags = list(ascii_tags_loader(io.StringIO(stream.getvalue())))
+    index = tags.index((9, '$HANDSEED'))
+    handseed = tags.pop(index + 1).value
+    handles = [int(tag.value, 16) for tag in tags if tag.code == 5]
+    assert len(handseed) == 16, 'expected padding by leading zeros'
+    assert int(handseed, 16) > max(handles)
+
+
+def test_existing_model_space_entities_are_written(doc):
+    doc.modelspace().add_point((1, 2))
+    stream = stream_lines(doc, 1)
+    doc2 = ezdxf.read(io.StringIO(stream.getvalue()))
+    assert len(doc2.modelspace()) == 2
+
+
+def test_modify_last_added_entity(doc):
+    stream = io.StringIO()
+    with streamwriter(stream, doc) as writer:
+        hatch = writer.add_hatch(color=1)
+        hatch.paths.add_polyline_path([(0, 0), (1, 0), (1, 1)])
+        blockref = writer.add_blockref('BLOCK1', (0, 0))
+        blockref.add_attrib('TAG', 'VALUE')
+        assert len(writer) == 1
+    assert len(writer) == 2
+    doc2 = ezdxf.read(io.StringIO(stream.getvalue()))
+    hatch, blockref = doc2.modelspace()
+    assert len(hatch.paths) == 1
+    assert blockref.get_attrib_text('TAG') == 'VALUE'
+
+
+def test_binary_dxf_format(doc, tmpdir):
+    stream = io.BytesIO()
+    with streamwriter(stream, doc, fmt='bin') as writer:
+        writer.add_line((0, 0), (1, 0))
+        writer.add_lwpolyline([(0, 0), (1, 0), (1, 1)])
+    filename = tmpdir.join('stream.dxf')
+    filename.write_binary(stream.getvalue())
+    doc2 = ezdxf.readfile(str(filename))
+    assert len(doc2.modelspace()) == 2
+
+
+def test_creating_new_blocks_raises_exception(doc):
+    with pytest.raises(DXFStructureError):
+        with streamwriter(io.StringIO(), doc) as writer:
+            writer.add_line((0, 0), (1, 0))
+            doc.blocks.new('BLOCK2')
+
+
+def test_adding_entities_to_closed_writer_raises_exception(doc):
+    writer = StreamWriter(io.StringIO(), doc)
+    writer.close()
+    assert writer.is_closed is True
+    with pytest.raises(DXFStructureError):
+        writer.add_line((0, 0), (1, 0))
+
+
+def test_dxf_r12_is_not_supported():
+    with pytest.raises(DXFVersionError):
+        StreamWriter(io.StringIO(), ezdxf.new('R12'))
@@ -0,0 +1,165 @@
+#  Copyright (c) 2021, Manfred Moitzi
+#  License: MIT License
+import pytest
+import os
+import ezdxf
+from ezdxf.addons import iterdxf
+from ezdxf.lldxf import fileindex
+
+
+@pytest.fixture(scope='module', params=['R12', 'R2000'])
+def dxf(request, tmpdir_factory):
+    doc = ezdxf.new(request.param)
+    doc.blocks.new('BLOCK')
+    msp = doc.modelspace()
+    handles = {}
+    for x in range(10):
+        msp.add_line((x, 0), (x, 1), dxfattribs={'layer': f'Layer{x % 2}'})
+    handles['polyline'] = msp.add_polyline3d(
+        [(0, 0, 0), (1, 0, 1), (1, 1, 2)], dxfattribs={'layer': 'Layer0'}
+    ).dxf.handle
+    insert = msp.add_blockref('BLOCK', (0, 0))
+    insert.add_attrib('TAG', 'VALUE')
+    handles['insert'] = insert.dxf.handle
+    handles['circle'] = msp.add_circle((0, 0), 1).dxf.handle
+    doc.layout().add_point((0, 0))  # paperspace entity
+    filename = str(tmpdir_factory.mktemp('iterdxf').join('index.dxf'))
+    doc.saveas(filename)
+    return filename, handles
+
+
+def test_entity_index(dxf):
+    filename, _ = dxf
+    doc = iterdxf.opendxf(filename)
+    try:
+        index = doc.entity_index
+        assert len(index) == 14, 'sub-entities are not indexed'
+        assert index.paperspace.count(1) == 1
+        assert set(index.layers) == {'Layer0', 'Layer1', '0'}
+    finally:
+        doc.close()
+
+
+def test_get_entity_by_handle(dxf):
+    filename, handles = dxf
+    if not handles['circle']:
+        pytest.skip('DXF R12 file without handles')
+    doc = iterdxf.opendxf(filename)
+    try:
+        polyline = doc.get(handles['polyline'])
+        assert polyline.dxftype() == 'POLYLINE'
+        assert len(polyline.vertices) == 3
+        insert = doc.get(handles['insert'])
+        assert insert.get_attrib_text('TAG') == 'VALUE'
+        assert doc.get(handles['circle']).dxf.radius == 1
+        assert doc.get('FEFEFE') is None
+    finally:
+        doc.close()
+
+
+def test_query_types_and_layers(dxf):
+    filename, _ = dxf
+    doc = iterdxf.opendxf(filename)
+    try:
+        lines = list(doc.query(['LINE'], ['layer1']))
+        assert len(lines) == 5
+        assert [e.dxf.start.x for e in lines] == [1, 3, 5, 7, 9]
+        assert [e.dxftype() for e in doc.query(layers=['Layer0'])] == \
+               ['LINE'] * 5 + ['POLYLINE']
+        assert len(list(doc.query(['POINT']))) == 0, \
+            'expected only modelspace entities'
+        assert len(list(doc.query())) == len(list(doc.modelspace()))
+    finally:
+        doc.close()
+
+
+def test_persistent_index(dxf):
+    filename, _ = dxf
+    sidecar = fileindex.index_filename(filename)
+    if os.path.exists(sidecar):
+        os.remove(sidecar)
+    doc = iterdxf.opendxf(filename, index=True)
+    doc.close()
+    assert os.path.exists(sidecar)
+    structure, sections, entity_index = fileindex.load_index(filename)
+    assert len(entity_index) == 14
+
+    doc = iterdxf.opendxf(filename, index=True)
+    try:
+        assert len(list(doc.query(['LINE']))) == 10
+    finally:
+        doc.close()
+
+
+def test_outdated_index_is_ignored(tmpdir):
+    filename = str(tmpdir.join('outdated.dxf'))
+    ezdxf.new().saveas(filename)
+    fileindex.save_index(filename, 'content')
+    assert fileindex.load_index(filename) == 'content'
+    with open(filename, 'at') as fp:
+        fp.write('\n')
+    assert fileindex.load_index(filename) is None
+    assert fileindex.load_index(str(tmpdir.join('missing.dxf'))) is None
+
+
+def test_modelspace_by_worker_processes(dxf, monkeypatch):
+    # small jobs to test linking of sub-entities across job boundaries
+    monkeypatch.setattr(iterdxf, 'ENTITIES_PER_JOB', 3)
+    filename, _ = dxf
+    doc = iterdxf.opendxf(filename)
+    try:
+        expected = [(e.dxftype(), e.dxf.handle) for e in doc.modelspace()]
+        entities = list(doc.modelspace(workers=2))
+        assert [(e.dxftype(), e.dxf.handle) for e in entities] == expected
+        polyline = [e for e in entities if e.dxftype() == 'POLYLINE'][0]
+        assert len(polyline.vertices) == 3
+        insert = [e for e in entities if e.dxftype() == 'INSERT'][0]
+        assert insert.get_attrib_text('TAG') == 'VALUE'
+    finally:
+        doc.close()
+
+
+def test_extract_columnar_data(tmpdir):
+    doc = ezdxf.new()
+    msp = doc.modelspace()
+    msp.add_line((1, 2, 3), (4, 5, 6), dxfattribs={'layer': 'Lines'})
+    msp.add_lwpolyline([(0, 0), (1, 0), (1, 1)])
+    msp.add_line((7, 8), (9, 10))
+    doc.layout().add_line((0, 0), (1, 1))  # paperspace entity
+    filename = str(tmpdir.join('extract.dxf'))
+    doc.saveas(filename)
+
+    idoc = iterdxf.opendxf(filename)
+    try:
+        data = idoc.extract(['LINE', 'LWPOLYLINE'], [10, 11])
+    finally:
+        idoc.close()
+    assert len(data) == 3
+    assert data.dxftypes == ['LINE', 'LWPOLYLINE']
+    assert list(data.dxftype) == [0, 1, 0]
+    assert data.layers == ['Lines', '0']
+    assert list(data.layer) == [0, 1, 1]
+    assert list(data.values[10]) == [1, 2, 3, 0, 0, 0, 1, 0, 0, 1, 1, 0, 7, 8,
+                                     0]
+    assert list(data.counts[10]) == [1, 3, 1]
+    assert list(data.offsets(10)) == [0, 3, 12]
+    assert list(data.values[11]) == [4, 5, 6, 9, 10, 0]
+    assert list(data.counts[11]) == [1, 0, 1]
+
+
+@pytest.mark.parametrize('fields', [[10, 20], [30, 10], [11, 21]])
+def test_extract_rejects_axis_of_requested_point(tmpdir, fields):
+    doc = ezdxf.new()
+    doc.modelspace().add_line((1, 2, 3), (4, 5, 6))
+    filename = str(tmpdir.join('extract.dxf'))
+    doc.saveas(filename)
+
+    idoc = iterdxf.opendxf(filename)
+    try:
+        with pytest.raises(ezdxf.DXFValueError):
+            idoc.extract(['LINE'], fields)
+        # y-axis without the point is a single value:
+        data = idoc.extract(['LINE'], [20])
+    finally:
+        idoc.close()
+    assert list(data.values[20]) == [2]
@@ -0,0 +1,99 @@
+#  Copyright (c) 2021, Manfred Moitzi
+#  License: MIT License
+# Test only the compatibility with the Python implementation,
+# full testing is located in test suite 042.
+from io import StringIO
+import pytest
+
+tagger = pytest.importorskip('ezdxf.acc.tagger')
+from ezdxf.lldxf.tagger import (
+    py_tag_compiler, py_internal_tag_compiler, ascii_tags_loader,
+    bulk_ascii_tags_loader,
+)
+from ezdxf.lldxf.types import DXFTag, DXFBinaryTag
+from ezdxf.lldxf.const import DXFStructureError
+
+TAGS = """  0
+SECTION
+  2
+ENTITIES
+  0
+LINE
+  5
+FF
+  8
+0
+ 62
+1
+ 10
+1.5
+ 20
+2.5
+ 30
+0.0
+ 11
+3.5
+ 21
+4.5
+1001
+APP
+1011
+1
+1021
+2
+1031
+3
+1040
+7
+1071
+99
+310
+FFFE
+  0
+ENDSEC
+"""
+
+
+def ext_tags(compiler, text):
+    return list(compiler(ascii_tags_loader(StringIO(text))))
+
+
+def test_tag_compiler():
+    tags = ext_tags(tagger.tag_compiler, TAGS)
+    assert tags == ext_tags(py_tag_compiler, TAGS)
+    assert tags[5] == (62, 1)
+    assert tags[6] == (10, (1.5, 2.5, 0))
+    assert tags[7] == (11, (3.5, 4.5))
+    assert isinstance(tags[-2], DXFBinaryTag)
+
+
+def test_internal_tag_compiler():
+    assert list(tagger.internal_tag_compiler(TAGS)) == list(
+        py_internal_tag_compiler(TAGS))
+
+
+def test_pre_compiled_tags_pass_through():
+    tags = list(tagger.tag_compiler(
+        bulk_ascii_tags_loader(TAGS.encode())))
+    assert tags == ext_tags(py_tag_compiler, TAGS)
+
+
+def test_2d_point_at_end_of_stream():
+    tags = list(tagger.tag_compiler(iter([DXFTag(10, '1'), DXFTag(20, '2')])))
+    assert tags == [(10, (1, 2))]
+
+
+def test_float_as_int():
+    # ProE stores int values as floats
+    assert ext_tags(tagger.tag_compiler, ' 71\n1.0\n') == [(71, 1)]
+
+
+@pytest.mark.parametrize('text', [
+    ' 40\nabc\n',
+    ' 71\nabc\n',
+    ' 10\n1.0\n 30\n1.0\n',
+    ' 10\nabc\n 20\n1.0\n',
+])
+def test_invalid_tags(text):
+    with pytest.raises(DXFStructureError):
+        ext_tags(tagger.tag_compiler, text)